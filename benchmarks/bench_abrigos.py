@@ -0,0 +1,72 @@
+"""Consultas na rede de abrigos: um processo só contra distribuição entre processos.
+
+Cria ``--abrigos`` abrigos temporários com ``--animais`` animais cada e mede a
+busca e as estatísticas da rede na primeira consulta (inclui a carga dos
+dados) e nas seguintes (dados já em memória nos processos).
+
+Uso (a partir da raiz do projeto):
+    python benchmarks/bench_abrigos.py --abrigos 8 --animais 20000 --processos 4
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from typing import Callable, Tuple
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.adocao.enums import PorteAnimal, StatusAnimal, TipoMoradia
+from src.adocao.pagination import FiltroAnimais
+from src.adocao.shelters import RedeAbrigos
+
+def popular(rede: RedeAbrigos, abrigos: int, animais: int) -> None:
+    """Cria os abrigos com animais e alguns adotantes sintéticos, gravando uma vez por abrigo."""
+    for a in range(abrigos):
+        nucleo = rede.criar_abrigo(f"abrigo{a:02d}", {"banco_tipo": "SQLITE"})
+        nucleo.salvar_automaticamente = False
+        for i in range(animais):
+            nucleo.cadastrar_cachorro(f"Cao{a}-{i}", "SRD", random.choice(list(PorteAnimal)), ["calmo"], True)
+        for i in range(20):
+            nucleo.cadastrar_adotante(f"Adotante{a}-{i}", "x", 30, TipoMoradia.CASA, 120.0, False)
+        nucleo.salvar()
+        nucleo.fechar()
+
+def medir(consulta: Callable[[], object], repeticoes: int) -> Tuple[float, float]:
+    """Retorna (ms da primeira execução, ms médio das seguintes)."""
+    inicio = time.perf_counter()
+    consulta()
+    primeira = (time.perf_counter() - inicio) * 1000
+    inicio = time.perf_counter()
+    for _ in range(repeticoes):
+        consulta()
+    return primeira, (time.perf_counter() - inicio) * 1000 / repeticoes
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--abrigos", type=int, default=8)
+    parser.add_argument("--animais", type=int, default=20000, help="animais por abrigo")
+    parser.add_argument("--processos", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--repeticoes", type=int, default=5)
+    args = parser.parse_args()
+
+    random.seed(42)
+    with tempfile.TemporaryDirectory() as pasta:
+        inicio = time.perf_counter()
+        with RedeAbrigos(pasta) as rede:
+            popular(rede, args.abrigos, args.animais)
+        print(f"{args.abrigos} abrigos x {args.animais:,} animais criados em {time.perf_counter() - inicio:.1f}s\n")
+
+        filtro = FiltroAnimais(status=StatusAnimal.DISPONIVEL, porte=PorteAnimal.G, prefixo_nome="cao1")
+        print(f"{'Modo':<22}{'Consulta':<14}{'1ª (ms)':>10}{'Seguintes (ms)':>16}")
+        for rotulo, paralelo, processos in (("1 processo", False, 1), (f"{args.processos} processos", True, args.processos)):
+            with RedeAbrigos(pasta, processos=processos, paralelo=paralelo) as rede:
+                for nome, consulta in (("busca", lambda: rede.buscar_animais(filtro)),
+                                       ("elegíveis", lambda: rede.animais_elegiveis("abrigo00", 0)),
+                                       ("estatísticas", rede.estatisticas)):
+                    primeira, seguintes = medir(consulta, args.repeticoes)
+                    print(f"{rotulo:<22}{nome:<14}{primeira:>10,.0f}{seguintes:>16,.1f}")
+
+if __name__ == "__main__":
+    main()
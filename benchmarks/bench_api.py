@@ -0,0 +1,110 @@
+"""Teste de carga da API HTTP: requisições por segundo com 1, 8 e 64 clientes simultâneos.
+
+Cada cliente mantém uma conexão keep-alive e envia uma mistura de leituras
+(listagem paginada e detalhe de animal) e reservas, sobre um abrigo
+temporário com dados sintéticos.
+
+Uso (a partir da raiz do projeto):
+    python benchmarks/bench_api.py --requisicoes 4000 --clientes 1 8 64
+"""
+import argparse
+import http.client
+import json
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+from typing import List, Tuple
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.adocao.api import ServidorAPI
+from src.adocao.core import NucleoAdocao
+from src.adocao.enums import PorteAnimal, TipoMoradia
+
+def popular(nucleo: NucleoAdocao, animais: int, adotantes: int) -> None:
+    """Cadastra animais e adotantes sintéticos gravando uma única vez no fim."""
+    nucleo.salvar_automaticamente = False
+    for i in range(animais):
+        nucleo.cadastrar_cachorro(f"Cao{i}", "SRD", random.choice(list(PorteAnimal)), ["calmo"], True)
+    for i in range(adotantes):
+        nucleo.cadastrar_adotante(f"Adotante{i}", f"a{i}@x.com", 30, TipoMoradia.CASA, 120.0, False)
+    nucleo.salvar()
+    nucleo.salvar_automaticamente = True
+
+def cliente(endereco: Tuple[str, int], requisicoes: int, animais: int, adotantes: int, fracao_escrita: float,
+            latencias: List[float], falhas: List[int], semente: int) -> None:
+    """Envia ``requisicoes`` requisições por uma conexão keep-alive, anotando latências e falhas."""
+    sorteio = random.Random(semente)
+    conexao = http.client.HTTPConnection(*endereco, timeout=30)
+    minhas, erros = [], 0
+    for _ in range(requisicoes):
+        if sorteio.random() < fracao_escrita:
+            corpo = json.dumps({"adotante": sorteio.randrange(adotantes)})
+            metodo, alvo = "POST", f"/animais/{sorteio.randrange(animais)}/reserva"
+        elif sorteio.random() < 0.5:
+            corpo, metodo, alvo = None, "GET", f"/animais?status=DISPONIVEL&apos={sorteio.randrange(animais)}&tamanho=10"
+        else:
+            corpo, metodo, alvo = None, "GET", f"/animais/{sorteio.randrange(animais)}"
+        inicio = time.perf_counter()
+        try:
+            conexao.request(metodo, alvo, body=corpo, headers={"Content-Type": "application/json"})
+            resposta = conexao.getresponse()
+            resposta.read()
+            if resposta.status >= 500:
+                erros += 1
+        except (OSError, http.client.HTTPException):
+            erros += 1
+            conexao.close()
+            conexao = http.client.HTTPConnection(*endereco, timeout=30)
+        minhas.append((time.perf_counter() - inicio) * 1000)
+    conexao.close()
+    latencias.extend(minhas)
+    falhas.append(erros)
+
+def medir(endereco: Tuple[str, int], clientes: int, requisicoes: int, animais: int, adotantes: int, fracao_escrita: float) -> Tuple[float, float, float, int]:
+    """Executa uma rodada com ``clientes`` threads e retorna (req/s, p50 ms, p95 ms, falhas)."""
+    latencias: List[float] = []
+    falhas: List[int] = []
+    por_cliente = max(1, requisicoes // clientes)
+    threads = [
+        threading.Thread(target=cliente, args=(endereco, por_cliente, animais, adotantes, fracao_escrita, latencias, falhas, i))
+        for i in range(clientes)
+    ]
+    inicio = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    segundos = time.perf_counter() - inicio
+    latencias.sort()
+    return len(latencias) / segundos, latencias[len(latencias) // 2], latencias[int(len(latencias) * 0.95)], sum(falhas)
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requisicoes", type=int, default=4000, help="requisições por rodada")
+    parser.add_argument("--clientes", type=int, nargs="+", default=[1, 8, 64])
+    parser.add_argument("--animais", type=int, default=2000)
+    parser.add_argument("--adotantes", type=int, default=500)
+    parser.add_argument("--escrita", type=float, default=0.1, help="fração de requisições de reserva")
+    args = parser.parse_args()
+
+    random.seed(42)
+    with tempfile.TemporaryDirectory() as pasta:
+        nucleo = NucleoAdocao(diretorio=pasta, registrar_log=False)
+        popular(nucleo, args.animais, args.adotantes)
+        servidor = ServidorAPI(nucleo, porta=0)
+        endereco = servidor.iniciar()
+        try:
+            print(f"{'Clientes':>8}{'Req/s':>12}{'p50 (ms)':>11}{'p95 (ms)':>11}{'Falhas':>8}")
+            for clientes in args.clientes:
+                vazao, p50, p95, falhas = medir(endereco, clientes, args.requisicoes, args.animais, args.adotantes, args.escrita)
+                print(f"{clientes:>8}{vazao:>12,.0f}{p50:>11.2f}{p95:>11.2f}{falhas:>8}")
+        finally:
+            servidor.parar()
+            nucleo.fechar()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""Latência da busca textual (IndiceBusca) com muitos animais em memória.
+
+Monta o índice com ``--animais`` animais sintéticos (nomes únicos, raças,
+temperamentos e alguns eventos de histórico) e mede consultas seletivas
+(nome exato ou prefixo de nome) e amplas (raça + temperamento comuns), além
+do custo de uma atualização incremental.
+
+Uso (a partir da raiz do projeto):
+    python benchmarks/bench_busca.py --animais 1000000
+"""
+import argparse
+import os
+import random
+import sys
+import time
+from typing import Callable, List
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.adocao.domain import Animal, Cachorro, Gato
+from src.adocao.enums import PorteAnimal, StatusAnimal
+from src.adocao.indexes import IndiceBusca
+
+RACAS = ["SRD", "Labrador", "Poodle", "Siamês", "Persa", "Beagle", "Maine Coon", "Pastor Alemão"]
+TEMPERAMENTOS = ["calmo", "brincalhão", "agitado", "tímido", "carinhoso", "independente"]
+
+def criar_animais(quantidade: int) -> List[Animal]:
+    """Gera animais sintéticos; um em cada dez recebe uma vacina no histórico."""
+    animais: List[Animal] = []
+    for i in range(quantidade):
+        temperamento = random.sample(TEMPERAMENTOS, 2)
+        if i % 2:
+            animal: Animal = Gato(f"Gato{i}", random.choice(RACAS), StatusAnimal.DISPONIVEL, PorteAnimal.P, temperamento, 5)
+        else:
+            animal = Cachorro(f"Cao{i}", random.choice(RACAS), StatusAnimal.DISPONIVEL, PorteAnimal.M, temperamento, True)
+        if i % 10 == 0:
+            animal.vacinar(random.choice(["Raiva", "V10", "Gripe"]))
+        animais.append(animal)
+    return animais
+
+def medir(operacao: Callable[[], object], repeticoes: int) -> float:
+    """Retorna o tempo médio de uma operação, em milissegundos."""
+    inicio = time.perf_counter()
+    for _ in range(repeticoes):
+        operacao()
+    return (time.perf_counter() - inicio) * 1000 / repeticoes
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--animais", type=int, default=200000)
+    parser.add_argument("--repeticoes", type=int, default=200)
+    args = parser.parse_args()
+
+    random.seed(42)
+    inicio = time.perf_counter()
+    animais = criar_animais(args.animais)
+    print(f"{args.animais:,} animais gerados em {time.perf_counter() - inicio:.1f}s")
+
+    indice = IndiceBusca()
+    inicio = time.perf_counter()
+    indice.reconstruir(animais)
+    print(f"Índice construído em {time.perf_counter() - inicio:.1f}s\n")
+
+    meio = args.animais // 2
+    consultas = [
+        ("nome exato", f"cao{meio}"),
+        ("prefixo de nome", f"gato{meio // 10 + 1}"),
+        ("raça + nome", f"siames cao{meio}"),
+        ("raça + temperamento", "siames calmo"),
+        ("histórico", "raiva"),
+    ]
+    print(f"{'Consulta':<22}{'Texto':<20}{'Encontrados':>12}{'ms/consulta':>14}")
+    for rotulo, texto in consultas:
+        encontrados = len(indice.buscar(texto, limite=args.animais))
+        ms = medir(lambda: indice.buscar(texto), args.repeticoes if encontrados < 1000 else 5)
+        print(f"{rotulo:<22}{texto:<20}{encontrados:>12,}{ms:>14.3f}")
+
+    alvo = animais[meio]
+    print(f"\n{'atualização (evento)':<54}{medir(lambda: alvo.adicionar_evento('Consulta de rotina'), args.repeticoes):>14.3f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""Compara a vazão do LoggerObserver (abre/fecha o arquivo por evento) com o LoggerBufferizado.
+
+Uso (a partir da raiz do projeto):
+    python benchmarks/bench_logger.py --eventos 20000
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.adocao.observers import LoggerObserver, LoggerBufferizado
+
+def medir(logger, eventos: int) -> float:
+    """Envia ``eventos`` mensagens ao logger e retorna o tempo total (s), incluindo a gravação final."""
+    inicio = time.perf_counter()
+    for i in range(eventos):
+        logger.atualizar(f"EXPIRAÇÃO: Reserva de Animal{i} (Tutor: Adotante{i}) venceu e foi cancelada.")
+    if hasattr(logger, "fechar"):
+        logger.fechar()
+    return time.perf_counter() - inicio
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--eventos", type=int, default=20000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as pasta:
+        resultados = {
+            "LoggerObserver": medir(LoggerObserver("sincrono.log", pasta=pasta), args.eventos),
+            "LoggerBufferizado": medir(LoggerBufferizado("bufferizado.log", pasta=pasta), args.eventos),
+        }
+        for nome in ("sincrono.log", "bufferizado.log"):
+            with open(os.path.join(pasta, nome), encoding="utf-8") as f:
+                assert sum(1 for _ in f) == args.eventos, f"{nome} perdeu linhas"
+
+    base = resultados["LoggerObserver"]
+    print(f"{'Logger':<20}{'Tempo (s)':>12}{'Eventos/s':>14}{'Ganho':>9}")
+    for nome, segundos in resultados.items():
+        print(f"{nome:<20}{segundos:>12.3f}{args.eventos / segundos:>14,.0f}{base / segundos:>8.1f}x")
+
+if __name__ == "__main__":
+    main()
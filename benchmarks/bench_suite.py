@@ -0,0 +1,253 @@
+"""Suíte de desempenho das operações do núcleo nos dois repositórios, com comparação entre execuções.
+
+``executar`` cria abrigos sintéticos com ``--tamanhos`` animais (e um adotante
+para cada dez animais) em ``RepositorioJSON`` e ``RepositorioSQLite`` e mede,
+com gravação automática ligada como no uso normal:
+
+    salvar       gravação inicial de todos os animais e adotantes
+    carga        abertura do abrigo até os dados estarem em memória
+    relatorio    relatório estatístico (sem cache) renderizado em texto
+    cadastro     cadastrar_cachorro
+    reserva      reservar_animal
+    adocao       realizar_adocao do animal reservado
+    devolucao    processar_devolucao
+    fila         entrar_fila_espera em animal reservado
+    expiracao    processar_reservas_vencidas com ``--operacoes`` reservas vencidas
+
+Os resultados (mediana, média e mínimo em ms por operação) vão para um JSON.
+``comparar`` confronta dois desses arquivos e termina com código 1 se alguma
+medição ficou mais lenta que a tolerância.
+
+Uso (a partir da raiz do projeto):
+    python benchmarks/bench_suite.py executar --tamanhos 1000 10000 --saida base.json
+    python benchmarks/bench_suite.py executar --tamanhos 1000 10000 --saida novo.json
+    python benchmarks/bench_suite.py comparar base.json novo.json --tolerancia 0.2
+
+Os tamanhos 100000 e 1000000 também são aceitos, mas com o repositório JSON
+cada operação regrava o arquivo inteiro: contem minutos por medição.
+"""
+import argparse
+import io
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.adocao.core import NucleoAdocao
+from src.adocao.enums import PorteAnimal, TipoMoradia
+from src.adocao.reports import SaidaTexto, gerar_relatorio, relatorio_estatistico
+
+BANCOS = ("JSON", "SQLITE")
+TAMANHOS_PADRAO = (1000, 10000)
+FORMATO = 1
+
+def abrir(diretorio: str) -> NucleoAdocao:
+    """Abre o abrigo e espera a carga dos dados."""
+    nucleo = NucleoAdocao(diretorio=diretorio, registrar_log=False)
+    nucleo.animais
+    return nucleo
+
+def popular(diretorio: str, banco: str, tamanho: int) -> float:
+    """Cria o abrigo sintético em memória e retorna os ms da gravação inicial."""
+    with open(os.path.join(diretorio, "settings.json"), "w", encoding="utf-8") as f:
+        json.dump({"banco_tipo": banco}, f)
+    nucleo = abrir(diretorio)
+    nucleo.salvar_automaticamente = False
+    for i in range(tamanho):
+        nucleo.cadastrar_cachorro(f"Cao{i}", "SRD", PorteAnimal.M, [random.choice(["calmo", "brincalhão"])], True)
+    for i in range(max(tamanho // 10, 1)):
+        nucleo.cadastrar_adotante(f"Adotante{i}", f"a{i}@x.com", 30, TipoMoradia.CASA, 200.0, False)
+    inicio = time.perf_counter()
+    nucleo.salvar()
+    duracao = (time.perf_counter() - inicio) * 1000
+    nucleo.fechar()
+    return duracao
+
+def cronometrar(operacao: Callable[[int], Any], vezes: int) -> List[float]:
+    """Executa ``operacao(i)`` para i em 0..vezes-1 e retorna os ms de cada execução."""
+    tempos = []
+    for i in range(vezes):
+        inicio = time.perf_counter()
+        operacao(i)
+        tempos.append((time.perf_counter() - inicio) * 1000)
+    return tempos
+
+def resumo(banco: str, tamanho: int, operacao: str, tempos: List[float]) -> Dict[str, Any]:
+    """Uma linha de resultado."""
+    return {
+        "banco": banco,
+        "tamanho": tamanho,
+        "operacao": operacao,
+        "repeticoes": len(tempos),
+        "mediana_ms": round(statistics.median(tempos), 4),
+        "media_ms": round(statistics.fmean(tempos), 4),
+        "min_ms": round(min(tempos), 4)
+    }
+
+def medir_abrigo(banco: str, tamanho: int, operacoes: int, cargas: int) -> List[Dict[str, Any]]:
+    """Mede todas as operações em um abrigo novo do banco e tamanho pedidos."""
+    resultados = []
+    with tempfile.TemporaryDirectory() as diretorio:
+        resultados.append(resumo(banco, tamanho, "salvar", [popular(diretorio, banco, tamanho)]))
+
+        tempos_carga: List[float] = []
+        tempos_relatorio: List[float] = []
+        nucleo: Optional[NucleoAdocao] = None
+        for _ in range(cargas):
+            if nucleo is not None:
+                nucleo.fechar()
+            inicio = time.perf_counter()
+            nucleo = abrir(diretorio)
+            tempos_carga.append((time.perf_counter() - inicio) * 1000)
+            inicio = time.perf_counter()
+            gerar_relatorio(relatorio_estatistico(nucleo.estatisticas()), [SaidaTexto(io.StringIO())])
+            tempos_relatorio.append((time.perf_counter() - inicio) * 1000)
+        assert nucleo is not None
+        resultados.append(resumo(banco, tamanho, "carga", tempos_carga))
+        resultados.append(resumo(banco, tamanho, "relatorio", tempos_relatorio))
+
+        # Animais [0, n) passam por reserva, adoção e devolução; [n, 2n) ficam
+        # reservados com fila para a expiração. Cada um com adotantes próprios.
+        n = operacoes
+        adotantes = len(nucleo.adotantes)
+        if adotantes < 3 * n or tamanho < 2 * n:
+            raise SystemExit(f"Tamanho {tamanho} pequeno demais para {n} operações.")
+        medicoes: List[Tuple[str, Callable[[int], Any]]] = [
+            ("cadastro", lambda i: nucleo.cadastrar_cachorro(f"Novo{i}", "SRD", PorteAnimal.M, ["calmo"], True)),
+            ("reserva", lambda i: nucleo.reservar_animal(i, i)),
+            ("adocao", lambda i: nucleo.realizar_adocao(i, i)),
+            ("devolucao", lambda i: nucleo.processar_devolucao(i, "Mudança de cidade")),
+        ]
+        for nome, operacao in medicoes:
+            resultados.append(resumo(banco, tamanho, nome, cronometrar(operacao, n)))
+
+        for i in range(n, 2 * n):
+            nucleo.reservar_animal(i, i)
+        resultados.append(resumo(banco, tamanho, "fila", cronometrar(lambda i: nucleo.entrar_fila_espera(n + i, 2 * n + i), n)))
+
+        def expirar(_: int) -> None:
+            vencida = (datetime.now() - timedelta(days=30)).isoformat()
+            for i in range(n, 2 * n):
+                nucleo.animais[i].data_reserva = vencida
+            inicio = time.perf_counter()
+            nucleo.processar_reservas_vencidas()
+            tempos_expiracao.append((time.perf_counter() - inicio) * 1000)
+
+        tempos_expiracao: List[float] = []
+        for rodada in range(3):
+            expirar(rodada)
+        resultados.append(resumo(banco, tamanho, "expiracao", tempos_expiracao))
+        nucleo.fechar()
+    return resultados
+
+def executar(args: argparse.Namespace) -> int:
+    """Subcomando ``executar``."""
+    random.seed(args.semente)
+    resultados = []
+    for banco in args.bancos:
+        for tamanho in args.tamanhos:
+            inicio = time.perf_counter()
+            linhas = medir_abrigo(banco, tamanho, args.operacoes, args.cargas)
+            resultados.extend(linhas)
+            for linha in linhas:
+                print(f"{banco:<8}{tamanho:>10,}  {linha['operacao']:<12}{linha['mediana_ms']:>12,.3f} ms")
+            print(f"{banco:<8}{tamanho:>10,}  ({time.perf_counter() - inicio:.1f}s)\n")
+
+    documento = {
+        "formato": FORMATO,
+        "gerado_em": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "plataforma": platform.platform(),
+        "parametros": {"operacoes": args.operacoes, "cargas": args.cargas, "semente": args.semente},
+        "resultados": resultados
+    }
+    pasta = os.path.dirname(args.saida)
+    if pasta:
+        os.makedirs(pasta, exist_ok=True)
+    with open(args.saida, "w", encoding="utf-8") as f:
+        json.dump(documento, f, ensure_ascii=False, indent=2)
+    print(f"Resultados gravados em {args.saida}")
+    return 0
+
+def comparar_resultados(base: Dict[str, Any], novo: Dict[str, Any], tolerancia: float,
+                        piso_ms: float) -> List[Dict[str, Any]]:
+    """Confronta duas execuções pelas medianas de cada (banco, tamanho, operação) presente em ambas.
+
+    Args:
+        base (Dict[str, Any]): Documento da execução de referência.
+        novo (Dict[str, Any]): Documento da execução a avaliar.
+        tolerancia (float): Aumento relativo aceito (0.2 = 20% mais lento).
+        piso_ms (float): Diferença absoluta abaixo da qual não há regressão (ruído de medição).
+
+    Returns:
+        List[Dict[str, Any]]: Uma linha por medição, com "razao" e "regressao".
+    """
+    chave = lambda r: (r["banco"], r["tamanho"], r["operacao"])
+    anteriores = {chave(r): r for r in base["resultados"]}
+    linhas = []
+    for r in novo["resultados"]:
+        anterior = anteriores.get(chave(r))
+        if anterior is None:
+            continue
+        antes, depois = anterior["mediana_ms"], r["mediana_ms"]
+        razao = depois / antes if antes > 0 else float("inf")
+        linhas.append({
+            "banco": r["banco"], "tamanho": r["tamanho"], "operacao": r["operacao"],
+            "base_ms": antes, "novo_ms": depois, "razao": razao,
+            "regressao": razao > 1 + tolerancia and depois - antes > piso_ms
+        })
+    return linhas
+
+def comparar(args: argparse.Namespace) -> int:
+    """Subcomando ``comparar``."""
+    with open(args.base, encoding="utf-8") as f:
+        base = json.load(f)
+    with open(args.novo, encoding="utf-8") as f:
+        novo = json.load(f)
+    linhas = comparar_resultados(base, novo, args.tolerancia, args.piso_ms)
+    if not linhas:
+        print("Nenhuma medição em comum entre os dois arquivos.")
+        return 2
+    print(f"{'Banco':<8}{'Tamanho':>10}  {'Operação':<12}{'Base (ms)':>12}{'Novo (ms)':>12}{'Razão':>8}")
+    for l in linhas:
+        marca = "  ❌ REGRESSÃO" if l["regressao"] else ""
+        print(f"{l['banco']:<8}{l['tamanho']:>10,}  {l['operacao']:<12}{l['base_ms']:>12,.3f}{l['novo_ms']:>12,.3f}"
+              f"{l['razao']:>7.2f}x{marca}")
+    regressoes = sum(l["regressao"] for l in linhas)
+    print(f"\n{regressoes} regressão(ões) acima de {args.tolerancia:.0%} em {len(linhas)} medições.")
+    return 1 if regressoes else 0
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    comandos = parser.add_subparsers(dest="comando", required=True)
+
+    p_executar = comandos.add_parser("executar", help="mede as operações e grava o JSON de resultados")
+    p_executar.add_argument("--tamanhos", type=int, nargs="+", default=list(TAMANHOS_PADRAO),
+                            help="animais por abrigo (ex: 1000 10000 100000 1000000)")
+    p_executar.add_argument("--bancos", nargs="+", choices=BANCOS, default=list(BANCOS))
+    p_executar.add_argument("--operacoes", type=int, default=20, help="execuções de cada operação por abrigo")
+    p_executar.add_argument("--cargas", type=int, default=3, help="aberturas do abrigo medidas")
+    p_executar.add_argument("--semente", type=int, default=42)
+    p_executar.add_argument("--saida", default="benchmarks/resultados.json")
+    p_executar.set_defaults(funcao=executar)
+
+    p_comparar = comandos.add_parser("comparar", help="compara dois JSON de resultados e aponta regressões")
+    p_comparar.add_argument("base")
+    p_comparar.add_argument("novo")
+    p_comparar.add_argument("--tolerancia", type=float, default=0.2, help="aumento relativo aceito (0.2 = 20%%)")
+    p_comparar.add_argument("--piso-ms", type=float, default=0.05, help="diferença mínima em ms para contar")
+    p_comparar.set_defaults(funcao=comparar)
+
+    args = parser.parse_args(argv)
+    return args.funcao(args)
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,434 @@
+"""Execução não interativa de comandos lidos de um arquivo JSON Lines.
+
+Cada linha é um objeto com o campo "comando" e seus argumentos (índices
+começam em 0, como no núcleo):
+
+    {"comando": "cadastrar_adotante", "nome": "Ana", "contato": "ana@x.com", "idade": 30,
+     "moradia": "CASA", "area_util": 80, "tem_criancas": false}
+    {"comando": "reservar", "animal": 0, "adotante": 0}
+    {"comando": "transacao", "comandos": [{"comando": "adotar", "animal": 0, "adotante": 0},
+                                          {"comando": "devolver", "animal": 1, "motivo": "alergia"}]}
+
+O campo opcional "id" é copiado para o resultado. Para cada linha é escrita
+uma linha JSON com o resultado e, no fim, uma linha com o resumo de vazão
+e latência.
+"""
+import enum
+import json
+import os
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional, TextIO, Type, TypeVar
+
+from .core import NucleoAdocao
+from .domain import Animal
+from .enums import PorteAnimal, TipoMoradia
+from .exceptions import AdocaoError, OperacaoInvalidaError
+
+E = TypeVar("E", bound=enum.Enum)
+
+@dataclass
+class ResultadoComando:
+    """Resultado de uma linha do arquivo de comandos.
+
+    Attributes:
+        linha (int): Número da linha no arquivo (a partir de 1).
+        comando (str): Nome do comando (vazio se a linha não pôde ser lida).
+        sucesso (bool): Se o comando foi aplicado.
+        duracao_ms (float): Tempo de execução em milissegundos.
+        id (Any): Valor do campo "id" da linha, se houver.
+        resultado (Optional[Dict[str, Any]]): Dados devolvidos pelo comando.
+        erro (Optional[str]): Mensagem de erro, em caso de falha.
+    """
+    linha: int
+    comando: str
+    sucesso: bool
+    duracao_ms: float = 0.0
+    id: Any = None
+    resultado: Optional[Dict[str, Any]] = None
+    erro: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serializa o resultado para a linha de saída.
+
+        Returns:
+            Dict[str, Any]: Dados do resultado.
+        """
+        return {
+            "linha": self.linha,
+            "id": self.id,
+            "comando": self.comando,
+            "ok": self.sucesso,
+            "resultado": self.resultado,
+            "erro": self.erro,
+            "ms": round(self.duracao_ms, 3)
+        }
+
+@dataclass
+class ResumoExecucao:
+    """Totais de uma execução em lote.
+
+    Attributes:
+        sucessos (int): Comandos aplicados.
+        falhas (int): Comandos rejeitados.
+        segundos (float): Tempo total da execução.
+        latencias_ms (List[float]): Duração de cada comando, na ordem de execução.
+    """
+    sucessos: int = 0
+    falhas: int = 0
+    segundos: float = 0.0
+    latencias_ms: List[float] = field(default_factory=list)
+
+    @property
+    def comandos(self) -> int:
+        """int: Total de comandos executados."""
+        return self.sucessos + self.falhas
+
+    @property
+    def comandos_por_segundo(self) -> float:
+        """float: Vazão da execução."""
+        return self.comandos / self.segundos if self.segundos > 0 else 0.0
+
+    def percentil(self, p: float) -> float:
+        """Calcula um percentil das latências (método do vizinho mais próximo).
+
+        Args:
+            p (float): Percentil entre 0 e 100.
+
+        Returns:
+            float: Latência em milissegundos (0.0 sem comandos).
+        """
+        if not self.latencias_ms:
+            return 0.0
+        ordenadas = sorted(self.latencias_ms)
+        posicao = max(0, min(len(ordenadas) - 1, int(round(p / 100 * len(ordenadas))) - 1))
+        return ordenadas[posicao]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serializa o resumo para a linha final da saída.
+
+        Returns:
+            Dict[str, Any]: Totais, vazão e latências (média, p50, p95, p99 e máxima).
+        """
+        media = sum(self.latencias_ms) / len(self.latencias_ms) if self.latencias_ms else 0.0
+        return {
+            "comandos": self.comandos,
+            "sucessos": self.sucessos,
+            "falhas": self.falhas,
+            "segundos": round(self.segundos, 4),
+            "comandos_por_segundo": round(self.comandos_por_segundo, 1),
+            "latencia_ms": {
+                "media": round(media, 3),
+                "p50": round(self.percentil(50), 3),
+                "p95": round(self.percentil(95), 3),
+                "p99": round(self.percentil(99), 3),
+                "max": round(max(self.latencias_ms, default=0.0), 3)
+            }
+        }
+
+    def __str__(self) -> str:
+        """Retorna o resumo legível exibido ao fim da execução."""
+        return (f"{self.comandos} comando(s): {self.sucessos} ok, {self.falhas} falha(s) em {self.segundos:.3f}s "
+                f"({self.comandos_por_segundo:.1f}/s) | latência p50 {self.percentil(50):.3f} ms, "
+                f"p95 {self.percentil(95):.3f} ms, p99 {self.percentil(99):.3f} ms")
+
+def ler_enum(tipo: Type[E], valor: Any) -> E:
+    """Aceita o nome (ex: "APTO") ou o valor (ex: "Apartamento") de um membro do enum."""
+    if isinstance(valor, str):
+        membro = tipo.__members__.get(valor.upper())
+        if membro is not None:
+            return membro
+    try:
+        return tipo(valor)
+    except ValueError:
+        opcoes = ", ".join(m.name for m in tipo)
+        raise ValueError(f"Valor inválido para {tipo.__name__}: {valor!r}. Use {opcoes}.")
+
+def mensagem_erro(erro: Exception) -> str:
+    """Texto de um erro de comando para a saída (KeyError vira "argumento ausente")."""
+    if isinstance(erro, KeyError):
+        return f"Argumento ausente: {erro.args[0]}"
+    return str(erro)
+
+def _booleano(dados: Dict[str, Any], campo: str, padrao: bool) -> bool:
+    """Lê um campo verdadeiro/falso; textos como "false" são recusados em vez de virarem True."""
+    valor = dados.get(campo, padrao)
+    if not isinstance(valor, bool):
+        raise TypeError(f"O campo {campo!r} deve ser true ou false, não {valor!r}.")
+    return valor
+
+def _animal(animal: Animal) -> Dict[str, Any]:
+    """Resumo de um animal para o resultado de um comando."""
+    return {"nome": animal.nome, "status": animal.status.value}
+
+class ExecutorComandos:
+    """Executa comandos JSON Lines sobre um núcleo, sem interação com o usuário.
+
+    Cada linha é independente: uma falha é registrada na saída e a execução
+    segue para a próxima. Para agrupar operações que devem valer juntas, use
+    o comando "transacao", executado dentro de NucleoAdocao.transacao().
+
+    Attributes:
+        nucleo (NucleoAdocao): Núcleo sobre o qual os comandos são aplicados.
+        pasta_relatorios (str): Pasta padrão dos relatórios gerados pelo comando "relatorio".
+    """
+
+    def __init__(self, nucleo: NucleoAdocao, pasta_relatorios: str = "relatorios") -> None:
+        """Inicializa o executor.
+
+        Args:
+            nucleo (NucleoAdocao): Núcleo sobre o qual os comandos são aplicados.
+            pasta_relatorios (str, optional): Pasta padrão dos relatórios. Defaults to "relatorios".
+        """
+        self.nucleo = nucleo
+        self.pasta_relatorios = pasta_relatorios
+        # Nome -> função que valida os argumentos e devolve a execução do comando.
+        self._comandos: Dict[str, Callable[[Dict[str, Any]], Callable[[], Dict[str, Any]]]] = {
+            "cadastrar_cachorro": self._cadastrar_cachorro,
+            "cadastrar_gato": self._cadastrar_gato,
+            "cadastrar_adotante": self._cadastrar_adotante,
+            "reservar": self._reservar,
+            "adotar": self._adotar,
+            "devolver": self._devolver,
+            "expirar": self._expirar,
+            "relatorio": self._relatorio,
+            "transacao": self._transacao
+        }
+
+    def executar(self, linhas: Iterable[str], saida: Optional[TextIO] = None) -> ResumoExecucao:
+        """Executa todas as linhas, escrevendo um resultado JSON por linha e o resumo no fim.
+
+        Linhas em branco e linhas iniciadas por "#" são ignoradas.
+
+        Args:
+            linhas (Iterable[str]): Linhas do arquivo de comandos.
+            saida (Optional[TextIO], optional): Destino dos resultados. Defaults to None (não escreve).
+
+        Returns:
+            ResumoExecucao: Totais da execução.
+        """
+        resumo = ResumoExecucao()
+        inicio = time.perf_counter()
+        for numero, linha in enumerate(linhas, start=1):
+            linha = linha.strip()
+            if not linha or linha.startswith("#"):
+                continue
+            resultado = self.executar_linha(numero, linha)
+            resumo.latencias_ms.append(resultado.duracao_ms)
+            if resultado.sucesso:
+                resumo.sucessos += 1
+            else:
+                resumo.falhas += 1
+            if saida is not None:
+                saida.write(json.dumps(resultado.to_dict(), ensure_ascii=False) + "\n")
+        resumo.segundos = time.perf_counter() - inicio
+        if saida is not None:
+            saida.write(json.dumps({"resumo": resumo.to_dict()}, ensure_ascii=False) + "\n")
+            saida.flush()
+        return resumo
+
+    def executar_linha(self, numero: int, linha: str) -> ResultadoComando:
+        """Interpreta e executa uma linha, convertendo erros em resultado de falha.
+
+        Args:
+            numero (int): Número da linha no arquivo.
+            linha (str): Objeto JSON do comando.
+
+        Returns:
+            ResultadoComando: Resultado da linha.
+        """
+        inicio = time.perf_counter()
+        resultado = ResultadoComando(numero, "", sucesso=False)
+        try:
+            dados = json.loads(linha)
+            if not isinstance(dados, dict):
+                raise ValueError("Cada linha deve ser um objeto JSON.")
+            resultado.id = dados.get("id")
+            resultado.comando = str(dados.get("comando", ""))
+            resultado.resultado = self.executar_comando(dados)
+            resultado.sucesso = True
+        except (AdocaoError, ValueError, KeyError, TypeError) as e:
+            resultado.erro = mensagem_erro(e)
+        resultado.duracao_ms = (time.perf_counter() - inicio) * 1000
+        return resultado
+
+    def executar_comando(self, dados: Dict[str, Any]) -> Dict[str, Any]:
+        """Executa um comando já interpretado.
+
+        Args:
+            dados (Dict[str, Any]): Objeto do comando, com o campo "comando".
+
+        Returns:
+            Dict[str, Any]: Dados devolvidos pelo comando.
+
+        Raises:
+            ValueError: Se o comando for desconhecido ou um argumento for inválido.
+            KeyError: Se faltar um argumento obrigatório.
+            AdocaoError: Se uma regra de negócio impedir a operação.
+        """
+        return self.preparar_comando(dados)()
+
+    def preparar_comando(self, dados: Dict[str, Any]) -> Callable[[], Dict[str, Any]]:
+        """Valida e converte os argumentos de um comando sem tocar no núcleo.
+
+        Separa os erros de entrada (antes de qualquer alteração) dos erros da
+        execução: a API responde 400 só para os primeiros.
+
+        Args:
+            dados (Dict[str, Any]): Objeto do comando, com o campo "comando".
+
+        Returns:
+            Callable[[], Dict[str, Any]]: Executa o comando e retorna os dados dele.
+
+        Raises:
+            ValueError: Se o comando for desconhecido ou um argumento for inválido.
+            KeyError: Se faltar um argumento obrigatório.
+            TypeError: Se um argumento tiver o tipo errado.
+        """
+        nome = dados.get("comando")
+        preparar = self._comandos.get(nome) if isinstance(nome, str) else None
+        if preparar is None:
+            raise ValueError(f"Comando desconhecido: {nome!r}. Use {', '.join(self._comandos)}.")
+        return preparar(dados)
+
+    def _cadastrar_cachorro(self, dados: Dict[str, Any]) -> Callable[[], Dict[str, Any]]:
+        """Comando "cadastrar_cachorro": nome, raca, porte, temperamento, precisa_passeio."""
+        nome, raca, porte = dados["nome"], dados["raca"], ler_enum(PorteAnimal, dados["porte"])
+        temperamento, precisa_passeio = list(dados.get("temperamento", [])), _booleano(dados, "precisa_passeio", True)
+
+        def executar() -> Dict[str, Any]:
+            with self.nucleo.trava_estrutura.exclusiva():
+                self.nucleo.cadastrar_cachorro(nome, raca, porte, temperamento, precisa_passeio)
+                return {"animal": len(self.nucleo.animais) - 1}
+        return executar
+
+    def _cadastrar_gato(self, dados: Dict[str, Any]) -> Callable[[], Dict[str, Any]]:
+        """Comando "cadastrar_gato": nome, raca, porte, temperamento, independencia."""
+        nome, raca, porte = dados["nome"], dados["raca"], ler_enum(PorteAnimal, dados["porte"])
+        temperamento, independencia = list(dados.get("temperamento", [])), int(dados.get("independencia", 5))
+
+        def executar() -> Dict[str, Any]:
+            with self.nucleo.trava_estrutura.exclusiva():
+                self.nucleo.cadastrar_gato(nome, raca, porte, temperamento, independencia)
+                return {"animal": len(self.nucleo.animais) - 1}
+        return executar
+
+    def _cadastrar_adotante(self, dados: Dict[str, Any]) -> Callable[[], Dict[str, Any]]:
+        """Comando "cadastrar_adotante": nome, contato, idade, moradia, area_util, tem_criancas."""
+        nome, contato, idade = dados["nome"], dados["contato"], int(dados["idade"])
+        moradia = ler_enum(TipoMoradia, dados["moradia"])
+        area_util, tem_criancas = float(dados.get("area_util", 0.0)), _booleano(dados, "tem_criancas", False)
+
+        def executar() -> Dict[str, Any]:
+            with self.nucleo.trava_estrutura.exclusiva():
+                suspeitas = self.nucleo.possiveis_duplicatas(nome, contato)
+                self.nucleo.cadastrar_adotante(nome, contato, idade, moradia, area_util, tem_criancas)
+                resultado: Dict[str, Any] = {"adotante": len(self.nucleo.adotantes) - 1}
+                if suspeitas:
+                    resultado["possiveis_duplicatas"] = [{"adotante": s.idx, "motivo": s.motivo} for s in suspeitas]
+                return resultado
+        return executar
+
+    def _reservar(self, dados: Dict[str, Any]) -> Callable[[], Dict[str, Any]]:
+        """Comando "reservar": animal, adotante."""
+        idx_animal, idx_adotante = int(dados["animal"]), int(dados["adotante"])
+
+        def executar() -> Dict[str, Any]:
+            resultado = self.nucleo.reservar_animal(idx_animal, idx_adotante)
+            return {**_animal(resultado.animal), "adotante": resultado.adotante.nome, "validade_horas": resultado.validade_horas}
+        return executar
+
+    def _adotar(self, dados: Dict[str, Any]) -> Callable[[], Dict[str, Any]]:
+        """Comando "adotar": animal, adotante."""
+        idx_animal, idx_adotante = int(dados["animal"]), int(dados["adotante"])
+
+        def executar() -> Dict[str, Any]:
+            resultado = self.nucleo.realizar_adocao(idx_animal, idx_adotante)
+            return {**_animal(resultado.animal), "adotante": resultado.adotante.nome, "taxa": str(resultado.taxa.valor)}
+        return executar
+
+    def _devolver(self, dados: Dict[str, Any]) -> Callable[[], Dict[str, Any]]:
+        """Comando "devolver": animal, motivo."""
+        idx_animal, motivo = int(dados["animal"]), str(dados["motivo"])
+
+        def executar() -> Dict[str, Any]:
+            return _animal(self.nucleo.processar_devolucao(idx_animal, motivo).animal)
+        return executar
+
+    def _expirar(self, dados: Dict[str, Any]) -> Callable[[], Dict[str, Any]]:
+        """Comando "expirar": processa as reservas vencidas."""
+        def executar() -> Dict[str, Any]:
+            expiradas = self.nucleo.processar_reservas_vencidas()
+            return {"expiradas": [{**_animal(r.animal), "novo_titular": r.novo_titular} for r in expiradas]}
+        return executar
+
+    def _relatorio(self, dados: Dict[str, Any]) -> Callable[[], Dict[str, Any]]:
+        """Comando "relatorio": tipo ("estatistico", "animais" ou "duplicatas"), formato e arquivo opcionais.
+
+        O arquivo é só um nome, sempre gravado em ``pasta_relatorios``: o comando
+        também é aceito pela API, e um caminho livre permitiria sobrescrever
+        qualquer arquivo do servidor.
+        """
+        from .reports import (SAIDAS_POR_FORMATO, caminho_relatorio, gerar_relatorio, relatorio_animais, relatorio_duplicatas,
+                              relatorio_estatistico)
+        tipo = dados.get("tipo", "estatistico")
+        formato = dados.get("formato", "json")
+        if formato not in SAIDAS_POR_FORMATO:
+            raise ValueError(f"Formato desconhecido: {formato}")
+        if tipo not in ("estatistico", "animais", "duplicatas"):
+            raise ValueError(f"Tipo de relatório desconhecido: {tipo}")
+        arquivo = dados.get("arquivo")
+        if arquivo is not None:
+            if not isinstance(arquivo, str):
+                raise TypeError("O campo 'arquivo' deve ser um texto.")
+            if os.path.basename(arquivo) != arquivo or arquivo in ("", ".", "..") or (os.altsep and os.altsep in arquivo):
+                raise ValueError(f"Arquivo inválido: {arquivo!r}. Informe só o nome; o relatório é gravado em {self.pasta_relatorios}.")
+
+        def executar() -> Dict[str, Any]:
+            if tipo == "estatistico":
+                relatorio, prefixo = relatorio_estatistico(self.nucleo.estatisticas()), "relatorio"
+            elif tipo == "animais":
+                relatorio, prefixo = relatorio_animais(self.nucleo.animais), "animais"
+            else:
+                relatorio, prefixo = relatorio_duplicatas(self.nucleo.relatorio_duplicatas()), "duplicatas"
+
+            if arquivo:
+                caminho = os.path.join(self.pasta_relatorios, arquivo)
+            else:
+                caminho = caminho_relatorio(self.pasta_relatorios, prefixo, formato, relatorio.gerado_em)
+            pasta = os.path.dirname(caminho)
+            if pasta:
+                os.makedirs(pasta, exist_ok=True)
+            with open(caminho, "w", encoding="utf-8", newline="" if formato == "csv" else None) as saida:
+                registros = gerar_relatorio(relatorio, [SAIDAS_POR_FORMATO[formato](saida)])
+            return {"arquivo": caminho, "registros": registros}
+        return executar
+
+    def _transacao(self, dados: Dict[str, Any]) -> Callable[[], Dict[str, Any]]:
+        """Comando "transacao": comandos (lista), aplicados juntos ou desfeitos juntos.
+
+        Todos os comandos são validados antes de a transação começar.
+        """
+        comandos = dados["comandos"]
+        if not isinstance(comandos, list):
+            raise ValueError("O campo 'comandos' deve ser uma lista.")
+        preparados = []
+        for posicao, comando in enumerate(comandos, start=1):
+            nome = comando.get("comando") if isinstance(comando, dict) else "?"
+            try:
+                if not isinstance(comando, dict):
+                    raise ValueError("Cada comando deve ser um objeto JSON.")
+                preparados.append((posicao, nome, self.preparar_comando(comando)))
+            except (ValueError, KeyError, TypeError) as e:
+                raise ValueError(f"Transação recusada no comando {posicao} ({nome}): {mensagem_erro(e)}") from e
+
+        def executar() -> Dict[str, Any]:
+            resultados = []
+            with self.nucleo.transacao():
+                for posicao, nome, executar_comando in preparados:
+                    try:
+                        resultados.append(executar_comando())
+                    except (AdocaoError, ValueError, KeyError, TypeError) as e:
+                        raise OperacaoInvalidaError(f"Transação desfeita no comando {posicao} ({nome}): {mensagem_erro(e)}") from e
+            return {"resultados": resultados}
+        return executar
@@ -0,0 +1,190 @@
+import os
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+ANIMAL = 0
+ADOTANTE = 1
+
+class TravaEstrutura:
+    """Trava de leitura/escrita sobre a estrutura das listas do núcleo.
+
+    Operações sobre entidades existentes (reservar, adotar, devolver...) usam
+    o modo compartilhado e podem rodar em paralelo, cada uma protegida pelas
+    travas das suas entidades. Operações que mudam as listas ou os índices de
+    posição (cadastro, exclusão, transações, restauração de lote) usam o modo
+    exclusivo e esperam as compartilhadas terminarem.
+
+    Os dois modos são reentrantes na mesma thread, e quem detém o modo
+    exclusivo também pode entrar no compartilhado. Escritores pendentes têm
+    prioridade sobre novos leitores, para que um cadastro não espere para sempre.
+    """
+
+    def __init__(self) -> None:
+        """Inicializa a trava livre."""
+        self._condicao = threading.Condition(threading.Lock())
+        self._leitores = 0
+        self._escritores_esperando = 0
+        self._dono: int = 0
+        self._profundidade_dono = 0
+        self._local = threading.local()
+
+    @contextmanager
+    def compartilhada(self) -> Iterator[None]:
+        """Entra no modo compartilhado enquanto durar o bloco."""
+        ident = threading.get_ident()
+        profundidade = getattr(self._local, "leituras", 0)
+        if profundidade == 0 and self._dono != ident:
+            with self._condicao:
+                while self._dono or self._escritores_esperando:
+                    self._condicao.wait()
+                self._leitores += 1
+        self._local.leituras = profundidade + 1
+        try:
+            yield
+        finally:
+            self._local.leituras -= 1
+            if profundidade == 0 and self._dono != ident:
+                with self._condicao:
+                    self._leitores -= 1
+                    if self._leitores == 0:
+                        self._condicao.notify_all()
+
+    @contextmanager
+    def exclusiva(self) -> Iterator[None]:
+        """Entra no modo exclusivo enquanto durar o bloco.
+
+        Raises:
+            RuntimeError: Se a thread já estiver no modo compartilhado (a promoção
+                de leitura para escrita causaria impasse entre duas threads).
+        """
+        ident = threading.get_ident()
+        with self._condicao:
+            if self._dono == ident:
+                self._profundidade_dono += 1
+            else:
+                if getattr(self._local, "leituras", 0):
+                    raise RuntimeError("Não é possível obter a trava exclusiva dentro de uma operação compartilhada.")
+                self._escritores_esperando += 1
+                try:
+                    while self._dono or self._leitores:
+                        self._condicao.wait()
+                finally:
+                    self._escritores_esperando -= 1
+                self._dono = ident
+                self._profundidade_dono = 1
+        try:
+            yield
+        finally:
+            with self._condicao:
+                self._profundidade_dono -= 1
+                if self._profundidade_dono == 0:
+                    self._dono = 0
+                    self._condicao.notify_all()
+
+class TravasEntidades:
+    """Uma trava reentrante por animal e por adotante, criada sob demanda.
+
+    Para evitar impasse entre operações que envolvem duas entidades (ex: o
+    animal 3 com o adotante 1 e o animal 1 com o adotante 3), as travas são
+    sempre obtidas na mesma ordem global: primeiro os animais, depois os
+    adotantes, cada grupo em ordem crescente de posição. As posições só
+    mudam em operações exclusivas da TravaEstrutura, então a chave de cada
+    trava é estável enquanto ela é usada.
+    """
+
+    def __init__(self) -> None:
+        """Inicializa o registro de travas vazio."""
+        self._travas: Dict[Tuple[int, int], threading.RLock] = {}
+        self._criacao = threading.Lock()
+
+    def _trava(self, chave: Tuple[int, int]) -> threading.RLock:
+        """Retorna (criando se preciso) a trava de uma entidade."""
+        trava = self._travas.get(chave)
+        if trava is None:
+            with self._criacao:
+                trava = self._travas.setdefault(chave, threading.RLock())
+        return trava
+
+    @contextmanager
+    def travar(self, animais: Iterable[int] = (), adotantes: Iterable[int] = ()) -> Iterator[None]:
+        """Obtém as travas das entidades na ordem global e as libera ao fim do bloco.
+
+        Args:
+            animais (Iterable[int], optional): Posições dos animais. Defaults to ().
+            adotantes (Iterable[int], optional): Posições dos adotantes. Defaults to ().
+        """
+        chaves = sorted({(ANIMAL, i) for i in animais} | {(ADOTANTE, i) for i in adotantes})
+        obtidas: List[threading.RLock] = []
+        try:
+            for chave in chaves:
+                trava = self._trava(chave)
+                trava.acquire()
+                obtidas.append(trava)
+            yield
+        finally:
+            for trava in reversed(obtidas):
+                trava.release()
+
+    @contextmanager
+    def tentar(self, tipo: int, indice: int) -> Iterator[bool]:
+        """Tenta obter a trava de uma entidade sem esperar.
+
+        Serve para quem já detém travas que vêm depois na ordem global (ex: a
+        trava de gravação) e por isso não pode esperar por uma entidade.
+
+        Args:
+            tipo (int): ANIMAL ou ADOTANTE.
+            indice (int): Posição da entidade.
+
+        Yields:
+            bool: Se a trava foi obtida (liberada ao fim do bloco).
+        """
+        trava = self._trava((tipo, indice))
+        obtida = trava.acquire(blocking=False)
+        try:
+            yield obtida
+        finally:
+            if obtida:
+                trava.release()
+
+@contextmanager
+def trava_arquivo(caminho: str) -> Iterator[None]:
+    """Trava exclusiva entre processos, baseada em um arquivo auxiliar.
+
+    Usa ``fcntl.flock`` (POSIX) ou ``msvcrt.locking`` (Windows). A trava é
+    liberada ao fim do bloco ou se o processo terminar.
+
+    Args:
+        caminho (str): Arquivo usado como trava (criado se não existir).
+    """
+    pasta = os.path.dirname(caminho)
+    if pasta:
+        os.makedirs(pasta, exist_ok=True)
+    with open(caminho, "a+b") as arquivo:
+        if fcntl is not None:
+            fcntl.flock(arquivo.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(arquivo.fileno(), fcntl.LOCK_UN)
+        else:
+            arquivo.seek(0)
+            while True:
+                try:
+                    msvcrt.locking(arquivo.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    # LK_LOCK desiste após ~10 s; continua tentando.
+                    continue
+            try:
+                yield
+            finally:
+                arquivo.seek(0)
+                msvcrt.locking(arquivo.fileno(), msvcrt.LK_UNLCK, 1)
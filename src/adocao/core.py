@@ -0,0 +1,1847 @@
+import copy
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import deque
+from contextlib import contextmanager
+from typing import Callable, Iterable, Iterator, List, Tuple, Optional, Dict, Any, Type, TypeVar, Union
+from datetime import datetime, timedelta
+from .domain import Animal, Adotante, Cachorro, Gato
+from .enums import StatusAnimal, PorteAnimal, TipoMoradia, TipoOperacao, PoliticaFilaCheia
+from .repositories import ConflitoVersao, Repositorio, RepositorioJSON, RepositorioSQLite
+from .fees import MotorTaxas, Taxa, TABELA_TAXAS_PADRAO
+from .indexes import IndiceAdotantes, IndiceBusca, IndicePopularidade, IndiceElegibilidade, SIMILARIDADE_BUSCA, SIMILARIDADE_DUPLICATA
+from .policy import PoliticaAdocao
+from .triage import ClassificadorDevolucao, PALAVRAS_TRIAGEM_PADRAO, PREFIXO_MOTIVO_DEVOLUCAO
+from .observers import Observador, LoggerBufferizado
+from .eventlog import Evento, LogEventosJSONL
+from .concurrency import ADOTANTE, ANIMAL, TravaEstrutura, TravasEntidades
+from .dispatch import DespachanteAssincrono, entregar
+from .instrumentation import Instrumentacao
+from .metrics import AmostraMetricas, SerieMetricas
+from .pagination import FiltroAnimais, FiltroAdotantes, Pagina, TAMANHO_PAGINA_PADRAO, paginar
+from .results import (
+    OperacaoLote,
+    ResultadoItemLote,
+    ResultadoLote,
+    ResultadoReserva,
+    ResultadoAdocao,
+    ResultadoDevolucao,
+    ResultadoFila,
+    ResultadoExpiracao,
+    ResultadoTriagem,
+    SuspeitaDuplicata,
+    ParDuplicado,
+    DetalhesFila,
+    EstatisticasAbrigo
+)
+from .exceptions import (
+    AdocaoError,
+    AnimalReservadoError,
+    ConflitoVersaoError,
+    EntidadeNaoEncontradaError,
+    OperacaoInvalidaError,
+    PoliticaNaoAtendidaError,
+    RegraNegocioError,
+    ReservaInvalidaError,
+    TransicaoStatusError
+)
+
+T = TypeVar("T")
+
+_log = logging.getLogger(__name__)
+
+class NucleoAdocao:
+    """Núcleo headless do sistema de adoção.
+
+    Mantém o estado em memória, aplica as regras de negócio e persiste pelo
+    repositório, sem imprimir nada nem pedir entrada ao usuário. Cada operação
+    retorna a entidade alterada ou um objeto de resultado (ver ``results``) e
+    sinaliza problemas lançando as exceções de ``exceptions``. A CLI
+    (``SistemaAdocao``) é apenas um adaptador sobre esta classe.
+
+    Attributes:
+        diretorio (str): Pasta base de settings.json, arquivos de dados e logs.
+        salvar_automaticamente (bool): Se cada operação persiste imediatamente.
+        avisos (List[str]): Avisos não fatais gerados durante a inicialização.
+        settings (Dict[str, Any]): Configurações do sistema carregadas.
+        repo (Repositorio): Instância do repositório (SQLite ou JSON).
+        animais (List[Animal]): Lista de animais carregados em memória.
+        adotantes (List[Adotante]): Lista de adotantes carregados em memória.
+        observadores (List[Observador]): Lista de observadores registrados.
+        indice_popularidade (IndicePopularidade): Índice de tamanhos de fila para consultas top-k.
+        indice_elegibilidade (IndiceElegibilidade): Bitmaps de elegibilidade da política de adoção.
+        indice_busca (IndiceBusca): Índice invertido para a busca textual de animais.
+        indice_adotantes (IndiceAdotantes): Trigramas de nomes e contatos, para busca aproximada e duplicatas.
+        classificador_devolucao (ClassificadorDevolucao): Triagem dos motivos de devolução.
+        motor_taxas (MotorTaxas): Cálculo das taxas de adoção pela tabela de taxas.
+        despachante (Optional[DespachanteAssincrono]): Entrega assíncrona aos observadores,
+            se "despacho_assincrono" estiver ativo nas configurações.
+        instrumentacao (Optional[Instrumentacao]): Métricas de chamadas, latência e E/S,
+            se "instrumentacao" estiver ativo nas configurações (vale ao iniciar o núcleo).
+        versao_dados (int): Contador incrementado a cada alteração de animais ou adotantes.
+        metricas (SerieMetricas): Série temporal dos contadores do abrigo (dados/metricas.db).
+        trava_estrutura (TravaEstrutura): Modo compartilhado para operações sobre entidades,
+            exclusivo para cadastros, exclusões, lotes e transações.
+        travas (TravasEntidades): Travas por animal e por adotante.
+
+    Vários processos podem usar o mesmo diretório: o repositório grava só o que
+    mudou, com comparar-e-trocar pela versão de cada entidade. Se outro processo
+    alterou a mesma entidade, a operação lança ConflitoVersaoError e a entidade
+    em memória passa a ter os dados gravados pelo outro processo.
+    """
+
+    def __init__(self, diretorio: str = ".", salvar_automaticamente: bool = True, registrar_log: bool = True, carregamento_tardio: bool = False) -> None:
+        """Inicializa o núcleo, carrega configurações, repositório e dados.
+
+        Args:
+            diretorio (str, optional): Pasta base dos arquivos. Defaults to ".".
+            salvar_automaticamente (bool, optional): Persiste a cada operação; se False,
+                as alterações só são gravadas em ``salvar()``. Defaults to True.
+            registrar_log (bool, optional): Registra os logs de eventos padrão (texto em
+                LoggerBufferizado e JSONL em LogEventosJSONL). Defaults to True.
+            carregamento_tardio (bool, optional): Carrega animais e adotantes em segundo
+                plano; o primeiro acesso a eles espera o fim da carga. Defaults to False.
+        """
+        self.diretorio = diretorio
+        self.salvar_automaticamente = salvar_automaticamente
+        self.avisos: List[str] = []
+        self._pendentes: set = set()
+        self._eventos_retidos: Optional[List[Evento]] = None
+        self.versao_dados = 0
+        self.trava_estrutura = TravaEstrutura()
+        self.travas = TravasEntidades()
+        self._trava_versao = threading.Lock()
+        self._trava_gravacao = threading.Lock()
+        self._versao_gravada: Dict[str, int] = {}
+        # (tipo, versão anterior, versão gravada, erro) das últimas gravações com conflito.
+        self._conflitos_recentes: deque = deque(maxlen=32)
+        self._sincronizacoes: List[ConflitoVersao] = []
+        self._cache_relatorios: Dict[str, Tuple[Tuple[str, int, str], Any]] = {}
+
+        self.settings = self._carregar_settings()
+        self.indice_elegibilidade = IndiceElegibilidade(PoliticaAdocao(self.settings))
+        self._assinatura_politica = PoliticaAdocao.assinatura(self.settings)
+        self.classificador_devolucao = ClassificadorDevolucao.de_settings(self.settings)
+        self.motor_taxas = MotorTaxas.de_settings(self.settings)
+
+        self.repo: Repositorio = self._criar_repositorio()
+        self.instrumentacao: Optional[Instrumentacao] = Instrumentacao() if self.settings.get("instrumentacao") else None
+        if self.instrumentacao is not None:
+            # Antes da carga, para que a leitura inicial também seja medida.
+            self.instrumentacao.instrumentar_repositorio(self.repo)
+
+        self.indice_popularidade = IndicePopularidade()
+        self.indice_busca = IndiceBusca()
+        self.indice_adotantes = IndiceAdotantes()
+        self._posicoes: Dict[str, Dict[int, int]] = {"animais": {}, "adotantes": {}}
+        self._animais: List[Animal] = []
+        self._adotantes: List[Adotante] = []
+        self._erro_carregamento: Optional[BaseException] = None
+        self._carregamento: Optional[threading.Thread] = None
+        if carregamento_tardio:
+            self._carregamento = threading.Thread(target=self._carregar_em_segundo_plano, name="carregamento-dados", daemon=True)
+            self._carregamento.start()
+        else:
+            self._carregar_dados()
+
+        self.metricas = SerieMetricas(os.path.join(self._caminho("dados"), "metricas.db"))
+        self._ultima_amostra: Optional[datetime] = None
+        self.despachante: Optional[DespachanteAssincrono] = self._criar_despachante()
+        self.observadores: List[Observador] = []
+        if registrar_log:
+            self.adicionar_observador(LoggerBufferizado(pasta=self._caminho("dados")))
+            self.adicionar_observador(LogEventosJSONL(pasta=os.path.join(self._caminho("dados"), "eventos")))
+        if self.instrumentacao is not None:
+            self.instrumentacao.instrumentar_nucleo(self)
+
+    @property
+    def animais(self) -> List[Animal]:
+        """List[Animal]: Animais carregados em memória."""
+        self._aguardar_carregamento()
+        return self._animais
+
+    @animais.setter
+    def animais(self, animais: List[Animal]) -> None:
+        """Substitui a lista de animais e reindexa as filas de espera."""
+        self._aguardar_carregamento()
+        self._definir_animais(animais)
+
+    @property
+    def adotantes(self) -> List[Adotante]:
+        """List[Adotante]: Adotantes carregados em memória."""
+        self._aguardar_carregamento()
+        return self._adotantes
+
+    @adotantes.setter
+    def adotantes(self, adotantes: List[Adotante]) -> None:
+        """Substitui a lista de adotantes."""
+        self._aguardar_carregamento()
+        self._adotantes = adotantes
+        self.indice_adotantes.reconstruir(adotantes)
+        self.indice_elegibilidade.limpar_adotantes()
+        self.versao_dados += 1
+
+    @property
+    def dados_carregados(self) -> bool:
+        """bool: Se a carga de animais e adotantes já terminou."""
+        return self._carregamento is None or not self._carregamento.is_alive()
+
+    def _definir_animais(self, animais: List[Animal]) -> None:
+        """Troca a lista de animais sem esperar a carga (usado pela própria carga)."""
+        self._animais = animais
+        self.indice_popularidade.reconstruir(animais)
+        self.indice_busca.reconstruir(animais)
+        self.indice_elegibilidade.limpar_animais()
+        self.versao_dados += 1
+
+    def _carregar_dados(self) -> None:
+        """Lê animais e adotantes do repositório."""
+        animais = self.repo.carregar_animais()
+        self._adotantes = self.repo.carregar_adotantes()
+        self.indice_adotantes.reconstruir(self._adotantes)
+        self.indice_elegibilidade.limpar_adotantes()
+        self._definir_animais(animais)
+
+    def _carregar_em_segundo_plano(self) -> None:
+        """Executa a carga na thread de carregamento, guardando o erro para quem esperar por ela."""
+        try:
+            self._carregar_dados()
+        except BaseException as e:
+            self._erro_carregamento = e
+
+    def _aguardar_carregamento(self) -> None:
+        """Bloqueia até a carga em segundo plano terminar.
+
+        Raises:
+            Exception: O erro da carga, se ela falhou (a cada acesso, para não operar sobre dados vazios).
+        """
+        carregamento = self._carregamento
+        if carregamento is not None and carregamento is not threading.current_thread():
+            carregamento.join()
+            self._carregamento = None
+        if self._erro_carregamento is not None:
+            raise self._erro_carregamento
+
+    @property
+    def banco_tipo(self) -> str:
+        """str: Tipo de banco configurado ("JSON" ou "SQLITE")."""
+        return self.settings.get("banco_tipo", "JSON").upper()
+
+    def _caminho(self, nome: str) -> str:
+        """Monta o caminho de um arquivo dentro do diretório base.
+
+        Args:
+            nome (str): Nome relativo do arquivo.
+
+        Returns:
+            str: Caminho completo.
+        """
+        return os.path.join(self.diretorio, nome)
+
+    def _criar_repositorio(self) -> Repositorio:
+        """Cria o repositório de acordo com o tipo de banco configurado.
+
+        Returns:
+            Repositorio: RepositorioSQLite ou RepositorioJSON.
+        """
+        if self.banco_tipo == "SQLITE":
+            return RepositorioSQLite(self._caminho("adocao.db"))
+        return RepositorioJSON(self._caminho("animais.json"), self._caminho("adotantes.json"))
+
+    def _criar_despachante(self) -> Optional[DespachanteAssincrono]:
+        """Cria o despachante assíncrono se ele estiver habilitado nas configurações.
+
+        Returns:
+            Optional[DespachanteAssincrono]: O despachante ou None (entrega síncrona).
+        """
+        if not self.settings.get("despacho_assincrono"):
+            return None
+        try:
+            politica = PoliticaFilaCheia(self.settings["politica_fila_cheia"])
+        except ValueError:
+            self.avisos.append(f"Política de fila cheia inválida: {self.settings['politica_fila_cheia']!r}. Usando 'bloquear'.")
+            politica = PoliticaFilaCheia.BLOQUEAR
+        return DespachanteAssincrono(
+            capacidade=self.settings["capacidade_fila_observadores"],
+            politica=politica,
+            pasta_transbordo=os.path.join(self._caminho("dados"), "transbordo")
+        )
+
+    def adicionar_observador(self, observador: Observador) -> None:
+        """Registra um novo observador para receber notificações.
+
+        Args:
+            observador (Observador): Instância do observador a ser registrada.
+        """
+        self.observadores.append(observador)
+
+    def notificar_observadores(self, evento: Union[str, Evento]) -> None:
+        """Notifica todos os observadores registrados sobre um evento.
+
+        Observadores estruturados (ObservadorEventos) recebem o Evento; os demais
+        recebem apenas a mensagem de texto. Com o despacho assíncrono ativo, a
+        entrega acontece nas threads do despachante e este método não espera.
+
+        Args:
+            evento (Union[str, Evento]): Descrição do evento ou o evento estruturado.
+        """
+        if isinstance(evento, str):
+            evento = Evento.de_mensagem(evento)
+        if self._eventos_retidos is not None:
+            self._eventos_retidos.append(evento)
+            return
+        if self.despachante is not None:
+            self.despachante.despachar(evento, list(self.observadores))
+            return
+        for obs in self.observadores:
+            entregar(obs, evento)
+
+    @contextmanager
+    def _travar(self, animais: Iterable[int] = (), adotantes: Iterable[int] = ()) -> Iterator[None]:
+        """Protege uma operação sobre entidades existentes: estrutura em modo compartilhado
+        e as travas das entidades envolvidas, na ordem global de TravasEntidades."""
+        with self.trava_estrutura.compartilhada(), self.travas.travar(animais, adotantes):
+            yield
+
+    def _nova_versao(self) -> int:
+        """Incrementa ``versao_dados`` e retorna o novo valor."""
+        with self._trava_versao:
+            self.versao_dados += 1
+            return self.versao_dados
+
+    def _gravar(self, tipo: str, versao: int, gravar: Callable[[], None]) -> None:
+        """Grava um tipo de entidade, agrupando gravações concorrentes.
+
+        As gravações são serializadas. Quem espera a vez e encontra uma gravação
+        iniciada depois da sua alteração (versão gravada >= a sua) não grava de
+        novo: o arquivo já contém a alteração. Com muitas operações simultâneas,
+        poucas gravações completas atendem a todas.
+
+        Args:
+            tipo (str): "animais" ou "adotantes".
+            versao (int): Versão dos dados produzida pela alteração a gravar.
+            gravar (Callable[[], None]): Grava a lista atual no repositório.
+
+        Raises:
+            ConflitoVersaoError: Se a gravação que cobriu esta alteração encontrou
+                entidades alteradas por outro processo.
+        """
+        with self._trava_gravacao:
+            self._sincronizar_conflitos()
+            for tipo_conflito, anterior, gravada, erro in self._conflitos_recentes:
+                if tipo_conflito == tipo and anterior < versao <= gravada:
+                    raise erro
+            anterior = self._versao_gravada.get(tipo, 0)
+            if anterior >= versao:
+                return
+            atual = self.versao_dados
+            try:
+                gravar()
+            except ConflitoVersaoError as erro:
+                self._conflitos_recentes.append((tipo, anterior, atual, erro))
+                self._tratar_conflito(erro)
+                raise
+            finally:
+                self._versao_gravada[tipo] = atual
+
+    def _tratar_conflito(self, erro: ConflitoVersaoError) -> None:
+        """Agenda a atualização em memória das entidades em conflito e tenta aplicá-la já."""
+        self._sincronizacoes.extend(c for c in erro.conflitos if c.entidade is not None)
+        self._sincronizar_conflitos()
+
+    def _sincronizar_conflitos(self) -> None:
+        """Traz para a memória a versão gravada por outro processo das entidades em conflito.
+
+        Chamado com a trava de gravação, que vem depois das travas de entidade
+        na ordem global: por isso a trava da entidade só é tentada, sem esperar.
+        Se outra thread estiver com ela, a atualização fica para a próxima gravação.
+        """
+        restantes = []
+        for conflito in self._sincronizacoes:
+            animal = conflito.tipo == "animais"
+            lista = self._animais if animal else self._adotantes
+            indice = next((i for i, e in enumerate(lista) if e is conflito.entidade), None)
+            if indice is None:
+                continue
+            with self.travas.tentar(ANIMAL if animal else ADOTANTE, indice) as obtida:
+                if not obtida:
+                    restantes.append(conflito)
+                    continue
+                self.repo.sincronizar(conflito)
+                if animal:
+                    self.indice_popularidade.registrar(conflito.entidade)
+                    self.indice_busca.atualizar(conflito.entidade)
+                    self.indice_elegibilidade.invalidar_animal(conflito.entidade)
+                else:
+                    self.indice_adotantes.atualizar(conflito.entidade)
+                    self.indice_elegibilidade.invalidar_adotante(conflito.entidade)
+            self._nova_versao()
+        self._sincronizacoes = restantes
+
+    def _persistir_animais(self, *alterados: Animal) -> None:
+        """Grava os animais agora ou marca como pendente, conforme ``salvar_automaticamente``.
+
+        Args:
+            *alterados (Animal): Animais existentes que foram alterados; incluídos e
+                excluídos são detectados pelo repositório e não precisam ser passados.
+        """
+        self.repo.marcar_animais(alterados)
+        versao = self._nova_versao()
+        if self.salvar_automaticamente:
+            self._gravar("animais", versao, lambda: self.repo.salvar_animais(self.animais))
+        else:
+            self._pendentes.add("animais")
+        self._amostrar_metricas_se_preciso()
+
+    def _persistir_adotantes(self, *alterados: Adotante) -> None:
+        """Grava os adotantes agora ou marca como pendente, conforme ``salvar_automaticamente``.
+
+        Args:
+            *alterados (Adotante): Adotantes existentes que foram alterados.
+        """
+        self.repo.marcar_adotantes(alterados)
+        versao = self._nova_versao()
+        if self.salvar_automaticamente:
+            self._gravar("adotantes", versao, lambda: self.repo.salvar_adotantes(self.adotantes))
+        else:
+            self._pendentes.add("adotantes")
+
+    def assinatura_settings(self) -> str:
+        """Resumo (hash) das configurações atuais, para invalidar caches que dependem delas.
+
+        Returns:
+            str: Hash SHA-1 do settings serializado com chaves ordenadas.
+        """
+        conteudo = json.dumps(self.settings, sort_keys=True, default=str)
+        return hashlib.sha1(conteudo.encode("utf-8")).hexdigest()
+
+    def assinatura_dados(self) -> Optional[str]:
+        """Resumo (hash) do estado gravado dos dados: uid e versão de cada animal e adotante.
+
+        Toda gravação de uma entidade incrementa a versão dela, então o resumo
+        muda a cada inclusão, alteração ou exclusão gravada e é o mesmo em
+        qualquer processo que abra os mesmos dados (ao contrário de ``versao_dados``).
+
+        Returns:
+            Optional[str]: Hash SHA-1, ou None se houver alterações ainda não gravadas
+                (o estado em memória não corresponde a nenhuma versão gravada).
+        """
+        with self.trava_estrutura.compartilhada():
+            if self._pendentes:
+                return None
+            resumo = hashlib.sha1()
+            for tipo, entidades in (("animais", self.animais), ("adotantes", self.adotantes)):
+                resumo.update(tipo.encode("utf-8"))
+                for entidade in entidades:
+                    resumo.update(f"|{entidade.uid}:{entidade.versao}".encode("utf-8"))
+            return resumo.hexdigest()
+
+    def chave_relatorio(self, tipo: str) -> Tuple[str, int, str]:
+        """Identifica o estado do qual um relatório depende.
+
+        Args:
+            tipo (str): Tipo do relatório (ex: "estatisticas", "animais").
+
+        Returns:
+            Tuple[str, int, str]: (tipo, versao_dados, assinatura das configurações).
+        """
+        return (tipo, self.versao_dados, self.assinatura_settings())
+
+    def _em_cache(self, tipo: str, calcular: Callable[[], T]) -> T:
+        """Retorna o último resultado de ``tipo`` se os dados e as configurações não mudaram."""
+        chave = self.chave_relatorio(tipo)
+        em_cache = self._cache_relatorios.get(tipo)
+        if em_cache is not None and em_cache[0] == chave:
+            return em_cache[1]
+        resultado = calcular()
+        self._cache_relatorios[tipo] = (chave, resultado)
+        return resultado
+
+    @contextmanager
+    def transacao(self) -> Iterator[None]:
+        """Agrupa operações: ou todas valem, ou nenhuma.
+
+        Dentro do bloco nada é gravado e os eventos ficam retidos. Se o bloco
+        terminar normalmente, as alterações são gravadas (se houver salvamento
+        automático) e os eventos são entregues; se lançar exceção, animais e
+        adotantes voltam ao estado anterior, os eventos são descartados e a
+        exceção é propagada.
+
+        Raises:
+            OperacaoInvalidaError: Se já houver uma transação em andamento.
+        """
+        with self.trava_estrutura.exclusiva():
+            yield from self._transacao_exclusiva()
+
+    def _transacao_exclusiva(self) -> Iterator[None]:
+        """Corpo de transacao(), executado com a estrutura em modo exclusivo."""
+        if self._eventos_retidos is not None:
+            raise OperacaoInvalidaError("Já existe uma transação em andamento.")
+        copia_animais = [a.to_dict() for a in self.animais]
+        copia_adotantes = [a.to_dict() for a in self.adotantes]
+        salvar_automaticamente = self.salvar_automaticamente
+        eventos: List[Evento] = []
+        self.salvar_automaticamente = False
+        self._eventos_retidos = eventos
+        try:
+            yield
+        except BaseException:
+            for animal in self.animais:
+                self.indice_elegibilidade.invalidar_animal(animal)
+            for adotante in self.adotantes:
+                self.indice_elegibilidade.invalidar_adotante(adotante)
+            self.animais = [Animal.from_dict(dados) for dados in copia_animais]
+            self.adotantes = [Adotante.from_dict(dados) for dados in copia_adotantes]
+            eventos.clear()
+            raise
+        finally:
+            self._eventos_retidos = None
+            self.salvar_automaticamente = salvar_automaticamente
+            if salvar_automaticamente:
+                self.salvar()
+        for evento in eventos:
+            self.notificar_observadores(evento)
+
+    def salvar(self) -> None:
+        """Grava no repositório as alterações pendentes (modo sem salvamento automático).
+
+        Raises:
+            ConflitoVersaoError: Se outro processo alterou alguma das entidades
+                (as demais alterações são gravadas mesmo assim).
+        """
+        with self._trava_gravacao:
+            conflitos: List[ConflitoVersao] = []
+            for tipo, gravar in (("animais", self.repo.salvar_animais), ("adotantes", self.repo.salvar_adotantes)):
+                if tipo not in self._pendentes:
+                    continue
+                try:
+                    gravar(self.animais if tipo == "animais" else self.adotantes)
+                except ConflitoVersaoError as erro:
+                    conflitos.extend(erro.conflitos)
+            self._pendentes.clear()
+            if conflitos:
+                erro = ConflitoVersaoError(" ".join(str(c) for c in conflitos), conflitos)
+                self._tratar_conflito(erro)
+                raise erro
+
+    def fechar(self) -> None:
+        """Grava as alterações pendentes, encerra os observadores que mantêm recursos abertos
+        e, com a instrumentação ativa, grava o snapshot das métricas em "arquivo_prometheus"."""
+        self.salvar()
+        if self.despachante is not None:
+            self.despachante.fechar()
+        for obs in self.observadores:
+            if hasattr(obs, "fechar"):
+                obs.fechar()
+        if self.instrumentacao is not None:
+            self.instrumentacao.escrever(self._caminho(self.settings["arquivo_prometheus"]))
+
+    def _carregar_settings(self) -> Dict[str, Any]:
+        """Carrega as configurações do arquivo JSON ou cria o padrão se não existir.
+
+        Returns:
+            Dict[str, Any]: Dicionário contendo as configurações do sistema.
+        """
+        padrao = {
+            "banco_tipo": "JSON",
+            "idade_minima": 18,
+            "reserva_horas": 48,
+            "area_minima_g": 40.0,
+            "pesos_compatibilidade": {
+                "moradia": 40,
+                "criancas": 30,
+                "experiencia": 20,
+                "idade_energia": 10
+            },
+            "triagem_devolucao": copy.deepcopy(PALAVRAS_TRIAGEM_PADRAO),
+            "tabela_taxas": copy.deepcopy(TABELA_TAXAS_PADRAO),
+            "despacho_assincrono": False,
+            "capacidade_fila_observadores": 1000,
+            "politica_fila_cheia": PoliticaFilaCheia.BLOQUEAR.value,
+            "intervalo_metricas_segundos": 3600,
+            "instrumentacao": False,
+            "arquivo_prometheus": os.path.join("dados", "metricas.prom")
+        }
+        caminho = self._caminho("settings.json")
+        try:
+            if os.path.exists(caminho):
+                with open(caminho, "r", encoding='utf-8') as f:
+                    dados = json.load(f)
+                    padrao.update(dados)
+        except Exception as e:
+            self.avisos.append(f"Erro ao ler settings.json: {e}")
+
+        if not os.path.exists(caminho):
+            self._salvar_settings_arquivo(padrao)
+
+        return padrao
+
+    def _salvar_settings_arquivo(self, dados: Dict[str, Any]) -> None:
+        """Salva as configurações no arquivo settings.json.
+
+        Args:
+            dados (Dict[str, Any]): Dicionário de configurações a ser salvo.
+
+        Raises:
+            RepositorioError: Se o arquivo não puder ser gravado.
+        """
+        try:
+            with open(self._caminho("settings.json"), "w", encoding='utf-8') as f:
+                json.dump(dados, f, indent=4, ensure_ascii=False)
+        except OSError as e:
+            from .exceptions import RepositorioError
+            raise RepositorioError(f"Erro ao salvar settings: {e}")
+
+    def atualizar_configuracao(self, chave: str, novo_valor: Any) -> Any:
+        """Atualiza uma chave específica nas configurações do sistema.
+
+        O valor é convertido para o tipo do valor atual da chave.
+
+        Args:
+            chave (str): A chave de configuração a ser alterada.
+            novo_valor (Any): O novo valor a ser atribuído.
+
+        Returns:
+            Any: O valor convertido e gravado.
+
+        Raises:
+            OperacaoInvalidaError: Se a chave não existir, for um dicionário ou o valor não puder ser convertido.
+        """
+        with self.trava_estrutura.exclusiva():
+            if chave not in self.settings:
+                raise OperacaoInvalidaError("Chave de configuração não encontrada.")
+
+            tipo_original = type(self.settings[chave])
+            try:
+                if tipo_original == int:
+                    valor_convertido = int(novo_valor)
+                elif tipo_original == float:
+                    valor_convertido = float(novo_valor)
+                elif tipo_original == bool:
+                    valor_convertido = str(novo_valor).lower() in ['true', '1', 's', 'sim']
+                elif isinstance(self.settings[chave], dict):
+                    raise OperacaoInvalidaError("Não é possível editar dicionários complexos por este menu.")
+                else:
+                    valor_convertido = str(novo_valor)
+            except ValueError:
+                raise OperacaoInvalidaError(f"Erro: O valor deve ser do tipo {tipo_original.__name__}.")
+
+            self.settings[chave] = valor_convertido
+            self._salvar_settings_arquivo(self.settings)
+            self._sincronizar_politica()
+            return valor_convertido
+
+    def buscar_animal(self, idx: int) -> Animal:
+        """Busca um animal pelo índice na lista em memória.
+
+        Args:
+            idx (int): Índice do animal.
+
+        Returns:
+            Animal: O objeto animal encontrado.
+
+        Raises:
+            EntidadeNaoEncontradaError: Se o índice for inválido.
+        """
+        try:
+            return self.animais[idx]
+        except IndexError:
+            raise EntidadeNaoEncontradaError(f"Animal com índice {idx} não encontrado.")
+
+    def buscar_adotante(self, idx: int) -> Adotante:
+        """Busca um adotante pelo índice na lista em memória.
+
+        Args:
+            idx (int): Índice do adotante.
+
+        Returns:
+            Adotante: O objeto adotante encontrado.
+
+        Raises:
+            EntidadeNaoEncontradaError: Se o índice for inválido.
+        """
+        try:
+            return self.adotantes[idx]
+        except IndexError:
+            raise EntidadeNaoEncontradaError(f"Adotante com índice {idx} não encontrado.")
+
+    def cadastrar_cachorro(self, nome: str, raca: str, porte: PorteAnimal, temperamento: List[str], precisa_passeio: bool) -> Cachorro:
+        """Cadastra um novo cachorro no sistema e salva no repositório.
+
+        Args:
+            nome (str): Nome do cachorro.
+            raca (str): Raça do cachorro.
+            porte (PorteAnimal): Porte do animal.
+            temperamento (List[str]): Lista de temperamentos.
+            precisa_passeio (bool): Se necessita de passeio.
+
+        Returns:
+            Cachorro: O cachorro cadastrado.
+        """
+        novo_pet = Cachorro(nome, raca, StatusAnimal.DISPONIVEL, porte, temperamento, precisa_passeio)
+        self._adicionar_animal(novo_pet)
+        return novo_pet
+
+    def cadastrar_gato(self, nome: str, raca: str, porte: PorteAnimal, temperamento: List[str], independencia: int) -> Gato:
+        """Cadastra um novo gato no sistema e salva no repositório.
+
+        Args:
+            nome (str): Nome do gato.
+            raca (str): Raça do gato.
+            porte (PorteAnimal): Porte do animal.
+            temperamento (List[str]): Lista de temperamentos.
+            independencia (int): Nível de independência.
+
+        Returns:
+            Gato: O gato cadastrado.
+        """
+        novo_pet = Gato(nome, raca, StatusAnimal.DISPONIVEL, porte, temperamento, independencia)
+        self._adicionar_animal(novo_pet)
+        return novo_pet
+
+    def _adicionar_animal(self, animal: Animal) -> None:
+        """Inclui um animal recém-criado na lista, nos índices e no repositório.
+
+        Args:
+            animal (Animal): O animal a ser incluído.
+        """
+        with self.trava_estrutura.exclusiva():
+            self.animais.append(animal)
+            self.indice_popularidade.registrar(animal)
+            self.indice_busca.registrar(animal)
+            self._persistir_animais()
+
+    def cadastrar_adotante(self, nome: str, contato: str, idade: int, moradia: TipoMoradia, area_util: float, tem_criancas: bool) -> Adotante:
+        """Cadastra um novo adotante no sistema e salva no repositório.
+
+        Args:
+            nome (str): Nome do adotante.
+            contato (str): Contato.
+            idade (int): Idade.
+            moradia (TipoMoradia): Tipo de moradia.
+            area_util (float): Área útil em m².
+            tem_criancas (bool): Se possui crianças.
+
+        Returns:
+            Adotante: O adotante cadastrado.
+        """
+        with self.trava_estrutura.exclusiva():
+            novo_adotante = Adotante(nome, contato, idade, moradia, area_util, tem_criancas)
+            self.adotantes.append(novo_adotante)
+            self.indice_adotantes.registrar(novo_adotante)
+            self._persistir_adotantes()
+            return novo_adotante
+
+    def excluir_animal(self, idx_animal: int) -> Animal:
+        """Remove um animal do sistema pelo índice.
+
+        Args:
+            idx_animal (int): Índice do animal a ser removido.
+
+        Returns:
+            Animal: O animal removido.
+
+        Raises:
+            EntidadeNaoEncontradaError: Se o índice for inválido.
+        """
+        with self.trava_estrutura.exclusiva():
+            self.buscar_animal(idx_animal)
+            removido = self.animais.pop(idx_animal)
+            self.indice_popularidade.remover(removido)
+            self.indice_busca.remover(removido)
+            self.indice_elegibilidade.invalidar_animal(removido)
+            self._persistir_animais()
+            return removido
+
+    def excluir_adotante(self, idx_adotante: int) -> Adotante:
+        """Remove um adotante do sistema pelo índice.
+
+        Args:
+            idx_adotante (int): Índice do adotante a ser removido.
+
+        Returns:
+            Adotante: O adotante removido.
+
+        Raises:
+            EntidadeNaoEncontradaError: Se o índice for inválido.
+        """
+        with self.trava_estrutura.exclusiva():
+            self.buscar_adotante(idx_adotante)
+            removido = self.adotantes.pop(idx_adotante)
+            self.indice_adotantes.remover(removido)
+            self.indice_elegibilidade.invalidar_adotante(removido)
+            self._persistir_adotantes()
+            return removido
+
+    def editar_animal(self, idx_animal: int, novo_nome: Optional[str] = None, nova_raca: Optional[str] = None, novo_porte: Optional[PorteAnimal] = None, novo_temperamento: Optional[List[str]] = None, extra_dado: Any = None) -> Animal:
+        """Edita os dados de um animal existente.
+
+        Args:
+            idx_animal (int): Índice do animal.
+            novo_nome (Optional[str], optional): Novo nome. Defaults to None.
+            nova_raca (Optional[str], optional): Nova raça. Defaults to None.
+            novo_porte (Optional[PorteAnimal], optional): Novo porte. Defaults to None.
+            novo_temperamento (Optional[List[str]], optional): Novo temperamento. Defaults to None.
+            extra_dado (Any, optional): Dado específico (passeio para Cães, independência para Gatos). Defaults to None.
+
+        Returns:
+            Animal: O animal editado.
+
+        Raises:
+            EntidadeNaoEncontradaError: Se o índice for inválido.
+        """
+        with self._travar(animais=[idx_animal]):
+            animal = self.buscar_animal(idx_animal)
+            if novo_nome: animal._nome = novo_nome
+            if nova_raca: animal._raca = nova_raca
+            if novo_porte: animal._porte = novo_porte
+            if novo_temperamento: animal._temperamento = novo_temperamento
+
+            if isinstance(animal, Cachorro) and extra_dado is not None:
+                animal._precisa_passeio = extra_dado
+            elif isinstance(animal, Gato) and extra_dado is not None:
+                animal._independencia = extra_dado
+
+            self.indice_elegibilidade.invalidar_animal(animal)
+            animal.adicionar_evento("Dados cadastrais editados manualmente.")
+            self.indice_busca.atualizar(animal)
+            self._persistir_animais(animal)
+            return animal
+
+    def editar_adotante(self, idx_adotante: int, novo_nome: Optional[str] = None, novo_contato: Optional[str] = None, nova_moradia: Optional[TipoMoradia] = None, nova_area: Optional[float] = None, novas_criancas: Optional[bool] = None) -> Adotante:
+        """Edita os dados de um adotante existente.
+
+        Args:
+            idx_adotante (int): Índice do adotante.
+            novo_nome (Optional[str], optional): Novo nome. Defaults to None.
+            novo_contato (Optional[str], optional): Novo contato. Defaults to None.
+            nova_moradia (Optional[TipoMoradia], optional): Nova moradia. Defaults to None.
+            nova_area (Optional[float], optional): Nova área útil. Defaults to None.
+            novas_criancas (Optional[bool], optional): Novo status de crianças. Defaults to None.
+
+        Returns:
+            Adotante: O adotante editado.
+
+        Raises:
+            EntidadeNaoEncontradaError: Se o índice for inválido.
+        """
+        with self._travar(adotantes=[idx_adotante]):
+            adotante = self.buscar_adotante(idx_adotante)
+
+            if novo_nome:
+                adotante._nome = novo_nome
+            if novo_contato:
+                adotante._contato = novo_contato
+            if nova_moradia:
+                adotante._moradia = nova_moradia
+            if nova_area:
+                adotante._area_util = nova_area
+            if novas_criancas is not None:
+                adotante._tem_criancas = novas_criancas
+            self.indice_elegibilidade.invalidar_adotante(adotante)
+            self.indice_adotantes.atualizar(adotante)
+
+            self._persistir_adotantes(adotante)
+            return adotante
+
+    def _buscar_por_indice(self, idx_animal: int, idx_adotante: Optional[int] = None) -> Tuple[Animal, Optional[Adotante]]:
+        """Método auxiliar para recuperar objetos pelos índices.
+
+        Args:
+            idx_animal (int): Índice do animal.
+            idx_adotante (Optional[int], optional): Índice do adotante. Defaults to None.
+
+        Returns:
+            Tuple[Animal, Optional[Adotante]]: Tupla contendo os objetos encontrados.
+        """
+        animal = self.buscar_animal(idx_animal)
+        adotante = None
+        if idx_adotante is not None:
+            adotante = self.buscar_adotante(idx_adotante)
+        return animal, adotante
+
+    def _sincronizar_politica(self) -> PoliticaAdocao:
+        """Recompila a política de adoção se as configurações das quais ela depende mudaram.
+
+        Returns:
+            PoliticaAdocao: A política em vigor.
+        """
+        assinatura = PoliticaAdocao.assinatura(self.settings)
+        if assinatura != self._assinatura_politica:
+            self._assinatura_politica = assinatura
+            self.indice_elegibilidade.definir_politica(PoliticaAdocao(self.settings))
+        return self.indice_elegibilidade.politica
+
+    def _validar_politica_adocao(self, animal: Animal, adotante: Adotante) -> Tuple[bool, str]:
+        """Verifica se o adotante cumpre os requisitos para adotar o animal.
+
+        Usa os bitmaps em cache como caminho rápido e só avalia a política
+        completa quando precisa do motivo da recusa.
+
+        Args:
+            animal (Animal): O animal pretendido.
+            adotante (Adotante): O candidato à adoção.
+
+        Returns:
+            Tuple[bool, str]: (Aprovado, Motivo da recusa ou string vazia).
+        """
+        politica = self._sincronizar_politica()
+        if self.indice_elegibilidade.elegivel(animal, adotante):
+            return True, ""
+        return politica.avaliar(animal, adotante)
+
+    def _exigir_politica_adocao(self, animal: Animal, adotante: Adotante) -> None:
+        """Garante que o par cumpre a política de adoção.
+
+        Args:
+            animal (Animal): O animal pretendido.
+            adotante (Adotante): O candidato à adoção.
+
+        Raises:
+            PoliticaNaoAtendidaError: Se algum critério (idade, moradia, segurança) não for atendido.
+        """
+        aprovado, motivo = self._validar_politica_adocao(animal, adotante)
+        if not aprovado:
+            raise PoliticaNaoAtendidaError(motivo)
+
+    def adotantes_elegiveis(self, idx_animal: int) -> List[Tuple[int, Adotante]]:
+        """Lista todos os adotantes que a política permite adotar o animal.
+
+        Args:
+            idx_animal (int): Índice do animal.
+
+        Returns:
+            List[Tuple[int, Adotante]]: Pares (índice, adotante) elegíveis.
+
+        Raises:
+            EntidadeNaoEncontradaError: Se o índice for inválido.
+        """
+        animal = self.buscar_animal(idx_animal)
+        self._sincronizar_politica()
+        return self.indice_elegibilidade.adotantes_elegiveis(animal, self.adotantes)
+
+    def pagina_animais(self, filtro: Optional[FiltroAnimais] = None, apos: Optional[int] = None, antes: Optional[int] = None, tamanho: int = TAMANHO_PAGINA_PADRAO) -> Pagina[Animal]:
+        """Lista uma página de animais por cursor, aplicando filtros.
+
+        Args:
+            filtro (Optional[FiltroAnimais], optional): Critérios de status, porte, espécie e nome. Defaults to None.
+            apos (Optional[int], optional): Cursor da próxima página (ID do último item exibido). Defaults to None.
+            antes (Optional[int], optional): Cursor da página anterior (ID do primeiro item exibido). Defaults to None.
+            tamanho (int, optional): Itens por página. Defaults to TAMANHO_PAGINA_PADRAO.
+
+        Returns:
+            Pagina[Animal]: Pares (ID, animal) e cursores de navegação.
+
+        Raises:
+            OperacaoInvalidaError: Se o tamanho da página for inválido.
+        """
+        with self.trava_estrutura.compartilhada():
+            filtro = filtro or FiltroAnimais()
+            try:
+                return paginar(self.animais, filtro.aceita, apos, antes, tamanho)
+            except ValueError as e:
+                raise OperacaoInvalidaError(str(e))
+
+    def pagina_adotantes(self, filtro: Optional[FiltroAdotantes] = None, apos: Optional[int] = None, antes: Optional[int] = None, tamanho: int = TAMANHO_PAGINA_PADRAO) -> Pagina[Adotante]:
+        """Lista uma página de adotantes por cursor, aplicando filtros.
+
+        Args:
+            filtro (Optional[FiltroAdotantes], optional): Critérios de nome. Defaults to None.
+            apos (Optional[int], optional): Cursor da próxima página. Defaults to None.
+            antes (Optional[int], optional): Cursor da página anterior. Defaults to None.
+            tamanho (int, optional): Itens por página. Defaults to TAMANHO_PAGINA_PADRAO.
+
+        Returns:
+            Pagina[Adotante]: Pares (ID, adotante) e cursores de navegação.
+
+        Raises:
+            OperacaoInvalidaError: Se o tamanho da página for inválido.
+        """
+        with self.trava_estrutura.compartilhada():
+            filtro = filtro or FiltroAdotantes()
+            try:
+                return paginar(self.adotantes, filtro.aceita, apos, antes, tamanho)
+            except ValueError as e:
+                raise OperacaoInvalidaError(str(e))
+
+    def animais_elegiveis(self, idx_adotante: int, apenas_adotaveis: bool = True) -> List[Tuple[int, Animal]]:
+        """Lista todos os animais que o adotante pode adotar segundo a política.
+
+        Args:
+            idx_adotante (int): Índice do adotante.
+            apenas_adotaveis (bool, optional): Considera só animais Disponíveis ou Reservados. Defaults to True.
+
+        Returns:
+            List[Tuple[int, Animal]]: Pares (índice, animal) elegíveis.
+
+        Raises:
+            EntidadeNaoEncontradaError: Se o índice for inválido.
+        """
+        return self.animais_elegiveis_para(self.buscar_adotante(idx_adotante), apenas_adotaveis)
+
+    def animais_elegiveis_para(self, adotante: Adotante, apenas_adotaveis: bool = True) -> List[Tuple[int, Animal]]:
+        """Lista os animais deste abrigo que um adotante qualquer pode adotar.
+
+        O adotante não precisa estar cadastrado aqui (ex: busca em outros abrigos
+        da rede); vale a política de adoção deste abrigo. A máscara de um adotante
+        de fora é calculada a cada consulta, sem entrar no cache do índice.
+
+        Args:
+            adotante (Adotante): O adotante.
+            apenas_adotaveis (bool, optional): Considera só animais Disponíveis ou Reservados. Defaults to True.
+
+        Returns:
+            List[Tuple[int, Animal]]: Pares (índice, animal) elegíveis.
+        """
+        self._sincronizar_politica()
+        registrado = self._posicao("adotantes", adotante) is not None
+        return self.indice_elegibilidade.animais_elegiveis(adotante, self.animais, apenas_adotaveis, em_cache=registrado)
+
+    def animais_mais_populares(self, k: int = 5, especie: Optional[Type[Animal]] = None) -> List[Tuple[Animal, int]]:
+        """Consulta os animais com as maiores filas de espera usando o índice mantido.
+
+        Args:
+            k (int, optional): Quantidade de animais. Defaults to 5.
+            especie (Optional[Type[Animal]], optional): Filtra por classe (Cachorro ou Gato). Defaults to None.
+
+        Returns:
+            List[Tuple[Animal, int]]: Pares (animal, tamanho da fila) em ordem decrescente.
+        """
+        return self.indice_popularidade.top_k(k, especie)
+
+    def buscar_animais(self, consulta: str, limite: int = 20) -> List[Tuple[int, Animal]]:
+        """Busca textual em nome, raça, temperamento e histórico dos animais.
+
+        Acentos e maiúsculas são ignorados, cada termo também casa como prefixo
+        ("siam" encontra "Siamês") e todos os termos precisam aparecer.
+
+        Args:
+            consulta (str): Texto livre (ex: "siames calmo").
+            limite (int, optional): Máximo de resultados. Defaults to 20.
+
+        Returns:
+            List[Tuple[int, Animal]]: Pares (índice, animal), do mais ao menos relevante.
+        """
+        with self.trava_estrutura.compartilhada():
+            encontrados = self.indice_busca.buscar(consulta, limite)
+            resultado = []
+            for animal, _ in encontrados:
+                idx = self._posicao("animais", animal)
+                if idx is not None:
+                    resultado.append((idx, animal))
+            return resultado
+
+    def buscar_adotantes(self, nome: str, limite: int = 10, similaridade_minima: float = SIMILARIDADE_BUSCA) -> List[Tuple[int, Adotante, float]]:
+        """Busca aproximada de adotantes pelo nome, tolerante a acentos, caixa e erros de digitação.
+
+        Args:
+            nome (str): Nome (ou parte dele) como digitado.
+            limite (int, optional): Máximo de resultados. Defaults to 10.
+            similaridade_minima (float, optional): Semelhança mínima (0 a 1). Defaults to SIMILARIDADE_BUSCA.
+
+        Returns:
+            List[Tuple[int, Adotante, float]]: (índice, adotante, semelhança), do mais ao menos parecido.
+        """
+        with self.trava_estrutura.compartilhada():
+            resultado = []
+            for adotante, similaridade in self.indice_adotantes.buscar(nome, limite, similaridade_minima):
+                idx = self._posicao("adotantes", adotante)
+                if idx is not None:
+                    resultado.append((idx, adotante, similaridade))
+            return resultado
+
+    def possiveis_duplicatas(self, nome: str, contato: str, similaridade_minima: float = SIMILARIDADE_DUPLICATA) -> List[SuspeitaDuplicata]:
+        """Adotantes já cadastrados que provavelmente são a mesma pessoa (mesmo contato ou nome parecido).
+
+        Usado antes de um cadastro, inclusive em importações em lote, para avisar
+        sobre duplicatas sem impedir o cadastro.
+
+        Args:
+            nome (str): Nome do novo cadastro.
+            contato (str): Contato do novo cadastro.
+            similaridade_minima (float, optional): Semelhança mínima dos nomes. Defaults to SIMILARIDADE_DUPLICATA.
+
+        Returns:
+            List[SuspeitaDuplicata]: Suspeitas, com contato igual primeiro.
+        """
+        with self.trava_estrutura.compartilhada():
+            resultado = []
+            for adotante, similaridade, motivo in self.indice_adotantes.duplicatas_de(nome, contato, similaridade_minima):
+                idx = self._posicao("adotantes", adotante)
+                if idx is not None:
+                    resultado.append(SuspeitaDuplicata(idx, adotante, similaridade, motivo))
+            return resultado
+
+    def relatorio_duplicatas(self, similaridade_minima: float = SIMILARIDADE_DUPLICATA) -> List[ParDuplicado]:
+        """Confere os adotantes já cadastrados e lista os pares que provavelmente são a mesma pessoa.
+
+        Args:
+            similaridade_minima (float, optional): Semelhança mínima dos nomes. Defaults to SIMILARIDADE_DUPLICATA.
+
+        Returns:
+            List[ParDuplicado]: Pares (mais antigo, mais recente), na ordem dos cadastros.
+        """
+        with self.trava_estrutura.compartilhada():
+            pares = []
+            for a, b, similaridade, motivo in self.indice_adotantes.pares_duplicados(similaridade_minima):
+                idx_a, idx_b = self._posicao("adotantes", a), self._posicao("adotantes", b)
+                if idx_a is not None and idx_b is not None:
+                    pares.append(ParDuplicado(idx_a, a, idx_b, b, similaridade, motivo))
+            return pares
+
+    def _posicao(self, tipo: str, entidade: Union[Animal, Adotante]) -> Optional[int]:
+        """Índice atual de um animal ou adotante, por um mapa refeito só quando as posições mudam."""
+        lista: List[Any] = self._animais if tipo == "animais" else self._adotantes
+        posicoes = self._posicoes[tipo]
+        idx = posicoes.get(id(entidade))
+        if idx is None or idx >= len(lista) or lista[idx] is not entidade:
+            posicoes = self._posicoes[tipo] = {id(e): i for i, e in enumerate(lista)}
+            idx = posicoes.get(id(entidade))
+        return idx
+
+    def cotar_taxas(self, pares: List[Tuple[int, int]]) -> List[Taxa]:
+        """Calcula as taxas de várias adoções hipotéticas sem alterar nada.
+
+        Args:
+            pares (List[Tuple[int, int]]): Pares (índice do animal, índice do adotante).
+
+        Returns:
+            List[Taxa]: Taxas na mesma ordem dos pares.
+
+        Raises:
+            EntidadeNaoEncontradaError: Se algum índice for inválido.
+        """
+        return self.motor_taxas.cotar_lote(self._buscar_por_indice(a, d) for a, d in pares)
+
+    def _calcular_compatibilidade(self, animal: Animal, adotante: Adotante) -> Tuple[int, List[str]]:
+        """Calcula um score de compatibilidade entre adotante e animal.
+
+        Args:
+            animal (Animal): O animal.
+            adotante (Adotante): O adotante.
+
+        Returns:
+            Tuple[int, List[str]]: Score (0-100) e lista de detalhes da pontuação.
+        """
+        score = 0
+        detalhes = []
+        pesos = self.settings["pesos_compatibilidade"]
+
+        if (animal.porte == PorteAnimal.G and adotante.moradia == TipoMoradia.CASA) or animal.porte != PorteAnimal.G:
+            score += pesos.get("moradia", 0)
+            detalhes.append(f"[+] Moradia adequada (+{pesos['moradia']})")
+
+        if not (adotante.tem_criancas and "arisco" in [t.lower() for t in animal.temperamento]):
+            score += pesos.get("criancas", 0)
+            detalhes.append(f"[+] Ambiente Seguro/Sem conflito (+{pesos['criancas']})")
+
+        if adotante.idade > 30:
+            score += pesos.get("experiencia", 0)
+            detalhes.append(f"[+] Experiência presumida (+{pesos['experiencia']})")
+
+        score += pesos.get("idade_energia", 0)
+
+        return min(score, 100), detalhes
+
+    def _aplicar_reserva(self, animal: Animal, adotante: Adotante) -> None:
+        """Valida e aplica a reserva em memória, sem persistir.
+
+        Args:
+            animal (Animal): O animal a ser reservado.
+            adotante (Adotante): O adotante que reserva.
+
+        Raises:
+            AnimalReservadoError: Se o animal já estiver reservado para outra pessoa.
+            ReservaInvalidaError: Se o adotante já for o titular da reserva.
+            TransicaoStatusError: Se o animal não estiver disponível.
+            PoliticaNaoAtendidaError: Se a política de adoção não for atendida.
+        """
+        if animal.status == StatusAnimal.RESERVADO:
+            if animal.nome_reservante == adotante.nome:
+                raise ReservaInvalidaError(f"{adotante.nome}, você JÁ possui a reserva deste animal!")
+            raise AnimalReservadoError(f"{animal.nome} já está RESERVADO para {animal.nome_reservante}.", animal.nome_reservante)
+
+        if animal.status != StatusAnimal.DISPONIVEL:
+            raise TransicaoStatusError(f"{animal.nome} não está disponível (Status: {animal.status.value}).")
+
+        self._exigir_politica_adocao(animal, adotante)
+
+        animal.mudar_status(StatusAnimal.RESERVADO)
+        animal.data_reserva = datetime.now().isoformat()
+        animal.nome_reservante = adotante.nome
+
+    def _aplicar_adocao(self, animal: Animal, adotante: Adotante) -> Taxa:
+        """Valida e aplica a adoção em memória, sem persistir nem notificar.
+
+        Args:
+            animal (Animal): O animal a ser adotado.
+            adotante (Adotante): O adotante.
+
+        Returns:
+            Taxa: Taxa cobrada (valor em Decimal e rótulo).
+
+        Raises:
+            ReservaInvalidaError: Se o animal estiver reservado para outra pessoa.
+            TransicaoStatusError: Se o status não permitir adoção.
+            PoliticaNaoAtendidaError: Se a política de adoção não for atendida.
+        """
+        if animal.status == StatusAnimal.RESERVADO and animal.nome_reservante != adotante.nome:
+            raise ReservaInvalidaError(f"Este animal está reservado para {animal.nome_reservante}.")
+
+        if animal.status not in [StatusAnimal.DISPONIVEL, StatusAnimal.RESERVADO]:
+            raise TransicaoStatusError(f"Status inválido ({animal.status.value}).")
+
+        self._exigir_politica_adocao(animal, adotante)
+
+        taxa = self.motor_taxas.cotar(animal, adotante)
+        animal.mudar_status(StatusAnimal.ADOTADO)
+        return taxa
+
+    def _aplicar_devolucao(self, animal: Animal, motivo: str) -> StatusAnimal:
+        """Valida e aplica a devolução em memória, triando o animal pelo motivo.
+
+        Args:
+            animal (Animal): O animal devolvido.
+            motivo (str): Motivo da devolução.
+
+        Returns:
+            StatusAnimal: O status final do animal após a triagem.
+
+        Raises:
+            TransicaoStatusError: Se o animal não estiver adotado.
+        """
+        if animal.status != StatusAnimal.ADOTADO:
+            raise TransicaoStatusError("Apenas animais adotados podem ser devolvidos.")
+
+        animal.mudar_status(StatusAnimal.DEVOLVIDO)
+        animal.adicionar_evento(f"{PREFIXO_MOTIVO_DEVOLUCAO}{motivo}")
+        animal.mudar_status(self.classificador_devolucao.classificar(motivo))
+        return animal.status
+
+    def _aplicar_vacina(self, animal: Animal, nome_vacina: str) -> None:
+        """Aplica a vacina em memória, sem persistir.
+
+        Args:
+            animal (Animal): O animal.
+            nome_vacina (str): Nome da vacina.
+
+        Raises:
+            RegraNegocioError: Se o animal não suportar vacinação.
+        """
+        if not hasattr(animal, 'vacinar'):
+            raise RegraNegocioError(f"{animal.nome} não pode ser vacinado.")
+        animal.vacinar(nome_vacina)
+
+    @staticmethod
+    def _evento_adocao(animal: Animal, adotante: Adotante, taxa: Taxa) -> Evento:
+        """Monta o evento estruturado de uma adoção."""
+        return Evento(
+            "ADOÇÃO",
+            f"ADOÇÃO: {adotante.nome} adotou {animal.nome}. Taxa: {taxa}",
+            animal=animal.nome,
+            adotante=adotante.nome,
+            taxa=taxa.valor
+        )
+
+    def reservar_animal(self, idx_animal: int, idx_adotante: int) -> ResultadoReserva:
+        """Reserva um animal disponível para um adotante.
+
+        Args:
+            idx_animal (int): Índice do animal.
+            idx_adotante (int): Índice do adotante.
+
+        Returns:
+            ResultadoReserva: Dados da reserva confirmada.
+
+        Raises:
+            AnimalReservadoError: Se já houver reserva de outra pessoa (a fila de espera é a alternativa).
+            AdocaoError: Demais violações de regra de negócio ou índice inválido.
+        """
+        with self._travar([idx_animal], [idx_adotante]):
+            animal, adotante = self._buscar_por_indice(idx_animal, idx_adotante)
+            self._aplicar_reserva(animal, adotante)
+            self._persistir_animais(animal)
+            return ResultadoReserva(animal, adotante, self.settings['reserva_horas'])
+
+    def realizar_adocao(self, idx_animal: int, idx_adotante: int) -> ResultadoAdocao:
+        """Efetiva a adoção de um animal, calculando taxas e atualizando status.
+
+        Args:
+            idx_animal (int): Índice do animal.
+            idx_adotante (int): Índice do adotante.
+
+        Returns:
+            ResultadoAdocao: Animal, tutor e taxa cobrada.
+
+        Raises:
+            AdocaoError: Se alguma regra de negócio impedir a adoção ou o índice for inválido.
+        """
+        with self._travar([idx_animal], [idx_adotante]):
+            animal, adotante = self._buscar_por_indice(idx_animal, idx_adotante)
+            taxa = self._aplicar_adocao(animal, adotante)
+            self._persistir_animais(animal)
+
+            self.notificar_observadores(self._evento_adocao(animal, adotante, taxa))
+            return ResultadoAdocao(animal, adotante, taxa)
+
+    def processar_devolucao(self, idx_animal: int, motivo: str) -> ResultadoDevolucao:
+        """Processa a devolução de um animal adotado, definindo o novo status.
+
+        Args:
+            idx_animal (int): Índice do animal.
+            motivo (str): Motivo da devolução.
+
+        Returns:
+            ResultadoDevolucao: Animal, motivo e status final.
+
+        Raises:
+            AdocaoError: Se o animal não estiver adotado ou o índice for inválido.
+        """
+        with self._travar([idx_animal]):
+            animal = self.buscar_animal(idx_animal)
+            status = self._aplicar_devolucao(animal, motivo)
+            self._persistir_animais(animal)
+            return ResultadoDevolucao(animal, motivo, status)
+
+    def entrar_fila_espera(self, idx_animal: int, idx_adotante: int) -> ResultadoFila:
+        """Adiciona um adotante à fila de espera de um animal.
+
+        Args:
+            idx_animal (int): Índice do animal.
+            idx_adotante (int): Índice do adotante.
+
+        Returns:
+            ResultadoFila: Score, detalhes e posição na fila (0 se já estava na fila).
+
+        Raises:
+            AdocaoError: Se o adotante for o titular, não cumprir a política ou o índice for inválido.
+        """
+        with self._travar([idx_animal], [idx_adotante]):
+            animal, adotante = self._buscar_por_indice(idx_animal, idx_adotante)
+            if animal.nome_reservante == adotante.nome:
+                raise ReservaInvalidaError(f"{adotante.nome}, você já é o titular da reserva!")
+            self._exigir_politica_adocao(animal, adotante)
+
+            score, detalhes = self._calcular_compatibilidade(animal, adotante)
+            animal.fila_espera.adicionar(adotante, score)
+            animal.adicionar_evento(f"{adotante.nome} entrou na fila (Score: {score}).")
+            self._persistir_animais(animal)
+
+            posicao = 0
+            for i, item in enumerate(animal.fila_espera.interessados):
+                if item['adotante'].nome == adotante.nome:
+                    posicao = i + 1
+                    break
+            return ResultadoFila(animal, adotante, score, detalhes, posicao)
+
+    def processar_reservas_vencidas(self) -> List[ResultadoExpiracao]:
+        """Verifica reservas que excederam o tempo limite e passa para o próximo da fila.
+
+        Returns:
+            List[ResultadoExpiracao]: Uma entrada por reserva vencida.
+        """
+        agora = datetime.now()
+        horas_limite = self.settings["reserva_horas"]
+        expiradas: List[ResultadoExpiracao] = []
+
+        with self.trava_estrutura.compartilhada():
+            for idx, animal in enumerate(self.animais):
+                with self.travas.travar([idx]):
+                    resultado = self._expirar_reserva(animal, agora, horas_limite)
+                if resultado is not None:
+                    expiradas.append(resultado)
+            if expiradas:
+                self._persistir_animais(*(r.animal for r in expiradas))
+        return expiradas
+
+    def _expirar_reserva(self, animal: Animal, agora: datetime, horas_limite: float) -> Optional[ResultadoExpiracao]:
+        """Cancela a reserva do animal se ela venceu, passando-a ao próximo da fila.
+
+        Returns:
+            Optional[ResultadoExpiracao]: A expiração, ou None se a reserva ainda vale.
+        """
+        if animal.status != StatusAnimal.RESERVADO or not animal.data_reserva:
+            return None
+        horas_passadas = (agora - datetime.fromisoformat(animal.data_reserva)).total_seconds() / 3600
+        if horas_passadas <= horas_limite:
+            return None
+
+        old_dono = animal.nome_reservante
+        resultado = ResultadoExpiracao(animal, old_dono, horas_passadas)
+
+        proximo_adotante = animal.fila_espera.proximo()
+        if proximo_adotante:
+            animal.nome_reservante = proximo_adotante.nome
+            animal.data_reserva = agora.isoformat()
+            animal.adicionar_evento(f"Reserva expirada. Transferida p/ fila: {proximo_adotante.nome}")
+            resultado.novo_titular = proximo_adotante.nome
+        else:
+            animal.mudar_status(StatusAnimal.DISPONIVEL)
+            animal.adicionar_evento("Reserva expirada. Animal liberado.")
+
+        self.notificar_observadores(Evento(
+            "EXPIRAÇÃO",
+            f"EXPIRAÇÃO: Reserva de {animal.nome} (Tutor: {old_dono}) venceu e foi cancelada.",
+            animal=animal.nome,
+            adotante=old_dono
+        ))
+        return resultado
+
+    def retriar_devolucoes(self, aplicar: bool = False) -> List[ResultadoTriagem]:
+        """Reclassifica devoluções antigas com as palavras-chave atuais da triagem.
+
+        Considera o último motivo de devolução registrado no histórico de cada
+        animal que ainda está no destino da triagem (Disponível, Quarentena ou
+        Inadotável). Os motivos são classificados de uma vez só.
+
+        Args:
+            aplicar (bool, optional): Aplica o novo status quando ele difere do atual
+                e a transição é permitida. Defaults to False (apenas sugere).
+
+        Returns:
+            List[ResultadoTriagem]: Uma entrada por animal com motivo registrado.
+        """
+        with self.trava_estrutura.exclusiva():
+            destinos = (StatusAnimal.DISPONIVEL, StatusAnimal.QUARENTENA, StatusAnimal.INADOTAVEL)
+            candidatos = []
+            for animal in self.animais:
+                if animal.status not in destinos:
+                    continue
+                for evento in reversed(animal.historico_eventos):
+                    _, separador, motivo = evento.partition(PREFIXO_MOTIVO_DEVOLUCAO)
+                    if separador:
+                        candidatos.append((animal, motivo))
+                        break
+
+            sugestoes = self.classificador_devolucao.classificar_lote(m for _, m in candidatos)
+            resultados = []
+            for (animal, motivo), sugerido in zip(candidatos, sugestoes):
+                resultado = ResultadoTriagem(animal, motivo, animal.status, sugerido)
+                if aplicar and sugerido != animal.status and animal.pode_mudar_para(sugerido):
+                    animal.mudar_status(sugerido)
+                    animal.adicionar_evento("Devolução re-triada.")
+                    resultado.aplicado = True
+                resultados.append(resultado)
+
+            if any(r.aplicado for r in resultados):
+                self._persistir_animais(*(r.animal for r in resultados if r.aplicado))
+            return resultados
+
+    def detalhes_fila(self, idx_animal: int) -> DetalhesFila:
+        """Consulta a reserva atual e a fila de espera de um animal.
+
+        Args:
+            idx_animal (int): Índice do animal.
+
+        Returns:
+            DetalhesFila: Titular, tempo restante e interessados.
+
+        Raises:
+            EntidadeNaoEncontradaError: Se o índice for inválido.
+        """
+        animal = self.buscar_animal(idx_animal)
+        titular = None
+        restante = None
+        if animal.status == StatusAnimal.RESERVADO and animal.data_reserva:
+            dt = datetime.fromisoformat(animal.data_reserva)
+            expira_em = dt + timedelta(hours=self.settings["reserva_horas"])
+            restante = expira_em - datetime.now()
+            titular = animal.nome_reservante
+        return DetalhesFila(animal, titular, restante, list(animal.fila_espera.interessados))
+
+    def vacinar_animal(self, idx_animal: int, nome_vacina: str) -> Animal:
+        """Aplica vacina em um animal, se a classe dele suportar.
+
+        Args:
+            idx_animal (int): Índice do animal.
+            nome_vacina (str): Nome da vacina.
+
+        Returns:
+            Animal: O animal vacinado.
+
+        Raises:
+            RegraNegocioError: Se o animal não puder ser vacinado.
+        """
+        with self._travar([idx_animal]):
+            animal = self.buscar_animal(idx_animal)
+            self._aplicar_vacina(animal, nome_vacina)
+            self._persistir_animais(animal)
+            return animal
+
+    def treinar_animal(self, idx_animal: int) -> Animal:
+        """Aplica treinamento em um animal, se a classe dele suportar.
+
+        Args:
+            idx_animal (int): Índice do animal.
+
+        Returns:
+            Animal: O animal treinado.
+
+        Raises:
+            RegraNegocioError: Se o animal não puder ser treinado.
+        """
+        with self._travar([idx_animal]):
+            animal = self.buscar_animal(idx_animal)
+            if not hasattr(animal, 'treinar'):
+                raise RegraNegocioError(f"{animal.nome} não pode ser treinado.")
+            animal.treinar()
+            self._persistir_animais(animal)
+            return animal
+
+    def executar_lote(self, operacoes: List[OperacaoLote], atomico: bool = True) -> ResultadoLote:
+        """Executa várias operações de reserva, adoção, vacinação e devolução com uma única gravação.
+
+        Todas as operações são validadas antes de qualquer alteração (índices,
+        campos obrigatórios, suporte a vacina). No modo atômico, qualquer falha
+        cancela o lote inteiro e desfaz o que já tinha sido aplicado; no modo
+        de melhor esforço, cada operação tem seu próprio resultado. Os animais
+        são salvos uma única vez e as notificações só saem após a gravação.
+
+        Args:
+            operacoes (List[OperacaoLote]): Operações, aplicadas na ordem informada.
+            atomico (bool, optional): Tudo-ou-nada (True) ou melhor esforço (False). Defaults to True.
+
+        Returns:
+            ResultadoLote: Resultado consolidado com um item por operação.
+        """
+        with self.trava_estrutura.exclusiva():
+            resultado = ResultadoLote(atomico=atomico)
+            resolvidas = []
+            for posicao, operacao in enumerate(operacoes):
+                item = ResultadoItemLote(posicao, operacao, sucesso=False)
+                resultado.itens.append(item)
+                try:
+                    resolvidas.append((item, *self._resolver_operacao_lote(operacao)))
+                except (ValueError, AdocaoError) as e:
+                    item.mensagem, item.erro = str(e), self._como_erro_adocao(e)
+
+            if atomico and len(resolvidas) < len(operacoes):
+                self._cancelar_lote(resultado, "Lote cancelado na validação.")
+                return resultado
+
+            copias: Dict[int, Dict[str, Any]] = {}
+            eventos: List[Evento] = []
+            alterados: Dict[int, Animal] = {}
+            for item, _, adotante in resolvidas:
+                idx = item.operacao.idx_animal
+                # Relido a cada item: uma falha anterior pode ter restaurado (recriado) o animal.
+                animal = self.animais[idx]
+                # Cópia profunda: to_dict compartilha as listas (histórico, vacinas) com o animal.
+                copia = copy.deepcopy(animal.to_dict())
+                copias.setdefault(idx, copia)
+                try:
+                    item.mensagem, evento = self._aplicar_operacao_lote(item.operacao, animal, adotante)
+                    item.sucesso = True
+                    alterados[idx] = animal
+                    if evento: eventos.append(evento)
+                except (ValueError, AdocaoError) as e:
+                    item.mensagem, item.erro = str(e), self._como_erro_adocao(e)
+                    if atomico:
+                        self._restaurar_animais(copias)
+                        self._cancelar_lote(resultado, "Lote desfeito: outra operação falhou.")
+                        return resultado
+                    # Melhor esforço: desfaz só esta operação, que pode ter alterado o animal pela metade.
+                    self._restaurar_animais({idx: copia})
+                    if idx in alterados:
+                        alterados[idx] = self.animais[idx]
+
+            if resultado.sucessos:
+                self._persistir_animais(*alterados.values())
+                resultado.aplicado = True
+                for evento in eventos:
+                    self.notificar_observadores(evento)
+            return resultado
+
+    def reservar_lote(self, pares: List[Tuple[int, int]], atomico: bool = True) -> ResultadoLote:
+        """Reserva vários animais de uma vez.
+
+        Args:
+            pares (List[Tuple[int, int]]): Pares (índice do animal, índice do adotante).
+            atomico (bool, optional): Tudo-ou-nada. Defaults to True.
+
+        Returns:
+            ResultadoLote: Resultado consolidado.
+        """
+        return self.executar_lote([OperacaoLote(TipoOperacao.RESERVAR, a, d) for a, d in pares], atomico)
+
+    def adotar_lote(self, pares: List[Tuple[int, int]], atomico: bool = True) -> ResultadoLote:
+        """Efetiva várias adoções de uma vez.
+
+        Args:
+            pares (List[Tuple[int, int]]): Pares (índice do animal, índice do adotante).
+            atomico (bool, optional): Tudo-ou-nada. Defaults to True.
+
+        Returns:
+            ResultadoLote: Resultado consolidado.
+        """
+        return self.executar_lote([OperacaoLote(TipoOperacao.ADOTAR, a, d) for a, d in pares], atomico)
+
+    def vacinar_lote(self, indices: List[int], nome_vacina: str, atomico: bool = True) -> ResultadoLote:
+        """Aplica a mesma vacina em vários animais (ex: dia de vacinação).
+
+        Args:
+            indices (List[int]): Índices dos animais.
+            nome_vacina (str): Nome da vacina.
+            atomico (bool, optional): Tudo-ou-nada. Defaults to True.
+
+        Returns:
+            ResultadoLote: Resultado consolidado.
+        """
+        return self.executar_lote([OperacaoLote(TipoOperacao.VACINAR, i, argumento=nome_vacina) for i in indices], atomico)
+
+    def devolver_lote(self, devolucoes: List[Tuple[int, str]], atomico: bool = True) -> ResultadoLote:
+        """Processa várias devoluções de uma vez.
+
+        Args:
+            devolucoes (List[Tuple[int, str]]): Pares (índice do animal, motivo).
+            atomico (bool, optional): Tudo-ou-nada. Defaults to True.
+
+        Returns:
+            ResultadoLote: Resultado consolidado.
+        """
+        return self.executar_lote([OperacaoLote(TipoOperacao.DEVOLVER, i, argumento=m) for i, m in devolucoes], atomico)
+
+    def _resolver_operacao_lote(self, operacao: OperacaoLote) -> Tuple[Animal, Optional[Adotante]]:
+        """Valida os campos de uma operação de lote e recupera as entidades envolvidas.
+
+        Args:
+            operacao (OperacaoLote): A operação.
+
+        Returns:
+            Tuple[Animal, Optional[Adotante]]: Animal e adotante (se aplicável).
+
+        Raises:
+            OperacaoInvalidaError: Se faltar algum campo obrigatório.
+            EntidadeNaoEncontradaError: Se algum índice for inválido.
+            RegraNegocioError: Se o animal não suportar vacinação.
+        """
+        precisa_adotante = operacao.tipo in (TipoOperacao.RESERVAR, TipoOperacao.ADOTAR)
+        if precisa_adotante and operacao.idx_adotante is None:
+            raise OperacaoInvalidaError(f"Operação '{operacao.tipo.value}' exige o índice do adotante.")
+        if not precisa_adotante and operacao.argumento is None:
+            raise OperacaoInvalidaError(f"Operação '{operacao.tipo.value}' exige um argumento (vacina ou motivo).")
+
+        animal, adotante = self._buscar_por_indice(operacao.idx_animal, operacao.idx_adotante if precisa_adotante else None)
+        if operacao.tipo == TipoOperacao.VACINAR and not hasattr(animal, 'vacinar'):
+            raise RegraNegocioError(f"{animal.nome} não pode ser vacinado.")
+        return animal, adotante
+
+    def _aplicar_operacao_lote(self, operacao: OperacaoLote, animal: Animal, adotante: Optional[Adotante]) -> Tuple[str, Optional[Evento]]:
+        """Aplica uma operação de lote já resolvida.
+
+        Args:
+            operacao (OperacaoLote): A operação.
+            animal (Animal): Animal envolvido.
+            adotante (Optional[Adotante]): Adotante envolvido, se houver.
+
+        Returns:
+            Tuple[str, Optional[Evento]]: Mensagem de sucesso e evento a notificar (se houver).
+        """
+        if operacao.tipo == TipoOperacao.RESERVAR:
+            self._aplicar_reserva(animal, adotante)
+            return f"{animal.nome} reservado para {adotante.nome}.", None
+        if operacao.tipo == TipoOperacao.ADOTAR:
+            taxa = self._aplicar_adocao(animal, adotante)
+            return f"{adotante.nome} adotou {animal.nome}.", self._evento_adocao(animal, adotante, taxa)
+        if operacao.tipo == TipoOperacao.VACINAR:
+            self._aplicar_vacina(animal, operacao.argumento)
+            return f"{animal.nome} vacinado contra {operacao.argumento}.", None
+        novo_status = self._aplicar_devolucao(animal, operacao.argumento)
+        return f"{animal.nome} devolvido. Novo status: {novo_status.value}.", None
+
+    def _restaurar_animais(self, copias: Dict[int, Dict[str, Any]]) -> None:
+        """Desfaz alterações em memória recriando os animais a partir das cópias.
+
+        Args:
+            copias (Dict[int, Dict[str, Any]]): Índice do animal -> estado serializado anterior.
+        """
+        for idx, dados in copias.items():
+            antigo = self.animais[idx]
+            restaurado = Animal.from_dict(dados)
+            self.animais[idx] = restaurado
+            self.indice_popularidade.remover(antigo)
+            self.indice_popularidade.registrar(restaurado)
+            self.indice_busca.remover(antigo)
+            self.indice_busca.registrar(restaurado)
+            self.indice_elegibilidade.invalidar_animal(antigo)
+
+    @staticmethod
+    def _cancelar_lote(resultado: ResultadoLote, motivo: str) -> None:
+        """Marca todos os itens de um lote atômico como não aplicados.
+
+        Args:
+            resultado (ResultadoLote): Resultado em construção.
+            motivo (str): Mensagem para os itens que não falharam por conta própria.
+        """
+        for item in resultado.itens:
+            if item.erro is None:
+                item.sucesso = False
+                item.mensagem = motivo
+
+    @staticmethod
+    def _como_erro_adocao(erro: Exception) -> AdocaoError:
+        """Converte erros genéricos (ex: ValueError) em AdocaoError para o resultado do lote."""
+        return erro if isinstance(erro, AdocaoError) else OperacaoInvalidaError(str(erro))
+
+    def estatisticas(self) -> EstatisticasAbrigo:
+        """Calcula os números do relatório estatístico do abrigo.
+
+        O resultado fica em cache até a próxima alteração de dados ou de configurações.
+
+        Returns:
+            EstatisticasAbrigo: Populares, taxas por espécie, tempo médio e contagens de status.
+        """
+        return self._em_cache("estatisticas", self._calcular_estatisticas)
+
+    def _calcular_estatisticas(self) -> EstatisticasAbrigo:
+        """Percorre os animais e monta as estatísticas (sem cache)."""
+        with self.trava_estrutura.compartilhada():
+            contagem = {status: 0 for status in StatusAnimal}
+            for animal in self.animais:
+                contagem[animal.status] += 1
+
+            return EstatisticasAbrigo(
+                gerado_em=datetime.now(),
+                populares=self.animais_mais_populares(5),
+                caes=self._calcular_taxa_adocao_por_tipo(Cachorro),
+                gatos=self._calcular_taxa_adocao_por_tipo(Gato),
+                tempo_medio_dias=self._calcular_tempo_medio_adocao(),
+                quarentena=contagem[StatusAnimal.QUARENTENA],
+                inadotaveis=contagem[StatusAnimal.INADOTAVEL],
+                devolvidos=contagem[StatusAnimal.DEVOLVIDO]
+            )
+
+    def registrar_metricas(self, momento: Optional[datetime] = None) -> AmostraMetricas:
+        """Grava na série temporal uma amostra dos contadores atuais.
+
+        Args:
+            momento (Optional[datetime], optional): Instante da amostra. Defaults to agora.
+
+        Returns:
+            AmostraMetricas: A amostra gravada.
+        """
+        valores = dict.fromkeys(("caes_total", "caes_adotados", "gatos_total", "gatos_adotados", "fila_total"), 0)
+        contagem = {status: 0 for status in StatusAnimal}
+        for animal in self.animais:
+            contagem[animal.status] += 1
+            valores["fila_total"] += len(animal.fila_espera)
+            especie = "caes" if isinstance(animal, Cachorro) else "gatos" if isinstance(animal, Gato) else None
+            if especie:
+                valores[f"{especie}_total"] += 1
+                if animal.status == StatusAnimal.ADOTADO:
+                    valores[f"{especie}_adotados"] += 1
+        valores.update(
+            disponiveis=contagem[StatusAnimal.DISPONIVEL],
+            reservados=contagem[StatusAnimal.RESERVADO],
+            quarentena=contagem[StatusAnimal.QUARENTENA],
+            inadotaveis=contagem[StatusAnimal.INADOTAVEL],
+            devolvidos=contagem[StatusAnimal.DEVOLVIDO]
+        )
+        amostra = AmostraMetricas(momento or datetime.now(), valores)
+        self.metricas.registrar(amostra)
+        self._ultima_amostra = amostra.momento
+        return amostra
+
+    def _amostrar_metricas_se_preciso(self) -> None:
+        """Grava uma amostra se a última tiver mais de "intervalo_metricas_segundos" (0 desativa).
+
+        Chamado depois de gravar os animais, para não atrasar a gravação. Fora do
+        primeiro uso (que lê o instante da última amostra do banco) e de uma vez
+        por intervalo, custa só uma comparação de horários. Uma falha ao gravar a
+        amostra não desfaz a operação: vai para o log e fica para o próximo intervalo.
+        """
+        intervalo = self.settings.get("intervalo_metricas_segundos", 0)
+        if not intervalo:
+            return
+        agora = datetime.now()
+        if self._ultima_amostra is not None and agora - self._ultima_amostra < timedelta(seconds=intervalo):
+            return
+        try:
+            if self._ultima_amostra is None:
+                ultima = self.metricas.ultima()
+                self._ultima_amostra = ultima.momento if ultima else datetime.min
+            if agora - self._ultima_amostra >= timedelta(seconds=intervalo):
+                self.registrar_metricas(agora)
+        except Exception:
+            _log.exception("Falha ao gravar a amostra de métricas em %s", self.metricas.db_name)
+            self._ultima_amostra = agora
+
+    def tendencia_metricas(self, dias: int = 365, intervalo_dias: int = 7, agregacao: str = "ultimo") -> List[AmostraMetricas]:
+        """Lê a série de métricas dos últimos dias, com um ponto por intervalo.
+
+        Args:
+            dias (int, optional): Tamanho do período. Defaults to 365.
+            intervalo_dias (int, optional): Dias por ponto. Defaults to 7.
+            agregacao (str, optional): "ultimo", "media" ou "maximo". Defaults to "ultimo".
+
+        Returns:
+            List[AmostraMetricas]: Pontos em ordem cronológica.
+
+        Raises:
+            OperacaoInvalidaError: Se os parâmetros forem inválidos.
+        """
+        fim = datetime.now()
+        try:
+            return self.metricas.consultar(fim - timedelta(days=dias), fim, timedelta(days=intervalo_dias), agregacao)
+        except ValueError as e:
+            raise OperacaoInvalidaError(str(e))
+
+    def _calcular_taxa_adocao_por_tipo(self, classe_tipo: Type[Animal]) -> Dict[str, Any]:
+        """Calcula estatísticas de adoção para uma classe de animal específica.
+
+        Args:
+            classe_tipo (Type[Animal]): A classe (Cachorro ou Gato) para filtrar.
+
+        Returns:
+            Dict[str, Any]: Dicionário com total, adotados e taxa percentual.
+        """
+        total = 0
+        adotados = 0
+        for animal in self.animais:
+            if isinstance(animal, classe_tipo):
+                total += 1
+                if animal.status == StatusAnimal.ADOTADO: adotados += 1
+        taxa = (adotados / total * 100) if total > 0 else 0.0
+        return {"total": total, "adotados": adotados, "taxa": round(taxa, 1)}
+
+    def _calcular_tempo_medio_adocao(self) -> Optional[float]:
+        """Calcula o tempo médio entre cadastro e adoção baseado no histórico.
+
+        Returns:
+            Optional[float]: Média de dias ou None se não houver dados.
+        """
+        total_dias, count = self.somar_tempos_adocao()
+        if count == 0: return None
+        return total_dias / count
+
+    def somar_tempos_adocao(self) -> Tuple[float, int]:
+        """Soma os dias entre cadastro e adoção dos animais adotados, para médias entre abrigos.
+
+        Returns:
+            Tuple[float, int]: (total de dias, quantidade de adoções com as duas datas no histórico).
+        """
+        total_dias = 0
+        count = 0
+        for animal in self.animais:
+            if animal.status == StatusAnimal.ADOTADO:
+                data_entrada = None
+                data_adocao = None
+                for evento in animal.historico_eventos:
+                    if "Cadastrado" in evento:
+                        try:
+                            data_str = evento.split(']')[0].replace('[', '')
+                            data_entrada = datetime.strptime(data_str, "%Y-%m-%d %H:%M")
+                        except: pass
+                    if "Status alterado: Reservado -> Adotado" in evento or "Status alterado: Disponível -> Adotado" in evento:
+                        try:
+                            data_str = evento.split(']')[0].replace('[', '')
+                            data_adocao = datetime.strptime(data_str, "%Y-%m-%d %H:%M")
+                        except: pass
+                if data_entrada and data_adocao:
+                    diferenca = data_adocao - data_entrada
+                    total_dias += diferenca.total_seconds() / 86400
+                    count += 1
+        return total_dias, count
@@ -0,0 +1,256 @@
+import atexit
+import hashlib
+import json
+import logging
+import os
+import queue
+import threading
+from dataclasses import dataclass
+from typing import Dict, Iterable, Optional
+from .enums import PoliticaFilaCheia
+from .eventlog import Evento, ObservadorEventos
+from .observers import Observador
+
+_log = logging.getLogger(__name__)
+
+@dataclass
+class EstatisticasEntrega:
+    """Contadores de entrega de um observador no despacho assíncrono.
+
+    Attributes:
+        entregues (int): Eventos entregues com sucesso.
+        falhas (int): Eventos cujo observador lançou exceção.
+        descartados (int): Eventos descartados com a fila cheia (política DESCARTAR).
+        transbordados (int): Eventos gravados em disco com a fila cheia (política DISCO).
+    """
+    entregues: int = 0
+    falhas: int = 0
+    descartados: int = 0
+    transbordados: int = 0
+
+def entregar(observador: Observador, evento: Evento) -> None:
+    """Entrega o evento no formato que o observador entende.
+
+    Args:
+        observador (Observador): Destinatário.
+        evento (Evento): Evento a entregar.
+    """
+    if isinstance(observador, ObservadorEventos):
+        observador.receber(evento)
+    else:
+        observador.atualizar(evento.mensagem)
+
+class _CanalObservador:
+    """Fila limitada e thread de entrega exclusivas de um observador.
+
+    A ordem de entrega é a ordem de despacho, inclusive quando eventos passam
+    pelo disco: enquanto houver transbordo pendente, novos eventos também vão
+    para o disco, e a thread só volta à fila depois de reler o arquivo.
+    """
+
+    _ENCERRAR = object()
+
+    def __init__(self, observador: Observador, capacidade: int, politica: PoliticaFilaCheia, arquivo_transbordo: str) -> None:
+        self.observador = observador
+        self.politica = politica
+        self.arquivo_transbordo = arquivo_transbordo
+        self.estatisticas = EstatisticasEntrega()
+        self._fila: queue.Queue = queue.Queue(maxsize=capacidade)
+        self._trava = threading.Lock()
+        self._transbordando = os.path.exists(arquivo_transbordo)
+        self._pendentes = self._contar_transbordo() if self._transbordando else 0
+        self._ocioso = threading.Condition(self._trava)
+        self._thread = threading.Thread(target=self._executar, name=f"Despacho-{type(observador).__name__}", daemon=True)
+        self._thread.start()
+
+    def enviar(self, evento: Evento) -> None:
+        """Coloca o evento na fila, aplicando a política se ela estiver cheia."""
+        with self._trava:
+            self._pendentes += 1
+            if self._transbordando:
+                self._transbordar(evento)
+                return
+        try:
+            if self.politica == PoliticaFilaCheia.BLOQUEAR:
+                self._fila.put(evento)
+            else:
+                self._fila.put_nowait(evento)
+        except queue.Full:
+            with self._trava:
+                if self.politica == PoliticaFilaCheia.DISCO:
+                    self._transbordando = True
+                    self._transbordar(evento)
+                else:
+                    self.estatisticas.descartados += 1
+                    self._concluir(1)
+
+    def drenar(self, timeout: Optional[float] = None) -> bool:
+        """Espera até que todos os eventos enviados tenham sido processados."""
+        with self._ocioso:
+            return self._ocioso.wait_for(lambda: self._pendentes == 0, timeout)
+
+    def encerrar(self) -> None:
+        """Processa o que falta e encerra a thread."""
+        self._fila.put(self._ENCERRAR)
+        self._thread.join()
+
+    def _contar_transbordo(self) -> int:
+        """Conta os eventos deixados em disco por uma execução anterior."""
+        with open(self.arquivo_transbordo, "r", encoding="utf-8") as f:
+            return sum(1 for _ in f)
+
+    def _transbordar(self, evento: Evento) -> None:
+        """Grava o evento no arquivo de transbordo (chamado com a trava adquirida)."""
+        os.makedirs(os.path.dirname(self.arquivo_transbordo), exist_ok=True)
+        with open(self.arquivo_transbordo, "a", encoding="utf-8") as f:
+            f.write(json.dumps(evento.to_dict(), ensure_ascii=False) + "\n")
+        self.estatisticas.transbordados += 1
+
+    def _concluir(self, quantidade: int) -> None:
+        """Atualiza o contador de pendentes (chamado com a trava adquirida)."""
+        self._pendentes -= quantidade
+        if self._pendentes <= 0:
+            self._ocioso.notify_all()
+
+    def _entregar(self, evento: Evento) -> None:
+        try:
+            entregar(self.observador, evento)
+            self.estatisticas.entregues += 1
+        except Exception:
+            _log.exception("Falha ao entregar o evento %s a %s", evento.tipo, type(self.observador).__name__)
+            self.estatisticas.falhas += 1
+        with self._trava:
+            self._concluir(1)
+
+    def _reler_transbordo(self) -> None:
+        """Entrega os eventos gravados em disco, em ordem, e volta a usar a fila."""
+        while True:
+            with self._trava:
+                if not os.path.exists(self.arquivo_transbordo):
+                    self._transbordando = False
+                    return
+                lendo = self.arquivo_transbordo + ".lendo"
+                os.replace(self.arquivo_transbordo, lendo)
+            with open(lendo, "r", encoding="utf-8") as f:
+                for linha in f:
+                    self._entregar(Evento.from_dict(json.loads(linha)))
+            os.remove(lendo)
+
+    def _executar(self) -> None:
+        while True:
+            if self._transbordando and self._fila.empty():
+                self._reler_transbordo()
+            try:
+                item = self._fila.get(timeout=0.1)
+            except queue.Empty:
+                continue
+            if item is self._ENCERRAR:
+                if self._transbordando:
+                    self._reler_transbordo()
+                return
+            self._entregar(item)
+
+class DespachanteAssincrono:
+    """Entrega eventos aos observadores fora da thread da operação.
+
+    Cada observador tem a própria fila limitada e a própria thread de entrega,
+    então um observador lento não atrasa os outros nem a operação, e cada um
+    recebe os eventos na ordem em que foram despachados. Quando a fila de um
+    observador enche, a política define se quem despacha espera (BLOQUEAR), se
+    o evento é descartado (DESCARTAR) ou gravado em disco para entrega
+    posterior (DISCO). No encerramento, incluindo a saída do programa, todas as
+    filas e transbordos são entregues antes de parar.
+
+    Attributes:
+        capacidade (int): Tamanho máximo da fila de cada observador.
+        politica (PoliticaFilaCheia): Comportamento com a fila cheia.
+        pasta_transbordo (str): Pasta dos arquivos de transbordo (política DISCO).
+    """
+
+    def __init__(self, capacidade: int = 1000, politica: PoliticaFilaCheia = PoliticaFilaCheia.BLOQUEAR, pasta_transbordo: str = os.path.join("dados", "transbordo")) -> None:
+        """Inicializa o despachante.
+
+        Args:
+            capacidade (int, optional): Tamanho máximo de cada fila. Defaults to 1000.
+            politica (PoliticaFilaCheia, optional): Política com fila cheia. Defaults to BLOQUEAR.
+            pasta_transbordo (str, optional): Pasta de transbordo. Defaults to "dados/transbordo".
+        """
+        self.capacidade = capacidade
+        self.politica = politica
+        self.pasta_transbordo = os.path.abspath(pasta_transbordo)
+        self._canais: Dict[int, _CanalObservador] = {}
+        # Reentrante: despachar segura a trava enquanto cria canais em _canal.
+        self._trava = threading.RLock()
+        self._fechado = False
+        atexit.register(self.fechar)
+
+    def despachar(self, evento: Evento, observadores: Iterable[Observador]) -> None:
+        """Enfileira o evento para cada observador e retorna sem esperar a entrega.
+
+        Args:
+            evento (Evento): Evento a entregar.
+            observadores (Iterable[Observador]): Destinatários.
+
+        Raises:
+            RuntimeError: Se o despachante já foi fechado.
+        """
+        # Com a trava, fechar espera os despachos em andamento: nada é enfileirado depois do encerramento.
+        with self._trava:
+            if self._fechado:
+                raise RuntimeError("DespachanteAssincrono já foi fechado.")
+            for observador in observadores:
+                self._canal(observador).enviar(evento)
+
+    def drenar(self, timeout: Optional[float] = None) -> bool:
+        """Espera a entrega de tudo o que já foi despachado.
+
+        Args:
+            timeout (Optional[float], optional): Tempo máximo de espera por observador (s). Defaults to None.
+
+        Returns:
+            bool: True se todas as filas esvaziaram.
+        """
+        return all(canal.drenar(timeout) for canal in list(self._canais.values()))
+
+    def estatisticas(self) -> Dict[str, EstatisticasEntrega]:
+        """Contadores de entrega por observador.
+
+        Returns:
+            Dict[str, EstatisticasEntrega]: Nome da classe do observador -> contadores.
+        """
+        return {type(c.observador).__name__: c.estatisticas for c in self._canais.values()}
+
+    def fechar(self) -> None:
+        """Entrega tudo o que está pendente e encerra as threads."""
+        with self._trava:
+            if self._fechado:
+                return
+            self._fechado = True
+            canais = list(self._canais.values())
+        for canal in canais:
+            canal.encerrar()
+        atexit.unregister(self.fechar)
+
+    def _canal(self, observador: Observador) -> _CanalObservador:
+        """Retorna (criando se preciso) o canal de um observador."""
+        chave = id(observador)
+        canal = self._canais.get(chave)
+        if canal is None or canal.observador is not observador:
+            with self._trava:
+                canal = self._canais.get(chave)
+                if canal is None or canal.observador is not observador:
+                    canal = self._canais[chave] = _CanalObservador(observador, self.capacidade, self.politica, self._arquivo_transbordo(observador))
+        return canal
+
+    def _arquivo_transbordo(self, observador: Observador) -> str:
+        """Arquivo de transbordo do observador, derivado de ``identificador()`` para que
+        outra execução com o mesmo observador encontre os eventos deixados em disco
+        (chamado com a trava adquirida)."""
+        resumo = hashlib.sha1(observador.identificador().encode("utf-8")).hexdigest()[:12]
+        base = os.path.join(self.pasta_transbordo, f"{type(observador).__name__}-{resumo}")
+        em_uso = {c.arquivo_transbordo for c in self._canais.values()}
+        arquivo, n = f"{base}.jsonl", 1
+        while arquivo in em_uso:
+            n += 1
+            arquivo = f"{base}-{n}.jsonl"
+        return arquivo
@@ -1,5 +1,6 @@
+import uuid
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Callable
 from datetime import datetime
 from .enums import StatusAnimal, PorteAnimal, TipoMoradia
 from .exceptions import TransicaoStatusError
@@ -78,6 +79,8 @@ class Adotante(Pessoa):
         _moradia (TipoMoradia): Tipo de moradia (Casa, Apartamento, etc.).
         _area_util (float): Área útil da moradia em m².
         _tem_criancas (bool): Indica se há crianças na residência.
+        uid (str): Identificador estável, igual em todos os processos.
+        versao (int): Versão gravada no repositório quando o adotante foi lido (0 se nunca gravado).
     """
 
     def __init__(self, nome: str, contato: str, idade: int, moradia: TipoMoradia, area_util: float, tem_criancas: bool) -> None:
@@ -96,6 +99,8 @@ class Adotante(Pessoa):
         self._moradia = moradia
         self._area_util = area_util
         self._tem_criancas = tem_criancas
+        self.uid = uuid.uuid4().hex
+        self.versao = 0
 
     @property
     def idade(self) -> int:
@@ -129,7 +134,9 @@ class Adotante(Pessoa):
             "idade": self._idade,
             "moradia": self._moradia.value,
             "area_util": self._area_util,
-            "tem_criancas": self._tem_criancas
+            "tem_criancas": self._tem_criancas,
+            "uid": self.uid,
+            "versao": self.versao
         }
 
     @classmethod
@@ -142,7 +149,7 @@ class Adotante(Pessoa):
         Returns:
             Adotante: Instância criada.
         """
-        return cls(
+        obj = cls(
             nome=dados["nome"],
             contato=dados["contato"],
             idade=dados.get("idade", 18),
@@ -150,6 +157,9 @@ class Adotante(Pessoa):
             area_util=dados.get("area_util", 0.0),
             tem_criancas=dados.get("tem_criancas", False)
         )
+        obj.uid = dados.get("uid") or obj.uid
+        obj.versao = dados.get("versao", 0)
+        return obj
 
     def __str__(self) -> str:
         """Retorna representação textual do Adotante."""
@@ -160,11 +170,18 @@ class FilaEspera:
 
     Attributes:
         interessados (List[Dict[str, Any]]): Lista de dicionários contendo adotante, score e data.
+        ao_alterar (Optional[Callable[[FilaEspera], None]]): Callback chamado sempre que o tamanho da fila muda.
     """
 
     def __init__(self) -> None:
         """Inicializa a fila de espera vazia."""
         self.interessados: List[Dict[str, Any]] = []
+        self.ao_alterar: Optional[Callable[['FilaEspera'], None]] = None
+
+    def _notificar_alteracao(self) -> None:
+        """Avisa o interessado registrado (ex: índice de popularidade) que o tamanho mudou."""
+        if self.ao_alterar is not None:
+            self.ao_alterar(self)
 
     def adicionar(self, adotante: Adotante, score: int) -> None:
         """Adiciona um adotante à fila, ordenando por score (decrescente) e data (crescente).
@@ -185,6 +202,7 @@ class FilaEspera:
         self.interessados.append(novo_item)
         
         self.interessados.sort(key=lambda x: (-x['score'], x['data_entrada']))
+        self._notificar_alteracao()
 
     def proximo(self) -> Optional[Adotante]:
         """Retorna e remove o próximo adotante da fila (maior prioridade).
@@ -193,7 +211,9 @@ class FilaEspera:
             Optional[Adotante]: O próximo da fila ou None se estiver vazia.
         """
         if self.interessados:
-            return self.interessados.pop(0)['adotante']
+            adotante = self.interessados.pop(0)['adotante']
+            self._notificar_alteracao()
+            return adotante
         return None
 
     def __len__(self) -> int: 
@@ -228,6 +248,9 @@ class Animal(ABC):
         data_reserva (Optional[str]): Data da reserva, se houver.
         nome_reservante (Optional[str]): Nome de quem reservou, se houver.
         fila_espera (FilaEspera): Fila de interessados no animal.
+        uid (str): Identificador estável, igual em todos os processos.
+        versao (int): Versão gravada no repositório quando o animal foi lido (0 se nunca gravado).
+        ao_registrar_evento (Optional[Callable[[Animal, str], None]]): Callback chamado a cada novo evento no histórico.
     """
 
     def __init__(self, nome: str, raca: str, status: StatusAnimal, porte: PorteAnimal, temperamento: List[str]) -> None:
@@ -250,6 +273,9 @@ class Animal(ABC):
         self.data_reserva: Optional[str] = None
         self.nome_reservante: Optional[str] = None
         self.fila_espera = FilaEspera()
+        self.uid = uuid.uuid4().hex
+        self.versao = 0
+        self.ao_registrar_evento: Optional[Callable[['Animal', str], None]] = None
         
         if len(self.historico_eventos) == 0:
             self.adicionar_evento("Cadastrado no sistema.")
@@ -282,6 +308,8 @@ class Animal(ABC):
         """
         data_hora = datetime.now().strftime("%Y-%m-%d %H:%M")
         self.historico_eventos.append(f"[{data_hora}] {descricao}")
+        if self.ao_registrar_evento is not None:
+            self.ao_registrar_evento(self, descricao)
 
     def pode_mudar_para(self, novo_status: StatusAnimal) -> bool:
         """Verifica se a transição de status é permitida pelas regras de negócio.
@@ -387,7 +415,9 @@ class Cachorro(Animal, VacinavelMixin, AdestravelMixin):
             "nivel_adestramento": self.nivel_adestramento,
             "data_reserva": self.data_reserva,
             "nome_reservante": self.nome_reservante, 
-            "fila_espera": self.fila_espera.to_list_dict()
+            "fila_espera": self.fila_espera.to_list_dict(),
+            "uid": self.uid,
+            "versao": self.versao
         }
 
     @classmethod
@@ -413,6 +443,8 @@ class Cachorro(Animal, VacinavelMixin, AdestravelMixin):
         obj.nivel_adestramento = dados.get("nivel_adestramento", 0)
         obj.data_reserva = dados.get("data_reserva")
         obj.nome_reservante = dados.get("nome_reservante")
+        obj.uid = dados.get("uid") or obj.uid
+        obj.versao = dados.get("versao", 0)
         
         lista_fila = dados.get("fila_espera", [])
         for item in lista_fila:
@@ -468,7 +500,9 @@ class Gato(Animal, VacinavelMixin):
             "vacinas": self.agenda_vacinas,
             "data_reserva": self.data_reserva,
             "nome_reservante": self.nome_reservante,
-            "fila_espera": self.fila_espera.to_list_dict()
+            "fila_espera": self.fila_espera.to_list_dict(),
+            "uid": self.uid,
+            "versao": self.versao
         }
 
     @classmethod
@@ -493,6 +527,8 @@ class Gato(Animal, VacinavelMixin):
         obj.agenda_vacinas = dados.get("vacinas", {})
         obj.data_reserva = dados.get("data_reserva")
         obj.nome_reservante = dados.get("nome_reservante")
+        obj.uid = dados.get("uid") or obj.uid
+        obj.versao = dados.get("versao", 0)
         
         lista_fila = dados.get("fila_espera", [])
         for item in lista_fila:
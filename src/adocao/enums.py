@@ -18,4 +18,16 @@ class PorteAnimal(enum.Enum):
 class TipoMoradia(enum.Enum):
     """Define os tipos de moradia do adotante."""
     CASA = "Casa"
-    APTO = "Apartamento"    
\ No newline at end of file
+    APTO = "Apartamento"    
+
+class TipoOperacao(enum.Enum):
+    """Define as operações que podem ser executadas em lote."""
+    RESERVAR = "reservar"
+    ADOTAR = "adotar"
+    VACINAR = "vacinar"
+    DEVOLVER = "devolver"
+class PoliticaFilaCheia(enum.Enum):
+    """Define o que o despacho assíncrono faz quando a fila de um observador está cheia."""
+    BLOQUEAR = "bloquear"
+    DESCARTAR = "descartar"
+    DISCO = "disco"
@@ -0,0 +1,283 @@
+import atexit
+import glob
+import json
+import os
+import threading
+from abc import abstractmethod
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, Dict, Iterator, List, Optional
+from .observers import Observador
+
+@dataclass
+class Evento:
+    """Evento de negócio estruturado enviado aos observadores.
+
+    Attributes:
+        tipo (str): Tipo do evento, o prefixo da mensagem (ex: "ADOÇÃO", "EXPIRAÇÃO").
+        mensagem (str): Texto legível do evento, o mesmo gravado no log de texto.
+        animal (Optional[str]): Nome do animal envolvido.
+        adotante (Optional[str]): Nome do adotante envolvido.
+        taxa (Optional[Decimal]): Valor cobrado, quando houver.
+        momento (datetime): Quando o evento ocorreu.
+    """
+    tipo: str
+    mensagem: str
+    animal: Optional[str] = None
+    adotante: Optional[str] = None
+    taxa: Optional[Decimal] = None
+    momento: datetime = field(default_factory=datetime.now)
+
+    @classmethod
+    def de_mensagem(cls, mensagem: str) -> 'Evento':
+        """Cria um evento a partir de uma mensagem livre ("TIPO: descrição").
+
+        Args:
+            mensagem (str): Mensagem do evento.
+
+        Returns:
+            Evento: Evento com o tipo extraído do prefixo (ou "EVENTO").
+        """
+        prefixo, separador, _ = mensagem.partition(":")
+        tipo = prefixo if separador and prefixo.isupper() else "EVENTO"
+        return cls(tipo, mensagem)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serializa o evento para um dicionário compatível com JSON.
+
+        Returns:
+            Dict[str, Any]: Dados do evento.
+        """
+        return {
+            "momento": self.momento.isoformat(timespec="microseconds"),
+            "tipo": self.tipo,
+            "animal": self.animal,
+            "adotante": self.adotante,
+            "taxa": str(self.taxa) if self.taxa is not None else None,
+            "mensagem": self.mensagem
+        }
+
+    @classmethod
+    def from_dict(cls, dados: Dict[str, Any]) -> 'Evento':
+        """Cria um Evento a partir de um dicionário.
+
+        Args:
+            dados (Dict[str, Any]): Dicionário com os dados.
+
+        Returns:
+            Evento: Instância criada.
+        """
+        return cls(
+            tipo=dados["tipo"],
+            mensagem=dados.get("mensagem", ""),
+            animal=dados.get("animal"),
+            adotante=dados.get("adotante"),
+            taxa=Decimal(dados["taxa"]) if dados.get("taxa") is not None else None,
+            momento=datetime.fromisoformat(dados["momento"])
+        )
+
+class ObservadorEventos(Observador):
+    """Observador que recebe o evento estruturado em vez de apenas a mensagem."""
+
+    @abstractmethod
+    def receber(self, evento: Evento) -> None:
+        """Método chamado com o evento estruturado.
+
+        Args:
+            evento (Evento): O evento ocorrido.
+        """
+        pass
+
+    def atualizar(self, mensagem: str) -> None:
+        """Aceita mensagens livres convertendo-as em Evento.
+
+        Args:
+            mensagem (str): A mensagem do evento.
+        """
+        self.receber(Evento.de_mensagem(mensagem))
+
+class LogEventosJSONL(ObservadorEventos):
+    """Log de eventos em JSON Lines, segmentado por tamanho e por dia, com índice de offsets.
+
+    Cada segmento se chama ``<prefixo>-AAAAMMDD-NNN.jsonl``. O arquivo
+    ``<prefixo>.idx.json`` guarda, por segmento, o intervalo de tempo coberto,
+    o tamanho indexado e pontos de controle (momento -> byte) a cada
+    ``passo_indice`` registros. Uma consulta por período lê só os segmentos
+    que cruzam o período e começa no ponto de controle mais próximo.
+
+    É thread-safe: gravação, troca de segmento e escrita do índice acontecem
+    sob uma trava, de modo que observadores chamados de várias threads não
+    escrevem em um arquivo já fechado nem perdem registros na rotação.
+
+    Attributes:
+        pasta (str): Pasta dos segmentos e do índice.
+        prefixo (str): Prefixo dos nomes de arquivo.
+        tamanho_maximo (int): Tamanho (bytes) a partir do qual um novo segmento é aberto.
+        passo_indice (int): Registros entre dois pontos de controle do índice.
+    """
+
+    def __init__(self, pasta: str = os.path.join("dados", "eventos"), prefixo: str = "eventos", tamanho_maximo: int = 10 * 1024 * 1024, passo_indice: int = 256) -> None:
+        """Inicializa o log, carregando (e corrigindo, se preciso) o índice existente.
+
+        Args:
+            pasta (str, optional): Pasta dos segmentos. Defaults to "dados/eventos".
+            prefixo (str, optional): Prefixo dos arquivos. Defaults to "eventos".
+            tamanho_maximo (int, optional): Tamanho máximo de um segmento em bytes. Defaults to 10 MiB.
+            passo_indice (int, optional): Registros por ponto de controle. Defaults to 256.
+        """
+        self.pasta = os.path.abspath(pasta)
+        self.prefixo = prefixo
+        self.tamanho_maximo = tamanho_maximo
+        self.passo_indice = passo_indice
+        self._arquivo = None
+        self._segmento: Optional[Dict[str, Any]] = None
+        self._trava = threading.Lock()
+        self._indice: Dict[str, Dict[str, Any]] = self._carregar_indice()
+
+    def identificador(self) -> str:
+        """Nome da classe, pasta e prefixo dos segmentos."""
+        return f"{type(self).__name__}:{os.path.join(self.pasta, self.prefixo)}"
+
+    @property
+    def caminho_indice(self) -> str:
+        """str: Caminho do arquivo de índice."""
+        return os.path.join(self.pasta, f"{self.prefixo}.idx.json")
+
+    def segmentos(self) -> List[str]:
+        """Lista os segmentos existentes em ordem cronológica.
+
+        Returns:
+            List[str]: Nomes dos arquivos de segmento.
+        """
+        padrao = os.path.join(self.pasta, f"{self.prefixo}-*.jsonl")
+        return sorted(os.path.basename(c) for c in glob.glob(padrao))
+
+    def receber(self, evento: Evento) -> None:
+        """Grava o evento no segmento atual, abrindo um novo se necessário.
+
+        Args:
+            evento (Evento): O evento ocorrido.
+        """
+        dados = evento.to_dict()
+        linha = (json.dumps(dados, ensure_ascii=False) + "\n").encode("utf-8")
+        momento = dados["momento"]
+        dia = momento[:10].replace("-", "")
+
+        with self._trava:
+            segmento = self._segmento
+            if segmento is None or segmento["dia"] != dia or (segmento["bytes"] and segmento["bytes"] + len(linha) > self.tamanho_maximo):
+                segmento = self._abrir_segmento(dia)
+
+            if segmento["registros"] % self.passo_indice == 0:
+                segmento["pontos"].append([momento, segmento["bytes"]])
+            self._arquivo.write(linha)
+            self._arquivo.flush()
+            segmento["inicio"] = segmento["inicio"] or momento
+            segmento["fim"] = momento
+            segmento["bytes"] += len(linha)
+            segmento["registros"] += 1
+
+    def consultar(self, inicio: Optional[datetime] = None, fim: Optional[datetime] = None, tipo: Optional[str] = None) -> Iterator[Evento]:
+        """Percorre os eventos de um período, lendo apenas os segmentos necessários.
+
+        Args:
+            inicio (Optional[datetime], optional): Início do período (inclusivo). Defaults to None.
+            fim (Optional[datetime], optional): Fim do período (inclusivo). Defaults to None.
+            tipo (Optional[str], optional): Filtra pelo tipo do evento. Defaults to None.
+
+        Yields:
+            Evento: Eventos em ordem cronológica.
+        """
+        de = inicio.isoformat(timespec="microseconds") if inicio else ""
+        ate = fim.isoformat(timespec="microseconds") if fim else "9999"
+        with self._trava:
+            if self._arquivo is not None:
+                self._arquivo.flush()
+
+        for nome in self.segmentos():
+            # Cópia sob a trava: o segmento atual continua recebendo registros durante a leitura.
+            with self._trava:
+                info = self._indice.get(nome) or self._indexar_segmento(nome)
+                inicio_info, fim_info, pontos = info["inicio"], info["fim"], list(info["pontos"])
+            if not inicio_info or fim_info < de or inicio_info > ate:
+                continue
+            momentos = [p[0] for p in pontos]
+            posicao = bisect_right(momentos, de) - 1
+            offset = pontos[posicao][1] if posicao >= 0 else 0
+            with open(os.path.join(self.pasta, nome), "rb") as f:
+                f.seek(offset)
+                for linha in f:
+                    dados = json.loads(linha)
+                    if dados["momento"] < de:
+                        continue
+                    if dados["momento"] > ate:
+                        break
+                    if tipo is None or dados["tipo"] == tipo:
+                        yield Evento.from_dict(dados)
+
+    def fechar(self) -> None:
+        """Fecha o segmento atual e grava o índice (também ocorre automaticamente na saída)."""
+        with self._trava:
+            self._fechar_segmento()
+        atexit.unregister(self.fechar)
+
+    def _fechar_segmento(self) -> None:
+        """Fecha o arquivo do segmento atual e grava o índice (chamado com a trava)."""
+        if self._arquivo is not None:
+            self._arquivo.close()
+            self._arquivo = None
+            self._salvar_indice()
+        self._segmento = None
+
+    def _abrir_segmento(self, dia: str) -> Dict[str, Any]:
+        """Fecha o segmento atual (se houver) e abre o próximo segmento do dia (chamado com a trava)."""
+        if self._arquivo is None:
+            atexit.register(self.fechar)
+        self._fechar_segmento()
+        os.makedirs(self.pasta, exist_ok=True)
+        do_dia = [s for s in self.segmentos() if s.startswith(f"{self.prefixo}-{dia}-")]
+        numero = int(do_dia[-1].rsplit("-", 1)[1].split(".")[0]) + 1 if do_dia else 1
+        nome = f"{self.prefixo}-{dia}-{numero:03d}.jsonl"
+        self._arquivo = open(os.path.join(self.pasta, nome), "ab")
+        self._segmento = {"dia": dia, "inicio": None, "fim": None, "bytes": 0, "registros": 0, "pontos": []}
+        self._indice[nome] = self._segmento
+        return self._segmento
+
+    def _indexar_segmento(self, nome: str) -> Dict[str, Any]:
+        """Reconstrói a entrada de índice de um segmento lendo o arquivo inteiro."""
+        info = {"dia": nome.split("-")[-2], "inicio": None, "fim": None, "bytes": 0, "registros": 0, "pontos": []}
+        with open(os.path.join(self.pasta, nome), "rb") as f:
+            for linha in f:
+                momento = json.loads(linha)["momento"]
+                if info["registros"] % self.passo_indice == 0:
+                    info["pontos"].append([momento, info["bytes"]])
+                info["inicio"] = info["inicio"] or momento
+                info["fim"] = momento
+                info["bytes"] += len(linha)
+                info["registros"] += 1
+        self._indice[nome] = info
+        return info
+
+    def _carregar_indice(self) -> Dict[str, Dict[str, Any]]:
+        """Lê o índice e descarta entradas que não batem com o tamanho atual do segmento."""
+        try:
+            with open(self.caminho_indice, "r", encoding="utf-8") as f:
+                indice = json.load(f)
+        except (OSError, ValueError):
+            indice = {}
+        validas = {}
+        for nome, info in indice.items():
+            caminho = os.path.join(self.pasta, nome)
+            if os.path.exists(caminho) and os.path.getsize(caminho) == info.get("bytes"):
+                validas[nome] = info
+        return validas
+
+    def _salvar_indice(self) -> None:
+        """Grava o índice de forma atômica (arquivo temporário + rename)."""
+        os.makedirs(self.pasta, exist_ok=True)
+        temporario = self.caminho_indice + ".tmp"
+        with open(temporario, "w", encoding="utf-8") as f:
+            json.dump(self._indice, f, ensure_ascii=False)
+        os.replace(temporario, self.caminho_indice)
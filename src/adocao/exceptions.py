@@ -34,4 +34,29 @@ class ReservaInvalidaError(RegraNegocioError):
     Ex: Tentar reservar um animal que já está reservado para outro.
     (Baseado na sua imagem: ReservaInvalidaError)
     """
-    pass
\ No newline at end of file
+    pass
+
+class AnimalReservadoError(ReservaInvalidaError):
+    """
+    Ex: Tentar reservar um animal que já está reservado para outra pessoa.
+    O titular atual fica disponível para quem quiser oferecer a fila de espera.
+    """
+    def __init__(self, mensagem: str, titular: str) -> None:
+        super().__init__(mensagem)
+        self.titular = titular
+
+class OperacaoInvalidaError(AdocaoError):
+    """
+    Ex: Operação de lote sem o adotante ou sem o motivo exigido.
+    """
+    pass
+
+class ConflitoVersaoError(RepositorioError):
+    """
+    Ex: Outro processo alterou ou excluiu o mesmo animal depois que ele foi lido.
+    As alterações sem conflito já foram gravadas; as entidades em conflito
+    ficam em ``conflitos`` (lista de ConflitoVersao) com os dados atuais.
+    """
+    def __init__(self, mensagem: str, conflitos: list) -> None:
+        super().__init__(mensagem)
+        self.conflitos = conflitos
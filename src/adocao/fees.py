@@ -0,0 +1,157 @@
+from bisect import bisect_right
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from .domain import Animal, Adotante
+from .enums import PorteAnimal
+
+TABELA_TAXAS_PADRAO: Dict[str, Any] = {
+    "padrao": {"rotulo": "padrão", "valor": "50.00"},
+    "regras": [
+        {"rotulo": "sênior", "idade_minima": 60, "valor": "20.00"},
+        {"rotulo": "porte grande", "porte": "G", "valor": "80.00"}
+    ]
+}
+
+CENTAVOS = Decimal("0.01")
+
+@dataclass(frozen=True)
+class Taxa:
+    """Valor cobrado em uma adoção.
+
+    Attributes:
+        valor (Decimal): Valor em reais, com duas casas decimais.
+        rotulo (str): Regra que originou o valor (ex: "padrão", "sênior").
+    """
+    valor: Decimal
+    rotulo: str
+
+    def __str__(self) -> str:
+        """Retorna o texto usado no recibo (ex: "R$ 50.00 (padrão)")."""
+        return f"R$ {self.valor} ({self.rotulo})"
+
+@dataclass(frozen=True)
+class RegraTaxa:
+    """Uma linha da tabela de taxas. Critérios ausentes (None) aceitam qualquer valor.
+
+    Attributes:
+        taxa (Taxa): Taxa aplicada quando a regra casa.
+        idade_minima (Optional[int]): Idade mínima do adotante.
+        porte (Optional[PorteAnimal]): Porte exigido do animal.
+        especie (Optional[str]): Nome da classe exigida (ex: "Gato").
+    """
+    taxa: Taxa
+    idade_minima: Optional[int] = None
+    porte: Optional[PorteAnimal] = None
+    especie: Optional[str] = None
+
+def _ler_taxa(dados: Dict[str, Any]) -> Taxa:
+    """Converte uma entrada da tabela em Taxa, sem passar por float."""
+    return Taxa(Decimal(str(dados["valor"])).quantize(CENTAVOS), dados.get("rotulo", ""))
+
+def _ler_porte(valor: Optional[str]) -> Optional[PorteAnimal]:
+    """Aceita o porte pelo nome do membro ("G") ou pelo valor ("Grande")."""
+    if valor is None:
+        return None
+    if valor in PorteAnimal.__members__:
+        return PorteAnimal[valor]
+    return PorteAnimal(valor)
+
+class MotorTaxas:
+    """Calcula taxas de adoção a partir da tabela ``tabela_taxas`` das configurações.
+
+    As regras são avaliadas na ordem da tabela e a primeira que casar define a
+    taxa; se nenhuma casar, vale a taxa padrão. Como as regras só dependem do
+    porte, da faixa etária do adotante e da espécie, o resultado é memorizado
+    por essa chave e a maior parte das cotações é uma consulta de dicionário.
+
+    Attributes:
+        padrao (Taxa): Taxa usada quando nenhuma regra casa.
+        regras (List[RegraTaxa]): Regras em ordem de prioridade.
+    """
+
+    def __init__(self, tabela: Optional[Dict[str, Any]] = None) -> None:
+        """Compila a tabela de taxas.
+
+        Args:
+            tabela (Optional[Dict[str, Any]], optional): Tabela no formato de
+                TABELA_TAXAS_PADRAO. Defaults to TABELA_TAXAS_PADRAO.
+
+        Raises:
+            ValueError: Se algum valor ou porte da tabela for inválido.
+        """
+        tabela = tabela if tabela is not None else TABELA_TAXAS_PADRAO
+        try:
+            self.padrao = _ler_taxa(tabela["padrao"])
+            self.regras = [
+                RegraTaxa(_ler_taxa(r), r.get("idade_minima"), _ler_porte(r.get("porte")), r.get("especie"))
+                for r in tabela.get("regras", [])
+            ]
+        except (ArithmeticError, KeyError) as e:
+            raise ValueError(f"Tabela de taxas inválida: {e}")
+        self._limites_idade = sorted({r.idade_minima for r in self.regras if r.idade_minima is not None})
+        self._cache: Dict[Tuple[PorteAnimal, int, str], Taxa] = {}
+
+    @classmethod
+    def de_settings(cls, settings: Dict[str, Any]) -> 'MotorTaxas':
+        """Cria o motor a partir da chave "tabela_taxas" das configurações.
+
+        Args:
+            settings (Dict[str, Any]): Configurações do sistema.
+
+        Returns:
+            MotorTaxas: Motor compilado.
+        """
+        return cls(settings.get("tabela_taxas"))
+
+    def faixa_etaria(self, idade: int) -> int:
+        """Agrupa a idade pelos limites usados na tabela (0 = abaixo de todos).
+
+        Args:
+            idade (int): Idade do adotante.
+
+        Returns:
+            int: Índice da faixa etária.
+        """
+        return bisect_right(self._limites_idade, idade)
+
+    def _avaliar(self, porte: PorteAnimal, faixa: int, especie: str) -> Taxa:
+        """Percorre as regras para uma combinação ainda não memorizada."""
+        idade_faixa = self._limites_idade[faixa - 1] if faixa > 0 else -1
+        for regra in self.regras:
+            if regra.idade_minima is not None and idade_faixa < regra.idade_minima:
+                continue
+            if regra.porte is not None and regra.porte != porte:
+                continue
+            if regra.especie is not None and regra.especie != especie:
+                continue
+            return regra.taxa
+        return self.padrao
+
+    def cotar(self, animal: Animal, adotante: Adotante) -> Taxa:
+        """Calcula a taxa de uma adoção.
+
+        Args:
+            animal (Animal): O animal a ser adotado.
+            adotante (Adotante): O adotante.
+
+        Returns:
+            Taxa: Valor e rótulo da regra aplicada.
+        """
+        chave = (animal.porte, self.faixa_etaria(adotante.idade), type(animal).__name__)
+        taxa = self._cache.get(chave)
+        if taxa is None:
+            taxa = self._cache[chave] = self._avaliar(*chave)
+        return taxa
+
+    def cotar_lote(self, pares: Iterable[Tuple[Animal, Adotante]]) -> List[Taxa]:
+        """Calcula as taxas de muitas adoções hipotéticas de uma vez.
+
+        Args:
+            pares (Iterable[Tuple[Animal, Adotante]]): Pares (animal, adotante).
+
+        Returns:
+            List[Taxa]: Taxas na mesma ordem dos pares.
+        """
+        cotar = self.cotar
+        return [cotar(animal, adotante) for animal, adotante in pares]
@@ -0,0 +1,811 @@
+import heapq
+import math
+import re
+import threading
+from collections import Counter
+from bisect import bisect_left, insort
+from itertools import islice
+from operator import itemgetter
+from typing import AbstractSet, Callable, Dict, FrozenSet, Iterable, Iterator, List, Optional, Set, Tuple, Type
+from .domain import Animal, Adotante
+from .enums import StatusAnimal
+from .policy import PoliticaAdocao, classe_elegibilidade
+from .triage import normalizar_texto
+
+STATUS_ADOTAVEIS = (StatusAnimal.DISPONIVEL, StatusAnimal.RESERVADO)
+
+class IndicePopularidade:
+    """Índice mantido incrementalmente com o tamanho das filas de espera.
+
+    Cada animal com fila não vazia fica em um "balde" indexado pelo tamanho da
+    fila, separado por espécie. Os tamanhos ocupados ficam em uma lista ordenada,
+    então uma consulta top-k percorre apenas os baldes necessários, sem tocar
+    na lista completa de animais.
+
+    Attributes:
+        _registrados (Dict[int, Animal]): id(animal) -> animal acompanhado.
+        _tamanhos (Dict[int, Tuple[str, int]]): id(animal) -> (espécie, tamanho atual).
+        _baldes (Dict[str, Dict[int, Dict[int, Animal]]]): espécie -> tamanho -> {id(animal): animal}.
+        _ordem (Dict[str, List[int]]): espécie -> tamanhos ocupados em ordem crescente.
+        _trava (threading.RLock): Protege os baldes quando filas de animais diferentes
+            mudam em paralelo.
+    """
+
+    def __init__(self) -> None:
+        """Inicializa o índice vazio."""
+        self._registrados: Dict[int, Animal] = {}
+        self._tamanhos: Dict[int, Tuple[str, int]] = {}
+        self._baldes: Dict[str, Dict[int, Dict[int, Animal]]] = {}
+        self._ordem: Dict[str, List[int]] = {}
+        self._trava = threading.RLock()
+
+    def reconstruir(self, animais: Iterable[Animal]) -> None:
+        """Descarta o estado atual e indexa novamente todos os animais informados.
+
+        Args:
+            animais (Iterable[Animal]): Animais a serem indexados.
+        """
+        with self._trava:
+            for animal in self._registrados.values():
+                animal.fila_espera.ao_alterar = None
+            self._registrados.clear()
+            self._tamanhos.clear()
+            self._baldes.clear()
+            self._ordem.clear()
+            for animal in animais:
+                self.registrar(animal)
+
+    def registrar(self, animal: Animal) -> None:
+        """Passa a acompanhar a fila de espera do animal.
+
+        Args:
+            animal (Animal): Animal a ser indexado.
+        """
+        with self._trava:
+            self._registrados[id(animal)] = animal
+            animal.fila_espera.ao_alterar = lambda _fila, a=animal: self.atualizar(a)
+            self.atualizar(animal)
+
+    def remover(self, animal: Animal) -> None:
+        """Deixa de acompanhar o animal (ex: após exclusão).
+
+        Args:
+            animal (Animal): Animal a ser removido do índice.
+        """
+        with self._trava:
+            animal.fila_espera.ao_alterar = None
+            self._retirar_do_balde(id(animal))
+            self._tamanhos.pop(id(animal), None)
+            self._registrados.pop(id(animal), None)
+
+    def atualizar(self, animal: Animal) -> None:
+        """Move o animal para o balde correspondente ao tamanho atual da fila.
+
+        Args:
+            animal (Animal): Animal cuja fila foi alterada.
+        """
+        with self._trava:
+            chave = id(animal)
+            especie = type(animal).__name__
+            tamanho = len(animal.fila_espera)
+
+            atual = self._tamanhos.get(chave)
+            if atual == (especie, tamanho):
+                return
+            self._retirar_do_balde(chave)
+
+            self._tamanhos[chave] = (especie, tamanho)
+            if tamanho > 0:
+                baldes = self._baldes.setdefault(especie, {})
+                if tamanho not in baldes:
+                    baldes[tamanho] = {}
+                    insort(self._ordem.setdefault(especie, []), tamanho)
+                baldes[tamanho][chave] = animal
+
+    def top_k(self, k: int, especie: Optional[Type[Animal]] = None, filtro: Optional[Callable[[Animal], bool]] = None) -> List[Tuple[Animal, int]]:
+        """Retorna os k animais com as maiores filas de espera.
+
+        Args:
+            k (int): Quantidade máxima de resultados.
+            especie (Optional[Type[Animal]], optional): Restringe a uma classe (Cachorro, Gato). Defaults to None.
+            filtro (Optional[Callable[[Animal], bool]], optional): Predicado adicional. Defaults to None.
+
+        Returns:
+            List[Tuple[Animal, int]]: Pares (animal, tamanho da fila) em ordem decrescente.
+        """
+        with self._trava:
+            if k <= 0:
+                return []
+            if especie is not None:
+                fontes = [self._percorrer(especie.__name__)]
+            else:
+                fontes = [self._percorrer(nome) for nome in self._ordem]
+
+            candidatos = heapq.merge(*fontes, key=lambda par: -par[1])
+            if filtro is not None:
+                candidatos = (par for par in candidatos if filtro(par[0]))
+            return list(islice(candidatos, k))
+
+    def tamanho_fila(self, animal: Animal) -> int:
+        """Retorna o tamanho de fila conhecido pelo índice.
+
+        Args:
+            animal (Animal): O animal consultado.
+
+        Returns:
+            int: Tamanho da fila (0 se não indexado).
+        """
+        return self._tamanhos.get(id(animal), ("", 0))[1]
+
+    def __len__(self) -> int:
+        """Retorna quantos animais possuem fila não vazia."""
+        return sum(len(balde) for baldes in self._baldes.values() for balde in baldes.values())
+
+    def _percorrer(self, especie: str) -> Iterator[Tuple[Animal, int]]:
+        """Gera (animal, tamanho) de uma espécie, das maiores filas para as menores."""
+        baldes = self._baldes.get(especie, {})
+        for tamanho in reversed(self._ordem.get(especie, [])):
+            for animal in baldes[tamanho].values():
+                yield animal, tamanho
+
+    def _retirar_do_balde(self, chave: int) -> None:
+        """Remove o animal do balde em que está, limpando baldes vazios."""
+        atual = self._tamanhos.get(chave)
+        if atual is None or atual[1] == 0:
+            return
+        especie, tamanho = atual
+        baldes = self._baldes[especie]
+        balde = baldes[tamanho]
+        balde.pop(chave, None)
+        if not balde:
+            del baldes[tamanho]
+            ordem = self._ordem[especie]
+            del ordem[bisect_left(ordem, tamanho)]
+
+
+class IndiceElegibilidade:
+    """Pré-filtro de elegibilidade baseado em bitmaps.
+
+    Cada adotante recebe uma máscara com um bit por classe de animal
+    (porte x temperamento) e cada animal recebe o índice do bit de sua classe.
+    Ambos ficam em cache, pelo ``uid``, até serem invalidados por edição,
+    troca da lista ou mudança de política, e a checagem de um par vira uma
+    operação de bits. O cache é pelo uid (e não por ``id()``, que o Python
+    reaproveita depois que o objeto é liberado) para que uma entidade nova
+    nunca herde a máscara de outra.
+
+    Attributes:
+        politica (PoliticaAdocao): Política compilada em uso.
+        _mascaras (Dict[str, int]): uid do adotante -> máscara de classes permitidas.
+        _classes (Dict[str, int]): uid do animal -> índice do bit da classe.
+    """
+
+    def __init__(self, politica: PoliticaAdocao) -> None:
+        """Inicializa o índice com a política informada.
+
+        Args:
+            politica (PoliticaAdocao): Política de adoção compilada.
+        """
+        self.politica = politica
+        self._mascaras: Dict[str, int] = {}
+        self._classes: Dict[str, int] = {}
+
+    def definir_politica(self, politica: PoliticaAdocao) -> None:
+        """Troca a política e descarta as máscaras calculadas com a anterior.
+
+        Args:
+            politica (PoliticaAdocao): Nova política compilada.
+        """
+        self.politica = politica
+        self._mascaras.clear()
+
+    def invalidar_adotante(self, adotante: Adotante) -> None:
+        """Descarta a máscara em cache de um adotante (ex: após edição)."""
+        self._mascaras.pop(adotante.uid, None)
+
+    def invalidar_animal(self, animal: Animal) -> None:
+        """Descarta a classe em cache de um animal (ex: após mudar porte/temperamento)."""
+        self._classes.pop(animal.uid, None)
+
+    def limpar_adotantes(self) -> None:
+        """Descarta todas as máscaras (ex: a lista de adotantes foi trocada ou recarregada)."""
+        self._mascaras.clear()
+
+    def limpar_animais(self) -> None:
+        """Descarta todas as classes (ex: a lista de animais foi trocada ou recarregada)."""
+        self._classes.clear()
+
+    def mascara(self, adotante: Adotante) -> int:
+        """Retorna a máscara de elegibilidade do adotante, calculando se necessário.
+
+        Args:
+            adotante (Adotante): O adotante.
+
+        Returns:
+            int: Bitmap das classes de animal permitidas.
+        """
+        chave = adotante.uid
+        bits = self._mascaras.get(chave)
+        if bits is None:
+            bits = self.politica.mascara(adotante)
+            self._mascaras[chave] = bits
+        return bits
+
+    def classe(self, animal: Animal) -> int:
+        """Retorna o índice do bit da classe do animal, calculando se necessário.
+
+        Args:
+            animal (Animal): O animal.
+
+        Returns:
+            int: Índice do bit (0 a 5).
+        """
+        chave = animal.uid
+        bit = self._classes.get(chave)
+        if bit is None:
+            bit = classe_elegibilidade(animal)
+            self._classes[chave] = bit
+        return bit
+
+    def elegivel(self, animal: Animal, adotante: Adotante) -> bool:
+        """Verifica, pelos bitmaps, se o adotante pode adotar o animal.
+
+        Args:
+            animal (Animal): O animal.
+            adotante (Adotante): O adotante.
+
+        Returns:
+            bool: True se a política permitir a adoção.
+        """
+        return bool(self.mascara(adotante) >> self.classe(animal) & 1)
+
+    def adotantes_elegiveis(self, animal: Animal, adotantes: Iterable[Adotante]) -> List[Tuple[int, Adotante]]:
+        """Lista os adotantes que podem adotar o animal.
+
+        Args:
+            animal (Animal): O animal.
+            adotantes (Iterable[Adotante]): Adotantes candidatos.
+
+        Returns:
+            List[Tuple[int, Adotante]]: Pares (índice, adotante) elegíveis.
+        """
+        bit = 1 << self.classe(animal)
+        mascara = self.mascara
+        return [(i, a) for i, a in enumerate(adotantes) if mascara(a) & bit]
+
+    def animais_elegiveis(self, adotante: Adotante, animais: Iterable[Animal], apenas_adotaveis: bool = True, em_cache: bool = True) -> List[Tuple[int, Animal]]:
+        """Lista os animais que o adotante pode adotar.
+
+        Args:
+            adotante (Adotante): O adotante.
+            animais (Iterable[Animal]): Animais candidatos.
+            apenas_adotaveis (bool, optional): Considera só animais Disponíveis ou Reservados. Defaults to True.
+            em_cache (bool, optional): Guarda a máscara do adotante; use False para adotantes
+                de fora da lista (ex: de outro abrigo), que nunca seriam invalidados. Defaults to True.
+
+        Returns:
+            List[Tuple[int, Animal]]: Pares (índice, animal) elegíveis.
+        """
+        bits = self.mascara(adotante) if em_cache else self.politica.mascara(adotante)
+        if bits == 0:
+            return []
+        classe = self.classe
+        return [
+            (i, a) for i, a in enumerate(animais)
+            if bits >> classe(a) & 1 and (not apenas_adotaveis or a.status in STATUS_ADOTAVEIS)
+        ]
+
+PESO_NOME = 8
+PESO_RACA = 4
+PESO_TEMPERAMENTO = 2
+PESO_HISTORICO = 1
+FATOR_PREFIXO = 0.4
+PREFIXO_MINIMO = 2
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+_DATA_EVENTO = re.compile(r"^\[[^\]]*\]\s*")
+# Palavras do histórico que aparecem em quase todo animal e só inchariam o índice.
+PALAVRAS_IGNORADAS_HISTORICO = frozenset({
+    "para", "com", "por", "uma", "que", "dos", "das", "nos", "nas", "pelo", "pela",
+    "cadastrado", "sistema", "status", "alterado"
+})
+
+def tokenizar(texto: str) -> List[str]:
+    """Quebra um texto em termos sem acentos e em caixa baixa.
+
+    Args:
+        texto (str): Texto livre (ex: "Siamês calmo").
+
+    Returns:
+        List[str]: Termos na ordem do texto (ex: ["siames", "calmo"]).
+    """
+    return _TOKEN.findall(normalizar_texto(texto))
+
+class IndiceBusca:
+    """Índice invertido para busca textual de animais.
+
+    Cada termo aponta para os animais em que aparece, com um peso que soma o
+    peso do campo (nome > raça > temperamento > histórico). Os termos ficam
+    também em uma lista ordenada, para que a busca por prefixo seja uma
+    busca binária. Consultas com vários termos exigem todos eles (E lógico):
+    a interseção começa pelo termo mais raro e os demais só são conferidos nos
+    candidatos restantes. O resultado é ordenado por relevância (peso x raridade
+    do termo; prefixos valem menos que termos exatos).
+
+    O índice é atualizado por animal: cadastro, edição e exclusão chamam
+    ``registrar``/``atualizar``/``remover``, e novos eventos de histórico
+    chegam pelo callback ``ao_registrar_evento`` do animal.
+
+    Internamente cada animal é identificado pela sua ordem de registro
+    (inteiros sequenciais espalham melhor nos dicionários que ``id()`` e
+    servem de desempate estável entre resultados de mesma relevância).
+
+    Attributes:
+        _chaves (Dict[int, int]): id(animal) -> chave (ordem de registro) do animal.
+        _registrados (Dict[int, Animal]): chave -> animal indexado.
+        _postagens (Dict[str, Dict[int, int]]): termo -> {chave: peso}.
+        _termos_animal (Dict[int, Dict[str, int]]): chave -> {termo: peso}, para remover e reindexar.
+        _vocabulario (List[str]): Termos em ordem alfabética (pode conter termos já sem animais).
+        _trava (threading.RLock): Protege o índice contra atualizações simultâneas.
+    """
+
+    def __init__(self) -> None:
+        """Inicializa o índice vazio."""
+        self._chaves: Dict[int, int] = {}
+        self._registrados: Dict[int, Animal] = {}
+        self._postagens: Dict[str, Dict[int, int]] = {}
+        self._termos_animal: Dict[int, Dict[str, int]] = {}
+        self._vocabulario: List[str] = []
+        self._termos_mortos = 0
+        self._proxima_chave = 0
+        self._trava = threading.RLock()
+
+    @staticmethod
+    def _termos_historico(evento: str) -> Iterator[str]:
+        """Termos relevantes de um evento de histórico (sem a data e palavras muito comuns)."""
+        for termo in tokenizar(_DATA_EVENTO.sub("", evento)):
+            if len(termo) >= 3 and not termo.isdigit() and termo not in PALAVRAS_IGNORADAS_HISTORICO:
+                yield termo
+
+    def _pesos(self, animal: Animal) -> Dict[str, int]:
+        """Calcula os termos de um animal e o peso de cada um."""
+        pesos: Dict[str, int] = {}
+        campos = ((animal.nome, PESO_NOME), (animal._raca, PESO_RACA), (" ".join(animal.temperamento), PESO_TEMPERAMENTO))
+        for texto, peso in campos:
+            for termo in tokenizar(texto):
+                pesos[termo] = pesos.get(termo, 0) + peso
+        for evento in animal.historico_eventos:
+            for termo in self._termos_historico(evento):
+                pesos[termo] = pesos.get(termo, 0) + PESO_HISTORICO
+        return pesos
+
+    def _somar(self, chave: int, pesos: Dict[str, int]) -> None:
+        """Acrescenta pesos de termos às postagens de um animal."""
+        termos = self._termos_animal.setdefault(chave, {})
+        for termo, peso in pesos.items():
+            postagem = self._postagens.get(termo)
+            if postagem is None:
+                postagem = self._postagens[termo] = {}
+                posicao = bisect_left(self._vocabulario, termo)
+                if posicao == len(self._vocabulario) or self._vocabulario[posicao] != termo:
+                    self._vocabulario.insert(posicao, termo)
+                else:
+                    self._termos_mortos -= 1
+            postagem[chave] = postagem.get(chave, 0) + peso
+            termos[termo] = termos.get(termo, 0) + peso
+
+    def _retirar(self, chave: int) -> None:
+        """Remove todas as postagens de um animal."""
+        for termo in self._termos_animal.pop(chave, {}):
+            postagem = self._postagens.get(termo)
+            if postagem is None:
+                continue
+            postagem.pop(chave, None)
+            if not postagem:
+                del self._postagens[termo]
+                self._termos_mortos += 1
+        if self._termos_mortos > len(self._vocabulario) // 2:
+            self._vocabulario = sorted(self._postagens)
+            self._termos_mortos = 0
+
+    def reconstruir(self, animais: Iterable[Animal]) -> None:
+        """Descarta o estado atual e indexa novamente todos os animais informados.
+
+        Args:
+            animais (Iterable[Animal]): Animais a indexar.
+        """
+        with self._trava:
+            for animal in self._registrados.values():
+                animal.ao_registrar_evento = None
+            self._chaves.clear()
+            self._registrados.clear()
+            self._postagens.clear()
+            self._termos_animal.clear()
+            for chave, animal in enumerate(animais):
+                self._chaves[id(animal)] = chave
+                self._registrados[chave] = animal
+                animal.ao_registrar_evento = self._ao_registrar_evento
+                termos = self._termos_animal[chave] = self._pesos(animal)
+                for termo, peso in termos.items():
+                    postagem = self._postagens.get(termo)
+                    if postagem is None:
+                        postagem = self._postagens[termo] = {}
+                    postagem[chave] = peso
+            self._vocabulario = sorted(self._postagens)
+            self._termos_mortos = 0
+            self._proxima_chave = len(self._registrados)
+
+    def registrar(self, animal: Animal) -> None:
+        """Passa a indexar um animal (ex: após cadastro).
+
+        Args:
+            animal (Animal): Animal a ser indexado.
+        """
+        with self._trava:
+            chave = self._chaves.get(id(animal))
+            if chave is None:
+                chave = self._chaves[id(animal)] = self._proxima_chave
+                self._proxima_chave += 1
+            self._retirar(chave)
+            self._registrados[chave] = animal
+            animal.ao_registrar_evento = self._ao_registrar_evento
+            self._somar(chave, self._pesos(animal))
+
+    def atualizar(self, animal: Animal) -> None:
+        """Reindexa um animal cujos dados mudaram (ex: após edição).
+
+        Args:
+            animal (Animal): Animal editado.
+        """
+        self.registrar(animal)
+
+    def remover(self, animal: Animal) -> None:
+        """Deixa de indexar o animal (ex: após exclusão).
+
+        Args:
+            animal (Animal): Animal a ser removido do índice.
+        """
+        with self._trava:
+            chave = self._chaves.pop(id(animal), None)
+            if chave is not None:
+                del self._registrados[chave]
+                animal.ao_registrar_evento = None
+                self._retirar(chave)
+
+    def _ao_registrar_evento(self, animal: Animal, descricao: str) -> None:
+        """Indexa só o texto do novo evento, sem reprocessar o histórico inteiro."""
+        pesos: Dict[str, int] = {}
+        for termo in self._termos_historico(descricao):
+            pesos[termo] = pesos.get(termo, 0) + PESO_HISTORICO
+        if pesos:
+            with self._trava:
+                chave = self._chaves.get(id(animal))
+                if chave is not None:
+                    self._somar(chave, pesos)
+
+    def _expandir(self, termo: str) -> List[Tuple[Dict[int, int], float]]:
+        """Postagens que casam com um termo da consulta: o termo exato e os que começam com ele.
+
+        Returns:
+            List[Tuple[Dict[int, int], float]]: (postagem, fator de relevância x raridade) de cada termo casado.
+        """
+        total = len(self._registrados) or 1
+        casados = []
+        if len(termo) < PREFIXO_MINIMO:
+            candidatos: Iterable[str] = (termo,)
+        else:
+            inicio = bisect_left(self._vocabulario, termo)
+            fim = bisect_left(self._vocabulario, termo + "\uffff", inicio)
+            candidatos = self._vocabulario[inicio:fim]
+        for candidato in candidatos:
+            postagem = self._postagens.get(candidato)
+            if postagem:
+                raridade = math.log(1 + total / len(postagem))
+                casados.append((postagem, raridade * (1.0 if candidato == termo else FATOR_PREFIXO)))
+        return casados
+
+    @staticmethod
+    def _chaves_casadas(casados: List[Tuple[Dict[int, int], float]]) -> AbstractSet[int]:
+        """Chaves dos animais presentes em alguma das postagens casadas por um termo."""
+        if len(casados) == 1:
+            return casados[0][0].keys()
+        chaves: Set[int] = set()
+        for postagem, _ in casados:
+            chaves.update(postagem)
+        return chaves
+
+    def buscar(self, consulta: str, limite: int = 20) -> List[Tuple[Animal, float]]:
+        """Busca animais que contenham todos os termos da consulta (cada um como termo ou prefixo).
+
+        Args:
+            consulta (str): Texto livre (ex: "siames calm").
+            limite (int, optional): Máximo de resultados. Defaults to 20.
+
+        Returns:
+            List[Tuple[Animal, float]]: Pares (animal, relevância) em ordem decrescente de relevância.
+        """
+        termos = list(dict.fromkeys(tokenizar(consulta)))
+        if not termos:
+            return []
+        with self._trava:
+            expansoes = [self._expandir(termo) for termo in termos]
+            if any(not casados for casados in expansoes):
+                return []
+            expansoes.sort(key=lambda casados: sum(len(postagem) for postagem, _ in casados))
+
+            # Interseção dos candidatos a partir do termo mais raro (operações de
+            # conjunto em C); só os que restam são pontuados.
+            candidatos = self._chaves_casadas(expansoes[0])
+            for casados in expansoes[1:]:
+                candidatos = candidatos & self._chaves_casadas(casados)
+                if not candidatos:
+                    return []
+            pontos: Dict[int, float] = dict.fromkeys(sorted(candidatos), 0.0)
+            for casados in expansoes:
+                if len(casados) == 1:
+                    postagem, fator = casados[0]
+                    for chave in pontos:
+                        pontos[chave] += postagem[chave] * fator
+                    continue
+                for chave in pontos:
+                    pontos[chave] += max(postagem.get(chave, 0) * fator for postagem, fator in casados)
+            # nlargest é estável: com as chaves em ordem, empates ficam com quem foi registrado antes.
+            melhores = heapq.nlargest(limite, pontos.items(), key=itemgetter(1))
+            return [(self._registrados[chave], round(valor, 3)) for chave, valor in melhores]
+
+    def __len__(self) -> int:
+        """Quantidade de animais indexados."""
+        return len(self._registrados)
+
+SIMILARIDADE_BUSCA = 0.3
+SIMILARIDADE_DUPLICATA = 0.5
+DIGITOS_TELEFONE = 8
+
+def normalizar_nome(nome: str) -> str:
+    """Nome sem acentos, pontuação, caixa e espaços repetidos ("  Ána  Souza." -> "ana souza")."""
+    return " ".join(tokenizar(nome))
+
+def chave_contato(contato: str) -> Optional[str]:
+    """Forma canônica de um contato, para achar o mesmo e-mail ou telefone escrito de outro jeito.
+
+    E-mails são comparados sem espaços e sem caixa; telefones, pelos últimos
+    dígitos (ignora DDI, DDD e máscara). Outros textos são só normalizados.
+
+    Args:
+        contato (str): Contato como digitado.
+
+    Returns:
+        Optional[str]: Chave do contato, ou None se estiver vazio.
+    """
+    texto = normalizar_texto(contato).strip()
+    if "@" in texto:
+        return "".join(texto.split())
+    digitos = "".join(c for c in texto if c.isdigit())
+    if len(digitos) >= DIGITOS_TELEFONE:
+        return "tel:" + digitos[-DIGITOS_TELEFONE:]
+    return normalizar_nome(texto) or None
+
+def trigramas(nome: str) -> FrozenSet[str]:
+    """Trigramas de cada palavra do nome normalizado, com bordas ("ana" -> "  a", " an", "ana", "na ")."""
+    resultado = set()
+    for palavra in normalizar_nome(nome).split():
+        palavra = f"  {palavra} "
+        resultado.update(palavra[i:i + 3] for i in range(len(palavra) - 2))
+    return frozenset(resultado)
+
+class IndiceAdotantes:
+    """Índice de trigramas dos nomes e de contatos normalizados dos adotantes.
+
+    Serve à busca aproximada por nome (erros de digitação, acentos, caixa) e
+    à detecção de cadastros provavelmente duplicados. A semelhança entre dois
+    nomes é o índice de Jaccard dos seus trigramas. Para não comparar todos
+    com todos, as postagens dos trigramas do nome consultado dão, de uma vez,
+    quantos trigramas cada adotante tem em comum com ele; só os que têm o
+    mínimo necessário para a semelhança pedida são examinados.
+
+    Attributes:
+        _chaves (Dict[int, int]): id(adotante) -> chave (ordem de registro).
+        _registrados (Dict[int, Adotante]): chave -> adotante indexado.
+        _trigramas (Dict[int, FrozenSet[str]]): chave -> trigramas do nome.
+        _contatos (Dict[int, Optional[str]]): chave -> contato normalizado.
+        _postagens (Dict[str, Set[int]]): trigrama -> chaves dos adotantes que o contêm.
+        _por_contato (Dict[str, Set[int]]): contato normalizado -> chaves.
+        _trava (threading.RLock): Protege o índice contra atualizações simultâneas.
+    """
+
+    def __init__(self) -> None:
+        """Inicializa o índice vazio."""
+        self._chaves: Dict[int, int] = {}
+        self._registrados: Dict[int, Adotante] = {}
+        self._trigramas: Dict[int, FrozenSet[str]] = {}
+        self._contatos: Dict[int, Optional[str]] = {}
+        self._postagens: Dict[str, Set[int]] = {}
+        self._por_contato: Dict[str, Set[int]] = {}
+        self._proxima_chave = 0
+        self._trava = threading.RLock()
+
+    def _retirar(self, chave: int) -> None:
+        """Remove as entradas de um adotante."""
+        for trigrama in self._trigramas.pop(chave, frozenset()):
+            postagem = self._postagens[trigrama]
+            postagem.discard(chave)
+            if not postagem:
+                del self._postagens[trigrama]
+        contato = self._contatos.pop(chave, None)
+        if contato is not None:
+            chaves = self._por_contato[contato]
+            chaves.discard(chave)
+            if not chaves:
+                del self._por_contato[contato]
+
+    def _indexar(self, chave: int, adotante: Adotante) -> None:
+        """Inclui nome e contato de um adotante já registrado."""
+        self._trigramas[chave] = trigramas(adotante.nome)
+        for trigrama in self._trigramas[chave]:
+            self._postagens.setdefault(trigrama, set()).add(chave)
+        contato = self._contatos[chave] = chave_contato(adotante.contato)
+        if contato is not None:
+            self._por_contato.setdefault(contato, set()).add(chave)
+
+    def reconstruir(self, adotantes: Iterable[Adotante]) -> None:
+        """Descarta o estado atual e indexa novamente todos os adotantes informados.
+
+        Args:
+            adotantes (Iterable[Adotante]): Adotantes a indexar.
+        """
+        with self._trava:
+            for estrutura in (self._chaves, self._registrados, self._trigramas, self._contatos, self._postagens, self._por_contato):
+                estrutura.clear()
+            for chave, adotante in enumerate(adotantes):
+                self._chaves[id(adotante)] = chave
+                self._registrados[chave] = adotante
+                self._indexar(chave, adotante)
+            self._proxima_chave = len(self._registrados)
+
+    def registrar(self, adotante: Adotante) -> None:
+        """Passa a indexar um adotante, ou reindexa se ele já estiver no índice.
+
+        Args:
+            adotante (Adotante): Adotante cadastrado ou editado.
+        """
+        with self._trava:
+            chave = self._chaves.get(id(adotante))
+            if chave is None:
+                chave = self._chaves[id(adotante)] = self._proxima_chave
+                self._proxima_chave += 1
+            self._retirar(chave)
+            self._registrados[chave] = adotante
+            self._indexar(chave, adotante)
+
+    def atualizar(self, adotante: Adotante) -> None:
+        """Reindexa um adotante cujo nome ou contato mudou.
+
+        Args:
+            adotante (Adotante): Adotante editado.
+        """
+        self.registrar(adotante)
+
+    def remover(self, adotante: Adotante) -> None:
+        """Deixa de indexar o adotante (ex: após exclusão).
+
+        Args:
+            adotante (Adotante): Adotante a ser removido do índice.
+        """
+        with self._trava:
+            chave = self._chaves.pop(id(adotante), None)
+            if chave is not None:
+                del self._registrados[chave]
+                self._retirar(chave)
+
+    def _semelhantes(self, alvo: FrozenSet[str], similaridade_minima: float) -> Dict[int, float]:
+        """Chaves com semelhança de nome >= similaridade_minima, com a semelhança de cada uma."""
+        if not alvo:
+            return {}
+        # A contagem de postagens (feita em C pelo Counter) já é o número de
+        # trigramas em comum; só quem alcança o mínimo necessário é examinado.
+        comuns: Counter = Counter()
+        for trigrama in alvo:
+            comuns.update(self._postagens.get(trigrama, ()))
+        necessarios = max(math.ceil(similaridade_minima * len(alvo)), 1)
+        semelhancas = {}
+        for chave in [chave for chave, n in comuns.items() if n >= necessarios]:
+            n = comuns[chave]
+            similaridade = n / (len(alvo) + len(self._trigramas[chave]) - n)
+            if similaridade >= similaridade_minima:
+                semelhancas[chave] = similaridade
+        return semelhancas
+
+    def buscar(self, nome: str, limite: int = 10, similaridade_minima: float = SIMILARIDADE_BUSCA) -> List[Tuple[Adotante, float]]:
+        """Busca aproximada por nome.
+
+        Args:
+            nome (str): Nome (ou parte dele) como digitado.
+            limite (int, optional): Máximo de resultados. Defaults to 10.
+            similaridade_minima (float, optional): Semelhança mínima (0 a 1). Defaults to SIMILARIDADE_BUSCA.
+
+        Returns:
+            List[Tuple[Adotante, float]]: Pares (adotante, semelhança), do mais ao menos parecido.
+        """
+        with self._trava:
+            semelhancas = self._semelhantes(trigramas(nome), similaridade_minima)
+            melhores = heapq.nlargest(limite, sorted(semelhancas.items()), key=itemgetter(1))
+            return [(self._registrados[chave], round(valor, 3)) for chave, valor in melhores]
+
+    def _suspeitas(self, alvo: FrozenSet[str], contato: Optional[str], similaridade_minima: float) -> Dict[int, Tuple[float, str]]:
+        """Chaves de possíveis duplicatas, com (semelhança do nome, motivo)."""
+        semelhancas = self._semelhantes(alvo, similaridade_minima)
+        suspeitas = {}
+        for chave in self._por_contato.get(contato, ()) if contato is not None else ():
+            outro = self._trigramas[chave]
+            comuns = len(alvo & outro)
+            suspeitas[chave] = (comuns / ((len(alvo) + len(outro) - comuns) or 1), "mesmo contato")
+        for chave, similaridade in semelhancas.items():
+            if chave not in suspeitas:
+                suspeitas[chave] = (similaridade, "mesmo nome" if similaridade == 1.0 else "nome parecido")
+        return suspeitas
+
+    def duplicatas_de(self, nome: str, contato: str, similaridade_minima: float = SIMILARIDADE_DUPLICATA) -> List[Tuple[Adotante, float, str]]:
+        """Adotantes já indexados que provavelmente são a mesma pessoa.
+
+        Args:
+            nome (str): Nome do cadastro a conferir.
+            contato (str): Contato do cadastro a conferir.
+            similaridade_minima (float, optional): Semelhança mínima dos nomes. Defaults to SIMILARIDADE_DUPLICATA.
+
+        Returns:
+            List[Tuple[Adotante, float, str]]: (adotante, semelhança do nome, motivo), contato igual
+                primeiro e depois do nome mais ao menos parecido.
+        """
+        with self._trava:
+            suspeitas = self._suspeitas(trigramas(nome), chave_contato(contato), similaridade_minima)
+            ordem = sorted(suspeitas.items(), key=lambda par: (par[1][1] != "mesmo contato", -par[1][0], par[0]))
+            return [(self._registrados[chave], round(similaridade, 3), motivo) for chave, (similaridade, motivo) in ordem]
+
+    def pares_duplicados(self, similaridade_minima: float = SIMILARIDADE_DUPLICATA) -> List[Tuple[Adotante, Adotante, float, str]]:
+        """Todos os pares de adotantes indexados que provavelmente são a mesma pessoa.
+
+        Args:
+            similaridade_minima (float, optional): Semelhança mínima dos nomes. Defaults to SIMILARIDADE_DUPLICATA.
+
+        Returns:
+            List[Tuple[Adotante, Adotante, float, str]]: (mais antigo, mais recente, semelhança, motivo),
+                na ordem de registro.
+        """
+        with self._trava:
+            encontrados: Dict[Tuple[int, int], Tuple[float, str]] = {}
+            # Junção por prefixo: com os trigramas de cada nome em ordem global do mais
+            # raro ao mais comum, dois nomes com Jaccard >= s compartilham algum dos
+            # |x| - ceil(s*|x|) + 1 primeiros trigramas de cada um. Cada adotante só
+            # consulta e entra nas listas desses trigramas, quase sempre curtas.
+            raridade = {trigrama: (len(chaves), trigrama) for trigrama, chaves in self._postagens.items()}
+            prefixos: Dict[str, List[int]] = {}
+            for chave in sorted(self._registrados):
+                alvo = self._trigramas[chave]
+                if not alvo:
+                    continue
+                ordenados = sorted(alvo, key=raridade.__getitem__)
+                prefixo = ordenados[:len(alvo) - max(math.ceil(similaridade_minima * len(alvo)), 1) + 1]
+                candidatos: Set[int] = set()
+                for trigrama in prefixo:
+                    anteriores = prefixos.setdefault(trigrama, [])
+                    candidatos.update(anteriores)
+                    anteriores.append(chave)
+                for outra in candidatos:
+                    outro = self._trigramas[outra]
+                    comuns = len(alvo & outro)
+                    similaridade = comuns / (len(alvo) + len(outro) - comuns)
+                    if similaridade >= similaridade_minima:
+                        encontrados[(outra, chave)] = (similaridade, "mesmo nome" if similaridade == 1.0 else "nome parecido")
+            for chaves in self._por_contato.values():
+                ordem = sorted(chaves)
+                for i, chave in enumerate(ordem):
+                    for outra in ordem[i + 1:]:
+                        alvo, outro = self._trigramas[chave], self._trigramas[outra]
+                        comuns = len(alvo & outro)
+                        encontrados[(chave, outra)] = (comuns / ((len(alvo) + len(outro) - comuns) or 1), "mesmo contato")
+            return [(self._registrados[a], self._registrados[b], round(similaridade, 3), motivo)
+                    for (a, b), (similaridade, motivo) in sorted(encontrados.items())]
+
+    def __len__(self) -> int:
+        """Quantidade de adotantes indexados."""
+        return len(self._registrados)
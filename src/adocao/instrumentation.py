@@ -0,0 +1,240 @@
+"""Instrumentação dos caminhos quentes, exportada no formato texto do Prometheus.
+
+Mede chamadas, erros e latência (histograma) dos métodos públicos de
+SistemaAdocao, NucleoAdocao e do repositório, e de cada entrega a um
+observador; do repositório mede também registros e bytes lidos/gravados
+(pelo callback ``Repositorio.ao_transferir``).
+
+Os métodos são embrulhados no próprio objeto (atributo de instância) só
+quando a instrumentação está ligada (``"instrumentacao": true`` em
+settings.json). Desligada, nada é embrulhado e o único custo que sobra é o
+teste ``ao_transferir is not None`` no repositório.
+
+O snapshot é gravado em ``"arquivo_prometheus"`` (padrão:
+dados/metricas.prom, no formato do textfile collector do node_exporter) ao
+fechar o núcleo e servido pela API em ``GET /metricas/prometheus``.
+"""
+import functools
+import os
+import threading
+import time
+from bisect import bisect_left
+from typing import Any, Callable, Dict, Iterable, List, Optional, TextIO, Tuple, Union
+from .eventlog import ObservadorEventos
+from .observers import Observador
+from .repositories import Repositorio
+
+# Limites superiores (segundos) dos baldes do histograma de latência.
+BALDES_LATENCIA = (0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+TIPO_CONTEUDO_PROMETHEUS = "text/plain; version=0.0.4; charset=utf-8"
+
+class _Serie:
+    """Contadores de um (componente, método)."""
+
+    __slots__ = ("chamadas", "erros", "soma", "baldes")
+
+    def __init__(self) -> None:
+        self.chamadas = 0
+        self.erros = 0
+        self.soma = 0.0
+        # Um contador por balde (não cumulativo) e o último para "+Inf".
+        self.baldes = [0] * (len(BALDES_LATENCIA) + 1)
+
+def _rotulos(**rotulos: str) -> str:
+    """Formata rótulos do Prometheus, escapando barra invertida, aspas e quebra de linha."""
+    partes = []
+    for nome, valor in rotulos.items():
+        valor = valor.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        partes.append(f'{nome}="{valor}"')
+    return "{" + ",".join(partes) + "}"
+
+class Instrumentacao:
+    """Registro de métricas compartilhado pelos objetos instrumentados (thread-safe).
+
+    Attributes:
+        prefixo (str): Prefixo dos nomes das métricas exportadas.
+    """
+
+    def __init__(self, prefixo: str = "adocao") -> None:
+        """Inicializa o registro vazio.
+
+        Args:
+            prefixo (str, optional): Prefixo das métricas. Defaults to "adocao".
+        """
+        self.prefixo = prefixo
+        self._trava = threading.Lock()
+        self._series: Dict[Tuple[str, str], _Serie] = {}
+        # (componente, operação) -> [registros, bytes]
+        self._transferencias: Dict[Tuple[str, str], List[int]] = {}
+
+    def registrar_chamada(self, componente: str, metodo: str, segundos: float, erro: bool = False) -> None:
+        """Contabiliza uma chamada.
+
+        Args:
+            componente (str): Ex: "nucleo", "repositorio", "observador".
+            metodo (str): Nome do método (ou Observador.método).
+            segundos (float): Duração.
+            erro (bool, optional): Se a chamada terminou com exceção. Defaults to False.
+        """
+        balde = bisect_left(BALDES_LATENCIA, segundos)
+        with self._trava:
+            serie = self._series.get((componente, metodo))
+            if serie is None:
+                serie = self._series[(componente, metodo)] = _Serie()
+            serie.chamadas += 1
+            serie.soma += segundos
+            serie.baldes[balde] += 1
+            if erro:
+                serie.erros += 1
+
+    def registrar_transferencia(self, componente: str, operacao: str, registros: int, tamanho: int) -> None:
+        """Soma registros e bytes movidos por uma operação de E/S.
+
+        Args:
+            componente (str): Ex: "repositorio".
+            operacao (str): Ex: "salvar_animais".
+            registros (int): Registros lidos ou gravados.
+            tamanho (int): Bytes lidos ou gravados.
+        """
+        with self._trava:
+            totais = self._transferencias.setdefault((componente, operacao), [0, 0])
+            totais[0] += registros
+            totais[1] += tamanho
+
+    def medir(self, componente: str, metodo: str, funcao: Callable[..., Any]) -> Callable[..., Any]:
+        """Embrulha uma função para contabilizar as chamadas dela.
+
+        Args:
+            componente (str): Componente do rótulo.
+            metodo (str): Método do rótulo.
+            funcao (Callable[..., Any]): Função (ou método já associado) a medir.
+
+        Returns:
+            Callable[..., Any]: Função com a mesma assinatura que registra cada chamada.
+        """
+        registrar = self.registrar_chamada
+        relogio = time.perf_counter
+
+        @functools.wraps(funcao)
+        def medida(*args: Any, **kwargs: Any) -> Any:
+            inicio = relogio()
+            try:
+                resultado = funcao(*args, **kwargs)
+            except BaseException:
+                registrar(componente, metodo, relogio() - inicio, True)
+                raise
+            registrar(componente, metodo, relogio() - inicio)
+            return resultado
+        medida.__instrumentado__ = True  # type: ignore[attr-defined]
+        return medida
+
+    def instrumentar(self, objeto: Any, componente: str, metodos: Optional[Iterable[str]] = None) -> None:
+        """Troca os métodos públicos do objeto (só nesta instância) por versões medidas.
+
+        Propriedades e atributos que não são funções da classe ficam como estão;
+        chamar de novo não embrulha duas vezes.
+
+        Args:
+            objeto (Any): Instância a instrumentar.
+            componente (str): Componente do rótulo.
+            metodos (Optional[Iterable[str]], optional): Nomes a embrulhar. Defaults to todos
+                os métodos públicos da classe.
+        """
+        if metodos is None:
+            metodos = [nome for nome in dir(type(objeto))
+                       if not nome.startswith("_") and callable(getattr(type(objeto), nome, None))
+                       and not isinstance(getattr(type(objeto), nome), (type, property))]
+        for nome in metodos:
+            atual = getattr(objeto, nome)
+            if not getattr(atual, "__instrumentado__", False):
+                setattr(objeto, nome, self.medir(componente, nome, atual))
+
+    def instrumentar_repositorio(self, repositorio: Repositorio) -> None:
+        """Mede os métodos públicos do repositório e os registros/bytes que ele move.
+
+        Args:
+            repositorio (Repositorio): Repositório a instrumentar.
+        """
+        self.instrumentar(repositorio, "repositorio")
+        repositorio.ao_transferir = functools.partial(self.registrar_transferencia, "repositorio")
+
+    def instrumentar_observador(self, observador: Observador) -> None:
+        """Mede as entregas ao observador (``receber`` ou ``atualizar``, o que o despacho usar).
+
+        Args:
+            observador (Observador): Observador a instrumentar.
+        """
+        metodo = "receber" if isinstance(observador, ObservadorEventos) else "atualizar"
+        atual = getattr(observador, metodo)
+        if not getattr(atual, "__instrumentado__", False):
+            setattr(observador, metodo, self.medir("observador", f"{type(observador).__name__}.{metodo}", atual))
+
+    def instrumentar_nucleo(self, nucleo: Any) -> None:
+        """Mede o núcleo, o repositório dele e os observadores atuais e futuros.
+
+        Args:
+            nucleo (NucleoAdocao): Núcleo a instrumentar.
+        """
+        self.instrumentar_repositorio(nucleo.repo)
+        for observador in nucleo.observadores:
+            self.instrumentar_observador(observador)
+        self.instrumentar(nucleo, "nucleo")
+        adicionar = nucleo.adicionar_observador
+
+        def adicionar_observador(observador: Observador) -> None:
+            self.instrumentar_observador(observador)
+            adicionar(observador)
+        adicionar_observador.__instrumentado__ = True  # type: ignore[attr-defined]
+        nucleo.adicionar_observador = adicionar_observador
+
+    def exportar(self) -> str:
+        """Gera o snapshot atual no formato texto de exposição do Prometheus.
+
+        Returns:
+            str: Métricas de chamadas, erros, latência, registros e bytes.
+        """
+        with self._trava:
+            series = sorted((chave, serie.chamadas, serie.erros, serie.soma, list(serie.baldes))
+                            for chave, serie in self._series.items())
+            transferencias = sorted((chave, tuple(totais)) for chave, totais in self._transferencias.items())
+        p = self.prefixo
+        linhas = [f"# HELP {p}_chamadas_total Chamadas por componente e método.",
+                  f"# TYPE {p}_chamadas_total counter"]
+        linhas += [f"{p}_chamadas_total{_rotulos(componente=c, metodo=m)} {chamadas}" for (c, m), chamadas, _, _, _ in series]
+        linhas += [f"# HELP {p}_erros_total Chamadas que terminaram com exceção.",
+                   f"# TYPE {p}_erros_total counter"]
+        linhas += [f"{p}_erros_total{_rotulos(componente=c, metodo=m)} {erros}" for (c, m), _, erros, _, _ in series]
+        linhas += [f"# HELP {p}_latencia_segundos Duração das chamadas.",
+                   f"# TYPE {p}_latencia_segundos histogram"]
+        for (c, m), chamadas, _, soma, baldes in series:
+            acumulado = 0
+            for limite, quantidade in zip(BALDES_LATENCIA, baldes):
+                acumulado += quantidade
+                linhas.append(f"{p}_latencia_segundos_bucket{_rotulos(componente=c, metodo=m, le=repr(limite))} {acumulado}")
+            linhas.append(f"{p}_latencia_segundos_bucket{_rotulos(componente=c, metodo=m, le='+Inf')} {chamadas}")
+            linhas.append(f"{p}_latencia_segundos_sum{_rotulos(componente=c, metodo=m)} {soma!r}")
+            linhas.append(f"{p}_latencia_segundos_count{_rotulos(componente=c, metodo=m)} {chamadas}")
+        linhas += [f"# HELP {p}_registros_total Registros lidos ou gravados.",
+                   f"# TYPE {p}_registros_total counter"]
+        linhas += [f"{p}_registros_total{_rotulos(componente=c, operacao=o)} {registros}" for (c, o), (registros, _) in transferencias]
+        linhas += [f"# HELP {p}_bytes_total Bytes lidos ou gravados.",
+                   f"# TYPE {p}_bytes_total counter"]
+        linhas += [f"{p}_bytes_total{_rotulos(componente=c, operacao=o)} {tamanho}" for (c, o), (_, tamanho) in transferencias]
+        return "\n".join(linhas) + "\n"
+
+    def escrever(self, destino: Union[str, TextIO]) -> None:
+        """Grava o snapshot; em arquivo, a troca é atômica (o coletor nunca lê pela metade).
+
+        Args:
+            destino (Union[str, TextIO]): Caminho do arquivo ou arquivo já aberto.
+        """
+        if not isinstance(destino, str):
+            destino.write(self.exportar())
+            return
+        pasta = os.path.dirname(destino)
+        if pasta:
+            os.makedirs(pasta, exist_ok=True)
+        temporario = destino + ".tmp"
+        with open(temporario, "w", encoding="utf-8") as f:
+            f.write(self.exportar())
+        os.replace(temporario, destino)
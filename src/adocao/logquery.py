@@ -0,0 +1,236 @@
+"""Consulta rápida ao histórico de eventos em texto (dados/historico_eventos.log).
+
+Uso (a partir da raiz do projeto):
+    python -m src.adocao.logquery --de "2025-12-16" --ate "2025-12-16 23:59:59" --tipo ADOÇÃO
+    python -m src.adocao.logquery --animal Thor --contar
+"""
+import argparse
+import mmap
+import os
+import re
+import sys
+from collections import Counter
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, Iterator, Optional, Tuple
+
+# "[AAAA-MM-DD HH:MM:SS]" tem 21 bytes; a mensagem começa depois de mais um espaço.
+TAMANHO_CARIMBO = 21
+FORMATO_CARIMBO = "%Y-%m-%d %H:%M:%S"
+
+PADROES_MENSAGEM: Dict[str, "re.Pattern[str]"] = {
+    "ADOÇÃO": re.compile(r"^(?P<adotante>.+) adotou (?P<animal>.+?)\. Taxa:"),
+    "EXPIRAÇÃO": re.compile(r"^Reserva de (?P<animal>.+) \(Tutor: (?P<adotante>.+)\) venceu")
+}
+
+@dataclass
+class RegistroLog:
+    """Uma linha do histórico de eventos.
+
+    Attributes:
+        momento (datetime): Carimbo de tempo da linha.
+        tipo (str): Tipo do evento (ex: "ADOÇÃO") ou "EVENTO" se não houver prefixo.
+        mensagem (str): Texto após o carimbo de tempo.
+        animal (Optional[str]): Nome do animal, quando o formato da mensagem é conhecido.
+        adotante (Optional[str]): Nome do adotante, quando o formato da mensagem é conhecido.
+    """
+    momento: datetime
+    tipo: str
+    mensagem: str
+    animal: Optional[str] = None
+    adotante: Optional[str] = None
+
+    def __str__(self) -> str:
+        """Retorna a linha no mesmo formato do arquivo de log."""
+        return f"[{self.momento.strftime(FORMATO_CARIMBO)}] {self.mensagem}"
+
+def _carimbo(linha: bytes) -> Optional[bytes]:
+    """Retorna o carimbo "[AAAA-MM-DD HH:MM:SS]" da linha, ou None se ela não tiver um."""
+    if linha[:1] == b"[" and linha[TAMANHO_CARIMBO - 1:TAMANHO_CARIMBO] == b"]":
+        return linha[:TAMANHO_CARIMBO]
+    return None
+
+def _chave(momento: datetime) -> bytes:
+    """Converte um datetime no carimbo comparável byte a byte com o do arquivo."""
+    return f"[{momento.strftime(FORMATO_CARIMBO)}]".encode("utf-8")
+
+def interpretar_linha(linha: str) -> Optional[RegistroLog]:
+    """Converte uma linha do log em RegistroLog.
+
+    Args:
+        linha (str): Linha no formato "[AAAA-MM-DD HH:MM:SS] TIPO: descrição".
+
+    Returns:
+        Optional[RegistroLog]: O registro, ou None se a linha não tiver carimbo válido.
+    """
+    linha = linha.rstrip("\r\n")
+    try:
+        momento = datetime.strptime(linha[1:TAMANHO_CARIMBO - 1], FORMATO_CARIMBO)
+    except ValueError:
+        return None
+    mensagem = linha[TAMANHO_CARIMBO + 1:]
+    prefixo, separador, descricao = mensagem.partition(": ")
+    tipo = prefixo if separador and prefixo.isupper() else "EVENTO"
+    registro = RegistroLog(momento, tipo, mensagem)
+    padrao = PADROES_MENSAGEM.get(tipo)
+    match = padrao.match(descricao) if padrao else None
+    if match:
+        registro.animal, registro.adotante = match.group("animal"), match.group("adotante")
+    return registro
+
+class ConsultaLog:
+    """Consulta ao histórico de eventos por período, tipo, animal e adotante.
+
+    O arquivo é mapeado em memória (mmap) e, como as linhas são gravadas em
+    ordem cronológica, o início do período é localizado por busca binária
+    sobre os offsets. Só as linhas do período são lidas, e filtros de tipo e
+    de nome são testados nos bytes antes de a linha ser decodificada.
+
+    Attributes:
+        caminho (str): Caminho do arquivo de log.
+    """
+
+    def __init__(self, caminho: str = os.path.join("dados", "historico_eventos.log")) -> None:
+        """Inicializa a consulta.
+
+        Args:
+            caminho (str, optional): Arquivo de log. Defaults to "dados/historico_eventos.log".
+        """
+        self.caminho = caminho
+
+    def consultar(self, inicio: Optional[datetime] = None, fim: Optional[datetime] = None, tipo: Optional[str] = None, animal: Optional[str] = None, adotante: Optional[str] = None) -> Iterator[RegistroLog]:
+        """Percorre os registros que atendem aos filtros, em ordem cronológica.
+
+        Args:
+            inicio (Optional[datetime], optional): Início do período (inclusivo). Defaults to None.
+            fim (Optional[datetime], optional): Fim do período (inclusivo, ao segundo). Defaults to None.
+            tipo (Optional[str], optional): Tipo do evento (ex: "ADOÇÃO"). Defaults to None.
+            animal (Optional[str], optional): Nome exato do animal. Defaults to None.
+            adotante (Optional[str], optional): Nome exato do adotante. Defaults to None.
+
+        Yields:
+            RegistroLog: Registros encontrados.
+        """
+        if not os.path.exists(self.caminho) or os.path.getsize(self.caminho) == 0:
+            return
+        ate = _chave(fim) if fim else None
+        prefixo_tipo = f"{tipo}: ".encode("utf-8") if tipo else None
+        nomes = [n.encode("utf-8") for n in (animal, adotante) if n]
+
+        with open(self.caminho, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            posicao = self._buscar(mm, _chave(inicio)) if inicio else 0
+            for linha in self._linhas(mm, posicao):
+                carimbo = _carimbo(linha)
+                if carimbo is None:
+                    continue
+                if ate is not None and carimbo > ate:
+                    break
+                if prefixo_tipo is not None and not linha.startswith(prefixo_tipo, TAMANHO_CARIMBO + 1):
+                    continue
+                if any(n not in linha for n in nomes):
+                    continue
+                registro = interpretar_linha(linha.decode("utf-8", errors="replace"))
+                if registro is None:
+                    continue
+                if animal and registro.animal != animal:
+                    continue
+                if adotante and registro.adotante != adotante:
+                    continue
+                yield registro
+
+    def contar(self, inicio: Optional[datetime] = None, fim: Optional[datetime] = None, tipo: Optional[str] = None, animal: Optional[str] = None, adotante: Optional[str] = None) -> Dict[str, int]:
+        """Conta os registros por tipo, com os mesmos filtros de consultar().
+
+        Returns:
+            Dict[str, int]: Tipo do evento -> quantidade, do mais frequente ao menos frequente.
+        """
+        contagem = Counter(r.tipo for r in self.consultar(inicio, fim, tipo, animal, adotante))
+        return dict(contagem.most_common())
+
+    @staticmethod
+    def _linhas(mm: mmap.mmap, posicao: int) -> Iterator[bytes]:
+        """Percorre as linhas do mapa a partir de um offset, sem o separador final."""
+        tamanho = len(mm)
+        while posicao < tamanho:
+            fim = mm.find(b"\n", posicao)
+            if fim == -1:
+                fim = tamanho
+            yield mm[posicao:fim].rstrip(b"\r")
+            posicao = fim + 1
+
+    @staticmethod
+    def _proximo_carimbo(mm: mmap.mmap, posicao: int) -> Tuple[Optional[bytes], int]:
+        """Acha a primeira linha com carimbo a partir de um offset.
+
+        Returns:
+            Tuple[Optional[bytes], int]: O carimbo (ou None no fim do arquivo) e o offset logo após a linha.
+        """
+        tamanho = len(mm)
+        while posicao < tamanho:
+            fim = mm.find(b"\n", posicao)
+            carimbo = _carimbo(mm[posicao:posicao + TAMANHO_CARIMBO])
+            posicao = tamanho if fim == -1 else fim + 1
+            if carimbo is not None:
+                return carimbo, posicao
+        return None, tamanho
+
+    @classmethod
+    def _buscar(cls, mm: mmap.mmap, chave: bytes) -> int:
+        """Busca binária pelo offset da primeira linha com carimbo >= chave.
+
+        Linhas sem carimbo (em branco ou corrompidas) são puladas ao comparar.
+        """
+        baixo, alto = 0, len(mm)
+        while baixo < alto:
+            meio = (baixo + alto) // 2
+            inicio_linha = mm.rfind(b"\n", 0, meio) + 1
+            carimbo, depois = cls._proximo_carimbo(mm, inicio_linha)
+            if carimbo is None or carimbo >= chave:
+                alto = inicio_linha
+            else:
+                baixo = depois
+        return baixo
+
+def _ler_data(texto: str) -> datetime:
+    """Aceita "AAAA-MM-DD" ou "AAAA-MM-DD HH:MM[:SS]" na linha de comando."""
+    try:
+        return datetime.fromisoformat(texto)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"data inválida: {texto!r}")
+
+def main(argv: Optional[list] = None) -> int:
+    """Executa a consulta pela linha de comando.
+
+    Args:
+        argv (Optional[list], optional): Argumentos (sem o nome do programa). Defaults to sys.argv.
+
+    Returns:
+        int: Código de saída.
+    """
+    parser = argparse.ArgumentParser(description="Consulta o histórico de eventos do abrigo.")
+    parser.add_argument("--arquivo", default=os.path.join("dados", "historico_eventos.log"))
+    parser.add_argument("--de", type=_ler_data, help="início do período (AAAA-MM-DD [HH:MM:SS])")
+    parser.add_argument("--ate", type=_ler_data, help="fim do período, inclusivo")
+    parser.add_argument("--tipo", help="tipo do evento (ex: ADOÇÃO, EXPIRAÇÃO)")
+    parser.add_argument("--animal", help="nome do animal")
+    parser.add_argument("--adotante", help="nome do adotante")
+    parser.add_argument("--contar", action="store_true", help="mostra só a contagem por tipo")
+    args = parser.parse_args(argv)
+
+    consulta = ConsultaLog(args.arquivo)
+    filtros = (args.de, args.ate, args.tipo.upper() if args.tipo else None, args.animal, args.adotante)
+    if args.contar:
+        contagem = consulta.contar(*filtros)
+        for tipo, quantidade in contagem.items():
+            print(f"{tipo:<15}{quantidade:>10}")
+        print(f"{'TOTAL':<15}{sum(contagem.values()):>10}")
+        return 0
+    try:
+        for registro in consulta.consultar(*filtros):
+            print(registro)
+    except BrokenPipeError:
+        sys.stderr.close()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
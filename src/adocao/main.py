@@ -1,13 +1,17 @@
+import argparse
 import sys
 import os
+from datetime import datetime
 
 sys.path.append(os.getcwd())
 
 try:
     from src.adocao.services import SistemaAdocao
+    from src.adocao.core import NucleoAdocao
     from src.adocao.enums import PorteAnimal, TipoMoradia, StatusAnimal
     from src.adocao.domain import Cachorro, Gato
     from src.adocao.exceptions import AdocaoError
+    from src.adocao.pagination import FiltroAnimais, FiltroAdotantes
 except ImportError as e:
     print("\n❌ Erro de Importação!")
     print("Certifique-se de executar este arquivo a partir da raiz do projeto.")
@@ -82,8 +86,127 @@ def menu_configuracoes(sistema):
         except ValueError:
             print("❌ Digite um número válido.")
             
-def main():
-    sistema = SistemaAdocao()
+def escolher_filtro_animais(atual):
+    print("\n🔎 Filtros [Enter para manter o atual, '-' para limpar]")
+    status_opcoes = list(StatusAnimal)
+    print("Status: " + ", ".join(f"{i+1}-{s.value}" for i, s in enumerate(status_opcoes)))
+    escolha = input(f"Escolha [{atual.status.value if atual.status else 'todos'}]: ").strip()
+    status = None if escolha == "-" else status_opcoes[int(escolha) - 1] if escolha.isdigit() and 0 < int(escolha) <= len(status_opcoes) else atual.status
+
+    escolha = input(f"Porte 1-P, 2-M, 3-G [{atual.porte.value if atual.porte else 'todos'}]: ").strip()
+    porte = None if escolha == "-" else {"1": PorteAnimal.P, "2": PorteAnimal.M, "3": PorteAnimal.G}.get(escolha, atual.porte)
+
+    escolha = input(f"Espécie 1-Cachorro, 2-Gato [{atual.especie.__name__ if atual.especie else 'todas'}]: ").strip()
+    especie = None if escolha == "-" else {"1": Cachorro, "2": Gato}.get(escolha, atual.especie)
+
+    escolha = input(f"Nome começa com [{atual.prefixo_nome or 'qualquer'}]: ").strip()
+    prefixo = None if escolha == "-" else escolha or atual.prefixo_nome
+    return FiltroAnimais(status, porte, especie, prefixo)
+
+def opcoes_navegacao(pagina):
+    opcoes = []
+    if pagina.cursor_anterior is not None: opcoes.append("[a] anterior")
+    if pagina.cursor_proximo is not None: opcoes.append("[p] próxima")
+    opcoes.append("[f] filtrar")
+    return input(f"{' '.join(opcoes)} [Enter] continuar: ").strip().lower()
+
+def navegar_animais(sistema, filtro=None):
+    filtro = filtro or FiltroAnimais()
+    pagina = sistema.exibir_pagina_animais(filtro)
+    while True:
+        escolha = opcoes_navegacao(pagina)
+        if escolha == "p" and pagina.cursor_proximo is not None:
+            pagina = sistema.exibir_pagina_animais(filtro, apos=pagina.cursor_proximo)
+        elif escolha == "a" and pagina.cursor_anterior is not None:
+            pagina = sistema.exibir_pagina_animais(filtro, antes=pagina.cursor_anterior)
+        elif escolha == "f":
+            filtro = escolher_filtro_animais(filtro)
+            pagina = sistema.exibir_pagina_animais(filtro)
+        elif escolha == "":
+            return
+
+def navegar_adotantes(sistema):
+    filtro = FiltroAdotantes()
+    pagina = sistema.exibir_pagina_adotantes(filtro)
+    while True:
+        escolha = opcoes_navegacao(pagina)
+        if escolha == "p" and pagina.cursor_proximo is not None:
+            pagina = sistema.exibir_pagina_adotantes(filtro, apos=pagina.cursor_proximo)
+        elif escolha == "a" and pagina.cursor_anterior is not None:
+            pagina = sistema.exibir_pagina_adotantes(filtro, antes=pagina.cursor_anterior)
+        elif escolha == "f":
+            filtro = FiltroAdotantes(input("Nome começa com [Enter = todos]: ").strip() or None)
+            pagina = sistema.exibir_pagina_adotantes(filtro)
+        elif escolha == "":
+            return
+
+def escolher_formatos(padrao):
+    texto = input(f"Formatos (txt, csv, json) [Enter = {padrao}]: ").strip().lower()
+    return [f.strip() for f in (texto or padrao).split(",") if f.strip()]
+
+def iniciar_sistema(rapido=False):
+    if rapido:
+        return SistemaAdocao(NucleoAdocao(carregamento_tardio=True))
+    return SistemaAdocao()
+
+SCRIPT_MEDICAO = (
+    "import time; t = time.perf_counter(); "
+    "from src.adocao import main; s = main.iniciar_sistema({rapido}); menu = time.perf_counter() - t; "
+    "s.nucleo.animais; dados = time.perf_counter() - t; s.fechar(); print('@@', menu, dados)"
+)
+
+def medir_inicio(repeticoes=5):
+    import statistics
+    import subprocess
+    print(f"⏱️  Medindo a inicialização ({repeticoes} execuções por modo)...")
+    print(f"{'Modo':<10}{'Menu (ms)':>12}{'Dados (ms)':>12}{'Processo (ms)':>15}")
+    for rapido in (False, True):
+        menu, dados, processo = [], [], []
+        for _ in range(repeticoes):
+            inicio = datetime.now()
+            saida = subprocess.run([sys.executable, "-c", SCRIPT_MEDICAO.format(rapido=rapido)],
+                                   capture_output=True, text=True, check=True).stdout
+            processo.append((datetime.now() - inicio).total_seconds())
+            _, t_menu, t_dados = [l for l in saida.splitlines() if l.startswith("@@")][-1].split()
+            menu.append(float(t_menu))
+            dados.append(float(t_dados))
+        nome = "rápido" if rapido else "normal"
+        print(f"{nome:<10}{statistics.median(menu) * 1000:>12.1f}{statistics.median(dados) * 1000:>12.1f}{statistics.median(processo) * 1000:>15.1f}")
+
+def executar_lote(caminho, caminho_saida=None):
+    from src.adocao.commands import ExecutorComandos
+    nucleo = NucleoAdocao()
+    entrada = sys.stdin if caminho == "-" else open(caminho, encoding="utf-8")
+    saida = open(caminho_saida, "w", encoding="utf-8") if caminho_saida else sys.stdout
+    try:
+        resumo = ExecutorComandos(nucleo).executar(entrada, saida)
+    finally:
+        if entrada is not sys.stdin: entrada.close()
+        if saida is not sys.stdout: saida.close()
+        nucleo.fechar()
+    print(f"📦 {resumo}", file=sys.stderr)
+    return 0 if resumo.falhas == 0 else 1
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="adote-me.org - sistema de adoção de animais")
+    parser.add_argument("--rapido", action="store_true", help="mostra o menu antes de terminar de carregar os dados")
+    parser.add_argument("--medir-inicio", action="store_true", help="mede o tempo de inicialização nos modos normal e rápido")
+    parser.add_argument("--batch", metavar="ARQUIVO", help="executa os comandos JSON Lines do arquivo ('-' lê da entrada padrão) e sai")
+    parser.add_argument("--saida", metavar="ARQUIVO", help="com --batch, grava os resultados no arquivo em vez da saída padrão")
+    parser.add_argument("--servidor", action="store_true", help="inicia a API HTTP/JSON em vez do menu")
+    parser.add_argument("--host", default="127.0.0.1", help="com --servidor, endereço de escuta")
+    parser.add_argument("--porta", type=int, default=8080, help="com --servidor, porta de escuta")
+    args = parser.parse_args(argv)
+    if args.servidor:
+        from src.adocao import api
+        return api.main(["--host", args.host, "--porta", str(args.porta)])
+    if args.batch:
+        return executar_lote(args.batch, args.saida)
+    if args.medir_inicio:
+        medir_inicio()
+        return
+
+    sistema = iniciar_sistema(args.rapido)
 
     while True:
         G1 = "\033[38;2;0;255;255m"
@@ -116,6 +239,12 @@ def main():
         print("13. 🔄 Processar Reservas Vencidas")
         print("14. 📈 Gerar Relatórios Consolidados")
         print("15. ⚙️  Configurações") 
+        print("16. 🔎 Consultar Histórico de Eventos")
+        print("17. 📋 Exportar Relatório Detalhado de Animais")
+        print("18. 📉 Tendência das Métricas")
+        print("19. 🔍 Buscar Animais")
+        print("20. 🔎 Buscar Adotantes")
+        print("21. 👥 Relatório de Adotantes Duplicados")
         print("-" * 25)
         print("0. Sair")
         
@@ -173,14 +302,12 @@ def main():
 
         elif opcao == "5":
             print(f"\n--- {G2}Reservar Animal{RESET} ---")
-            sistema.gerar_relatorio_animais()
-            sistema.listar_adotantes()
-            print("-" * 30)
-            
             try:
+                navegar_animais(sistema)
                 id_animal = int(input("Digite o ID do Animal: "))
                 sistema.buscar_animal(id_animal) # Lança erro se não existir
 
+                navegar_adotantes(sistema)
                 id_adotante = int(input("Digite o ID do Adotante: "))
                 sistema.buscar_adotante(id_adotante) # Lança erro se não existir
 
@@ -190,14 +317,12 @@ def main():
 
         elif opcao == "6":
             print(f"\n--- {G4}Realizar Adoção{RESET} ---")
-            sistema.gerar_relatorio_animais()
-            sistema.listar_adotantes()
-            print("-" * 30)
-
             try:
+                navegar_animais(sistema)
                 id_animal = int(input("Digite o ID do Animal: "))
                 sistema.buscar_animal(id_animal) 
 
+                navegar_adotantes(sistema)
                 id_adotante = int(input("Digite o ID do Adotante: "))
                 sistema.buscar_adotante(id_adotante) 
 
@@ -207,10 +332,8 @@ def main():
 
         elif opcao == "7":
             print(f"\n--- {G3}Devolução{RESET} ---")
-            sistema.gerar_relatorio_animais(apenas_adotados=True)
-            print("-" * 30)
-            
             try:
+                navegar_animais(sistema, FiltroAnimais(status=StatusAnimal.ADOTADO))
                 id_animal = int(input("ID do Animal para devolver: "))
                 animal = sistema.buscar_animal(id_animal)
                 if animal.status != StatusAnimal.ADOTADO:
@@ -238,7 +361,7 @@ def main():
                 print(f"❌ Erro: {e}")
 
         elif opcao == "8":
-            sistema.gerar_relatorio_animais()
+            navegar_animais(sistema)
             try:
                 id_animal = int(input("\nDigite o ID do Animal para editar: "))
                 animal_atual = sistema.buscar_animal(id_animal) 
@@ -287,7 +410,7 @@ def main():
                 print(f"❌ Erro: {e}")
 
         elif opcao == "9":
-            sistema.gerar_relatorio_animais()
+            navegar_animais(sistema)
             try:
 
                 id_animal = int(input("\nDigite o ID do Animal para EXCLUIR: "))
@@ -300,7 +423,7 @@ def main():
                 print(f"❌ Erro: {e}")
 
         elif opcao == "10":
-            sistema.listar_adotantes()
+            navegar_adotantes(sistema)
             try:
 
                 id_adotante = int(input("\nDigite o ID do Adotante para editar: "))
@@ -334,7 +457,7 @@ def main():
                 print(f"❌ Erro: {e}")
 
         elif opcao == "11":
-            sistema.listar_adotantes()
+            navegar_adotantes(sistema)
             try:
  
                 id_adotante = int(input("\nDigite o ID do Adotante para EXCLUIR: "))
@@ -347,7 +470,7 @@ def main():
                 print(f"❌ Erro: {e}")
 
         elif opcao == "12":
-            sistema.gerar_relatorio_animais()
+            navegar_animais(sistema)
             try:
                 id_animal = int(input("\nDigite o ID do animal para ver detalhes da fila: "))
                 sistema.visualizar_detalhes_fila(id_animal)
@@ -358,12 +481,58 @@ def main():
             sistema.processar_reservas_vencidas()
 
         elif opcao == "14":
-            sistema.gerar_relatorios_estatisticos()
+            sistema.gerar_relatorios_estatisticos(escolher_formatos("txt"))
 
         elif opcao == "15":
             menu_configuracoes(sistema)
 
+        elif opcao == "16":
+            print(f"\n--- {G2}Histórico de Eventos{RESET} ---")
+            print(f"{G2}[Deixe vazio e aperte Enter para não filtrar]{RESET}")
+            try:
+                de = input("De (AAAA-MM-DD [HH:MM:SS]): ").strip()
+                ate = input("Até (AAAA-MM-DD [HH:MM:SS]): ").strip()
+                tipo = input("Tipo (ex: ADOÇÃO, EXPIRAÇÃO): ").strip().upper() or None
+                animal = input("Animal: ").strip() or None
+                adotante = input("Adotante: ").strip() or None
+                inicio = datetime.fromisoformat(de) if de else None
+                fim = datetime.fromisoformat(ate) if ate else None
+
+                from src.adocao.logquery import ConsultaLog
+                total = 0
+                for registro in ConsultaLog().consultar(inicio, fim, tipo, animal, adotante):
+                    print(registro)
+                    total += 1
+                print(f"\n{total} evento(s) encontrado(s).")
+            except ValueError as e:
+                print(f"❌ Erro: {e}")
+
+        elif opcao == "17":
+            sistema.exportar_relatorio_animais(escolher_formatos("csv"))
+
+        elif opcao == "18":
+            try:
+                dias = int(input("Período em dias [Enter = 365]: ").strip() or 365)
+                intervalo = int(input("Dias por linha [Enter = 7]: ").strip() or 7)
+                sistema.gerar_relatorio_tendencia(dias, intervalo)
+            except ValueError as e:
+                print(f"❌ Erro: {e}")
+
+        elif opcao == "19":
+            consulta = input("Buscar (nome, raça, temperamento, histórico): ").strip()
+            if consulta:
+                sistema.exibir_busca_animais(consulta)
+
+        elif opcao == "20":
+            nome = input("Nome do adotante: ").strip()
+            if nome:
+                sistema.exibir_busca_adotantes(nome)
+
+        elif opcao == "21":
+            sistema.gerar_relatorio_duplicatas(escolher_formatos(""))
+
         elif opcao == "0":
+            sistema.fechar()
             print(f"\n{G4}Saindo... Seus dados estão salvos! 💾{RESET}")
             break
         
@@ -371,4 +540,4 @@ def main():
             print("⚠️ Opção inválida, tente novamente.")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    sys.exit(main())
\ No newline at end of file
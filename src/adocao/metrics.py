@@ -0,0 +1,192 @@
+import os
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import sqlite3
+
+CAMPOS_METRICAS = [
+    "caes_total", "caes_adotados", "gatos_total", "gatos_adotados",
+    "disponiveis", "reservados", "quarentena", "inadotaveis", "devolvidos", "fila_total"
+]
+
+AGREGACOES = ("ultimo", "media", "maximo")
+
+@dataclass
+class AmostraMetricas:
+    """Contadores do abrigo em um instante (ou agregados em um intervalo).
+
+    Attributes:
+        momento (datetime): Instante da amostra (ou início do intervalo agregado).
+        valores (Dict[str, float]): Valor de cada campo de CAMPOS_METRICAS.
+    """
+    momento: datetime
+    valores: Dict[str, float] = field(default_factory=dict)
+
+    def taxa_adocao(self, especie: str) -> float:
+        """Calcula a taxa de adoção (%) de uma espécie.
+
+        Args:
+            especie (str): "caes" ou "gatos".
+
+        Returns:
+            float: Percentual de adotados, com uma casa decimal (0.0 sem animais).
+        """
+        total = self.valores.get(f"{especie}_total", 0)
+        return round(self.valores.get(f"{especie}_adotados", 0) / total * 100, 1) if total else 0.0
+
+class SerieMetricas:
+    """Série temporal dos contadores do relatório estatístico, em uma tabela SQLite.
+
+    Cada amostra é uma linha de inteiros indexada pelo instante em segundos
+    (tabela WITHOUT ROWID), o que mantém o arquivo pequeno. Consultas por
+    período podem ser reduzidas no próprio SQLite a um ponto por intervalo
+    (último valor, média ou máximo), de modo que uma tendência anual semanal
+    lê poucas dezenas de linhas agregadas.
+
+    Attributes:
+        db_name (str): Caminho do arquivo do banco.
+    """
+
+    def __init__(self, db_name: str = os.path.join("dados", "metricas.db")) -> None:
+        """Inicializa a série. O arquivo só é criado na primeira gravação.
+
+        Args:
+            db_name (str, optional): Caminho do banco. Defaults to "dados/metricas.db".
+        """
+        self.db_name = db_name
+        self._inicializado = False
+
+    def _get_conexao(self) -> 'sqlite3.Connection':
+        """Abre uma conexão, criando a pasta e a tabela se necessário.
+
+        Returns:
+            sqlite3.Connection: Objeto de conexão do SQLite.
+        """
+        if not self._inicializado:
+            pasta = os.path.dirname(self.db_name)
+            if pasta:
+                os.makedirs(pasta, exist_ok=True)
+        import sqlite3
+        conn = sqlite3.connect(self.db_name)
+        if not self._inicializado:
+            colunas = ", ".join(f"{c} INTEGER NOT NULL" for c in CAMPOS_METRICAS)
+            conn.execute(f"CREATE TABLE IF NOT EXISTS metricas (momento INTEGER PRIMARY KEY, {colunas}) WITHOUT ROWID")
+            conn.commit()
+            self._inicializado = True
+        return conn
+
+    def registrar(self, amostra: AmostraMetricas) -> None:
+        """Grava uma amostra (substitui outra do mesmo segundo, se houver).
+
+        Args:
+            amostra (AmostraMetricas): Contadores a gravar.
+        """
+        valores = [int(amostra.momento.timestamp())] + [int(amostra.valores.get(c, 0)) for c in CAMPOS_METRICAS]
+        marcadores = ", ".join("?" * len(valores))
+        conn = self._get_conexao()
+        try:
+            conn.execute(f"INSERT OR REPLACE INTO metricas (momento, {', '.join(CAMPOS_METRICAS)}) VALUES ({marcadores})", valores)
+            conn.commit()
+        finally:
+            conn.close()
+
+    def ultima(self) -> Optional[AmostraMetricas]:
+        """Retorna a amostra mais recente.
+
+        Returns:
+            Optional[AmostraMetricas]: A amostra ou None se a série estiver vazia.
+        """
+        if not os.path.exists(self.db_name):
+            return None
+        conn = self._get_conexao()
+        try:
+            linha = conn.execute(f"SELECT momento, {', '.join(CAMPOS_METRICAS)} FROM metricas ORDER BY momento DESC LIMIT 1").fetchone()
+        finally:
+            conn.close()
+        return self._amostra(linha) if linha else None
+
+    def consultar(self, inicio: Optional[datetime] = None, fim: Optional[datetime] = None, intervalo: Optional[timedelta] = None, agregacao: str = "ultimo") -> List[AmostraMetricas]:
+        """Lê as amostras de um período, opcionalmente reduzidas a uma por intervalo.
+
+        Args:
+            inicio (Optional[datetime], optional): Início do período (inclusivo). Defaults to None.
+            fim (Optional[datetime], optional): Fim do período (inclusivo). Defaults to None.
+            intervalo (Optional[timedelta], optional): Tamanho de cada intervalo; None devolve
+                as amostras brutas. Defaults to None.
+            agregacao (str, optional): "ultimo", "media" ou "maximo" por intervalo. Defaults to "ultimo".
+
+        Returns:
+            List[AmostraMetricas]: Amostras em ordem cronológica. Com intervalo, o momento
+                de cada amostra é o início do intervalo (alinhado a ``inicio``, ou à época).
+
+        Raises:
+            ValueError: Se a agregação ou o intervalo forem inválidos.
+        """
+        if agregacao not in AGREGACOES:
+            raise ValueError(f"Agregação inválida: {agregacao}. Use {', '.join(AGREGACOES)}.")
+        if not os.path.exists(self.db_name):
+            return []
+
+        de = int(inicio.timestamp()) if inicio else 0
+        ate = int(fim.timestamp()) if fim else 2 ** 62
+        colunas = ", ".join(CAMPOS_METRICAS)
+        if intervalo is None:
+            sql = f"SELECT momento, {colunas} FROM metricas WHERE momento BETWEEN ? AND ? ORDER BY momento"
+            parametros = (de, ate)
+        else:
+            passo = int(intervalo.total_seconds())
+            if passo <= 0:
+                raise ValueError("O intervalo precisa ser de pelo menos um segundo.")
+            balde = "(? + ((momento - ?) / ?) * ?)"
+            if agregacao == "ultimo":
+                # No SQLite, colunas simples junto de MAX() vêm da linha que tem o máximo.
+                selecao = f"MAX(momento), {colunas}"
+            else:
+                funcao = "AVG" if agregacao == "media" else "MAX"
+                selecao = "MIN(momento), " + ", ".join(f"{funcao}({c})" for c in CAMPOS_METRICAS)
+            sql = (f"SELECT {balde} AS balde, {selecao} FROM metricas WHERE momento BETWEEN ? AND ? "
+                   f"GROUP BY balde ORDER BY balde")
+            parametros = (de, de, passo, passo, de, ate)
+
+        conn = self._get_conexao()
+        try:
+            linhas = conn.execute(sql, parametros).fetchall()
+        finally:
+            conn.close()
+        if intervalo is not None:
+            linhas = [(linha[0],) + tuple(linha[2:]) for linha in linhas]
+        return [self._amostra(linha) for linha in linhas]
+
+    def variacao(self, campo: str, inicio: Optional[datetime] = None, fim: Optional[datetime] = None, intervalo: timedelta = timedelta(days=7)) -> List[AmostraMetricas]:
+        """Calcula quanto um contador cresceu em cada intervalo (ex: adoções por semana).
+
+        Args:
+            campo (str): Campo de CAMPOS_METRICAS (ex: "caes_adotados").
+            inicio (Optional[datetime], optional): Início do período. Defaults to None.
+            fim (Optional[datetime], optional): Fim do período. Defaults to None.
+            intervalo (timedelta, optional): Tamanho de cada intervalo. Defaults to 7 dias.
+
+        Returns:
+            List[AmostraMetricas]: Uma amostra por intervalo com ``valores[campo]`` igual à
+                diferença entre o último valor do intervalo e o do intervalo anterior.
+
+        Raises:
+            ValueError: Se o campo não existir.
+        """
+        if campo not in CAMPOS_METRICAS:
+            raise ValueError(f"Campo de métrica desconhecido: {campo}")
+        pontos = self.consultar(inicio, fim, intervalo, "ultimo")
+        resultado = []
+        anterior = None
+        for ponto in pontos:
+            valor = ponto.valores[campo]
+            resultado.append(AmostraMetricas(ponto.momento, {campo: valor - anterior if anterior is not None else 0}))
+            anterior = valor
+        return resultado
+
+    @staticmethod
+    def _amostra(linha: tuple) -> AmostraMetricas:
+        """Converte uma linha (momento, campos...) em AmostraMetricas."""
+        return AmostraMetricas(datetime.fromtimestamp(linha[0]), dict(zip(CAMPOS_METRICAS, linha[1:])))
@@ -0,0 +1,187 @@
+import atexit
+import os
+import queue
+import threading
+import time
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import List
+
+class Observador(ABC):
+    """Interface abstrata para observadores do sistema (Observer Pattern)."""
+
+    @abstractmethod
+    def atualizar(self, mensagem: str) -> None:
+        """Método chamado quando um evento ocorre no sujeito observado.
+
+        Args:
+            mensagem (str): A mensagem ou descrição do evento.
+        """
+        pass
+
+    def identificador(self) -> str:
+        """Nome estável do observador entre execuções (ex: para nomear arquivos de transbordo).
+
+        Returns:
+            str: Por padrão, o nome da classe; observadores que gravam em arquivo incluem o destino.
+        """
+        return type(self).__name__
+
+class LoggerObserver(Observador):
+    """Implementação concreta de Observador que registra eventos em um arquivo de log.
+
+    Attributes:
+        arquivo (str): Nome do arquivo de log.
+        pasta (str): Pasta onde o arquivo de log é gravado.
+    """
+
+    def __init__(self, arquivo: str = "historico_eventos.log", pasta: str = "dados") -> None:
+        """Inicializa o LoggerObserver.
+
+        Args:
+            arquivo (str, optional): Caminho do arquivo de log. Defaults to "historico_eventos.log".
+            pasta (str, optional): Pasta do arquivo de log. Defaults to "dados".
+        """
+        self.arquivo = arquivo
+        self.pasta = pasta
+
+    def atualizar(self, mensagem: str) -> None:
+        """Escreve a mensagem formatada com timestamp no arquivo de log.
+
+        Args:
+            mensagem (str): A mensagem do evento a ser logada.
+        """
+        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        log_entry = f"[{timestamp}] {mensagem}\n"
+        try:
+            pasta = self.pasta
+            if not os.path.exists(pasta):
+                os.makedirs(pasta)
+            caminho = os.path.join(pasta, self.arquivo)
+            with open(caminho, "a", encoding="utf-8") as f:
+                f.write(log_entry)
+        except Exception as e:
+            print(f"Erro ao gravar log: {e}")
+
+    def identificador(self) -> str:
+        """Nome da classe e caminho absoluto do arquivo de log."""
+        return f"{type(self).__name__}:{os.path.abspath(os.path.join(self.pasta, self.arquivo))}"
+
+class LoggerBufferizado(Observador):
+    """Observador de log que grava em lote a partir de uma thread de escrita.
+
+    ``atualizar`` apenas formata a linha (com o horário do evento) e a coloca
+    numa fila; a thread de escrita mantém o arquivo aberto e grava as linhas
+    acumuladas quando o lote enche, quando o intervalo vence ou no
+    encerramento. O formato das linhas é o mesmo do LoggerObserver.
+
+    Attributes:
+        arquivo (str): Nome do arquivo de log.
+        pasta (str): Pasta onde o arquivo de log é gravado.
+        intervalo (float): Tempo máximo (s) que uma linha espera antes de ser gravada.
+        tamanho_lote (int): Quantidade de linhas que força uma gravação imediata.
+    """
+
+    _DESCARREGAR = object()
+    _ENCERRAR = object()
+
+    def __init__(self, arquivo: str = "historico_eventos.log", pasta: str = "dados", intervalo: float = 0.5, tamanho_lote: int = 256) -> None:
+        """Inicializa o logger e inicia a thread de escrita.
+
+        Args:
+            arquivo (str, optional): Nome do arquivo de log. Defaults to "historico_eventos.log".
+            pasta (str, optional): Pasta do arquivo de log. Defaults to "dados".
+            intervalo (float, optional): Intervalo máximo entre gravações (s). Defaults to 0.5.
+            tamanho_lote (int, optional): Linhas por gravação. Defaults to 256.
+        """
+        self.arquivo = arquivo
+        # A gravação acontece depois, em outra thread: fixa o caminho contra mudanças de diretório.
+        self.pasta = os.path.abspath(pasta)
+        self.intervalo = intervalo
+        self.tamanho_lote = tamanho_lote
+        self._fila: queue.Queue = queue.Queue()
+        self._fechado = False
+        # Protege a verificação de _fechado junto com o put: nada entra na fila depois de _ENCERRAR.
+        self._trava = threading.Lock()
+        self._thread = threading.Thread(target=self._escrever, name="LoggerBufferizado", daemon=True)
+        self._thread.start()
+        atexit.register(self.fechar)
+
+    def atualizar(self, mensagem: str) -> None:
+        """Enfileira a mensagem formatada com timestamp para gravação.
+
+        Args:
+            mensagem (str): A mensagem do evento a ser logada.
+        """
+        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        with self._trava:
+            if self._fechado:
+                raise RuntimeError("LoggerBufferizado já foi fechado.")
+            self._fila.put(f"[{timestamp}] {mensagem}\n")
+
+    def identificador(self) -> str:
+        """Nome da classe e caminho absoluto do arquivo de log."""
+        return f"{type(self).__name__}:{os.path.join(self.pasta, self.arquivo)}"
+
+    def descarregar(self) -> None:
+        """Bloqueia até que todas as linhas enfileiradas até aqui estejam gravadas."""
+        gravado = threading.Event()
+        with self._trava:
+            if self._fechado:
+                return
+            self._fila.put((self._DESCARREGAR, gravado))
+        gravado.wait()
+
+    def fechar(self) -> None:
+        """Grava o que falta, fecha o arquivo e encerra a thread de escrita."""
+        with self._trava:
+            if self._fechado:
+                return
+            self._fechado = True
+            self._fila.put(self._ENCERRAR)
+        self._thread.join()
+        atexit.unregister(self.fechar)
+
+    def __enter__(self) -> 'LoggerBufferizado':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.fechar()
+
+    def _escrever(self) -> None:
+        """Laço da thread de escrita: junta linhas em lotes e grava com um único handle."""
+        arquivo = None
+        pendentes: List[str] = []
+        avisar: List[threading.Event] = []
+        encerrar = False
+        while not encerrar:
+            limite = time.monotonic() + self.intervalo
+            while len(pendentes) < self.tamanho_lote:
+                try:
+                    item = self._fila.get(timeout=max(0.0, limite - time.monotonic()))
+                except queue.Empty:
+                    break
+                if item is self._ENCERRAR:
+                    encerrar = True
+                    break
+                if isinstance(item, tuple):
+                    avisar.append(item[1])
+                    break
+                pendentes.append(item)
+
+            if pendentes:
+                try:
+                    if arquivo is None:
+                        os.makedirs(self.pasta, exist_ok=True)
+                        arquivo = open(os.path.join(self.pasta, self.arquivo), "a", encoding="utf-8")
+                    arquivo.write("".join(pendentes))
+                    arquivo.flush()
+                except Exception as e:
+                    print(f"Erro ao gravar log: {e}")
+                pendentes = []
+            for evento in avisar:
+                evento.set()
+            avisar = []
+
+        if arquivo is not None:
+            arquivo.close()
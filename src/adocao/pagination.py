@@ -0,0 +1,134 @@
+from dataclasses import dataclass, field
+from typing import Callable, Generic, List, Optional, Sequence, Tuple, Type, TypeVar
+from .domain import Animal, Adotante
+from .enums import StatusAnimal, PorteAnimal
+from .triage import normalizar_texto
+
+T = TypeVar("T")
+
+TAMANHO_PAGINA_PADRAO = 10
+
+@dataclass
+class FiltroAnimais:
+    """Critérios de listagem de animais. Critérios None aceitam qualquer valor.
+
+    Attributes:
+        status (Optional[StatusAnimal]): Status exigido.
+        porte (Optional[PorteAnimal]): Porte exigido.
+        especie (Optional[Type[Animal]]): Classe exigida (Cachorro ou Gato).
+        prefixo_nome (Optional[str]): Início do nome, sem diferenciar acentos e maiúsculas.
+    """
+    status: Optional[StatusAnimal] = None
+    porte: Optional[PorteAnimal] = None
+    especie: Optional[Type[Animal]] = None
+    prefixo_nome: Optional[str] = None
+
+    def aceita(self, animal: Animal) -> bool:
+        """Verifica se o animal atende a todos os critérios.
+
+        Args:
+            animal (Animal): O animal avaliado.
+
+        Returns:
+            bool: True se o animal deve aparecer na listagem.
+        """
+        if self.status is not None and animal.status != self.status:
+            return False
+        if self.porte is not None and animal.porte != self.porte:
+            return False
+        if self.especie is not None and not isinstance(animal, self.especie):
+            return False
+        if self.prefixo_nome and not normalizar_texto(animal.nome).startswith(normalizar_texto(self.prefixo_nome)):
+            return False
+        return True
+
+@dataclass
+class FiltroAdotantes:
+    """Critérios de listagem de adotantes.
+
+    Attributes:
+        prefixo_nome (Optional[str]): Início do nome, sem diferenciar acentos e maiúsculas.
+    """
+    prefixo_nome: Optional[str] = None
+
+    def aceita(self, adotante: Adotante) -> bool:
+        """Verifica se o adotante atende aos critérios.
+
+        Args:
+            adotante (Adotante): O adotante avaliado.
+
+        Returns:
+            bool: True se o adotante deve aparecer na listagem.
+        """
+        if self.prefixo_nome and not normalizar_texto(adotante.nome).startswith(normalizar_texto(self.prefixo_nome)):
+            return False
+        return True
+
+@dataclass
+class Pagina(Generic[T]):
+    """Uma página de listagem com cursores de navegação.
+
+    Os cursores são IDs (posições na lista): a próxima página começa depois
+    de ``cursor_proximo`` e a anterior termina antes de ``cursor_anterior``.
+
+    Attributes:
+        itens (List[Tuple[int, T]]): Pares (ID, entidade) da página, em ordem de ID.
+        cursor_anterior (Optional[int]): Cursor da página anterior, ou None se esta for a primeira.
+        cursor_proximo (Optional[int]): Cursor da próxima página, ou None se esta for a última.
+    """
+    itens: List[Tuple[int, T]] = field(default_factory=list)
+    cursor_anterior: Optional[int] = None
+    cursor_proximo: Optional[int] = None
+
+def paginar(itens: Sequence[T], aceita: Callable[[T], bool], apos: Optional[int] = None, antes: Optional[int] = None, tamanho: int = TAMANHO_PAGINA_PADRAO) -> Pagina[T]:
+    """Monta uma página por cursor (keyset) sobre uma sequência indexada por ID.
+
+    A busca começa no cursor e para assim que a página e um item extra (para
+    saber se há continuação) são encontrados, então o custo depende do
+    tamanho da página e da seletividade do filtro, não do total de itens.
+
+    Args:
+        itens (Sequence[T]): Entidades; o ID é a posição na sequência.
+        aceita (Callable[[T], bool]): Filtro.
+        apos (Optional[int], optional): Lista IDs maiores que este. Defaults to None (início).
+        antes (Optional[int], optional): Lista os últimos IDs menores que este (página anterior).
+            Tem precedência sobre ``apos``. Defaults to None.
+        tamanho (int, optional): Itens por página. Defaults to TAMANHO_PAGINA_PADRAO.
+
+    Returns:
+        Pagina[T]: A página encontrada.
+
+    Raises:
+        ValueError: Se o tamanho da página não for positivo.
+    """
+    if tamanho <= 0:
+        raise ValueError("O tamanho da página deve ser positivo.")
+
+    if antes is not None:
+        encontrados = _buscar(itens, aceita, range(min(antes, len(itens)) - 1, -1, -1), tamanho + 1)
+        encontrados.reverse()
+        ha_anterior = len(encontrados) > tamanho
+        pagina = encontrados[-tamanho:]
+        ha_proximo = antes < len(itens) and bool(_buscar(itens, aceita, range(antes, len(itens)), 1))
+    else:
+        inicio = apos + 1 if apos is not None else 0
+        encontrados = _buscar(itens, aceita, range(max(inicio, 0), len(itens)), tamanho + 1)
+        ha_proximo = len(encontrados) > tamanho
+        pagina = encontrados[:tamanho]
+        ha_anterior = inicio > 0 and bool(_buscar(itens, aceita, range(min(inicio, len(itens)) - 1, -1, -1), 1))
+
+    return Pagina(
+        itens=pagina,
+        cursor_anterior=pagina[0][0] if pagina and ha_anterior else None,
+        cursor_proximo=pagina[-1][0] if pagina and ha_proximo else None
+    )
+
+def _buscar(itens: Sequence[T], aceita: Callable[[T], bool], posicoes: range, limite: int) -> List[Tuple[int, T]]:
+    """Percorre as posições na ordem dada até achar ``limite`` itens aceitos."""
+    encontrados = []
+    for i in posicoes:
+        if aceita(itens[i]):
+            encontrados.append((i, itens[i]))
+            if len(encontrados) == limite:
+                break
+    return encontrados
@@ -0,0 +1,109 @@
+from typing import Any, Dict, Tuple
+from .domain import Animal, Adotante
+from .enums import PorteAnimal, TipoMoradia
+
+TEMPERAMENTOS_ARISCOS = frozenset({"arisco", "agressivo"})
+ORDEM_PORTES = (PorteAnimal.P, PorteAnimal.M, PorteAnimal.G)
+
+def eh_arisco(animal: Animal) -> bool:
+    """Indica se algum temperamento do animal é considerado arisco/agressivo.
+
+    Args:
+        animal (Animal): O animal avaliado.
+
+    Returns:
+        bool: True se o animal tiver temperamento arisco ou agressivo.
+    """
+    return any(t.lower() in TEMPERAMENTOS_ARISCOS for t in animal.temperamento)
+
+def classe_elegibilidade(animal: Animal) -> int:
+    """Calcula a posição do bit que representa a classe (porte, temperamento) do animal.
+
+    São 6 classes: 3 portes x (dócil, arisco). O bit de índice ``2 * porte + arisco``
+    é usado nas máscaras de elegibilidade dos adotantes.
+
+    Args:
+        animal (Animal): O animal avaliado.
+
+    Returns:
+        int: Índice do bit (0 a 5).
+    """
+    return 2 * ORDEM_PORTES.index(animal.porte) + (1 if eh_arisco(animal) else 0)
+
+class PoliticaAdocao:
+    """Política de adoção compilada a partir das configurações do sistema.
+
+    Os limites lidos do ``settings.json`` são copiados na criação, de modo que a
+    avaliação de um par (animal, adotante) não consulta mais o dicionário de
+    configurações nem usa exceções como fluxo de controle.
+
+    Attributes:
+        idade_minima (int): Idade mínima do adotante.
+        area_minima_g (float): Área mínima exigida para animais de porte grande.
+    """
+
+    def __init__(self, settings: Dict[str, Any]) -> None:
+        """Compila a política a partir das configurações.
+
+        Args:
+            settings (Dict[str, Any]): Configurações do sistema.
+        """
+        self.idade_minima = settings["idade_minima"]
+        self.area_minima_g = settings["area_minima_g"]
+
+    @staticmethod
+    def assinatura(settings: Dict[str, Any]) -> Tuple[Any, ...]:
+        """Retorna os valores de configuração dos quais a política depende.
+
+        Args:
+            settings (Dict[str, Any]): Configurações do sistema.
+
+        Returns:
+            Tuple[Any, ...]: Tupla usada para detectar mudanças nas configurações.
+        """
+        return (settings["idade_minima"], settings["area_minima_g"])
+
+    def avaliar(self, animal: Animal, adotante: Adotante) -> Tuple[bool, str]:
+        """Avalia se o adotante cumpre os requisitos para adotar o animal.
+
+        Args:
+            animal (Animal): O animal pretendido.
+            adotante (Adotante): O candidato à adoção.
+
+        Returns:
+            Tuple[bool, str]: (Aprovado, Motivo da recusa ou string vazia).
+        """
+        if adotante.idade < self.idade_minima:
+            return False, f"Adotante deve ter >= {self.idade_minima} anos."
+
+        if animal.porte == PorteAnimal.G:
+            if adotante.moradia != TipoMoradia.CASA:
+                return False, "Animais de Porte Grande exigem moradia em CASA."
+            if adotante.area_util < self.area_minima_g:
+                return False, f"Porte G exige área mínima de {self.area_minima_g}m²."
+
+        if adotante.tem_criancas and eh_arisco(animal):
+            return False, "Não permitido adotar animais 'ariscos' em casas com crianças."
+
+        return True, ""
+
+    def mascara(self, adotante: Adotante) -> int:
+        """Calcula o bitmap das classes de animal que o adotante pode adotar.
+
+        Args:
+            adotante (Adotante): O adotante avaliado.
+
+        Returns:
+            int: Máscara com um bit por classe (ver ``classe_elegibilidade``).
+        """
+        if adotante.idade < self.idade_minima:
+            return 0
+
+        bits = 0
+        for posicao, porte in enumerate(ORDEM_PORTES):
+            if porte == PorteAnimal.G and (adotante.moradia != TipoMoradia.CASA or adotante.area_util < self.area_minima_g):
+                continue
+            bits |= 1 << (2 * posicao)
+            if not adotante.tem_criancas:
+                bits |= 1 << (2 * posicao + 1)
+        return bits
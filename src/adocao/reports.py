@@ -0,0 +1,388 @@
+import csv
+import json
+import os
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, TextIO
+from .domain import Animal
+from .metrics import AmostraMetricas
+from .results import EstatisticasAbrigo, ParDuplicado
+
+SEPARADOR = "=" * 50
+
+@dataclass
+class Secao:
+    """Uma seção de relatório: registros homogêneos produzidos sob demanda.
+
+    Attributes:
+        chave (str): Identificador estável da seção (usado no CSV e no JSON).
+        titulo (str): Título exibido no texto.
+        colunas (List[str]): Campos de cada registro, na ordem de saída.
+        registros (Iterable[Dict[str, Any]]): Registros da seção (pode ser um gerador).
+        formatar (Callable[[Dict[str, Any]], str]): Converte um registro na linha de texto.
+        vazio (str): Linha de texto exibida quando a seção não tem registros.
+    """
+    chave: str
+    titulo: str
+    colunas: List[str]
+    registros: Iterable[Dict[str, Any]]
+    formatar: Callable[[Dict[str, Any]], str]
+    vazio: str = "   (Nenhum registro)"
+
+@dataclass
+class Relatorio:
+    """Relatório composto por seções geradas sob demanda.
+
+    Attributes:
+        nome (str): Identificador do relatório (ex: "estatisticas").
+        titulo (str): Título exibido no texto.
+        secoes (Iterable[Secao]): Seções, na ordem de saída.
+        gerado_em (datetime): Momento da geração.
+    """
+    nome: str
+    titulo: str
+    secoes: Iterable[Secao]
+    gerado_em: datetime = field(default_factory=datetime.now)
+
+class SaidaRelatorio(ABC):
+    """Destino de um relatório (Strategy). Recebe o relatório em fluxo, registro a registro."""
+
+    @abstractmethod
+    def iniciar(self, relatorio: Relatorio) -> None:
+        """Chamado antes da primeira seção."""
+
+    @abstractmethod
+    def iniciar_secao(self, secao: Secao) -> None:
+        """Chamado no início de cada seção."""
+
+    @abstractmethod
+    def registro(self, secao: Secao, dados: Dict[str, Any]) -> None:
+        """Chamado para cada registro da seção."""
+
+    @abstractmethod
+    def finalizar_secao(self, secao: Secao, quantidade: int) -> None:
+        """Chamado ao fim de cada seção, com o número de registros emitidos."""
+
+    @abstractmethod
+    def finalizar(self, relatorio: Relatorio) -> None:
+        """Chamado depois da última seção."""
+
+class SaidaTexto(SaidaRelatorio):
+    """Relatório legível (com emojis), o mesmo formato exibido no console.
+
+    Attributes:
+        destino (TextIO): Fluxo de saída (arquivo ou sys.stdout).
+    """
+
+    def __init__(self, destino: TextIO) -> None:
+        self.destino = destino
+
+    def _linha(self, texto: str) -> None:
+        self.destino.write(texto + "\n")
+
+    def iniciar(self, relatorio: Relatorio) -> None:
+        self._linha("\n" + SEPARADOR)
+        self._linha(relatorio.titulo)
+        self._linha("Data de Geração: " + relatorio.gerado_em.strftime("%d/%m/%Y %H:%M:%S"))
+        self._linha(SEPARADOR)
+
+    def iniciar_secao(self, secao: Secao) -> None:
+        self._linha("\n" + secao.titulo)
+
+    def registro(self, secao: Secao, dados: Dict[str, Any]) -> None:
+        self._linha(secao.formatar(dados))
+
+    def finalizar_secao(self, secao: Secao, quantidade: int) -> None:
+        if quantidade == 0:
+            self._linha(secao.vazio)
+
+    def finalizar(self, relatorio: Relatorio) -> None:
+        self._linha(SEPARADOR)
+        self.destino.flush()
+
+class SaidaCSV(SaidaRelatorio):
+    """Relatório em CSV: uma linha por registro, com a coluna "secao" na frente.
+
+    O cabeçalho é escrito no início e repetido (após uma linha em branco)
+    apenas quando uma seção tem colunas diferentes da anterior; relatórios de
+    uma única seção, como o detalhado de animais, são um CSV comum.
+
+    Attributes:
+        destino (TextIO): Arquivo aberto com newline="".
+    """
+
+    def __init__(self, destino: TextIO) -> None:
+        self.destino = destino
+        self._escritor = csv.writer(destino)
+        self._colunas: Optional[List[str]] = None
+
+    def iniciar(self, relatorio: Relatorio) -> None:
+        pass
+
+    def iniciar_secao(self, secao: Secao) -> None:
+        if secao.colunas != self._colunas:
+            if self._colunas is not None:
+                self._escritor.writerow([])
+            self._escritor.writerow(["secao"] + secao.colunas)
+            self._colunas = secao.colunas
+
+    def registro(self, secao: Secao, dados: Dict[str, Any]) -> None:
+        self._escritor.writerow([secao.chave] + [_valor_simples(dados.get(c)) for c in secao.colunas])
+
+    def finalizar_secao(self, secao: Secao, quantidade: int) -> None:
+        pass
+
+    def finalizar(self, relatorio: Relatorio) -> None:
+        self.destino.flush()
+
+class SaidaJSON(SaidaRelatorio):
+    """Relatório em JSON, escrito incrementalmente (sem montar o documento em memória).
+
+    Formato: ``{"relatorio", "gerado_em", "secoes": [{"chave", "titulo", "registros": [...]}]}``.
+
+    Attributes:
+        destino (TextIO): Fluxo de saída.
+    """
+
+    def __init__(self, destino: TextIO) -> None:
+        self.destino = destino
+        self._primeira_secao = True
+        self._primeiro_registro = True
+
+    def iniciar(self, relatorio: Relatorio) -> None:
+        self.destino.write('{"relatorio": %s, "gerado_em": %s, "secoes": [' % (
+            json.dumps(relatorio.nome), json.dumps(relatorio.gerado_em.isoformat(timespec="seconds"))))
+        self._primeira_secao = True
+
+    def iniciar_secao(self, secao: Secao) -> None:
+        if not self._primeira_secao:
+            self.destino.write(", ")
+        self._primeira_secao = False
+        self._primeiro_registro = True
+        self.destino.write('\n  {"chave": %s, "titulo": %s, "registros": [' % (
+            json.dumps(secao.chave), json.dumps(secao.titulo, ensure_ascii=False)))
+
+    def registro(self, secao: Secao, dados: Dict[str, Any]) -> None:
+        if not self._primeiro_registro:
+            self.destino.write(",")
+        self._primeiro_registro = False
+        self.destino.write("\n    " + json.dumps(dados, ensure_ascii=False, default=_valor_simples))
+
+    def finalizar_secao(self, secao: Secao, quantidade: int) -> None:
+        self.destino.write("]}")
+
+    def finalizar(self, relatorio: Relatorio) -> None:
+        self.destino.write("\n]}\n")
+        self.destino.flush()
+
+SAIDAS_POR_FORMATO: Dict[str, Callable[[TextIO], SaidaRelatorio]] = {
+    "txt": SaidaTexto,
+    "csv": SaidaCSV,
+    "json": SaidaJSON
+}
+
+def _valor_simples(valor: Any) -> Any:
+    """Converte enums, datas e Decimals em tipos aceitos por CSV/JSON."""
+    if hasattr(valor, "value"):
+        return valor.value
+    if isinstance(valor, datetime):
+        return valor.isoformat(timespec="seconds")
+    if isinstance(valor, (list, tuple)):
+        return ", ".join(str(v) for v in valor)
+    if valor is None or isinstance(valor, (str, int, float, bool)):
+        return valor
+    return str(valor)
+
+def gerar_relatorio(relatorio: Relatorio, saidas: Iterable[SaidaRelatorio]) -> int:
+    """Percorre o relatório uma única vez, repassando cada registro a todas as saídas.
+
+    Nenhuma seção é acumulada: a memória usada não depende do número de registros.
+
+    Args:
+        relatorio (Relatorio): Relatório a gerar.
+        saidas (Iterable[SaidaRelatorio]): Destinos.
+
+    Returns:
+        int: Total de registros emitidos.
+    """
+    saidas = list(saidas)
+    total = 0
+    for saida in saidas:
+        saida.iniciar(relatorio)
+    for secao in relatorio.secoes:
+        for saida in saidas:
+            saida.iniciar_secao(secao)
+        quantidade = 0
+        for dados in secao.registros:
+            for saida in saidas:
+                saida.registro(secao, dados)
+            quantidade += 1
+        for saida in saidas:
+            saida.finalizar_secao(secao, quantidade)
+        total += quantidade
+    for saida in saidas:
+        saida.finalizar(relatorio)
+    return total
+
+def relatorio_estatistico(stats: EstatisticasAbrigo) -> Relatorio:
+    """Monta o relatório estatístico do abrigo.
+
+    Args:
+        stats (EstatisticasAbrigo): Números calculados pelo núcleo.
+
+    Returns:
+        Relatorio: Relatório com as seções populares, adoção por espécie, tempo médio e devoluções.
+    """
+    icones = {"Cães": "🐶 Cães: ", "Gatos": "🐱 Gatos:"}
+    rotulos = {
+        "quarentena": "🏥 Em Quarentena (Saúde)",
+        "inadotaveis": "⛔ Inadotáveis (Comportamento)",
+        "devolvidos": "🔙 Devolvidos (Aguardando)"
+    }
+
+    def populares() -> Iterator[Dict[str, Any]]:
+        for i, (animal, tamanho) in enumerate(stats.populares):
+            yield {"posicao": i + 1, "animal": animal.nome, "fila": tamanho}
+
+    def tempo_medio() -> Iterator[Dict[str, Any]]:
+        if stats.tempo_medio_dias is not None:
+            yield {"media_dias": round(stats.tempo_medio_dias, 1)}
+
+    secoes = [
+        Secao("populares", "🏆 TOP 5 - ANIMAIS MAIS POPULARES (Maiores Filas)", ["posicao", "animal", "fila"],
+              populares(), lambda r: f"   {r['posicao']}º. {r['animal']} - Fila: {r['fila']} pessoas",
+              "   (Nenhum animal com fila de espera no momento)"),
+        Secao("adocao_por_especie", "📈 TAXA DE ADOÇÃO POR ESPÉCIE", ["especie", "adotados", "total", "taxa"],
+              [dict(especie="Cães", **stats.caes), dict(especie="Gatos", **stats.gatos)],
+              lambda r: f"   {icones[r['especie']]} {r['adotados']}/{r['total']} ({r['taxa']}%)"),
+        Secao("tempo_medio", "⏱️  TEMPO MÉDIO ATÉ A ADOÇÃO", ["media_dias"],
+              tempo_medio(), lambda r: f"   Média geral: {r['media_dias']:.1f} dias",
+              "   (Dados insuficientes para cálculo)"),
+        Secao("devolucoes", "⚠️  DEVOLUÇÕES E ANIMAIS INADOTÁVEIS", ["situacao", "quantidade"],
+              [{"situacao": chave, "quantidade": getattr(stats, chave)} for chave in rotulos],
+              lambda r: f"   {rotulos[r['situacao']]}: {r['quantidade']}")
+    ]
+    return Relatorio("estatisticas", "📊 RELATÓRIOS ESTATÍSTICOS DO ABRIGO", secoes, stats.gerado_em)
+
+COLUNAS_ANIMAL = ["id", "nome", "especie", "raca", "porte", "status", "temperamento", "vacinas", "reservante", "fila", "eventos"]
+
+def relatorio_animais(animais: Iterable[Animal]) -> Relatorio:
+    """Monta o relatório detalhado por animal, gerado sob demanda.
+
+    Args:
+        animais (Iterable[Animal]): Animais (na ordem dos IDs).
+
+    Returns:
+        Relatorio: Relatório com uma seção e um registro por animal.
+    """
+    def registros() -> Iterator[Dict[str, Any]]:
+        for i, animal in enumerate(animais):
+            yield {
+                "id": i,
+                "nome": animal.nome,
+                "especie": type(animal).__name__,
+                "raca": animal._raca,
+                "porte": animal.porte.value,
+                "status": animal.status.value,
+                "temperamento": list(animal.temperamento),
+                "vacinas": sorted(animal.agenda_vacinas),
+                "reservante": animal.nome_reservante,
+                "fila": len(animal.fila_espera),
+                "eventos": len(animal.historico_eventos)
+            }
+
+    def formatar(r: Dict[str, Any]) -> str:
+        extra = f" [Reservado: {r['reservante']}]" if r["reservante"] else ""
+        extra += f" [Fila: {r['fila']}]" if r["fila"] else ""
+        vacinas = ", ".join(r["vacinas"]) or "nenhuma"
+        return f"   [{r['id']}] {r['nome']} ({r['especie']}, {r['raca']}, {r['porte']}) - {r['status']}{extra} | Vacinas: {vacinas}"
+
+    secao = Secao("animais", "🐾 DETALHES POR ANIMAL", COLUNAS_ANIMAL, registros(), formatar,
+                  "   (Nenhum animal cadastrado)")
+    return Relatorio("animais", "📋 RELATÓRIO DETALHADO DE ANIMAIS", [secao])
+
+COLUNAS_TENDENCIA = ["inicio", "adocoes", "taxa_caes", "taxa_gatos", "quarentena", "inadotaveis", "devolvidos", "fila_total"]
+
+def relatorio_tendencia(pontos: Iterable[AmostraMetricas], intervalo_dias: int) -> Relatorio:
+    """Monta o relatório de tendência a partir da série de métricas reduzida.
+
+    Args:
+        pontos (Iterable[AmostraMetricas]): Um ponto por intervalo (último valor do intervalo).
+        intervalo_dias (int): Dias por ponto, exibido no título.
+
+    Returns:
+        Relatorio: Relatório com uma linha por intervalo; "adocoes" é o aumento de
+            adotados em relação ao intervalo anterior.
+    """
+    def registros() -> Iterator[Dict[str, Any]]:
+        anterior = None
+        for ponto in pontos:
+            adotados = ponto.valores["caes_adotados"] + ponto.valores["gatos_adotados"]
+            yield {
+                "inicio": ponto.momento.strftime("%Y-%m-%d"),
+                "adocoes": max(adotados - anterior, 0) if anterior is not None else None,
+                "taxa_caes": ponto.taxa_adocao("caes"),
+                "taxa_gatos": ponto.taxa_adocao("gatos"),
+                "quarentena": ponto.valores["quarentena"],
+                "inadotaveis": ponto.valores["inadotaveis"],
+                "devolvidos": ponto.valores["devolvidos"],
+                "fila_total": ponto.valores["fila_total"]
+            }
+            anterior = adotados
+
+    def formatar(r: Dict[str, Any]) -> str:
+        adocoes = "-" if r["adocoes"] is None else r["adocoes"]
+        return (f"   {r['inicio']} | Adoções: {adocoes} | 🐶 {r['taxa_caes']}% 🐱 {r['taxa_gatos']}% | "
+                f"🏥 {r['quarentena']} ⛔ {r['inadotaveis']} 🔙 {r['devolvidos']} | Fila: {r['fila_total']}")
+
+    secao = Secao("tendencia", f"📉 EVOLUÇÃO A CADA {intervalo_dias} DIA(S)", COLUNAS_TENDENCIA, registros(), formatar,
+                  "   (Nenhuma amostra de métricas no período)")
+    return Relatorio("tendencia", "📉 TENDÊNCIA DAS MÉTRICAS DO ABRIGO", [secao])
+
+COLUNAS_DUPLICATAS = ["id_a", "nome_a", "contato_a", "id_b", "nome_b", "contato_b", "similaridade", "motivo"]
+
+def relatorio_duplicatas(pares: Iterable[ParDuplicado]) -> Relatorio:
+    """Monta o relatório de adotantes provavelmente duplicados.
+
+    Args:
+        pares (Iterable[ParDuplicado]): Pares encontrados (ver NucleoAdocao.relatorio_duplicatas).
+
+    Returns:
+        Relatorio: Relatório com uma linha por par.
+    """
+    def registros() -> Iterator[Dict[str, Any]]:
+        for par in pares:
+            yield {
+                "id_a": par.idx_a,
+                "nome_a": par.adotante_a.nome,
+                "contato_a": par.adotante_a.contato,
+                "id_b": par.idx_b,
+                "nome_b": par.adotante_b.nome,
+                "contato_b": par.adotante_b.contato,
+                "similaridade": par.similaridade,
+                "motivo": par.motivo
+            }
+
+    def formatar(r: Dict[str, Any]) -> str:
+        return (f"   [{r['id_a']}] {r['nome_a']} ({r['contato_a']}) x [{r['id_b']}] {r['nome_b']} ({r['contato_b']})"
+                f" - {r['motivo']}, semelhança {r['similaridade']:.0%}")
+
+    secao = Secao("duplicatas", "👥 CADASTROS PROVAVELMENTE DUPLICADOS", COLUNAS_DUPLICATAS, registros(), formatar,
+                  "   (Nenhuma duplicata provável encontrada)")
+    return Relatorio("duplicatas", "👥 RELATÓRIO DE DUPLICATAS DE ADOTANTES", [secao])
+
+def caminho_relatorio(pasta: str, nome: str, formato: str, momento: Optional[datetime] = None) -> str:
+    """Monta o caminho ``<pasta>/<nome>_AAAA-MM-DD_HH-MM-SS.<formato>``.
+
+    Args:
+        pasta (str): Pasta dos relatórios.
+        nome (str): Prefixo do arquivo (ex: "relatorio").
+        formato (str): Extensão ("txt", "csv" ou "json").
+        momento (Optional[datetime], optional): Carimbo do nome. Defaults to agora.
+
+    Returns:
+        str: Caminho do arquivo.
+    """
+    momento = momento or datetime.now()
+    return os.path.join(pasta, f"{nome}_{momento.strftime('%Y-%m-%d_%H-%M-%S')}.{formato}")
@@ -1,12 +1,78 @@
+import itertools
 import json
 import os
-import sqlite3
+import threading
 from abc import ABC, abstractmethod
-from typing import List
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union, TYPE_CHECKING
+from .concurrency import trava_arquivo
 from .domain import Animal, Adotante
+from .exceptions import ConflitoVersaoError, RepositorioError
+
+if TYPE_CHECKING:
+    import sqlite3
+
+Entidade = Union[Animal, Adotante]
+
+@dataclass
+class ConflitoVersao:
+    """Uma entidade que outro processo alterou ou excluiu depois de ela ser lida.
+
+    Attributes:
+        tipo (str): "animais" ou "adotantes".
+        uid (str): Identificador estável da entidade.
+        nome (str): Nome da entidade, para a mensagem de erro.
+        versao_esperada (int): Versão que este processo leu.
+        versao_atual (Optional[int]): Versão gravada agora (None se foi excluída).
+        dados_atuais (Optional[Dict[str, Any]]): Estado gravado agora (None se foi excluída).
+        entidade (Optional[Entidade]): Objeto em memória (None se este processo o excluiu).
+    """
+    tipo: str
+    uid: str
+    nome: str
+    versao_esperada: int
+    versao_atual: Optional[int]
+    dados_atuais: Optional[Dict[str, Any]]
+    entidade: Optional[Entidade] = None
+
+    def __str__(self) -> str:
+        """Descrição do conflito para o usuário."""
+        rotulo = "Animal" if self.tipo == "animais" else "Adotante"
+        if self.versao_atual is None:
+            return f"{rotulo} '{self.nome}' foi excluído por outro processo."
+        return f"{rotulo} '{self.nome}' foi alterado por outro processo (versão {self.versao_atual}, esperada {self.versao_esperada})."
 
 class Repositorio(ABC):
-    """Classe abstrata que define a interface para persistência de dados."""
+    """Classe abstrata que define a interface para persistência de dados.
+
+    Cada entidade tem um ``uid`` estável e uma ``versao`` que o repositório
+    incrementa a cada gravação. As implementações gravam só as entidades
+    marcadas como alteradas (``marcar_animais``/``marcar_adotantes``), as novas
+    e as excluídas desde a última leitura/gravação, e só se a versão gravada
+    ainda for a que foi lida (comparar-e-trocar); do contrário, levantam
+    ConflitoVersaoError depois de gravar as demais alterações. Assim vários
+    processos podem compartilhar os mesmos arquivos sem sobrescrever o trabalho
+    uns dos outros.
+
+    Attributes:
+        ao_transferir (Optional[Callable[[str, int, int], None]]): Callback chamado após cada
+            leitura ou gravação com (operação, registros, bytes), ex: para a instrumentação.
+    """
+
+    def __init__(self) -> None:
+        """Inicializa o registro do que foi lido/gravado por este processo."""
+        # tipo -> uid -> versão lida/gravada; base do comparar-e-trocar.
+        self._persistidos: Dict[str, Dict[str, int]] = {"animais": {}, "adotantes": {}}
+        # tipo -> uid -> número da marcação; entidades alteradas em memória desde a última gravação.
+        self._alteradas: Dict[str, Dict[str, int]] = {"animais": {}, "adotantes": {}}
+        # Marcações vistas pela gravação em curso: uma nova marcação feita durante a
+        # gravação (número diferente) sobrevive a ela.
+        self._marcas_lidas: Dict[str, Dict[str, int]] = {"animais": {}, "adotantes": {}}
+        self._contador_marcas = itertools.count(1)
+        self._trava_marcas = threading.Lock()
+        # Entidades que outro processo excluiu e que não devem ser recriadas.
+        self._excluidos: Set[str] = set()
+        self.ao_transferir: Optional[Callable[[str, int, int], None]] = None
 
     @abstractmethod
     def salvar_animais(self, animais: List[Animal]) -> None:
@@ -14,6 +80,9 @@ class Repositorio(ABC):
 
         Args:
             animais (List[Animal]): Lista de instâncias de Animal a serem salvas.
+
+        Raises:
+            ConflitoVersaoError: Se algum animal alterado foi gravado por outro processo nesse meio tempo.
         """
         pass
 
@@ -32,6 +101,9 @@ class Repositorio(ABC):
 
         Args:
             adotantes (List[Adotante]): Lista de instâncias de Adotante a serem salvas.
+
+        Raises:
+            ConflitoVersaoError: Se algum adotante alterado foi gravado por outro processo nesse meio tempo.
         """
         pass
 
@@ -44,29 +116,365 @@ class Repositorio(ABC):
         """
         pass
 
+    def marcar_animais(self, animais: Iterable[Animal]) -> None:
+        """Anota animais alterados em memória, para que a próxima gravação os inclua.
+
+        Animais novos e excluídos não precisam ser marcados: são detectados pelo uid.
+
+        Args:
+            animais (Iterable[Animal]): Animais alterados.
+        """
+        self._marcar("animais", animais)
+
+    def marcar_adotantes(self, adotantes: Iterable[Adotante]) -> None:
+        """Anota adotantes alterados em memória, para que a próxima gravação os inclua.
+
+        Args:
+            adotantes (Iterable[Adotante]): Adotantes alterados.
+        """
+        self._marcar("adotantes", adotantes)
+
+    def importar_animais(self, animais: Iterable[Animal]) -> int:
+        """Acrescenta animais novos em massa, consumindo o iterável aos poucos.
+
+        Ao contrário de ``salvar_animais``, não compara com o que foi lido nem
+        guarda os animais gravados: serve para cargas grandes (ex: dados
+        sintéticos) que não cabem em memória. Os registros entram com versão 1.
+
+        Args:
+            animais (Iterable[Animal]): Animais a incluir (pode ser um gerador).
+
+        Returns:
+            int: Quantidade de animais gravados.
+
+        Raises:
+            RepositorioError: Se algum uid já existir no repositório; nada é gravado.
+        """
+        return self._importar("animais", animais)
+
+    def importar_adotantes(self, adotantes: Iterable[Adotante]) -> int:
+        """Acrescenta adotantes novos em massa, consumindo o iterável aos poucos.
+
+        Args:
+            adotantes (Iterable[Adotante]): Adotantes a incluir (pode ser um gerador).
+
+        Returns:
+            int: Quantidade de adotantes gravados.
+
+        Raises:
+            RepositorioError: Se algum uid já existir no repositório; nada é gravado.
+        """
+        return self._importar("adotantes", adotantes)
+
+    @abstractmethod
+    def _importar(self, tipo: str, entidades: Iterable[Entidade]) -> int:
+        """Grava entidades novas sem mantê-las em memória (ver ``importar_animais``)."""
+        pass
+
+    @staticmethod
+    def _registros_importados(entidades: Iterable[Entidade]) -> Iterator[Tuple[str, int, str]]:
+        """(uid, versão, JSON) de cada entidade importada; entidades nunca gravadas ficam com versão 1."""
+        for entidade in entidades:
+            dados = entidade.to_dict()
+            dados["versao"] = entidade.versao or 1
+            yield entidade.uid, dados["versao"], json.dumps(dados, ensure_ascii=False)
+
+    def sincronizar(self, conflito: ConflitoVersao) -> None:
+        """Aceita a versão gravada por outro processo para uma entidade em conflito.
+
+        A entidade em memória recebe o estado atual (no próprio objeto, para que
+        índices e referências continuem válidos). Se ela foi excluída, deixa de
+        ser gravada por este processo.
+
+        Args:
+            conflito (ConflitoVersao): Conflito levantado por uma gravação.
+        """
+        entidade = conflito.entidade
+        if entidade is None:
+            return
+        if conflito.dados_atuais is None:
+            self._excluidos.add(conflito.uid)
+            self._persistidos[conflito.tipo].pop(conflito.uid, None)
+            self._alteradas[conflito.tipo].pop(conflito.uid, None)
+            return
+        classe = Animal if conflito.tipo == "animais" else Adotante
+        atual = classe.from_dict(conflito.dados_atuais)
+        entidade.__dict__.update(atual.__dict__)
+        self._registrar(conflito.tipo, entidade)
+
+    def _informar_transferencia(self, operacao: str, registros: int, tamanho: int) -> None:
+        """Avisa o interessado registrado quantos registros e bytes uma operação moveu."""
+        if self.ao_transferir is not None:
+            self.ao_transferir(operacao, registros, tamanho)
+
+    def _marcar(self, tipo: str, entidades: Iterable[Entidade]) -> None:
+        """Anota entidades como alteradas (ver ``marcar_animais``)."""
+        alteradas = self._alteradas[tipo]
+        with self._trava_marcas:
+            for entidade in entidades:
+                alteradas[entidade.uid] = next(self._contador_marcas)
+
+    def _registrar(self, tipo: str, entidade: Entidade) -> None:
+        """Anota a entidade como igual à gravada (após carregar ou sincronizar)."""
+        self._persistidos[tipo][entidade.uid] = entidade.versao
+        self._alteradas[tipo].pop(entidade.uid, None)
+
+    def _alteracoes(self, tipo: str, entidades: List[Entidade]) -> Tuple[List[Tuple[Entidade, int, Dict[str, Any]]], List[Tuple[str, int]]]:
+        """Separa o que precisa ser gravado: entidades marcadas, novas e excluídas.
+
+        Só as entidades alteradas ou novas são serializadas; das demais, a lista
+        é percorrida apenas para conferir o uid.
+
+        Args:
+            tipo (str): "animais" ou "adotantes".
+            entidades (List[Entidade]): Lista atual em memória.
+
+        Returns:
+            Tuple[List[Tuple[Entidade, int, Dict[str, Any]]], List[Tuple[str, int]]]:
+                (entidade, versão lida (0 se nova), dados com a próxima versão) de cada
+                entidade alterada ou nova, e (uid, versão lida) de cada entidade excluída.
+        """
+        persistidos = self._persistidos[tipo]
+        with self._trava_marcas:
+            marcas = dict(self._alteradas[tipo])
+        self._marcas_lidas[tipo] = marcas
+        alteradas = []
+        conhecidas = 0
+        for entidade in entidades:
+            uid = entidade.uid
+            versao = persistidos.get(uid)
+            if versao is not None:
+                conhecidas += 1
+                if uid not in marcas:
+                    continue
+            elif uid in self._excluidos:
+                continue
+            else:
+                versao = 0
+            dados = entidade.to_dict()
+            dados["versao"] = versao + 1
+            alteradas.append((entidade, versao, dados))
+        excluidas: List[Tuple[str, int]] = []
+        if conhecidas < len(persistidos):
+            presentes = {entidade.uid for entidade in entidades}
+            excluidas = [(uid, versao) for uid, versao in persistidos.items() if uid not in presentes]
+        return alteradas, excluidas
+
+    def _confirmar(self, tipo: str, gravadas: List[Tuple[Entidade, int, Dict[str, Any]]], excluidas: List[str]) -> None:
+        """Atualiza versões e a base de comparação depois de uma gravação bem-sucedida.
+
+        A marcação de uma entidade gravada só é retirada se for a mesma lida no
+        início da gravação; se ela foi marcada de novo no meio tempo, continua pendente.
+        """
+        persistidos = self._persistidos[tipo]
+        alteradas = self._alteradas[tipo]
+        lidas = self._marcas_lidas[tipo]
+        with self._trava_marcas:
+            for entidade, _, dados in gravadas:
+                entidade.versao = dados["versao"]
+                persistidos[entidade.uid] = entidade.versao
+                if entidade.uid in lidas and alteradas.get(entidade.uid) == lidas[entidade.uid]:
+                    del alteradas[entidade.uid]
+            for uid in excluidas:
+                persistidos.pop(uid, None)
+                alteradas.pop(uid, None)
+
+    def _levantar_conflitos(self, tipo: str, conflitos: List[ConflitoVersao], excluidas_em_conflito: List[str]) -> None:
+        """Esquece exclusões que não valeram e levanta ConflitoVersaoError, se houver conflitos.
+
+        Uma exclusão em conflito (o registro foi alterado por outro processo) não é
+        refeita: a entidade continua gravada com os dados do outro processo.
+        """
+        for uid in excluidas_em_conflito:
+            self._persistidos[tipo].pop(uid, None)
+        if conflitos:
+            raise ConflitoVersaoError(" ".join(str(c) for c in conflitos), conflitos)
+
+    @staticmethod
+    def _nome(dados: Optional[Dict[str, Any]], entidade: Optional[Entidade], uid: str) -> str:
+        """Nome para exibir em um conflito."""
+        if entidade is not None:
+            return entidade.nome
+        return (dados or {}).get("nome", uid)
+
 class RepositorioJSON(Repositorio):
     """Implementação do repositório utilizando arquivos JSON para armazenamento.
 
+    Cada gravação relê o arquivo sob uma trava entre processos (arquivo
+    ``.lock`` ao lado), aplica só as entidades alteradas por este processo
+    (mantendo as inclusões e alterações de outros) e troca o arquivo de forma
+    atômica, de modo que a leitura nunca vê um arquivo pela metade.
+
     Attributes:
         arquivo_animais (str): Caminho do arquivo JSON de animais.
         arquivo_adotantes (str): Caminho do arquivo JSON de adotantes.
     """
 
-    def __init__(self) -> None:
-        """Inicializa o repositório JSON definindo os nomes dos arquivos."""
-        self.arquivo_animais = "animais.json"
-        self.arquivo_adotantes = "adotantes.json"
+    def __init__(self, arquivo_animais: str = "animais.json", arquivo_adotantes: str = "adotantes.json") -> None:
+        """Inicializa o repositório JSON definindo os nomes dos arquivos.
+
+        Args:
+            arquivo_animais (str, optional): Caminho do arquivo de animais. Defaults to "animais.json".
+            arquivo_adotantes (str, optional): Caminho do arquivo de adotantes. Defaults to "adotantes.json".
+        """
+        super().__init__()
+        self.arquivo_animais = arquivo_animais
+        self.arquivo_adotantes = arquivo_adotantes
+        # arquivo -> (assinatura do arquivo, registros, registros já codificados) da última gravação.
+        self._ultima_gravacao: Dict[str, Tuple[Tuple[int, int, int], List[Dict[str, Any]], List[str]]] = {}
+
+    @staticmethod
+    def _assinatura(arquivo: str) -> Optional[Tuple[int, int, int]]:
+        """Identifica a versão do arquivo em disco (inode, tamanho, modificação)."""
+        try:
+            info = os.stat(arquivo)
+        except OSError:
+            return None
+        return (info.st_ino, info.st_size, info.st_mtime_ns)
+
+    @staticmethod
+    def _ler_registros(arquivo: str, prefixo: str) -> List[Dict[str, Any]]:
+        """Lê os registros do arquivo, completando uid e versão de arquivos antigos.
+
+        Args:
+            arquivo (str): Caminho do arquivo JSON.
+            prefixo (str): Prefixo do uid dado a registros antigos ("animal" ou "adotante").
+
+        Returns:
+            List[Dict[str, Any]]: Registros na ordem do arquivo (vazio se não existir).
+        """
+        if not os.path.exists(arquivo):
+            return []
+        with open(arquivo, 'r', encoding='utf-8') as f:
+            registros = json.load(f)
+        for posicao, dados in enumerate(registros):
+            if not dados.get("uid"):
+                dados["uid"] = f"{prefixo}-{posicao}"
+            dados.setdefault("versao", 1)
+        return registros
+
+    def _salvar(self, tipo: str, arquivo: str, prefixo: str, entidades: List[Entidade]) -> None:
+        """Mescla as alterações deste processo no arquivo, com comparar-e-trocar por entidade.
+
+        Args:
+            tipo (str): "animais" ou "adotantes".
+            arquivo (str): Caminho do arquivo JSON.
+            prefixo (str): Prefixo do uid de registros antigos.
+            entidades (List[Entidade]): Lista atual em memória.
+
+        Raises:
+            ConflitoVersaoError: Se alguma entidade alterada mudou no arquivo desde a leitura.
+        """
+        alteradas, excluidas = self._alteracoes(tipo, entidades)
+        if not alteradas and not excluidas:
+            return
+        conflitos: List[ConflitoVersao] = []
+        gravadas, removidas, excluidas_em_conflito = [], [], []
+        with trava_arquivo(arquivo + ".lock"):
+            # Se ninguém gravou desde a nossa última gravação, não é preciso reler nem recodificar.
+            cache = self._ultima_gravacao.get(arquivo)
+            if cache is not None and cache[0] == self._assinatura(arquivo):
+                registros, linhas = list(cache[1]), list(cache[2])
+            else:
+                registros = self._ler_registros(arquivo, prefixo)
+                linhas = [json.dumps(dados, ensure_ascii=False) for dados in registros]
+            posicoes = {dados["uid"]: posicao for posicao, dados in enumerate(registros)}
+            for entidade, versao, dados in alteradas:
+                posicao = posicoes.get(entidade.uid)
+                if versao == 0 and posicao is None:
+                    posicoes[entidade.uid] = len(registros)
+                    registros.append(dados)
+                    linhas.append(json.dumps(dados, ensure_ascii=False))
+                elif posicao is None or registros[posicao]["versao"] != versao:
+                    atual = registros[posicao] if posicao is not None else None
+                    conflitos.append(ConflitoVersao(tipo, entidade.uid, entidade.nome, versao,
+                                                    atual["versao"] if atual else None, atual, entidade))
+                    continue
+                else:
+                    registros[posicao] = dados
+                    linhas[posicao] = json.dumps(dados, ensure_ascii=False)
+                gravadas.append((entidade, versao, dados))
+            for uid, versao in excluidas:
+                posicao = posicoes.get(uid)
+                if posicao is not None and registros[posicao]["versao"] != versao:
+                    atual = registros[posicao]
+                    conflitos.append(ConflitoVersao(tipo, uid, self._nome(atual, None, uid), versao, atual["versao"], atual))
+                    excluidas_em_conflito.append(uid)
+                else:
+                    removidas.append(uid)
+            if gravadas or removidas:
+                if removidas:
+                    descartar = set(removidas)
+                    mantidos = [i for i, dados in enumerate(registros) if dados["uid"] not in descartar]
+                    registros, linhas = [registros[i] for i in mantidos], [linhas[i] for i in mantidos]
+                # Um registro por linha: o codificador em C do json só é usado sem indentação.
+                temporario = arquivo + ".tmp"
+                with open(temporario, 'w', encoding='utf-8') as f:
+                    f.write("[\n" + ",\n".join(linhas) + "\n]\n")
+                os.replace(temporario, arquivo)
+                assinatura = self._assinatura(arquivo)
+                self._ultima_gravacao[arquivo] = (assinatura, registros, linhas)
+                self._informar_transferencia(f"salvar_{tipo}", len(gravadas) + len(removidas), assinatura[1] if assinatura else 0)
+        self._confirmar(tipo, gravadas, removidas)
+        self._levantar_conflitos(tipo, conflitos, excluidas_em_conflito)
+
+    def _importar(self, tipo: str, entidades: Iterable[Entidade]) -> int:
+        """Reescreve o arquivo com os registros atuais seguidos das entidades novas, uma por linha.
+
+        Os registros já gravados são relidos (sob a trava entre processos); as
+        entidades novas vão direto do iterável para o arquivo temporário, que só
+        substitui o original se a importação terminar sem erro.
+
+        Args:
+            tipo (str): "animais" ou "adotantes".
+            entidades (Iterable[Entidade]): Entidades a incluir.
+
+        Returns:
+            int: Quantidade de entidades gravadas.
+
+        Raises:
+            RepositorioError: Se algum uid já existir no arquivo.
+        """
+        arquivo, prefixo = (self.arquivo_animais, "animal") if tipo == "animais" else (self.arquivo_adotantes, "adotante")
+        quantidade = 0
+        with trava_arquivo(arquivo + ".lock"):
+            registros = self._ler_registros(arquivo, prefixo)
+            existentes = {dados["uid"] for dados in registros}
+            temporario = arquivo + ".tmp"
+            try:
+                with open(temporario, 'w', encoding='utf-8') as f:
+                    f.write("[\n" + ",\n".join(json.dumps(dados, ensure_ascii=False) for dados in registros))
+                    separador = ",\n" if registros else ""
+                    del registros
+                    for uid, _, linha in self._registros_importados(entidades):
+                        if uid in existentes:
+                            raise RepositorioError(f"Importação cancelada: uid {uid} já existe em {arquivo}.")
+                        f.write(separador + linha)
+                        separador = ",\n"
+                        quantidade += 1
+                    f.write("\n]\n")
+                os.replace(temporario, arquivo)
+            except BaseException:
+                if os.path.exists(temporario):
+                    os.remove(temporario)
+                raise
+            self._ultima_gravacao.pop(arquivo, None)
+            self._informar_transferencia(f"importar_{tipo}", quantidade, os.path.getsize(arquivo))
+        return quantidade
 
     def salvar_animais(self, animais: List[Animal]) -> None:
-        """Salva a lista de animais serializando para um arquivo JSON.
+        """Grava no arquivo JSON os animais alterados, incluídos ou excluídos.
 
         Args:
             animais (List[Animal]): Lista de animais a serem persistidos.
+
+        Raises:
+            ConflitoVersaoError: Se algum animal alterado foi gravado por outro processo nesse meio tempo.
         """
-        dados = [animal.to_dict() for animal in animais]
         try:
-            with open(self.arquivo_animais, 'w', encoding='utf-8') as f:
-                json.dump(dados, f, indent=4, ensure_ascii=False)
+            self._salvar("animais", self.arquivo_animais, "animal", animais)
+        except ConflitoVersaoError:
+            raise
         except Exception as e:
             print(f"Erro ao salvar animais (JSON): {e}")
 
@@ -79,29 +487,33 @@ class RepositorioJSON(Repositorio):
         if not os.path.exists(self.arquivo_animais):
             return []
         try:
-            with open(self.arquivo_animais, 'r', encoding='utf-8') as f:
-                dados_brutos = json.load(f)
+            dados_brutos = self._ler_registros(self.arquivo_animais, "animal")
             
             lista_objetos = []
             for item in dados_brutos:
                 obj = Animal.from_dict(item)
                 if obj:
                     lista_objetos.append(obj)
+                    self._registrar("animais", obj)
+            self._informar_transferencia("carregar_animais", len(dados_brutos), os.path.getsize(self.arquivo_animais))
             return lista_objetos
         except Exception as e:
             print(f"Erro ao carregar animais (JSON): {e}")
             return []
 
     def salvar_adotantes(self, adotantes: List[Adotante]) -> None:
-        """Salva a lista de adotantes serializando para um arquivo JSON.
+        """Grava no arquivo JSON os adotantes alterados, incluídos ou excluídos.
 
         Args:
             adotantes (List[Adotante]): Lista de adotantes a serem persistidos.
+
+        Raises:
+            ConflitoVersaoError: Se algum adotante alterado foi gravado por outro processo nesse meio tempo.
         """
-        dados = [adotante.to_dict() for adotante in adotantes]
         try:
-            with open(self.arquivo_adotantes, 'w', encoding='utf-8') as f:
-                json.dump(dados, f, indent=4, ensure_ascii=False)
+            self._salvar("adotantes", self.arquivo_adotantes, "adotante", adotantes)
+        except ConflitoVersaoError:
+            raise
         except Exception as e:
             print(f"Erro ao salvar adotantes (JSON): {e}")
 
@@ -114,9 +526,11 @@ class RepositorioJSON(Repositorio):
         if not os.path.exists(self.arquivo_adotantes):
             return []
         try:
-            with open(self.arquivo_adotantes, 'r', encoding='utf-8') as f:
-                dados_brutos = json.load(f)
-            return [Adotante.from_dict(item) for item in dados_brutos]
+            lista_objetos = [Adotante.from_dict(item) for item in self._ler_registros(self.arquivo_adotantes, "adotante")]
+            for obj in lista_objetos:
+                self._registrar("adotantes", obj)
+            self._informar_transferencia("carregar_adotantes", len(lista_objetos), os.path.getsize(self.arquivo_adotantes))
+            return lista_objetos
         except Exception as e:
             print(f"Erro ao carregar adotantes (JSON): {e}")
             return []
@@ -124,121 +538,241 @@ class RepositorioJSON(Repositorio):
 class RepositorioSQLite(Repositorio):
     """Implementação do repositório utilizando banco de dados SQLite.
     
-    Os objetos são serializados em JSON e armazenados em colunas de texto no banco.
+    Os objetos são serializados em JSON e armazenados em colunas de texto no banco,
+    ao lado das colunas ``uid`` e ``versao`` usadas no comparar-e-trocar.
 
     Attributes:
         db_name (str): Nome do arquivo do banco de dados.
+        tempo_espera (float): Segundos que uma conexão espera por um banco travado
+            por outro processo antes de desistir ("database is locked").
     """
 
-    def __init__(self) -> None:
-        """Inicializa o repositório SQLite e garante que as tabelas existam."""
-        self.db_name = "adocao.db"
+    TABELAS = (("animais", "animal"), ("adotantes", "adotante"))
+
+    def __init__(self, db_name: str = "adocao.db", tempo_espera: float = 30.0) -> None:
+        """Inicializa o repositório SQLite e garante que as tabelas existam.
+
+        Args:
+            db_name (str, optional): Caminho do arquivo do banco. Defaults to "adocao.db".
+            tempo_espera (float, optional): Espera máxima por um banco travado, em segundos. Defaults to 30.0.
+        """
+        super().__init__()
+        self.db_name = db_name
+        self.tempo_espera = tempo_espera
         self._inicializar_banco()
 
-    def _get_conexao(self) -> sqlite3.Connection:
+    def _get_conexao(self) -> 'sqlite3.Connection':
         """Cria e retorna uma conexão com o banco de dados.
 
+        O módulo sqlite3 só é importado aqui, para que o backend JSON não pague por ele.
+
         Returns:
             sqlite3.Connection: Objeto de conexão do SQLite.
         """
-        return sqlite3.connect(self.db_name)
+        import sqlite3
+        return sqlite3.connect(self.db_name, timeout=self.tempo_espera)
 
     def _inicializar_banco(self) -> None:
-        """Cria as tabelas 'animais' e 'adotantes' caso não existam."""
+        """Cria as tabelas 'animais' e 'adotantes' caso não existam.
+
+        Bancos antigos (sem ``uid``/``versao``) ganham as colunas, com uid
+        derivado do id da linha e versão 1.
+        """
         conn = self._get_conexao()
+        conn.isolation_level = None
         cursor = conn.cursor()
-        
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS animais (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                dados_json TEXT NOT NULL
-            )
-        """)
-        
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS adotantes (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                dados_json TEXT NOT NULL
-            )
-        """)
-        
-        conn.commit()
-        conn.close()
+        try:
+            cursor.execute("BEGIN IMMEDIATE")
+            for tabela, prefixo in self.TABELAS:
+                cursor.execute(f"""
+                    CREATE TABLE IF NOT EXISTS {tabela} (
+                        id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        dados_json TEXT NOT NULL,
+                        uid TEXT,
+                        versao INTEGER NOT NULL DEFAULT 1
+                    )
+                """)
+                colunas = {linha[1] for linha in cursor.execute(f"PRAGMA table_info({tabela})")}
+                if "uid" not in colunas:
+                    cursor.execute(f"ALTER TABLE {tabela} ADD COLUMN uid TEXT")
+                if "versao" not in colunas:
+                    cursor.execute(f"ALTER TABLE {tabela} ADD COLUMN versao INTEGER NOT NULL DEFAULT 1")
+                cursor.execute(f"UPDATE {tabela} SET uid = '{prefixo}-' || id WHERE uid IS NULL")
+                cursor.execute(f"CREATE UNIQUE INDEX IF NOT EXISTS idx_{tabela}_uid ON {tabela} (uid)")
+            cursor.execute("COMMIT")
+        except Exception:
+            cursor.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
 
-    def salvar_animais(self, animais: List[Animal]) -> None:
-        """Salva a lista de animais no banco de dados.
-        
-        Nota: A implementação atual limpa a tabela e reinsere os dados.
+    def _salvar(self, tabela: str, entidades: List[Entidade]) -> None:
+        """Grava as entidades alteradas em uma transação, com comparar-e-trocar por linha.
 
         Args:
-            animais (List[Animal]): Lista de animais a serem salvos.
+            tabela (str): "animais" ou "adotantes".
+            entidades (List[Entidade]): Lista atual em memória.
+
+        Raises:
+            ConflitoVersaoError: Se alguma linha alterada mudou no banco desde a leitura.
+            RepositorioError: Se a transação falhar (ex: banco travado além de ``tempo_espera``);
+                ela é desfeita e as alterações continuam pendentes para a próxima gravação.
         """
+        alteradas, excluidas = self._alteracoes(tabela, entidades)
+        if not alteradas and not excluidas:
+            return
+        conflitos: List[ConflitoVersao] = []
+        gravadas, removidas, excluidas_em_conflito = [], [], []
+        tamanho = 0
         conn = self._get_conexao()
         cursor = conn.cursor()
-        
+
+        def atual(uid: str) -> Tuple[Optional[int], Optional[Dict[str, Any]]]:
+            linha = cursor.execute(f"SELECT versao, dados_json FROM {tabela} WHERE uid = ?", (uid,)).fetchone()
+            if linha is None:
+                return None, None
+            dados = json.loads(linha[1])
+            dados["uid"], dados["versao"] = uid, linha[0]
+            return linha[0], dados
+
         try:
-            cursor.execute("DELETE FROM animais")
-            
-            for animal in animais:
-                dados_string = json.dumps(animal.to_dict(), ensure_ascii=False)
-                cursor.execute("INSERT INTO animais (dados_json) VALUES (?)", (dados_string,))
-            
+            for entidade, versao, dados in alteradas:
+                dados_string = json.dumps(dados, ensure_ascii=False)
+                if self.ao_transferir is not None:
+                    tamanho += len(dados_string.encode("utf-8"))
+                if versao == 0:
+                    cursor.execute(f"INSERT INTO {tabela} (uid, versao, dados_json) VALUES (?, ?, ?)", (entidade.uid, dados["versao"], dados_string))
+                else:
+                    cursor.execute(f"UPDATE {tabela} SET dados_json = ?, versao = ? WHERE uid = ? AND versao = ?",
+                                   (dados_string, dados["versao"], entidade.uid, versao))
+                    if cursor.rowcount == 0:
+                        versao_atual, dados_atuais = atual(entidade.uid)
+                        conflitos.append(ConflitoVersao(tabela, entidade.uid, entidade.nome, versao, versao_atual, dados_atuais, entidade))
+                        continue
+                gravadas.append((entidade, versao, dados))
+            for uid, versao in excluidas:
+                cursor.execute(f"DELETE FROM {tabela} WHERE uid = ? AND versao = ?", (uid, versao))
+                if cursor.rowcount == 0:
+                    versao_atual, dados_atuais = atual(uid)
+                    if versao_atual is not None:
+                        conflitos.append(ConflitoVersao(tabela, uid, self._nome(dados_atuais, None, uid), versao, versao_atual, dados_atuais))
+                        excluidas_em_conflito.append(uid)
+                        continue
+                removidas.append(uid)
             conn.commit()
         except Exception as e:
-            print(f"Erro ao salvar animais (SQLite): {e}")
+            conn.rollback()
+            raise RepositorioError(f"Erro ao salvar {tabela} (SQLite): {e}") from e
         finally:
             conn.close()
+        self._informar_transferencia(f"salvar_{tabela}", len(gravadas) + len(removidas), tamanho)
+        self._confirmar(tabela, gravadas, removidas)
+        self._levantar_conflitos(tabela, conflitos, excluidas_em_conflito)
 
-    def carregar_animais(self) -> List[Animal]:
-        """Carrega todos os animais armazenados no banco de dados.
+    def _importar(self, tabela: str, entidades: Iterable[Entidade]) -> int:
+        """Insere as entidades novas em uma única transação, lendo o iterável aos poucos.
+
+        Args:
+            tabela (str): "animais" ou "adotantes".
+            entidades (Iterable[Entidade]): Entidades a incluir.
 
         Returns:
-            List[Animal]: Lista de objetos Animal reconstruídos a partir do JSON armazenado.
+            int: Quantidade de linhas inseridas.
+
+        Raises:
+            RepositorioError: Se algum uid já existir na tabela; a transação é desfeita.
+        """
+        import sqlite3
+        tamanho = 0
+
+        def linhas() -> Iterator[Tuple[str, int, str]]:
+            nonlocal tamanho
+            for uid, versao, dados_json in self._registros_importados(entidades):
+                if self.ao_transferir is not None:
+                    tamanho += len(dados_json.encode("utf-8"))
+                yield uid, versao, dados_json
+
+        conn = self._get_conexao()
+        try:
+            cursor = conn.executemany(f"INSERT INTO {tabela} (uid, versao, dados_json) VALUES (?, ?, ?)", linhas())
+            conn.commit()
+            self._informar_transferencia(f"importar_{tabela}", cursor.rowcount, tamanho)
+            return cursor.rowcount
+        except sqlite3.IntegrityError as e:
+            conn.rollback()
+            raise RepositorioError(f"Importação cancelada: uid repetido em {tabela} ({e}).") from e
+        except BaseException:
+            conn.rollback()
+            raise
+        finally:
+            conn.close()
+
+    def _carregar(self, tabela: str, classe: type) -> List[Entidade]:
+        """Carrega as linhas de uma tabela na ordem de inclusão.
+
+        Args:
+            tabela (str): "animais" ou "adotantes".
+            classe (type): Animal ou Adotante.
+
+        Returns:
+            List[Entidade]: Objetos reconstruídos a partir do JSON armazenado.
         """
         conn = self._get_conexao()
         cursor = conn.cursor()
         lista_objetos = []
         
         try:
-            cursor.execute("SELECT dados_json FROM animais")
+            cursor.execute(f"SELECT uid, versao, dados_json FROM {tabela} ORDER BY id")
             linhas = cursor.fetchall()
             
-            for linha in linhas:
-                dicionario = json.loads(linha[0])
-                obj = Animal.from_dict(dicionario)
+            for uid, versao, dados_json in linhas:
+                dicionario = json.loads(dados_json)
+                dicionario["uid"], dicionario["versao"] = uid, versao
+                obj = classe.from_dict(dicionario)
                 if obj:
                     lista_objetos.append(obj)
+                    self._registrar(tabela, obj)
+            if self.ao_transferir is not None:
+                self._informar_transferencia(f"carregar_{tabela}", len(linhas), sum(len(linha[2].encode("utf-8")) for linha in linhas))
                     
         except Exception as e:
-            print(f"Erro ao carregar animais (SQLite): {e}")
+            print(f"Erro ao carregar {tabela} (SQLite): {e}")
         finally:
             conn.close()
             
         return lista_objetos
 
-    def salvar_adotantes(self, adotantes: List[Adotante]) -> None:
-        """Salva a lista de adotantes no banco de dados.
+    def salvar_animais(self, animais: List[Animal]) -> None:
+        """Grava no banco os animais alterados, incluídos ou excluídos.
+
+        Args:
+            animais (List[Animal]): Lista de animais a serem salvos.
+
+        Raises:
+            ConflitoVersaoError: Se algum animal alterado foi gravado por outro processo nesse meio tempo.
+            RepositorioError: Se a gravação falhar (ex: banco travado); nada é gravado.
+        """
+        self._salvar("animais", animais)
+
+    def carregar_animais(self) -> List[Animal]:
+        """Carrega todos os animais armazenados no banco de dados.
 
-        Nota: A implementação atual limpa a tabela e reinsere os dados.
+        Returns:
+            List[Animal]: Lista de objetos Animal reconstruídos a partir do JSON armazenado.
+        """
+        return self._carregar("animais", Animal)
+
+    def salvar_adotantes(self, adotantes: List[Adotante]) -> None:
+        """Grava no banco os adotantes alterados, incluídos ou excluídos.
 
         Args:
             adotantes (List[Adotante]): Lista de adotantes a serem salvos.
+
+        Raises:
+            ConflitoVersaoError: Se algum adotante alterado foi gravado por outro processo nesse meio tempo.
+            RepositorioError: Se a gravação falhar (ex: banco travado); nada é gravado.
         """
-        conn = self._get_conexao()
-        cursor = conn.cursor()
-        
-        try:
-            cursor.execute("DELETE FROM adotantes")
-            
-            for adotante in adotantes:
-                dados_string = json.dumps(adotante.to_dict(), ensure_ascii=False)
-                cursor.execute("INSERT INTO adotantes (dados_json) VALUES (?)", (dados_string,))
-            
-            conn.commit()
-        except Exception as e:
-            print(f"Erro ao salvar adotantes (SQLite): {e}")
-        finally:
-            conn.close()
+        self._salvar("adotantes", adotantes)
 
     def carregar_adotantes(self) -> List[Adotante]:
         """Carrega todos os adotantes armazenados no banco de dados.
@@ -246,23 +780,4 @@ class RepositorioSQLite(Repositorio):
         Returns:
             List[Adotante]: Lista de objetos Adotante reconstruídos a partir do JSON armazenado.
         """
-        conn = self._get_conexao()
-        cursor = conn.cursor()
-        lista_objetos = []
-        
-        try:
-            cursor.execute("SELECT dados_json FROM adotantes")
-            linhas = cursor.fetchall()
-            
-            for linha in linhas:
-                dicionario = json.loads(linha[0])
-                obj = Adotante.from_dict(dicionario)
-                if obj:
-                    lista_objetos.append(obj)
-                    
-        except Exception as e:
-            print(f"Erro ao carregar adotantes (SQLite): {e}")
-        finally:
-            conn.close()
-            
-        return lista_objetos
\ No newline at end of file
+        return self._carregar("adotantes", Adotante)
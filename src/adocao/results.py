@@ -0,0 +1,222 @@
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+from .domain import Animal, Adotante
+from .enums import StatusAnimal, TipoOperacao
+from .exceptions import AdocaoError
+from .fees import Taxa
+
+@dataclass
+class OperacaoLote:
+    """Uma operação a ser executada dentro de um lote.
+
+    Attributes:
+        tipo (TipoOperacao): Tipo da operação (reservar, adotar, vacinar, devolver).
+        idx_animal (int): Índice do animal.
+        idx_adotante (Optional[int]): Índice do adotante (reservar/adotar).
+        argumento (Optional[str]): Nome da vacina (vacinar) ou motivo (devolver).
+    """
+    tipo: TipoOperacao
+    idx_animal: int
+    idx_adotante: Optional[int] = None
+    argumento: Optional[str] = None
+
+@dataclass
+class ResultadoItemLote:
+    """Resultado de uma operação individual de um lote.
+
+    Attributes:
+        posicao (int): Posição da operação dentro do lote.
+        operacao (OperacaoLote): A operação solicitada.
+        sucesso (bool): Se a operação foi aplicada (e mantida).
+        mensagem (str): Descrição do resultado ou do erro.
+        erro (Optional[AdocaoError]): Exceção que impediu a operação, se houver.
+    """
+    posicao: int
+    operacao: OperacaoLote
+    sucesso: bool
+    mensagem: str = ""
+    erro: Optional[AdocaoError] = None
+
+@dataclass
+class ResultadoLote:
+    """Resultado consolidado de um lote de operações.
+
+    Attributes:
+        atomico (bool): Se o lote foi executado no modo tudo-ou-nada.
+        aplicado (bool): Se alguma alteração foi persistida.
+        itens (List[ResultadoItemLote]): Resultados individuais, na ordem do lote.
+    """
+    atomico: bool
+    aplicado: bool = False
+    itens: List[ResultadoItemLote] = field(default_factory=list)
+
+    @property
+    def sucessos(self) -> List[ResultadoItemLote]:
+        """List[ResultadoItemLote]: Itens aplicados com sucesso."""
+        return [item for item in self.itens if item.sucesso]
+
+    @property
+    def falhas(self) -> List[ResultadoItemLote]:
+        """List[ResultadoItemLote]: Itens que falharam ou foram desfeitos."""
+        return [item for item in self.itens if not item.sucesso]
+
+@dataclass
+class ResultadoReserva:
+    """Resultado de uma reserva confirmada.
+
+    Attributes:
+        animal (Animal): Animal reservado.
+        adotante (Adotante): Titular da reserva.
+        validade_horas (int): Horas de validade da reserva.
+    """
+    animal: Animal
+    adotante: Adotante
+    validade_horas: int
+
+@dataclass
+class ResultadoAdocao:
+    """Resultado de uma adoção efetivada.
+
+    Attributes:
+        animal (Animal): Animal adotado.
+        adotante (Adotante): Novo tutor.
+        taxa (Taxa): Taxa cobrada (valor em Decimal e rótulo).
+    """
+    animal: Animal
+    adotante: Adotante
+    taxa: Taxa
+
+@dataclass
+class ResultadoDevolucao:
+    """Resultado de uma devolução processada.
+
+    Attributes:
+        animal (Animal): Animal devolvido.
+        motivo (str): Motivo informado.
+        status (StatusAnimal): Status final após a triagem.
+    """
+    animal: Animal
+    motivo: str
+    status: StatusAnimal
+
+@dataclass
+class ResultadoFila:
+    """Resultado da entrada de um adotante na fila de espera.
+
+    Attributes:
+        animal (Animal): Animal da fila.
+        adotante (Adotante): Adotante interessado.
+        score (int): Score de compatibilidade (0-100).
+        detalhes (List[str]): Detalhamento do score.
+        posicao (int): Posição na fila (1 = próximo); 0 se já estava na fila.
+    """
+    animal: Animal
+    adotante: Adotante
+    score: int
+    detalhes: List[str]
+    posicao: int
+
+@dataclass
+class ResultadoExpiracao:
+    """Resultado do processamento de uma reserva vencida.
+
+    Attributes:
+        animal (Animal): Animal cuja reserva venceu.
+        titular_anterior (Optional[str]): Quem tinha a reserva.
+        horas_passadas (float): Horas desde a reserva.
+        novo_titular (Optional[str]): Próximo da fila que assumiu a reserva, se houver.
+    """
+    animal: Animal
+    titular_anterior: Optional[str]
+    horas_passadas: float
+    novo_titular: Optional[str] = None
+
+@dataclass
+class ResultadoTriagem:
+    """Resultado da re-triagem de uma devolução registrada no histórico.
+
+    Attributes:
+        animal (Animal): Animal devolvido.
+        motivo (str): Último motivo de devolução registrado.
+        status_atual (StatusAnimal): Status no momento da re-triagem.
+        status_sugerido (StatusAnimal): Status indicado pelas palavras-chave atuais.
+        aplicado (bool): Se o status sugerido foi aplicado.
+    """
+    animal: Animal
+    motivo: str
+    status_atual: StatusAnimal
+    status_sugerido: StatusAnimal
+    aplicado: bool = False
+
+@dataclass
+class SuspeitaDuplicata:
+    """Adotante já cadastrado que provavelmente é a mesma pessoa de outro cadastro.
+
+    Attributes:
+        idx (int): Índice do adotante já cadastrado.
+        adotante (Adotante): O adotante já cadastrado.
+        similaridade (float): Semelhança entre os nomes (0 a 1).
+        motivo (str): "mesmo contato", "mesmo nome" ou "nome parecido".
+    """
+    idx: int
+    adotante: Adotante
+    similaridade: float
+    motivo: str
+
+@dataclass
+class ParDuplicado:
+    """Par de adotantes cadastrados que provavelmente são a mesma pessoa.
+
+    Attributes:
+        idx_a (int): Índice do cadastro mais antigo.
+        adotante_a (Adotante): Cadastro mais antigo.
+        idx_b (int): Índice do cadastro mais recente.
+        adotante_b (Adotante): Cadastro mais recente.
+        similaridade (float): Semelhança entre os nomes (0 a 1).
+        motivo (str): "mesmo contato", "mesmo nome" ou "nome parecido".
+    """
+    idx_a: int
+    adotante_a: Adotante
+    idx_b: int
+    adotante_b: Adotante
+    similaridade: float
+    motivo: str
+
+@dataclass
+class DetalhesFila:
+    """Situação da reserva e da fila de espera de um animal.
+
+    Attributes:
+        animal (Animal): O animal consultado.
+        titular (Optional[str]): Titular da reserva atual, se houver.
+        restante (Optional[timedelta]): Tempo até o vencimento da reserva (negativo se vencida).
+        interessados (List[Dict[str, Any]]): Itens da fila (adotante, score, data_entrada).
+    """
+    animal: Animal
+    titular: Optional[str]
+    restante: Optional[timedelta]
+    interessados: List[Dict[str, Any]]
+
+@dataclass
+class EstatisticasAbrigo:
+    """Números consolidados usados no relatório estatístico.
+
+    Attributes:
+        gerado_em (datetime): Momento do cálculo.
+        populares (List[Tuple[Animal, int]]): Animais com maiores filas e o tamanho da fila.
+        caes (Dict[str, Any]): Total, adotados e taxa de adoção de cães.
+        gatos (Dict[str, Any]): Total, adotados e taxa de adoção de gatos.
+        tempo_medio_dias (Optional[float]): Tempo médio até a adoção.
+        quarentena (int): Animais em quarentena.
+        inadotaveis (int): Animais inadotáveis.
+        devolvidos (int): Animais devolvidos aguardando triagem.
+    """
+    gerado_em: datetime
+    populares: List[Tuple[Animal, int]]
+    caes: Dict[str, Any]
+    gatos: Dict[str, Any]
+    tempo_medio_dias: Optional[float]
+    quarentena: int
+    inadotaveis: int
+    devolvidos: int
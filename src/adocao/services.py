@@ -1,97 +1,117 @@
-import json
 import os
-from typing import List, Tuple, Optional, Dict, Any, Type
-from datetime import datetime, timedelta
-from .domain import Animal, Adotante, Cachorro, Gato
+import sys
+from contextlib import ExitStack
+from typing import Iterable, List, Tuple, Optional, Dict, Any, Type, TYPE_CHECKING
+from datetime import datetime
+from .domain import Animal, Adotante
 from .enums import StatusAnimal, PorteAnimal, TipoMoradia
-from .repositories import RepositorioJSON, RepositorioSQLite
-from .strategies import FabricaTaxas
-from abc import ABC, abstractmethod
-from .exceptions import (
-    AdocaoError, 
-    EntidadeNaoEncontradaError, 
-    PoliticaNaoAtendidaError, 
-    ReservaInvalidaError, 
-    TransicaoStatusError
-)
+from .repositories import Repositorio
+from .indexes import IndicePopularidade, IndiceElegibilidade
+from .core import NucleoAdocao
+from .observers import Observador, LoggerObserver, LoggerBufferizado
+from .results import OperacaoLote, ResultadoLote
+from .pagination import FiltroAnimais, FiltroAdotantes, Pagina, TAMANHO_PAGINA_PADRAO
+from .exceptions import AdocaoError, AnimalReservadoError, RegraNegocioError
 
-class Observador(ABC):
-    """Interface abstrata para observadores do sistema (Observer Pattern)."""
-
-    @abstractmethod
-    def atualizar(self, mensagem: str) -> None:
-        """Método chamado quando um evento ocorre no sujeito observado.
-
-        Args:
-            mensagem (str): A mensagem ou descrição do evento.
-        """
-        pass
-
-class LoggerObserver(Observador):
-    """Implementação concreta de Observador que registra eventos em um arquivo de log.
-
-    Attributes:
-        arquivo (str): Nome do arquivo de log.
-    """
-
-    def __init__(self, arquivo: str = "historico_eventos.log") -> None:
-        """Inicializa o LoggerObserver.
-
-        Args:
-            arquivo (str, optional): Caminho do arquivo de log. Defaults to "historico_eventos.log".
-        """
-        self.arquivo = arquivo
-
-    def atualizar(self, mensagem: str) -> None:
-        """Escreve a mensagem formatada com timestamp no arquivo de log.
-
-        Args:
-            mensagem (str): A mensagem do evento a ser logada.
-        """
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        log_entry = f"[{timestamp}] {mensagem}\n"
-        try:
-            pasta = "dados"
-            if not os.path.exists(pasta):
-                os.makedirs(pasta)
-            caminho = os.path.join(pasta, self.arquivo)
-            with open(caminho, "a", encoding="utf-8") as f:
-                f.write(log_entry)
-        except Exception as e:
-            print(f"Erro ao gravar log: {e}")
+if TYPE_CHECKING:
+    from .reports import Relatorio
 
 class SistemaAdocao:
-    """Classe principal (Fachada/Controller) que gerencia o sistema de adoção.
+    """Classe principal (Fachada/Controller) usada pela interface de linha de comando.
 
-    Responsável por coordenar repositórios, regras de negócio, configurações
-    e notificações de eventos.
+    Adaptador de apresentação sobre o ``NucleoAdocao``: toda regra de negócio e
+    persistência fica no núcleo, e esta classe apenas imprime resultados e
+    erros no console (e pergunta sobre a fila de espera quando o animal já
+    está reservado).
 
     Attributes:
+        nucleo (NucleoAdocao): Núcleo headless com o estado e as regras do sistema.
         settings (Dict[str, Any]): Configurações do sistema carregadas.
         repo (Repositorio): Instância do repositório (SQLite ou JSON).
         animais (List[Animal]): Lista de animais carregados em memória.
         adotantes (List[Adotante]): Lista de adotantes carregados em memória.
         observadores (List[Observador]): Lista de observadores registrados.
+        indice_popularidade (IndicePopularidade): Índice de tamanhos de fila para consultas top-k.
+        indice_elegibilidade (IndiceElegibilidade): Bitmaps de elegibilidade da política de adoção.
+
+    Relatórios salvos são reaproveitados enquanto os dados gravados e as
+    configurações não mudarem, em vez de gravar outro arquivo idêntico: o nome
+    do arquivo é derivado de ``nucleo.assinatura_dados()`` e
+    ``nucleo.assinatura_settings()``, e basta ele existir em
+    ``<nucleo.diretorio>/relatorios``, inclusive se gerado por outro processo.
     """
 
-    def __init__(self) -> None:
-        """Inicializa o sistema, carrega configurações e repositórios."""
-        self.settings = self._carregar_settings()
-        
-        tipo_banco = self.settings.get("banco_tipo", "JSON").upper()
-        
-        if tipo_banco == "SQLITE":
+    def __init__(self, nucleo: Optional[NucleoAdocao] = None) -> None:
+        """Inicializa o sistema sobre um núcleo existente ou cria um no diretório atual.
+
+        Args:
+            nucleo (Optional[NucleoAdocao], optional): Núcleo a ser usado. Defaults to None.
+        """
+        self.nucleo = nucleo or NucleoAdocao()
+        if self.nucleo.instrumentacao is not None:
+            self.nucleo.instrumentacao.instrumentar(self, "sistema")
+        for aviso in self.nucleo.avisos:
+            print(f"⚠️ {aviso}")
+
+        if self.nucleo.banco_tipo == "SQLITE":
             print("💾 Usando Banco de Dados SQLite")
-            self.repo = RepositorioSQLite()
         else:
             print("💾 Usando Arquivos JSON")
-            self.repo = RepositorioJSON()
-
-        self.animais: List[Animal] = self.repo.carregar_animais()
-        self.adotantes: List[Adotante] = self.repo.carregar_adotantes()
 
-        self.observadores: List[Observador] = []
-        self.adicionar_observador(LoggerObserver())
+    @property
+    def settings(self) -> Dict[str, Any]:
+        """Dict[str, Any]: Configurações do sistema."""
+        return self.nucleo.settings
+
+    @settings.setter
+    def settings(self, settings: Dict[str, Any]) -> None:
+        self.nucleo.settings = settings
+
+    @property
+    def repo(self) -> Repositorio:
+        """Repositorio: Repositório em uso pelo núcleo."""
+        return self.nucleo.repo
+
+    @repo.setter
+    def repo(self, repo: Repositorio) -> None:
+        self.nucleo.repo = repo
+
+    @property
+    def animais(self) -> List[Animal]:
+        """List[Animal]: Animais carregados em memória."""
+        return self.nucleo.animais
+
+    @animais.setter
+    def animais(self, animais: List[Animal]) -> None:
+        self.nucleo.animais = animais
+
+    @property
+    def adotantes(self) -> List[Adotante]:
+        """List[Adotante]: Adotantes carregados em memória."""
+        return self.nucleo.adotantes
+
+    @adotantes.setter
+    def adotantes(self, adotantes: List[Adotante]) -> None:
+        self.nucleo.adotantes = adotantes
+
+    @property
+    def observadores(self) -> List[Observador]:
+        """List[Observador]: Observadores registrados."""
+        return self.nucleo.observadores
+
+    @observadores.setter
+    def observadores(self, observadores: List[Observador]) -> None:
+        self.nucleo.observadores = observadores
+
+    @property
+    def indice_popularidade(self) -> IndicePopularidade:
+        """IndicePopularidade: Índice de tamanhos de fila."""
+        return self.nucleo.indice_popularidade
+
+    @property
+    def indice_elegibilidade(self) -> IndiceElegibilidade:
+        """IndiceElegibilidade: Bitmaps de elegibilidade."""
+        return self.nucleo.indice_elegibilidade
 
     def adicionar_observador(self, observador: Observador) -> None:
         """Registra um novo observador para receber notificações.
@@ -99,7 +119,7 @@ class SistemaAdocao:
         Args:
             observador (Observador): Instância do observador a ser registrada.
         """
-        self.observadores.append(observador)
+        self.nucleo.adicionar_observador(observador)
 
     def notificar_observadores(self, evento: str) -> None:
         """Notifica todos os observadores registrados sobre um evento.
@@ -107,51 +127,11 @@ class SistemaAdocao:
         Args:
             evento (str): Descrição do evento ocorrido.
         """
-        for obs in self.observadores:
-            obs.atualizar(evento)
-
-    def _carregar_settings(self) -> Dict[str, Any]:
-        """Carrega as configurações do arquivo JSON ou cria o padrão se não existir.
-
-        Returns:
-            Dict[str, Any]: Dicionário contendo as configurações do sistema.
-        """
-        padrao = {
-            "banco_tipo": "JSON",
-            "idade_minima": 18,
-            "reserva_horas": 48,
-            "area_minima_g": 40.0,
-            "pesos_compatibilidade": {
-                "moradia": 40,
-                "criancas": 30,
-                "experiencia": 20,
-                "idade_energia": 10
-            }
-        }
-        try:
-            if os.path.exists("settings.json"):
-                with open("settings.json", "r", encoding='utf-8') as f:
-                    dados = json.load(f)
-                    padrao.update(dados)
-        except Exception as e:
-            print(f"⚠️ Erro ao ler settings.json: {e}")
-        
-        if not os.path.exists("settings.json"):
-            self._salvar_settings_arquivo(padrao)
-            
-        return padrao
-
-    def _salvar_settings_arquivo(self, dados: Dict[str, Any]) -> None:
-        """Salva as configurações no arquivo settings.json.
+        self.nucleo.notificar_observadores(evento)
 
-        Args:
-            dados (Dict[str, Any]): Dicionário de configurações a ser salvo.
-        """
-        try:
-            with open("settings.json", "w", encoding='utf-8') as f:
-                json.dump(dados, f, indent=4, ensure_ascii=False)
-        except Exception as e:
-            print(f"Erro ao salvar settings: {e}")
+    def fechar(self) -> None:
+        """Grava pendências e encerra o log de eventos (também ocorre automaticamente na saída)."""
+        self.nucleo.fechar()
 
     def atualizar_configuracao(self, chave: str, novo_valor: Any) -> Tuple[bool, str]:
         """Atualiza uma chave específica nas configurações do sistema.
@@ -163,28 +143,11 @@ class SistemaAdocao:
         Returns:
             Tuple[bool, str]: (Sucesso, Mensagem de retorno).
         """
-        if chave in self.settings:
-            tipo_original = type(self.settings[chave])
-            
-            try:
-                if tipo_original == int:
-                    valor_convertido = int(novo_valor)
-                elif tipo_original == float:
-                    valor_convertido = float(novo_valor)
-                elif tipo_original == bool:
-                    valor_convertido = str(novo_valor).lower() in ['true', '1', 's', 'sim']
-                elif isinstance(self.settings[chave], dict):
-                    return False, "❌ Não é possível editar dicionários complexos por este menu."
-                else:
-                    valor_convertido = str(novo_valor)
-                
-                self.settings[chave] = valor_convertido
-                self._salvar_settings_arquivo(self.settings)
-                return True, f"✅ '{chave}' atualizado para: {valor_convertido}"
-            except ValueError:
-                return False, f"❌ Erro: O valor deve ser do tipo {tipo_original.__name__}."
-        else:
-            return False, "❌ Chave de configuração não encontrada."
+        try:
+            valor_convertido = self.nucleo.atualizar_configuracao(chave, novo_valor)
+            return True, f"✅ '{chave}' atualizado para: {valor_convertido}"
+        except AdocaoError as e:
+            return False, f"❌ {e}"
 
     def buscar_animal(self, idx: int) -> Animal:
         """Busca um animal pelo índice na lista em memória.
@@ -198,10 +161,7 @@ class SistemaAdocao:
         Raises:
             EntidadeNaoEncontradaError: Se o índice for inválido.
         """
-        try:
-            return self.animais[idx]
-        except IndexError:
-            raise EntidadeNaoEncontradaError(f"Animal com índice {idx} não encontrado.")
+        return self.nucleo.buscar_animal(idx)
 
     def buscar_adotante(self, idx: int) -> Adotante:
         """Busca um adotante pelo índice na lista em memória.
@@ -215,10 +175,7 @@ class SistemaAdocao:
         Raises:
             EntidadeNaoEncontradaError: Se o índice for inválido.
         """
-        try:
-            return self.adotantes[idx]
-        except IndexError:
-            raise EntidadeNaoEncontradaError(f"Adotante com índice {idx} não encontrado.")
+        return self.nucleo.buscar_adotante(idx)
 
     def cadastrar_cachorro(self, nome: str, raca: str, porte: PorteAnimal, temperamento: List[str], precisa_passeio: bool) -> None:
         """Cadastra um novo cachorro no sistema e salva no repositório.
@@ -230,9 +187,7 @@ class SistemaAdocao:
             temperamento (List[str]): Lista de temperamentos.
             precisa_passeio (bool): Se necessita de passeio.
         """
-        novo_pet = Cachorro(nome, raca, StatusAnimal.DISPONIVEL, porte, temperamento, precisa_passeio)
-        self.animais.append(novo_pet)
-        self.repo.salvar_animais(self.animais)
+        self.nucleo.cadastrar_cachorro(nome, raca, porte, temperamento, precisa_passeio)
         print(f"✅ Cachorro {nome} cadastrado com sucesso!")
 
     def cadastrar_gato(self, nome: str, raca: str, porte: PorteAnimal, temperamento: List[str], independencia: int) -> None:
@@ -245,9 +200,7 @@ class SistemaAdocao:
             temperamento (List[str]): Lista de temperamentos.
             independencia (int): Nível de independência.
         """
-        novo_pet = Gato(nome, raca, StatusAnimal.DISPONIVEL, porte, temperamento, independencia)
-        self.animais.append(novo_pet)
-        self.repo.salvar_animais(self.animais)
+        self.nucleo.cadastrar_gato(nome, raca, porte, temperamento, independencia)
         print(f"✅ Gato {nome} cadastrado com sucesso!")
 
     def cadastrar_adotante(self, nome: str, contato: str, idade: int, moradia: TipoMoradia, area_util: float, tem_criancas: bool) -> None:
@@ -261,10 +214,13 @@ class SistemaAdocao:
             area_util (float): Área útil em m².
             tem_criancas (bool): Se possui crianças.
         """
-        novo_adotante = Adotante(nome, contato, idade, moradia, area_util, tem_criancas)
-        self.adotantes.append(novo_adotante)
-        self.repo.salvar_adotantes(self.adotantes)
+        suspeitas = self.nucleo.possiveis_duplicatas(nome, contato)
+        self.nucleo.cadastrar_adotante(nome, contato, idade, moradia, area_util, tem_criancas)
         print(f"👤 Adotante {nome} cadastrado com sucesso!")
+        if suspeitas:
+            print("⚠️  Possível cadastro duplicado. Confira:")
+            for s in suspeitas:
+                print(f"   {self._linha_adotante(s.idx, s.adotante)} - {s.motivo}")
 
     def excluir_animal(self, idx_animal: int) -> None:
         """Remove um animal do sistema pelo índice.
@@ -273,9 +229,7 @@ class SistemaAdocao:
             idx_animal (int): Índice do animal a ser removido.
         """
         try:
-            self.buscar_animal(idx_animal)
-            removido = self.animais.pop(idx_animal)
-            self.repo.salvar_animais(self.animais)
+            removido = self.nucleo.excluir_animal(idx_animal)
             print(f"🗑️ Animal '{removido.nome}' removido com sucesso!")
         except (ValueError, AdocaoError) as e:
             print(f"❌ Índice inválido ou erro: {e}")
@@ -287,9 +241,7 @@ class SistemaAdocao:
             idx_adotante (int): Índice do adotante a ser removido.
         """
         try:
-            self.buscar_adotante(idx_adotante)
-            removido = self.adotantes.pop(idx_adotante)
-            self.repo.salvar_adotantes(self.adotantes)
+            removido = self.nucleo.excluir_adotante(idx_adotante)
             print(f"🗑️ Adotante '{removido.nome}' removido com sucesso!")
         except (ValueError, AdocaoError) as e:
             print(f"❌ Erro: {e}")
@@ -306,19 +258,7 @@ class SistemaAdocao:
             extra_dado (Any, optional): Dado específico (passeio para Cães, independência para Gatos). Defaults to None.
         """
         try:
-            animal = self.buscar_animal(idx_animal)
-            if novo_nome: animal._nome = novo_nome
-            if nova_raca: animal._raca = nova_raca
-            if novo_porte: animal._porte = novo_porte
-            if novo_temperamento: animal._temperamento = novo_temperamento
-            
-            if isinstance(animal, Cachorro) and extra_dado is not None:
-                animal._precisa_passeio = extra_dado
-            elif isinstance(animal, Gato) and extra_dado is not None:
-                animal._independencia = extra_dado
-            
-            animal.adicionar_evento("Dados cadastrais editados manualmente.")
-            self.repo.salvar_animais(self.animais)
+            animal = self.nucleo.editar_animal(idx_animal, novo_nome, nova_raca, novo_porte, novo_temperamento, extra_dado)
             print(f"✏️ Dados de {animal.nome} atualizados com sucesso!")
         except (ValueError, AdocaoError) as e: print(f"❌ {e}")
 
@@ -334,62 +274,21 @@ class SistemaAdocao:
             novas_criancas (Optional[bool], optional): Novo status de crianças. Defaults to None.
         """
         try:
-            adotante = self.buscar_adotante(idx_adotante)
-            
-            if novo_nome:
-                adotante._nome = novo_nome
-            if novo_contato:
-                adotante._contato = novo_contato
-            if nova_moradia:
-                adotante._moradia = nova_moradia
-            if nova_area:
-                adotante._area_util = nova_area
-            if novas_criancas is not None:
-                adotante._tem_criancas = novas_criancas
-            
-            self.repo.salvar_adotantes(self.adotantes)
+            adotante = self.nucleo.editar_adotante(idx_adotante, novo_nome, novo_contato, nova_moradia, nova_area, novas_criancas)
             print(f"✏️ Dados de {adotante.nome} atualizados com sucesso!")
         except (ValueError, AdocaoError) as e: print(f"❌ {e}")
 
-    def _buscar_por_indice(self, idx_animal: int, idx_adotante: Optional[int] = None) -> Tuple[Animal, Optional[Adotante]]:
-        """Método auxiliar para recuperar objetos pelos índices.
-
-        Args:
-            idx_animal (int): Índice do animal.
-            idx_adotante (Optional[int], optional): Índice do adotante. Defaults to None.
-
-        Returns:
-            Tuple[Animal, Optional[Adotante]]: Tupla contendo os objetos encontrados.
-        """
-        animal = self.buscar_animal(idx_animal)
-        adotante = None
-        if idx_adotante is not None:
-            adotante = self.buscar_adotante(idx_adotante)
-        return animal, adotante
-
-    def _validar_politica_adocao(self, animal: Animal, adotante: Adotante) -> None:
+    def _validar_politica_adocao(self, animal: Animal, adotante: Adotante) -> Tuple[bool, str]:
         """Verifica se o adotante cumpre os requisitos para adotar o animal.
 
         Args:
             animal (Animal): O animal pretendido.
             adotante (Adotante): O candidato à adoção.
 
-        Raises:
-            PoliticaNaoAtendidaError: Se algum critério (idade, moradia, segurança) não for atendido.
+        Returns:
+            Tuple[bool, str]: (Aprovado, Motivo da recusa ou string vazia).
         """
-        if adotante.idade < self.settings["idade_minima"]:
-            raise PoliticaNaoAtendidaError(f"Adotante deve ter >= {self.settings['idade_minima']} anos.")
-
-        if animal.porte == PorteAnimal.G:
-            if adotante.moradia != TipoMoradia.CASA:
-                raise PoliticaNaoAtendidaError("Animais de Porte Grande exigem moradia em CASA.")
-            if adotante.area_util < self.settings["area_minima_g"]:
-                raise PoliticaNaoAtendidaError(f"Porte G exige área mínima de {self.settings['area_minima_g']}m².")
-
-        if adotante.tem_criancas:
-            temperamentos_pet = [t.lower() for t in animal.temperamento]
-            if "arisco" in temperamentos_pet or "agressivo" in temperamentos_pet:
-                raise PoliticaNaoAtendidaError("Não permitido adotar animais 'ariscos' em casas com crianças.")
+        return self.nucleo._validar_politica_adocao(animal, adotante)
 
     def _calcular_compatibilidade(self, animal: Animal, adotante: Adotante) -> Tuple[int, List[str]]:
         """Calcula um score de compatibilidade entre adotante e animal.
@@ -401,25 +300,42 @@ class SistemaAdocao:
         Returns:
             Tuple[int, List[str]]: Score (0-100) e lista de detalhes da pontuação.
         """
-        score = 0
-        detalhes = []
-        pesos = self.settings["pesos_compatibilidade"]
-        
-        if (animal.porte == PorteAnimal.G and adotante.moradia == TipoMoradia.CASA) or animal.porte != PorteAnimal.G:
-            score += pesos.get("moradia", 0)
-            detalhes.append(f"[+] Moradia adequada (+{pesos['moradia']})")
-        
-        if not (adotante.tem_criancas and "arisco" in [t.lower() for t in animal.temperamento]):
-            score += pesos.get("criancas", 0)
-            detalhes.append(f"[+] Ambiente Seguro/Sem conflito (+{pesos['criancas']})")
-            
-        if adotante.idade > 30:
-            score += pesos.get("experiencia", 0)
-            detalhes.append(f"[+] Experiência presumida (+{pesos['experiencia']})")
-        
-        score += pesos.get("idade_energia", 0)
-        
-        return min(score, 100), detalhes
+        return self.nucleo._calcular_compatibilidade(animal, adotante)
+
+    def adotantes_elegiveis(self, idx_animal: int) -> List[Tuple[int, Adotante]]:
+        """Lista todos os adotantes que a política permite adotar o animal.
+
+        Args:
+            idx_animal (int): Índice do animal.
+
+        Returns:
+            List[Tuple[int, Adotante]]: Pares (índice, adotante) elegíveis.
+        """
+        return self.nucleo.adotantes_elegiveis(idx_animal)
+
+    def animais_elegiveis(self, idx_adotante: int, apenas_adotaveis: bool = True) -> List[Tuple[int, Animal]]:
+        """Lista todos os animais que o adotante pode adotar segundo a política.
+
+        Args:
+            idx_adotante (int): Índice do adotante.
+            apenas_adotaveis (bool, optional): Considera só animais Disponíveis ou Reservados. Defaults to True.
+
+        Returns:
+            List[Tuple[int, Animal]]: Pares (índice, animal) elegíveis.
+        """
+        return self.nucleo.animais_elegiveis(idx_adotante, apenas_adotaveis)
+
+    def animais_mais_populares(self, k: int = 5, especie: Optional[Type[Animal]] = None) -> List[Tuple[Animal, int]]:
+        """Consulta os animais com as maiores filas de espera.
+
+        Args:
+            k (int, optional): Quantidade de animais. Defaults to 5.
+            especie (Optional[Type[Animal]], optional): Filtra por classe (Cachorro ou Gato). Defaults to None.
+
+        Returns:
+            List[Tuple[Animal, int]]: Pares (animal, tamanho da fila) em ordem decrescente.
+        """
+        return self.nucleo.animais_mais_populares(k, especie)
 
     def reservar_animal(self, idx_animal: int, idx_adotante: int) -> None:
         """Tenta reservar um animal para um adotante ou sugere entrar na fila.
@@ -429,64 +345,26 @@ class SistemaAdocao:
             idx_adotante (int): Índice do adotante.
         """
         try:
-            animal, adotante = self._buscar_por_indice(idx_animal, idx_adotante)
-            
-            if animal.status == StatusAnimal.RESERVADO:
-                if animal.nome_reservante == adotante.nome:
-                    raise ReservaInvalidaError(f"{adotante.nome}, você JÁ possui a reserva deste animal!")
-
-                print(f"❌ {animal.nome} já está RESERVADO para {animal.nome_reservante}.")
-                entrar = input("Deseja entrar na fila de espera? (s/n): ").lower()
-                if entrar == 's':
-                    self.entrar_fila_espera(idx_animal, idx_adotante)
-                return
-            
-            if animal.status != StatusAnimal.DISPONIVEL:
-                raise TransicaoStatusError(f"{animal.nome} não está disponível (Status: {animal.status.value}).")
-            
-            self._validar_politica_adocao(animal, adotante)
-
-            animal.mudar_status(StatusAnimal.RESERVADO)
-            animal.data_reserva = datetime.now().isoformat()
-            animal.nome_reservante = adotante.nome
-            
-            self.repo.salvar_animais(self.animais)
-            print(f"🗓️  Reserva confirmada para {adotante.nome}!")
-            print(f"⚠️  Válida por {self.settings['reserva_horas']} horas.")
-            
+            resultado = self.nucleo.reservar_animal(idx_animal, idx_adotante)
+            print(f"🗓️  Reserva confirmada para {resultado.adotante.nome}!")
+            print(f"⚠️  Válida por {resultado.validade_horas} horas.")
+        except AnimalReservadoError as e:
+            print(f"❌ {e}")
+            entrar = input("Deseja entrar na fila de espera? (s/n): ").lower()
+            if entrar == 's':
+                self.entrar_fila_espera(idx_animal, idx_adotante)
         except (ValueError, AdocaoError) as e: print(f"❌ {e}")
 
     def realizar_adocao(self, idx_animal: int, idx_adotante: int) -> None:
-        """Efetiva a adoção de um animal, calculando taxas e atualizando status.
+        """Efetiva a adoção de um animal e imprime o recibo.
 
         Args:
             idx_animal (int): Índice do animal.
             idx_adotante (int): Índice do adotante.
         """
         try:
-            animal, adotante = self._buscar_por_indice(idx_animal, idx_adotante)
-
-            if animal.status == StatusAnimal.RESERVADO and animal.nome_reservante != adotante.nome:
-                raise ReservaInvalidaError(f"Este animal está reservado para {animal.nome_reservante}.")
-
-            if animal.status not in [StatusAnimal.DISPONIVEL, StatusAnimal.RESERVADO]:
-                raise TransicaoStatusError(f"Status inválido ({animal.status.value}).")
-
-            self._validar_politica_adocao(animal, adotante)
-
-            estrategia = FabricaTaxas.obter_estrategia(animal, adotante)
-            valor_taxa = estrategia.calcular(animal, adotante)
-
-            animal.mudar_status(StatusAnimal.ADOTADO)
-            self.repo.salvar_animais(self.animais)
-            
-            try:
-                valor_float = float(valor_taxa)
-                texto_taxa = f"R$ {valor_float:.2f}"
-            except:
-                texto_taxa = f"R$ {valor_taxa}"
-
-            self.notificar_observadores(f"ADOÇÃO: {adotante.nome} adotou {animal.nome}. Taxa: {texto_taxa}")
+            resultado = self.nucleo.realizar_adocao(idx_animal, idx_adotante)
+            animal, adotante = resultado.animal, resultado.adotante
 
             print(f"🎉 ADOÇÃO SUCESSO! {adotante.nome} adotou {animal.nome}!")
             print("="*40)
@@ -494,7 +372,7 @@ class SistemaAdocao:
             print("="*40)
             print(f"Animal: {animal.nome} ({animal.porte.value})")
             print(f"Tutor:  {adotante.nome}")
-            print(f"Taxa:   {texto_taxa}")
+            print(f"Taxa:   {resultado.taxa}")
             print("="*40)
 
         except (ValueError, AdocaoError) as e: print(f"❌ {e}")
@@ -507,31 +385,28 @@ class SistemaAdocao:
             motivo (str): Motivo da devolução.
         """
         try:
-            animal = self.buscar_animal(idx_animal)
-            if animal.status != StatusAnimal.ADOTADO:
-                raise TransicaoStatusError("Apenas animais adotados podem ser devolvidos.")
-
+            resultado = self.nucleo.processar_devolucao(idx_animal, motivo)
             print(f"📝 Motivo registrado: '{motivo}'")
-            animal.mudar_status(StatusAnimal.DEVOLVIDO)
-
-            motivo_lower = motivo.lower()
-            palavras_saude = ["doente", "saude", "saúde", "doença", "vômito", "ferido"]
-            palavras_agressao = ["mordeu", "agressivo", "atacou", "bravo", "arisco"]
+            print(f"🔙 Devolução concluída. Novo status: {resultado.status.value}.")
+        except (ValueError, AdocaoError) as e: print(f"❌ {e}")
 
-            eh_saude = any(p in motivo_lower for p in palavras_saude)
-            eh_agressao = any(p in motivo_lower for p in palavras_agressao)
+    def retriar_devolucoes(self, aplicar: bool = False) -> None:
+        """Reclassifica as devoluções registradas com as palavras-chave atuais e exibe o resultado.
 
-            if eh_saude:
-                animal.mudar_status(StatusAnimal.QUARENTENA)
-            elif eh_agressao:
-                animal.mudar_status(StatusAnimal.INADOTAVEL)
+        Args:
+            aplicar (bool, optional): Aplica os novos status permitidos. Defaults to False.
+        """
+        resultados = self.nucleo.retriar_devolucoes(aplicar)
+        if not resultados:
+            print("✅ Nenhuma devolução registrada para re-triagem.")
+            return
+        for r in resultados:
+            if r.status_sugerido == r.status_atual:
+                print(f"✔️  {r.animal.nome}: {r.status_atual.value} (mantido)")
+            elif r.aplicado:
+                print(f"🔁 {r.animal.nome}: {r.status_atual.value} -> {r.status_sugerido.value}")
             else:
-                animal.mudar_status(StatusAnimal.DISPONIVEL)
-
-            self.repo.salvar_animais(self.animais)
-            print(f"🔙 Devolução concluída. Novo status: {animal.status.value}.")
-            
-        except (ValueError, AdocaoError) as e: print(f"❌ {e}")
+                print(f"💡 {r.animal.nome}: sugerido {r.status_sugerido.value} (atual: {r.status_atual.value})")
 
     def entrar_fila_espera(self, idx_animal: int, idx_adotante: int) -> None:
         """Adiciona um adotante à fila de espera de um animal.
@@ -541,62 +416,29 @@ class SistemaAdocao:
             idx_adotante (int): Índice do adotante.
         """
         try:
-            animal, adotante = self._buscar_por_indice(idx_animal, idx_adotante)
-            if animal.nome_reservante == adotante.nome:
-                raise ReservaInvalidaError(f"{adotante.nome}, você já é o titular da reserva!")
-            self._validar_politica_adocao(animal, adotante)
-
-            score, detalhes = self._calcular_compatibilidade(animal, adotante)
-            animal.fila_espera.adicionar(adotante, score)
-            animal.adicionar_evento(f"{adotante.nome} entrou na fila (Score: {score}).")
-            self.repo.salvar_animais(self.animais)
-            
-            print(f"✅ {adotante.nome} entrou na fila com Score {score}/100.")
-            for d in detalhes: print("   " + d)
-            
-            posicao = 0
-            for i, item in enumerate(animal.fila_espera.interessados):
-                if item['adotante'].nome == adotante.nome:
-                    posicao = i + 1
-                    break
-            
-            if posicao == 0: print("⚠️ Aviso: Adotante já estava na fila.")
-            else: print(f"📍 Posição atual: {posicao}º lugar")
+            resultado = self.nucleo.entrar_fila_espera(idx_animal, idx_adotante)
+
+            print(f"✅ {resultado.adotante.nome} entrou na fila com Score {resultado.score}/100.")
+            for d in resultado.detalhes: print("   " + d)
+
+            if resultado.posicao == 0: print("⚠️ Aviso: Adotante já estava na fila.")
+            else: print(f"📍 Posição atual: {resultado.posicao}º lugar")
 
         except (ValueError, AdocaoError) as e: print(f"❌ {e}")
 
     def processar_reservas_vencidas(self) -> None:
         """Verifica reservas que excederam o tempo limite e passa para o próximo da fila."""
         print("🔄 Verificando validade das reservas...")
-        agora = datetime.now()
-        horas_limite = self.settings["reserva_horas"]
-        alterou = False
-
-        for animal in self.animais:
-            if animal.status == StatusAnimal.RESERVADO and animal.data_reserva:
-                data_res = datetime.fromisoformat(animal.data_reserva)
-                horas_passadas = (agora - data_res).total_seconds() / 3600
-
-                if horas_passadas > horas_limite:
-                    old_dono = animal.nome_reservante
-                    print(f"⏰ Reserva de {old_dono} p/ {animal.nome} VENCEU ({horas_passadas:.1f}h passadas).")
-                    
-                    proximo_adotante = animal.fila_espera.proximo()
-                    if proximo_adotante:
-                        animal.nome_reservante = proximo_adotante.nome
-                        animal.data_reserva = agora.isoformat()
-                        print(f"🔔 VEZ DA FILA: {animal.nome} agora reservado para {proximo_adotante.nome}!")
-                        animal.adicionar_evento(f"Reserva expirada. Transferida p/ fila: {proximo_adotante.nome}")
-                    else:
-                        animal.mudar_status(StatusAnimal.DISPONIVEL)
-                        print(f"🔓 {animal.nome} está DISPONÍVEL novamente.")
-                        animal.adicionar_evento("Reserva expirada. Animal liberado.")
-                    alterou = True
-
-                self.notificar_observadores(f"EXPIRAÇÃO: Reserva de {animal.nome} (Tutor: {old_dono}) venceu e foi cancelada.")
-        
-        if alterou:
-            self.repo.salvar_animais(self.animais)
+        expiradas = self.nucleo.processar_reservas_vencidas()
+
+        for exp in expiradas:
+            print(f"⏰ Reserva de {exp.titular_anterior} p/ {exp.animal.nome} VENCEU ({exp.horas_passadas:.1f}h passadas).")
+            if exp.novo_titular:
+                print(f"🔔 VEZ DA FILA: {exp.animal.nome} agora reservado para {exp.novo_titular}!")
+            else:
+                print(f"🔓 {exp.animal.nome} está DISPONÍVEL novamente.")
+
+        if expiradas:
             print("✅ Processamento concluído e dados salvos.")
         else:
             print("✅ Nenhuma reserva vencida encontrada.")
@@ -608,23 +450,21 @@ class SistemaAdocao:
             idx_animal (int): Índice do animal.
         """
         try:
-            animal = self.buscar_animal(idx_animal)
+            detalhes = self.nucleo.detalhes_fila(idx_animal)
+            animal = detalhes.animal
             print(f"\n📊 DETALHES DE: {animal.nome}")
             print(f"Status Atual: {animal.status.value}")
-            
-            if animal.status == StatusAnimal.RESERVADO and animal.data_reserva:
-                dt = datetime.fromisoformat(animal.data_reserva)
-                expira_em = dt + timedelta(hours=self.settings["reserva_horas"])
-                restante = expira_em - datetime.now()
-                str_restante = str(restante).split('.')[0]
-                if restante.total_seconds() < 0: str_restante = "VENCIDO"
-                print(f"👑 Titular da Reserva: {animal.nome_reservante}")
+
+            if detalhes.titular is not None:
+                str_restante = str(detalhes.restante).split('.')[0]
+                if detalhes.restante.total_seconds() < 0: str_restante = "VENCIDO"
+                print(f"👑 Titular da Reserva: {detalhes.titular}")
                 print(f"⏳ Vencimento em: {str_restante}")
-            
-            print(f"\n👥 FILA DE ESPERA ({len(animal.fila_espera)} interessados):")
-            if len(animal.fila_espera) == 0: print("   (Vazia)")
+
+            print(f"\n👥 FILA DE ESPERA ({len(detalhes.interessados)} interessados):")
+            if not detalhes.interessados: print("   (Vazia)")
             else:
-                for i, item in enumerate(animal.fila_espera.interessados):
+                for i, item in enumerate(detalhes.interessados):
                     adotante = item['adotante']
                     score = item['score']
                     dt_entr = item['data_entrada'].split('T')[0]
@@ -639,12 +479,9 @@ class SistemaAdocao:
             nome_vacina (str): Nome da vacina.
         """
         try:
-            animal = self.buscar_animal(idx_animal)
-            if hasattr(animal, 'vacinar'):
-                animal.vacinar(nome_vacina)
-                self.repo.salvar_animais(self.animais)
-                print(f"💉 {animal.nome} foi vacinado contra {nome_vacina}!")
-            else: print(f"⚠️ {animal.nome} não pode ser vacinado.")
+            animal = self.nucleo.vacinar_animal(idx_animal, nome_vacina)
+            print(f"💉 {animal.nome} foi vacinado contra {nome_vacina}!")
+        except RegraNegocioError as e: print(f"⚠️ {e}")
         except (ValueError, AdocaoError) as e: print(f"❌ {e}")
 
     def treinar_animal(self, idx_animal: int) -> None:
@@ -654,14 +491,72 @@ class SistemaAdocao:
             idx_animal (int): Índice do animal.
         """
         try:
-            animal = self.buscar_animal(idx_animal)
-            if hasattr(animal, 'treinar'):
-                animal.treinar()
-                self.repo.salvar_animais(self.animais)
-                print(f"🎓 {animal.nome} recebeu treinamento! Nível atualizado.")
-            else: print(f"⚠️ {animal.nome} não pode ser treinado.")
+            animal = self.nucleo.treinar_animal(idx_animal)
+            print(f"🎓 {animal.nome} recebeu treinamento! Nível atualizado.")
+        except RegraNegocioError as e: print(f"⚠️ {e}")
         except (ValueError, AdocaoError) as e: print(f"❌ {e}")
 
+    def executar_lote(self, operacoes: List[OperacaoLote], atomico: bool = True) -> ResultadoLote:
+        """Executa várias operações com uma única gravação (ver ``NucleoAdocao.executar_lote``).
+
+        Args:
+            operacoes (List[OperacaoLote]): Operações, aplicadas na ordem informada.
+            atomico (bool, optional): Tudo-ou-nada (True) ou melhor esforço (False). Defaults to True.
+
+        Returns:
+            ResultadoLote: Resultado consolidado com um item por operação.
+        """
+        return self.nucleo.executar_lote(operacoes, atomico)
+
+    def reservar_lote(self, pares: List[Tuple[int, int]], atomico: bool = True) -> ResultadoLote:
+        """Reserva vários animais de uma vez.
+
+        Args:
+            pares (List[Tuple[int, int]]): Pares (índice do animal, índice do adotante).
+            atomico (bool, optional): Tudo-ou-nada. Defaults to True.
+
+        Returns:
+            ResultadoLote: Resultado consolidado.
+        """
+        return self.nucleo.reservar_lote(pares, atomico)
+
+    def adotar_lote(self, pares: List[Tuple[int, int]], atomico: bool = True) -> ResultadoLote:
+        """Efetiva várias adoções de uma vez.
+
+        Args:
+            pares (List[Tuple[int, int]]): Pares (índice do animal, índice do adotante).
+            atomico (bool, optional): Tudo-ou-nada. Defaults to True.
+
+        Returns:
+            ResultadoLote: Resultado consolidado.
+        """
+        return self.nucleo.adotar_lote(pares, atomico)
+
+    def vacinar_lote(self, indices: List[int], nome_vacina: str, atomico: bool = True) -> ResultadoLote:
+        """Aplica a mesma vacina em vários animais (ex: dia de vacinação).
+
+        Args:
+            indices (List[int]): Índices dos animais.
+            nome_vacina (str): Nome da vacina.
+            atomico (bool, optional): Tudo-ou-nada. Defaults to True.
+
+        Returns:
+            ResultadoLote: Resultado consolidado.
+        """
+        return self.nucleo.vacinar_lote(indices, nome_vacina, atomico)
+
+    def devolver_lote(self, devolucoes: List[Tuple[int, str]], atomico: bool = True) -> ResultadoLote:
+        """Processa várias devoluções de uma vez.
+
+        Args:
+            devolucoes (List[Tuple[int, str]]): Pares (índice do animal, motivo).
+            atomico (bool, optional): Tudo-ou-nada. Defaults to True.
+
+        Returns:
+            ResultadoLote: Resultado consolidado.
+        """
+        return self.nucleo.devolver_lote(devolucoes, atomico)
+
     def gerar_relatorio_animais(self, apenas_adotados: bool = False) -> None:
         """Gera um relatório impresso no console com o status dos animais.
 
@@ -673,16 +568,10 @@ class SistemaAdocao:
         for i, a in enumerate(self.animais):
             if apenas_adotados and a.status != StatusAnimal.ADOTADO:
                 continue
-                
-            extra_info = ""
-            if a.status == StatusAnimal.RESERVADO:
-                extra_info = f" [Reservado: {a.nome_reservante}]"
-            if len(a.fila_espera) > 0:
-                extra_info += f" [Fila: {len(a.fila_espera)}]"
-            icone = "🟢" if a.status == StatusAnimal.DISPONIVEL else "🔴" if a.status == StatusAnimal.ADOTADO else "🟡"
-            print(f"[{i}] {icone} {a.nome} ({a.porte.value}) - {a.status.value}{extra_info}")
+
+            print(self._linha_animal(i, a))
             contador += 1
-        
+
         if contador == 0:
             print("   (Nenhum animal encontrado para este filtro)")
 
@@ -690,105 +579,193 @@ class SistemaAdocao:
         """Imprime a lista de adotantes cadastrados com alertas de elegibilidade."""
         print("\n--- ADOTANTES ---")
         for i, a in enumerate(self.adotantes):
-            aviso = ""
-            if a.idade < self.settings["idade_minima"]:
-                aviso = " ⚠️ [Menor de Idade - Adoção Bloqueada]"
-            print(f"[{i}] {a.nome}, {a.idade} anos ({a.moradia.value}, {a.area_util}m²){aviso}")
-
-    def gerar_relatorios_estatisticos(self) -> None:
-        """Gera relatórios estatísticos detalhados e salva em arquivo .txt."""
-        linhas_relatorio = []
-        def log(texto: str) -> None:
-            print(texto)
-            linhas_relatorio.append(texto)
-
-        log("\n" + "="*50)
-        log("📊 RELATÓRIOS ESTATÍSTICOS DO ABRIGO")
-        log("Data de Geração: " + datetime.now().strftime("%d/%m/%Y %H:%M:%S"))
-        log("="*50)
-
-        log("\n🏆 TOP 5 - ANIMAIS MAIS POPULARES (Maiores Filas)")
-        populares = [(a, len(a.fila_espera)) for a in self.animais if len(a.fila_espera) > 0]
-        populares.sort(key=lambda x: x[1], reverse=True)
-        if not populares: log("   (Nenhum animal com fila de espera no momento)")
-        else:
-            for i, (animal, tamanho) in enumerate(populares[:5]):
-                log(f"   {i+1}º. {animal.nome} - Fila: {tamanho} pessoas")
-
-        log("\n📈 TAXA DE ADOÇÃO POR ESPÉCIE")
-        stats_caes = self._calcular_taxa_adocao_por_tipo(Cachorro)
-        stats_gatos = self._calcular_taxa_adocao_por_tipo(Gato)
-        log(f"   🐶 Cães:  {stats_caes['adotados']}/{stats_caes['total']} ({stats_caes['taxa']}%)")
-        log(f"   🐱 Gatos: {stats_gatos['adotados']}/{stats_gatos['total']} ({stats_gatos['taxa']}%)")
-
-        log("\n⏱️  TEMPO MÉDIO ATÉ A ADOÇÃO")
-        media_dias = self._calcular_tempo_medio_adocao()
-        if media_dias is not None: log(f"   Média geral: {media_dias:.1f} dias")
-        else: log("   (Dados insuficientes para cálculo)")
-
-        log("\n⚠️  DEVOLUÇÕES E ANIMAIS INADOTÁVEIS")
-        quarentena = len([a for a in self.animais if a.status == StatusAnimal.QUARENTENA])
-        inadotavel = len([a for a in self.animais if a.status == StatusAnimal.INADOTAVEL])
-        devolvidos = len([a for a in self.animais if a.status == StatusAnimal.DEVOLVIDO])
-        log(f"   🏥 Em Quarentena (Saúde): {quarentena}")
-        log(f"   ⛔ Inadotáveis (Comportamento): {inadotavel}")
-        log(f"   🔙 Devolvidos (Aguardando): {devolvidos}")
-        log("="*50)
+            print(self._linha_adotante(i, a))
 
-        try:
-            pasta_relatorios = "relatorios"
-            if not os.path.exists(pasta_relatorios): os.makedirs(pasta_relatorios)
-            nome_arquivo = f"relatorio_{datetime.now().strftime('%Y-%m-%d_%H-%M-%S')}.txt"
-            caminho_completo = os.path.join(pasta_relatorios, nome_arquivo)
-            with open(caminho_completo, "w", encoding="utf-8") as arquivo:
-                arquivo.write("\n".join(linhas_relatorio))
-            print(f"\n💾 Relatório salvo com sucesso em: {caminho_completo}")
-        except Exception as e: print(f"\n❌ Erro ao salvar arquivo de relatório: {e}")
+    def exibir_pagina_animais(self, filtro: Optional[FiltroAnimais] = None, apos: Optional[int] = None, antes: Optional[int] = None, tamanho: int = TAMANHO_PAGINA_PADRAO) -> Pagina[Animal]:
+        """Imprime apenas uma página da listagem de animais.
+
+        Args:
+            filtro (Optional[FiltroAnimais], optional): Critérios da listagem. Defaults to None.
+            apos (Optional[int], optional): Cursor da próxima página. Defaults to None.
+            antes (Optional[int], optional): Cursor da página anterior. Defaults to None.
+            tamanho (int, optional): Itens por página. Defaults to TAMANHO_PAGINA_PADRAO.
+
+        Returns:
+            Pagina[Animal]: A página exibida, com os cursores de navegação.
+        """
+        pagina = self.nucleo.pagina_animais(filtro, apos, antes, tamanho)
+        print("\n--- STATUS DO ABRIGO ---")
+        for i, a in pagina.itens:
+            print(self._linha_animal(i, a))
+        if not pagina.itens:
+            print("   (Nenhum animal encontrado para este filtro)")
+        return pagina
 
-    def _calcular_taxa_adocao_por_tipo(self, classe_tipo: Type[Animal]) -> Dict[str, Any]:
-        """Calcula estatísticas de adoção para uma classe de animal específica.
+    def exibir_busca_animais(self, consulta: str, limite: int = 20) -> List[Tuple[int, Animal]]:
+        """Imprime os animais encontrados pela busca textual, do mais ao menos relevante.
 
         Args:
-            classe_tipo (Type[Animal]): A classe (Cachorro ou Gato) para filtrar.
+            consulta (str): Texto livre (ex: "siames calmo").
+            limite (int, optional): Máximo de resultados. Defaults to 20.
 
         Returns:
-            Dict[str, Any]: Dicionário com total, adotados e taxa percentual.
+            List[Tuple[int, Animal]]: Pares (índice, animal) exibidos.
         """
-        total = 0
-        adotados = 0
-        for animal in self.animais:
-            if isinstance(animal, classe_tipo):
-                total += 1
-                if animal.status == StatusAnimal.ADOTADO: adotados += 1
-        taxa = (adotados / total * 100) if total > 0 else 0.0
-        return {"total": total, "adotados": adotados, "taxa": round(taxa, 1)}
+        encontrados = self.nucleo.buscar_animais(consulta, limite)
+        print(f"\n--- BUSCA: {consulta} ---")
+        for i, a in encontrados:
+            print(self._linha_animal(i, a))
+        if not encontrados:
+            print("   (Nenhum animal encontrado para esta busca)")
+        return encontrados
 
-    def _calcular_tempo_medio_adocao(self) -> Optional[float]:
-        """Calcula o tempo médio entre cadastro e adoção baseado no histórico.
+    def exibir_busca_adotantes(self, nome: str, limite: int = 10) -> List[Tuple[int, Adotante, float]]:
+        """Imprime os adotantes com nome parecido com o informado.
+
+        Args:
+            nome (str): Nome (ou parte dele) como digitado.
+            limite (int, optional): Máximo de resultados. Defaults to 10.
+
+        Returns:
+            List[Tuple[int, Adotante, float]]: (índice, adotante, semelhança) exibidos.
+        """
+        encontrados = self.nucleo.buscar_adotantes(nome, limite)
+        print(f"\n--- BUSCA DE ADOTANTES: {nome} ---")
+        for i, a, similaridade in encontrados:
+            print(f"{self._linha_adotante(i, a)} - {similaridade:.0%}")
+        if not encontrados:
+            print("   (Nenhum adotante encontrado para esta busca)")
+        return encontrados
+
+    def exibir_pagina_adotantes(self, filtro: Optional[FiltroAdotantes] = None, apos: Optional[int] = None, antes: Optional[int] = None, tamanho: int = TAMANHO_PAGINA_PADRAO) -> Pagina[Adotante]:
+        """Imprime apenas uma página da listagem de adotantes.
+
+        Args:
+            filtro (Optional[FiltroAdotantes], optional): Critérios da listagem. Defaults to None.
+            apos (Optional[int], optional): Cursor da próxima página. Defaults to None.
+            antes (Optional[int], optional): Cursor da página anterior. Defaults to None.
+            tamanho (int, optional): Itens por página. Defaults to TAMANHO_PAGINA_PADRAO.
 
         Returns:
-            Optional[float]: Média de dias ou None se não houver dados.
-        """
-        total_dias = 0
-        count = 0
-        for animal in self.animais:
-            if animal.status == StatusAnimal.ADOTADO:
-                data_entrada = None
-                data_adocao = None
-                for evento in animal.historico_eventos:
-                    if "Cadastrado" in evento:
-                        try:
-                            data_str = evento.split(']')[0].replace('[', '')
-                            data_entrada = datetime.strptime(data_str, "%Y-%m-%d %H:%M")
-                        except: pass
-                    if "Status alterado: Reservado -> Adotado" in evento or "Status alterado: Disponível -> Adotado" in evento:
-                        try:
-                            data_str = evento.split(']')[0].replace('[', '')
-                            data_adocao = datetime.strptime(data_str, "%Y-%m-%d %H:%M")
-                        except: pass
-                if data_entrada and data_adocao:
-                    diferenca = data_adocao - data_entrada
-                    total_dias += diferenca.total_seconds() / 86400 
-                    count += 1
-        if count == 0: return None
-        return total_dias / count
\ No newline at end of file
+            Pagina[Adotante]: A página exibida, com os cursores de navegação.
+        """
+        pagina = self.nucleo.pagina_adotantes(filtro, apos, antes, tamanho)
+        print("\n--- ADOTANTES ---")
+        for i, a in pagina.itens:
+            print(self._linha_adotante(i, a))
+        if not pagina.itens:
+            print("   (Nenhum adotante encontrado para este filtro)")
+        return pagina
+
+    @staticmethod
+    def _linha_animal(i: int, a: Animal) -> str:
+        """Formata a linha de um animal nas listagens."""
+        extra_info = ""
+        if a.status == StatusAnimal.RESERVADO:
+            extra_info = f" [Reservado: {a.nome_reservante}]"
+        if len(a.fila_espera) > 0:
+            extra_info += f" [Fila: {len(a.fila_espera)}]"
+        icone = "🟢" if a.status == StatusAnimal.DISPONIVEL else "🔴" if a.status == StatusAnimal.ADOTADO else "🟡"
+        return f"[{i}] {icone} {a.nome} ({a.porte.value}) - {a.status.value}{extra_info}"
+
+    def _linha_adotante(self, i: int, a: Adotante) -> str:
+        """Formata a linha de um adotante nas listagens, com alerta de idade mínima."""
+        aviso = ""
+        if a.idade < self.settings["idade_minima"]:
+            aviso = " ⚠️ [Menor de Idade - Adoção Bloqueada]"
+        return f"[{i}] {a.nome}, {a.idade} anos ({a.moradia.value}, {a.area_util}m²){aviso}"
+
+    def gerar_relatorios_estatisticos(self, formatos: Iterable[str] = ("txt",)) -> None:
+        """Exibe o relatório estatístico e o salva em relatorios/ nos formatos pedidos.
+
+        Args:
+            formatos (Iterable[str], optional): "txt", "csv" e/ou "json". Defaults to ("txt",).
+        """
+        from .reports import relatorio_estatistico
+        chave = self._chave_arquivo_relatorio()
+        self._emitir_relatorio(relatorio_estatistico(self.nucleo.estatisticas()), "relatorio", formatos, chave, console=True)
+
+    def exportar_relatorio_animais(self, formatos: Iterable[str] = ("csv",)) -> None:
+        """Salva o relatório detalhado por animal em relatorios/, sem exibi-lo no console.
+
+        Args:
+            formatos (Iterable[str], optional): "txt", "csv" e/ou "json". Defaults to ("csv",).
+        """
+        from .reports import relatorio_animais
+        chave = self._chave_arquivo_relatorio()
+        self._emitir_relatorio(relatorio_animais(self.animais), "animais", formatos, chave, console=False)
+
+    def gerar_relatorio_tendencia(self, dias: int = 365, intervalo_dias: int = 7, formatos: Iterable[str] = ()) -> None:
+        """Exibe a evolução das métricas do abrigo e, opcionalmente, salva em relatorios/.
+
+        Args:
+            dias (int, optional): Tamanho do período. Defaults to 365.
+            intervalo_dias (int, optional): Dias por linha. Defaults to 7.
+            formatos (Iterable[str], optional): "txt", "csv" e/ou "json". Defaults to () (só console).
+        """
+        from .reports import relatorio_tendencia
+        try:
+            pontos = self.nucleo.tendencia_metricas(dias, intervalo_dias)
+        except AdocaoError as e:
+            print(f"❌ Erro: {e}")
+            return
+        self._emitir_relatorio(relatorio_tendencia(pontos, intervalo_dias), "tendencia", formatos, None, console=True)
+
+    def gerar_relatorio_duplicatas(self, formatos: Iterable[str] = ()) -> None:
+        """Exibe os pares de adotantes provavelmente duplicados e, opcionalmente, salva em relatorios/.
+
+        Args:
+            formatos (Iterable[str], optional): "txt", "csv" e/ou "json". Defaults to () (só console).
+        """
+        from .reports import relatorio_duplicatas
+        chave = self._chave_arquivo_relatorio()
+        self._emitir_relatorio(relatorio_duplicatas(self.nucleo.relatorio_duplicatas()), "duplicatas", formatos, chave, console=True)
+
+    def _chave_arquivo_relatorio(self) -> Optional[str]:
+        """Parte do nome do arquivo que identifica os dados gravados e as configurações
+        (None se houver alterações não gravadas: o relatório não é reaproveitável)."""
+        dados = self.nucleo.assinatura_dados()
+        if dados is None:
+            return None
+        return f"{dados[:16]}-{self.nucleo.assinatura_settings()[:12]}"
+
+    def _caminho_relatorio(self, pasta: str, prefixo: str, formato: str, chave: Optional[str], relatorio: 'Relatorio') -> str:
+        """Caminho do arquivo: derivado da chave (dados gravados e configurações) ou, sem chave, do horário."""
+        from .reports import caminho_relatorio
+        if chave is None:
+            return caminho_relatorio(pasta, prefixo, formato, relatorio.gerado_em)
+        return os.path.join(pasta, f"{prefixo}_{chave}.{formato}")
+
+    def _emitir_relatorio(self, relatorio: 'Relatorio', prefixo: str, formatos: Iterable[str], chave: Optional[str], console: bool) -> None:
+        """Gera o relatório em uma única passagem para o console e para os arquivos que ainda não existem."""
+        from .reports import SaidaTexto, SAIDAS_POR_FORMATO, gerar_relatorio
+        pasta_relatorios = os.path.join(self.nucleo.diretorio, "relatorios")
+        caminhos = []
+        try:
+            pendentes = []
+            for formato in formatos:
+                caminho = self._caminho_relatorio(pasta_relatorios, prefixo, formato, chave, relatorio)
+                if chave is not None and os.path.exists(caminho):
+                    print(f"\n♻️  Nenhuma alteração desde o último relatório. Arquivo mantido: {caminho}")
+                else:
+                    pendentes.append((formato, caminho))
+            formatos = [formato for formato, _ in pendentes]
+            invalidos = [f for f in formatos if f not in SAIDAS_POR_FORMATO]
+            if invalidos:
+                raise ValueError(f"Formato(s) desconhecido(s): {', '.join(invalidos)}")
+            if formatos and not os.path.exists(pasta_relatorios): os.makedirs(pasta_relatorios)
+            with ExitStack() as arquivos:
+                saidas = [SaidaTexto(sys.stdout)] if console else []
+                for formato, caminho in pendentes:
+                    arquivo = arquivos.enter_context(open(caminho, "w", encoding="utf-8", newline="" if formato == "csv" else None))
+                    saidas.append(SAIDAS_POR_FORMATO[formato](arquivo))
+                    caminhos.append(caminho)
+                gerar_relatorio(relatorio, saidas)
+            for caminho in caminhos:
+                print(f"\n💾 Relatório salvo com sucesso em: {caminho}")
+        except Exception as e:
+            # Um arquivo pela metade seria reaproveitado na próxima vez: descarta.
+            for caminho in caminhos:
+                if os.path.exists(caminho):
+                    os.remove(caminho)
+            print(f"\n❌ Erro ao salvar arquivo de relatório: {e}")
@@ -0,0 +1,417 @@
+"""Rede de abrigos: cada abrigo é um shard com o próprio diretório de dados.
+
+Cada subpasta de ``pasta`` é um abrigo completo (settings.json, adocao.db ou
+arquivos JSON, dados/), igual ao diretório de uma instalação com um abrigo só.
+Alterações são feitas no abrigo dono dos dados (``RedeAbrigos.abrigo(nome)``);
+consultas que atravessam a rede (busca, estatísticas, animais elegíveis em
+qualquer abrigo) são distribuídas entre processos e os resultados, mesclados.
+
+Cada abrigo é sempre atendido pelo mesmo processo, que mantém os dados dele
+em memória e só os relê quando os arquivos mudam. Assim a memória total é a
+soma dos abrigos (não multiplicada pelo número de processos) e uma consulta
+repetida não paga a carga de novo.
+
+Uso (a partir da raiz do projeto):
+    python -m src.adocao.shelters --pasta abrigos --nome re --status DISPONIVEL
+    python -m src.adocao.shelters --pasta abrigos --elegiveis centro:3
+    python -m src.adocao.shelters --pasta abrigos --estatisticas
+"""
+import argparse
+import multiprocessing
+import os
+import sys
+import zlib
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from .core import NucleoAdocao
+from .domain import Animal, Adotante, Cachorro, Gato
+from .enums import StatusAnimal
+from .exceptions import EntidadeNaoEncontradaError, OperacaoInvalidaError
+from .pagination import FiltroAnimais
+from .results import EstatisticasAbrigo
+
+ARQUIVOS_DADOS = ("settings.json", "animais.json", "adotantes.json", "adocao.db")
+LIMITE_PADRAO = 50
+
+# Núcleos abertos neste processo: diretório -> (assinatura dos arquivos, núcleo).
+_nucleos: Dict[str, Tuple[Tuple[Any, ...], NucleoAdocao]] = {}
+
+def _assinatura(diretorio: str) -> Tuple[Any, ...]:
+    """Resume tamanho e data de modificação dos arquivos de dados de um abrigo."""
+    assinatura = []
+    for nome in ARQUIVOS_DADOS:
+        try:
+            info = os.stat(os.path.join(diretorio, nome))
+        except OSError:
+            continue
+        assinatura.append((nome, info.st_size, info.st_mtime_ns))
+    return tuple(assinatura)
+
+def _abrir(diretorio: str) -> NucleoAdocao:
+    """Retorna o núcleo do abrigo neste processo, relendo os dados se os arquivos mudaram."""
+    assinatura = _assinatura(diretorio)
+    em_cache = _nucleos.get(diretorio)
+    if em_cache is not None and em_cache[0] == assinatura:
+        return em_cache[1]
+    if em_cache is not None:
+        em_cache[1].fechar()
+    nucleo = NucleoAdocao(diretorio=diretorio, registrar_log=False)
+    _nucleos[diretorio] = (assinatura, nucleo)
+    return nucleo
+
+def _buscar(diretorio: str, filtro: FiltroAnimais, limite: int) -> Tuple[int, List[Tuple[int, Dict[str, Any]]]]:
+    """(No processo do abrigo) Conta os animais que atendem ao filtro e serializa os primeiros."""
+    nucleo = _abrir(diretorio)
+    total, primeiros = 0, []
+    with nucleo.trava_estrutura.compartilhada():
+        for idx, animal in enumerate(nucleo.animais):
+            if filtro.aceita(animal):
+                total += 1
+                if len(primeiros) < limite:
+                    primeiros.append((idx, animal.to_dict()))
+    return total, primeiros
+
+def _elegiveis(diretorio: str, dados_adotante: Dict[str, Any], limite: int) -> Tuple[int, List[Tuple[int, Dict[str, Any]]]]:
+    """(No processo do abrigo) Animais elegíveis para o adotante segundo a política deste abrigo."""
+    nucleo = _abrir(diretorio)
+    with nucleo.trava_estrutura.compartilhada():
+        elegiveis = nucleo.animais_elegiveis_para(Adotante.from_dict(dados_adotante))
+        return len(elegiveis), [(idx, animal.to_dict()) for idx, animal in elegiveis[:limite]]
+
+def _adotante(diretorio: str, idx_adotante: int) -> Dict[str, Any]:
+    """(No processo do abrigo) Dados de um adotante cadastrado."""
+    return _abrir(diretorio).buscar_adotante(idx_adotante).to_dict()
+
+def _parciais(diretorio: str, k: int) -> Dict[str, Any]:
+    """(No processo do abrigo) Somas que, mescladas, formam as estatísticas da rede."""
+    nucleo = _abrir(diretorio)
+    with nucleo.trava_estrutura.compartilhada():
+        status = {s.name: 0 for s in StatusAnimal}
+        especies = {"caes": [0, 0], "gatos": [0, 0]}
+        for animal in nucleo.animais:
+            status[animal.status.name] += 1
+            especie = "caes" if isinstance(animal, Cachorro) else "gatos" if isinstance(animal, Gato) else None
+            if especie:
+                especies[especie][0] += 1
+                especies[especie][1] += animal.status == StatusAnimal.ADOTADO
+        return {
+            "status": status,
+            "especies": especies,
+            "tempos": nucleo.somar_tempos_adocao(),
+            "populares": [(tamanho, animal.to_dict()) for animal, tamanho in nucleo.animais_mais_populares(k)]
+        }
+
+@dataclass
+class AnimalEncontrado:
+    """Um animal de algum abrigo da rede.
+
+    Attributes:
+        abrigo (str): Nome do abrigo (subpasta) onde o animal está.
+        id (int): Posição do animal no abrigo (o ID usado pelo núcleo e pela API).
+        animal (Animal): Cópia do animal, reconstruída a partir dos dados do abrigo.
+    """
+    abrigo: str
+    id: int
+    animal: Animal
+
+@dataclass
+class ResultadoRede:
+    """Resultado mesclado de uma consulta distribuída.
+
+    Attributes:
+        itens (List[AnimalEncontrado]): Até ``limite`` animais, em ordem de abrigo e ID.
+        total (int): Quantos animais atendem à consulta em toda a rede.
+        por_abrigo (Dict[str, int]): Quantos atendem em cada abrigo.
+        erros (Dict[str, str]): Abrigos que falharam e o motivo (os demais são mesclados mesmo assim).
+    """
+    itens: List[AnimalEncontrado] = field(default_factory=list)
+    total: int = 0
+    por_abrigo: Dict[str, int] = field(default_factory=dict)
+    erros: Dict[str, str] = field(default_factory=dict)
+
+class RedeAbrigos:
+    """Vários abrigos, cada um com o próprio repositório, consultados em paralelo.
+
+    Attributes:
+        pasta (str): Pasta com uma subpasta por abrigo.
+        processos (int): Máximo de processos usados nas consultas distribuídas.
+        paralelo (bool): Se False, as consultas rodam no próprio processo, um abrigo
+            por vez (útil para poucos abrigos pequenos e para depuração).
+    """
+
+    def __init__(self, pasta: str, processos: Optional[int] = None, paralelo: bool = True) -> None:
+        """Prepara a rede sem abrir nenhum abrigo.
+
+        Args:
+            pasta (str): Pasta com uma subpasta por abrigo (criada se não existir).
+            processos (Optional[int], optional): Máximo de processos. Defaults to os.cpu_count().
+            paralelo (bool, optional): Distribui as consultas entre processos. Defaults to True.
+        """
+        self.pasta = pasta
+        self.processos = max(1, processos or os.cpu_count() or 1)
+        self.paralelo = paralelo
+        self._executores: Dict[int, ProcessPoolExecutor] = {}
+        self._abertos: Dict[str, NucleoAdocao] = {}
+        os.makedirs(pasta, exist_ok=True)
+
+    @property
+    def abrigos(self) -> List[str]:
+        """List[str]: Nomes dos abrigos (subpastas), em ordem alfabética."""
+        return sorted(nome for nome in os.listdir(self.pasta)
+                      if not nome.startswith(".") and os.path.isdir(os.path.join(self.pasta, nome)))
+
+    def _diretorio(self, nome: str) -> str:
+        """Caminho do abrigo, validando que ele existe.
+
+        Raises:
+            EntidadeNaoEncontradaError: Se não houver abrigo com esse nome.
+        """
+        diretorio = os.path.join(self.pasta, nome)
+        if not nome or os.sep in nome or not os.path.isdir(diretorio):
+            raise EntidadeNaoEncontradaError(f"Abrigo '{nome}' não encontrado.")
+        return diretorio
+
+    def criar_abrigo(self, nome: str, settings: Optional[Dict[str, Any]] = None) -> NucleoAdocao:
+        """Cria um abrigo vazio na rede.
+
+        Args:
+            nome (str): Nome do abrigo (vira o nome da subpasta).
+            settings (Optional[Dict[str, Any]], optional): Configurações próprias do abrigo
+                (ex: {"banco_tipo": "SQLITE", "idade_minima": 21}). Defaults to o padrão.
+
+        Returns:
+            NucleoAdocao: Núcleo do novo abrigo, para os cadastros.
+
+        Raises:
+            OperacaoInvalidaError: Se o nome for inválido ou o abrigo já existir.
+        """
+        if not nome or nome.startswith(".") or os.sep in nome or (os.altsep and os.altsep in nome):
+            raise OperacaoInvalidaError(f"Nome de abrigo inválido: {nome!r}.")
+        diretorio = os.path.join(self.pasta, nome)
+        if os.path.exists(diretorio):
+            raise OperacaoInvalidaError(f"O abrigo '{nome}' já existe.")
+        os.makedirs(diretorio)
+        nucleo = NucleoAdocao(diretorio=diretorio, registrar_log=False)
+        for chave, valor in (settings or {}).items():
+            nucleo.atualizar_configuracao(chave, valor)
+        if settings and "banco_tipo" in settings:
+            nucleo.fechar()
+            nucleo = NucleoAdocao(diretorio=diretorio, registrar_log=False)
+        self._abertos[nome] = nucleo
+        return nucleo
+
+    def abrigo(self, nome: str) -> NucleoAdocao:
+        """Núcleo de um abrigo neste processo, para cadastros e operações.
+
+        Args:
+            nome (str): Nome do abrigo.
+
+        Returns:
+            NucleoAdocao: O núcleo (aberto na primeira chamada e reaproveitado).
+
+        Raises:
+            EntidadeNaoEncontradaError: Se não houver abrigo com esse nome.
+        """
+        if nome not in self._abertos:
+            self._abertos[nome] = NucleoAdocao(diretorio=self._diretorio(nome), registrar_log=False)
+        return self._abertos[nome]
+
+    def _executor(self, nome: str) -> ProcessPoolExecutor:
+        """Processo responsável por um abrigo: sempre o mesmo, pelo hash do nome."""
+        posicao = zlib.crc32(nome.encode("utf-8")) % self.processos
+        if posicao not in self._executores:
+            self._executores[posicao] = ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn"))
+        return self._executores[posicao]
+
+    def _distribuir(self, funcao: Callable[..., Any], *args: Any, abrigos: Optional[List[str]] = None) -> Dict[str, Any]:
+        """Executa ``funcao(diretorio, *args)`` em cada abrigo e reúne os resultados.
+
+        Args:
+            funcao (Callable[..., Any]): Função do módulo (precisa ser serializável para outro processo).
+            *args (Any): Argumentos repassados depois do diretório.
+            abrigos (Optional[List[str]], optional): Abrigos consultados. Defaults to todos.
+
+        Returns:
+            Dict[str, Any]: Abrigo -> resultado, ou a exceção que o abrigo levantou.
+        """
+        abrigos = self.abrigos if abrigos is None else abrigos
+        if not self.paralelo:
+            resultados = {}
+            for nome in abrigos:
+                try:
+                    resultados[nome] = funcao(os.path.join(self.pasta, nome), *args)
+                except Exception as e:
+                    resultados[nome] = e
+            return resultados
+        futuros: Dict[str, Future] = {
+            nome: self._executor(nome).submit(funcao, os.path.abspath(os.path.join(self.pasta, nome)), *args)
+            for nome in abrigos
+        }
+        resultados = {}
+        for nome, futuro in futuros.items():
+            try:
+                resultados[nome] = futuro.result()
+            except Exception as e:
+                resultados[nome] = e
+        return resultados
+
+    @staticmethod
+    def _mesclar(parciais: Dict[str, Any], limite: int) -> ResultadoRede:
+        """Junta os pares (total, primeiros) de cada abrigo em ordem de abrigo e ID."""
+        resultado = ResultadoRede()
+        for nome, parcial in parciais.items():
+            if isinstance(parcial, Exception):
+                resultado.erros[nome] = str(parcial)
+                continue
+            total, primeiros = parcial
+            resultado.por_abrigo[nome] = total
+            resultado.total += total
+            for idx, dados in primeiros:
+                if len(resultado.itens) >= limite:
+                    break
+                resultado.itens.append(AnimalEncontrado(nome, idx, Animal.from_dict(dados)))
+        return resultado
+
+    def buscar_animais(self, filtro: Optional[FiltroAnimais] = None, limite: int = LIMITE_PADRAO) -> ResultadoRede:
+        """Busca animais em todos os abrigos.
+
+        Args:
+            filtro (Optional[FiltroAnimais], optional): Critérios (status, porte, espécie, nome). Defaults to todos.
+            limite (int, optional): Máximo de animais retornados. Defaults to LIMITE_PADRAO.
+
+        Returns:
+            ResultadoRede: Primeiros animais encontrados e contagens por abrigo.
+        """
+        return self._mesclar(self._distribuir(_buscar, filtro or FiltroAnimais(), limite), limite)
+
+    def animais_elegiveis(self, abrigo: str, idx_adotante: int, limite: int = LIMITE_PADRAO) -> ResultadoRede:
+        """Procura em toda a rede animais que um adotante pode adotar.
+
+        Cada abrigo aplica a própria política de adoção.
+
+        Args:
+            abrigo (str): Abrigo onde o adotante está cadastrado.
+            idx_adotante (int): Índice do adotante nesse abrigo.
+            limite (int, optional): Máximo de animais retornados. Defaults to LIMITE_PADRAO.
+
+        Returns:
+            ResultadoRede: Primeiros animais elegíveis e contagens por abrigo.
+
+        Raises:
+            EntidadeNaoEncontradaError: Se o abrigo ou o adotante não existir.
+        """
+        self._diretorio(abrigo)
+        dados = self._distribuir(_adotante, idx_adotante, abrigos=[abrigo])[abrigo]
+        if isinstance(dados, Exception):
+            raise dados
+        return self._mesclar(self._distribuir(_elegiveis, dados, limite), limite)
+
+    def estatisticas(self, k: int = 5) -> EstatisticasAbrigo:
+        """Estatísticas consolidadas da rede, no mesmo formato das de um abrigo.
+
+        Args:
+            k (int, optional): Quantidade de animais populares. Defaults to 5.
+
+        Returns:
+            EstatisticasAbrigo: Somas de todos os abrigos que responderam.
+        """
+        status = {s.name: 0 for s in StatusAnimal}
+        especies = {"caes": [0, 0], "gatos": [0, 0]}
+        total_dias, adocoes = 0.0, 0
+        populares: List[Tuple[int, Dict[str, Any]]] = []
+        for parcial in self._distribuir(_parciais, k).values():
+            if isinstance(parcial, Exception):
+                continue
+            for nome, quantidade in parcial["status"].items():
+                status[nome] += quantidade
+            for especie, (total, adotados) in parcial["especies"].items():
+                especies[especie][0] += total
+                especies[especie][1] += adotados
+            total_dias += parcial["tempos"][0]
+            adocoes += parcial["tempos"][1]
+            populares.extend(parcial["populares"])
+        populares.sort(key=lambda par: par[0], reverse=True)
+
+        def taxa(especie: str) -> Dict[str, Any]:
+            total, adotados = especies[especie]
+            return {"total": total, "adotados": adotados, "taxa": round(adotados / total * 100, 1) if total else 0.0}
+
+        return EstatisticasAbrigo(
+            gerado_em=datetime.now(),
+            populares=[(Animal.from_dict(dados), tamanho) for tamanho, dados in populares[:k]],
+            caes=taxa("caes"),
+            gatos=taxa("gatos"),
+            tempo_medio_dias=total_dias / adocoes if adocoes else None,
+            quarentena=status[StatusAnimal.QUARENTENA.name],
+            inadotaveis=status[StatusAnimal.INADOTAVEL.name],
+            devolvidos=status[StatusAnimal.DEVOLVIDO.name]
+        )
+
+    def fechar(self) -> None:
+        """Grava o que estiver pendente nos abrigos abertos e encerra os processos."""
+        for nucleo in self._abertos.values():
+            nucleo.fechar()
+        self._abertos.clear()
+        for executor in self._executores.values():
+            executor.shutdown()
+        self._executores.clear()
+
+    def __enter__(self) -> "RedeAbrigos":
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.fechar()
+
+def main(argv: Optional[list] = None) -> int:
+    """Executa uma consulta na rede pela linha de comando.
+
+    Args:
+        argv (Optional[list], optional): Argumentos (sem o nome do programa). Defaults to sys.argv.
+
+    Returns:
+        int: Código de saída.
+    """
+    from .commands import ler_enum
+    from .enums import PorteAnimal
+    from .reports import SaidaTexto, gerar_relatorio, relatorio_estatistico
+
+    parser = argparse.ArgumentParser(description="Consulta todos os abrigos de uma rede.")
+    parser.add_argument("--pasta", default="abrigos", help="pasta com uma subpasta por abrigo")
+    parser.add_argument("--processos", type=int, help="máximo de processos (padrão: núcleos da máquina)")
+    parser.add_argument("--nome", help="início do nome do animal")
+    parser.add_argument("--status", help="status do animal (ex: DISPONIVEL)")
+    parser.add_argument("--porte", help="porte do animal (P, M ou G)")
+    parser.add_argument("--elegiveis", metavar="ABRIGO:ID", help="animais elegíveis para um adotante, em toda a rede")
+    parser.add_argument("--estatisticas", action="store_true", help="relatório estatístico consolidado")
+    parser.add_argument("--limite", type=int, default=LIMITE_PADRAO)
+    args = parser.parse_args(argv)
+
+    with RedeAbrigos(args.pasta, args.processos) as rede:
+        try:
+            if args.estatisticas:
+                gerar_relatorio(relatorio_estatistico(rede.estatisticas()), [SaidaTexto(sys.stdout)])
+                return 0
+            if args.elegiveis:
+                abrigo, _, idx = args.elegiveis.rpartition(":")
+                resultado = rede.animais_elegiveis(abrigo, int(idx), args.limite)
+            else:
+                filtro = FiltroAnimais(
+                    status=ler_enum(StatusAnimal, args.status) if args.status else None,
+                    porte=ler_enum(PorteAnimal, args.porte) if args.porte else None,
+                    prefixo_nome=args.nome
+                )
+                resultado = rede.buscar_animais(filtro, args.limite)
+        except (ValueError, EntidadeNaoEncontradaError) as e:
+            print(f"❌ {e}", file=sys.stderr)
+            return 1
+        for item in resultado.itens:
+            print(f"[{item.abrigo}:{item.id}] {item.animal}")
+        print(f"{resultado.total} encontrado(s) em {len(resultado.por_abrigo)} abrigo(s).")
+        for nome, erro in resultado.erros.items():
+            print(f"⚠️ {nome}: {erro}", file=sys.stderr)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
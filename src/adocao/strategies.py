@@ -1,12 +1,23 @@
-from abc import ABC, abstractmethod
+from abc import ABC
+from decimal import Decimal
+from typing import Dict
 from .domain import Animal, Adotante
 from .enums import PorteAnimal
+from .fees import Taxa
 
 class EstrategiaTaxa(ABC):
-    """Interface (Strategy) para cálculo de taxa de adoção."""
-    
-    @abstractmethod
-    def calcular(self, animal: Animal, adotante: Adotante) -> str:
+    """Interface (Strategy) para cálculo de taxa de adoção.
+
+    Cada estratégia corresponde a uma linha da tabela padrão de taxas. O cálculo
+    do sistema é feito pelo ``MotorTaxas``; as estratégias continuam disponíveis
+    para quem precisa de uma regra isolada.
+
+    Attributes:
+        taxa (Taxa): Valor e rótulo cobrados pela estratégia.
+    """
+    taxa: Taxa
+
+    def calcular(self, animal: Animal, adotante: Adotante) -> Decimal:
         """Calcula a taxa de adoção baseada na estratégia definida.
 
         Args:
@@ -14,65 +25,39 @@ class EstrategiaTaxa(ABC):
             adotante (Adotante): O potencial adotante.
 
         Returns:
-            str: O valor da taxa calculado.
+            Decimal: O valor da taxa.
         """
-        pass
+        return self.taxa.valor
 
 class TaxaPadrao(EstrategiaTaxa):
     """Implementa a cobrança padrão do abrigo."""
-
-    def calcular(self, animal: Animal, adotante: Adotante) -> str:
-        """Aplica a taxa padrão para adoções.
-
-        Args:
-            animal (Animal): O animal a ser adotado.
-            adotante (Adotante): O adotante.
-
-        Returns:
-            str: O valor da taxa padrão formatado.
-        """
-        self.taxa = "50.00 (padrão)"
-        return self.taxa
+    taxa = Taxa(Decimal("50.00"), "padrão")
 
 class TaxaSenior(EstrategiaTaxa):
     """Implementa desconto para adotantes idosos para incentivar a companhia na terceira idade."""
-
-    def calcular(self, animal: Animal, adotante: Adotante) -> str:
-        """Calcula a taxa com desconto se o adotante for idoso.
-
-        Args:
-            animal (Animal): O animal a ser adotado.
-            adotante (Adotante): O adotante.
-
-        Returns:
-            str: O valor da taxa com desconto sênior.
-        """
-        if adotante.idade >= 60:
-            self.taxa = "20.00 (sênior)"
-            return self.taxa 
+    taxa = Taxa(Decimal("20.00"), "sênior")
 
 class TaxaPorteGrande(EstrategiaTaxa):
     """Implementa taxa diferenciada para animais de porte grande devido aos custos maiores."""
+    taxa = Taxa(Decimal("80.00"), "porte grande")
 
-    def calcular(self, animal: Animal, adotante: Adotante) -> str:
-        """Calcula a taxa majorada se o animal for de grande porte.
+class FabricaTaxas:
+    """Factory para decidir qual estratégia de taxa usar automaticamente.
 
-        Args:
-            animal (Animal): O animal a ser adotado.
-            adotante (Adotante): O adotante.
+    As estratégias não têm estado, então a fábrica devolve sempre as mesmas instâncias.
+    """
 
-        Returns:
-            str: O valor da taxa para porte grande.
-        """
-        if animal.porte == PorteAnimal.G:
-            self.taxa = "80.00 (porte grande)"
-            return self.taxa
+    _instancias: Dict[type, EstrategiaTaxa] = {}
 
-class FabricaTaxas:
-    """Factory para decidir qual estratégia de taxa usar automaticamente."""
+    @classmethod
+    def _instancia(cls, tipo: type) -> EstrategiaTaxa:
+        """Retorna a instância compartilhada de uma estratégia."""
+        if tipo not in cls._instancias:
+            cls._instancias[tipo] = tipo()
+        return cls._instancias[tipo]
 
-    @staticmethod
-    def obter_estrategia(animal: Animal, adotante: Adotante) -> EstrategiaTaxa:
+    @classmethod
+    def obter_estrategia(cls, animal: Animal, adotante: Adotante) -> EstrategiaTaxa:
         """Determina a estratégia de taxa adequada baseada nas regras de prioridade.
 
         Args:
@@ -83,9 +68,9 @@ class FabricaTaxas:
             EstrategiaTaxa: A instância da estratégia de taxa selecionada.
         """
         if adotante.idade >= 60:
-            return TaxaSenior()
-        
+            return cls._instancia(TaxaSenior)
+
         if animal.porte == PorteAnimal.G:
-            return TaxaPorteGrande()
-            
-        return TaxaPadrao()
\ No newline at end of file
+            return cls._instancia(TaxaPorteGrande)
+
+        return cls._instancia(TaxaPadrao)
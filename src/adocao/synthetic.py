@@ -0,0 +1,469 @@
+"""Geração determinística de dados sintéticos em grande escala.
+
+Produz N animais e M adotantes a partir de uma semente fixa, com as
+distribuições descritas em um ``PerfilSintetico`` (espécie, porte, mix de
+status, temperamentos, tamanho das filas, profundidade do histórico e idade
+das reservas). Cada entidade é gerada por um ``random.Random`` próprio,
+semeado com (semente, tipo, posição): a entidade ``i`` é sempre a mesma,
+qualquer que seja N, e pode ser gerada sozinha. Por isso a saída é um fluxo
+(nada é acumulado em memória) e uma fila de espera pode citar o adotante
+``j`` regenerando-o em vez de guardá-lo.
+
+As datas são deslocamentos aleatórios a partir de ``referencia`` (padrão:
+agora), para que reservas e filas tenham idades realistas no momento da
+carga. Com a mesma semente e a mesma referência a saída é idêntica byte a byte.
+
+Diferente do ``seed.py``, nada é apagado: os dados são acrescentados ao
+repositório (``Repositorio.importar_animais``/``importar_adotantes``) ou
+escritos em JSONL, um registro por linha com o campo ``"tipo"``.
+
+Uso (a partir da raiz do projeto):
+    python -m src.adocao.synthetic --animais 1000000 --adotantes 200000 --pasta carga --banco SQLITE
+    python -m src.adocao.synthetic --animais 50000 --adotantes 10000 --semente 7 --jsonl carga.jsonl \\
+        --status DISPONIVEL=0.5,RESERVADO=0.3,ADOTADO=0.2 --fila 2:10 --referencia 2026-01-01T12:00
+"""
+import argparse
+import json
+import os
+import random
+import sys
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, Iterator, List, Optional, TextIO, Tuple, TypeVar, Union
+from .domain import Adotante, Animal
+from .enums import PorteAnimal, StatusAnimal, TipoMoradia
+from .repositories import Repositorio, RepositorioJSON, RepositorioSQLite
+from .triage import PREFIXO_MOTIVO_DEVOLUCAO
+
+T = TypeVar("T")
+
+ESPECIES = ("Cachorro", "Gato")
+RACAS = {
+    "Cachorro": ["SRD", "Labrador", "Poodle", "Beagle", "Pastor Alemão", "Vira-lata Caramelo", "Shih Tzu", "Pinscher"],
+    "Gato": ["SRD", "Siamês", "Persa", "Maine Coon", "Angorá", "Bengal", "Sphynx", "Ragdoll"],
+}
+NOMES_ANIMAIS = ["Rex", "Luna", "Thor", "Mel", "Bob", "Nina", "Simba", "Mia", "Toby", "Lola", "Fred", "Amora",
+                 "Zeus", "Pipoca", "Bidu", "Frida", "Salem", "Paçoca", "Tom", "Belinha", "Max", "Jade", "Chico", "Kiara"]
+PRENOMES = ["Ana", "Bruno", "Carla", "Daniel", "Eduarda", "Felipe", "Gabriela", "Hugo", "Isabela", "João",
+            "Larissa", "Marcos", "Natália", "Otávio", "Paula", "Rafael", "Sofia", "Tiago", "Vanessa", "William"]
+SOBRENOMES = ["Silva", "Souza", "Oliveira", "Santos", "Lima", "Pereira", "Costa", "Rodrigues", "Almeida", "Nascimento",
+              "Carvalho", "Araújo", "Ribeiro", "Gomes", "Martins", "Rocha", "Barbosa", "Dias", "Teixeira", "Moreira"]
+VACINAS = ["V8", "V10", "Raiva", "Gripe", "Giárdia", "V4", "FeLV"]
+MOTIVOS_DEVOLUCAO = ["mudança de endereço", "alergia na família", "comportamento agressivo", "falta de tempo"]
+
+# Transições de status (do cadastro até o status final), na ordem em que o núcleo as registraria.
+CAMINHOS_STATUS: Dict[StatusAnimal, List[StatusAnimal]] = {
+    StatusAnimal.DISPONIVEL: [],
+    StatusAnimal.RESERVADO: [StatusAnimal.RESERVADO],
+    StatusAnimal.ADOTADO: [StatusAnimal.RESERVADO, StatusAnimal.ADOTADO],
+    StatusAnimal.DEVOLVIDO: [StatusAnimal.RESERVADO, StatusAnimal.ADOTADO, StatusAnimal.DEVOLVIDO],
+    StatusAnimal.QUARENTENA: [StatusAnimal.RESERVADO, StatusAnimal.ADOTADO, StatusAnimal.DEVOLVIDO, StatusAnimal.QUARENTENA],
+    StatusAnimal.INADOTAVEL: [StatusAnimal.INADOTAVEL],
+}
+
+@dataclass
+class PerfilSintetico:
+    """Distribuições usadas pelo gerador. Pesos não precisam somar 1.
+
+    Faixas ``(mínimo, máximo)`` são inclusivas e sorteadas de maneira uniforme.
+
+    Attributes:
+        especies (Dict[str, float]): Peso de "Cachorro" e "Gato".
+        portes (Dict[PorteAnimal, float]): Peso de cada porte.
+        status (Dict[StatusAnimal, float]): Mix de status final dos animais.
+        temperamentos (List[str]): Traços possíveis de temperamento.
+        temperamentos_por_animal (Tuple[int, int]): Quantos traços cada animal recebe.
+        fila (Tuple[int, int]): Tamanho da fila de espera dos animais reservados.
+        historico (Tuple[int, int]): Eventos no histórico; sobe até caber cadastro, transições e fila.
+        idade_reserva_horas (Tuple[float, float]): Há quanto tempo (antes da referência) as reservas foram feitas.
+        dias_no_abrigo (Tuple[float, float]): Tempo entre o cadastro e o último evento de status.
+        moradias (Dict[TipoMoradia, float]): Peso de cada tipo de moradia dos adotantes.
+        idade_adotante (Tuple[int, int]): Faixa de idade dos adotantes.
+        proporcao_criancas (float): Fração de adotantes com crianças em casa.
+        proporcao_telefone (float): Fração de adotantes com telefone (os demais têm e-mail) como contato.
+    """
+    especies: Dict[str, float] = field(default_factory=lambda: {"Cachorro": 0.55, "Gato": 0.45})
+    portes: Dict[PorteAnimal, float] = field(default_factory=lambda: {PorteAnimal.P: 0.35, PorteAnimal.M: 0.4, PorteAnimal.G: 0.25})
+    status: Dict[StatusAnimal, float] = field(default_factory=lambda: {
+        StatusAnimal.DISPONIVEL: 0.55, StatusAnimal.RESERVADO: 0.15, StatusAnimal.ADOTADO: 0.2,
+        StatusAnimal.DEVOLVIDO: 0.02, StatusAnimal.QUARENTENA: 0.05, StatusAnimal.INADOTAVEL: 0.03})
+    temperamentos: List[str] = field(default_factory=lambda: ["calmo", "brincalhão", "agitado", "tímido", "carinhoso",
+                                                               "independente", "protetor", "sociável", "medroso", "curioso"])
+    temperamentos_por_animal: Tuple[int, int] = (1, 3)
+    fila: Tuple[int, int] = (0, 3)
+    historico: Tuple[int, int] = (1, 6)
+    idade_reserva_horas: Tuple[float, float] = (0.0, 96.0)
+    dias_no_abrigo: Tuple[float, float] = (1.0, 365.0)
+    moradias: Dict[TipoMoradia, float] = field(default_factory=lambda: {TipoMoradia.CASA: 0.55, TipoMoradia.APTO: 0.45})
+    idade_adotante: Tuple[int, int] = (18, 75)
+    proporcao_criancas: float = 0.35
+    proporcao_telefone: float = 0.3
+
+class _Sorteio:
+    """Escolha ponderada com os pesos acumulados calculados uma vez só."""
+
+    def __init__(self, pesos: Dict[Any, float]) -> None:
+        """Valida os pesos e guarda as opções com peso positivo.
+
+        Raises:
+            ValueError: Se nenhum peso for positivo ou algum for negativo.
+        """
+        if any(peso < 0 for peso in pesos.values()) or not any(peso > 0 for peso in pesos.values()):
+            raise ValueError(f"Pesos inválidos: {pesos}")
+        self.opcoes = [opcao for opcao, peso in pesos.items() if peso > 0]
+        self.acumulados: List[float] = []
+        total = 0.0
+        for opcao in self.opcoes:
+            total += pesos[opcao]
+            self.acumulados.append(total)
+
+    def __call__(self, rng: random.Random) -> Any:
+        """Sorteia uma opção."""
+        return rng.choices(self.opcoes, cum_weights=self.acumulados)[0]
+
+class GeradorSintetico:
+    """Gera animais e adotantes sintéticos de forma determinística e sob demanda.
+
+    Attributes:
+        quantidade_animais (int): N, número de animais gerados por ``animais()``.
+        quantidade_adotantes (int): M, número de adotantes gerados por ``adotantes()``.
+        perfil (PerfilSintetico): Distribuições usadas.
+        semente (int): Semente base; cada entidade deriva a sua desta.
+        referencia (datetime): Instante a partir do qual as datas são recuadas.
+    """
+
+    def __init__(self, quantidade_animais: int, quantidade_adotantes: int, perfil: Optional[PerfilSintetico] = None,
+                 semente: int = 42, referencia: Optional[datetime] = None) -> None:
+        """Prepara o gerador (nenhuma entidade é criada aqui).
+
+        Args:
+            quantidade_animais (int): Número de animais.
+            quantidade_adotantes (int): Número de adotantes.
+            perfil (Optional[PerfilSintetico], optional): Distribuições. Defaults to PerfilSintetico().
+            semente (int, optional): Semente base. Defaults to 42.
+            referencia (Optional[datetime], optional): "Agora" dos dados. Defaults to o minuto atual.
+
+        Raises:
+            ValueError: Se as quantidades forem negativas, algum peso for inválido, ou se houver
+                reservas sem nenhum adotante para ser o titular.
+        """
+        if quantidade_animais < 0 or quantidade_adotantes < 0:
+            raise ValueError("As quantidades de animais e adotantes não podem ser negativas.")
+        self.quantidade_animais = quantidade_animais
+        self.quantidade_adotantes = quantidade_adotantes
+        self.perfil = perfil or PerfilSintetico()
+        self.semente = semente
+        self.referencia = referencia or datetime.now().replace(second=0, microsecond=0)
+        self._especie = _Sorteio(self.perfil.especies)
+        self._porte = _Sorteio(self.perfil.portes)
+        self._status = _Sorteio(self.perfil.status)
+        self._moradia = _Sorteio(self.perfil.moradias)
+        if quantidade_animais and not quantidade_adotantes and set(self._status.opcoes) - {StatusAnimal.DISPONIVEL, StatusAnimal.INADOTAVEL}:
+            raise ValueError("Reservas e adoções precisam de pelo menos um adotante.")
+
+    def _rng(self, tipo: str, posicao: int) -> random.Random:
+        """Gerador próprio da entidade; semente em texto é estável entre execuções e versões do Python."""
+        return random.Random(f"{self.semente}:{tipo}:{posicao}")
+
+    @staticmethod
+    def _uid(rng: random.Random) -> str:
+        """uid no mesmo formato de ``uuid4().hex``, mas vindo do gerador da entidade."""
+        return f"{rng.getrandbits(128):032x}"
+
+    def dados_adotante(self, posicao: int) -> Dict[str, Any]:
+        """Dados (formato de ``Adotante.to_dict``) do adotante ``posicao``, com versão 1.
+
+        Args:
+            posicao (int): Posição do adotante, de 0 a M - 1.
+
+        Returns:
+            Dict[str, Any]: Dados do adotante; sempre os mesmos para a mesma semente e posição.
+        """
+        rng = self._rng("adotante", posicao)
+        perfil = self.perfil
+        prenome, sobrenome = rng.choice(PRENOMES), rng.choice(SOBRENOMES)
+        nome = f"{prenome} {rng.choice(SOBRENOMES)} {sobrenome}"
+        if rng.random() < perfil.proporcao_telefone:
+            contato = f"(11) 9{rng.randint(1000, 9999)}-{posicao % 10000:04d}"
+        else:
+            contato = f"{prenome.lower()}.{sobrenome.lower()}{posicao}@exemplo.com"
+        moradia = self._moradia(rng)
+        area = rng.uniform(60.0, 400.0) if moradia == TipoMoradia.CASA else rng.uniform(30.0, 150.0)
+        return {
+            "nome": nome,
+            "contato": contato,
+            "idade": rng.randint(*perfil.idade_adotante),
+            "moradia": moradia.value,
+            "area_util": round(area, 1),
+            "tem_criancas": rng.random() < perfil.proporcao_criancas,
+            "uid": self._uid(rng),
+            "versao": 1
+        }
+
+    def dados_animal(self, posicao: int) -> Dict[str, Any]:
+        """Dados (formato de ``Cachorro.to_dict``/``Gato.to_dict``) do animal ``posicao``, com versão 1.
+
+        O histórico começa no cadastro, tem vacinas/treinos como eventos extras e
+        termina com as transições que levam ao status final. Animais reservados
+        têm titular, data de reserva e fila de espera (titular e fila são
+        adotantes sorteados entre os M, sem repetição).
+
+        Args:
+            posicao (int): Posição do animal, de 0 a N - 1.
+
+        Returns:
+            Dict[str, Any]: Dados do animal; sempre os mesmos para a mesma semente e posição.
+        """
+        rng = self._rng("animal", posicao)
+        perfil = self.perfil
+        especie = self._especie(rng)
+        status = self._status(rng)
+        minimo, maximo = perfil.temperamentos_por_animal
+        quantidade_tracos = min(rng.randint(minimo, maximo), len(perfil.temperamentos))
+        dados: Dict[str, Any] = {
+            "tipo_classe": especie,
+            "nome": rng.choice(NOMES_ANIMAIS),
+            "raca": rng.choice(RACAS[especie]),
+            "status": status.value,
+            "porte": self._porte(rng).value,
+            "temperamento": rng.sample(perfil.temperamentos, quantidade_tracos),
+        }
+        if especie == "Cachorro":
+            dados["precisa_passeio"] = rng.random() < 0.7
+        else:
+            dados["independencia"] = rng.randint(0, 10)
+        data_reserva: Optional[str] = None
+        nome_reservante: Optional[str] = None
+
+        # Eventos obrigatórios: transições até o status final (e o motivo, se houve devolução).
+        transicoes: List[str] = []
+        anterior = StatusAnimal.DISPONIVEL
+        for proximo in CAMINHOS_STATUS[status]:
+            transicoes.append(f"Status alterado: {anterior.value} -> {proximo.value}")
+            if proximo == StatusAnimal.DEVOLVIDO:
+                transicoes.append(f"{PREFIXO_MOTIVO_DEVOLUCAO}{rng.choice(MOTIVOS_DEVOLUCAO)}")
+            anterior = proximo
+
+        fim = self.referencia
+        fila: List[Dict[str, Any]] = []
+        eventos_fila: List[Tuple[datetime, str]] = []
+        if status == StatusAnimal.RESERVADO:
+            fim = self.referencia - timedelta(hours=rng.uniform(*perfil.idade_reserva_horas))
+            tamanho_fila = min(rng.randint(*perfil.fila), self.quantidade_adotantes - 1)
+            titular, *interessados = rng.sample(range(self.quantidade_adotantes), tamanho_fila + 1)
+            data_reserva = fim.isoformat()
+            nome_reservante = self.dados_adotante(titular)["nome"]
+            for j in interessados:
+                adotante = self.dados_adotante(j)
+                entrada = fim + (self.referencia - fim) * rng.random()
+                score = rng.randint(20, 100)
+                fila.append({"adotante": adotante, "score": score, "data_entrada": entrada.isoformat()})
+                eventos_fila.append((entrada, f"{adotante['nome']} entrou na fila (Score: {score})."))
+            fila.sort(key=lambda x: (-x['score'], x['data_entrada']))
+
+        inicio = fim - timedelta(days=rng.uniform(*perfil.dias_no_abrigo))
+        extras = max(0, rng.randint(*perfil.historico) - 1 - len(transicoes) - len(eventos_fila))
+        instantes = sorted(inicio + (fim - inicio) * rng.random() for _ in range(extras + len(transicoes)))
+        eventos = [(inicio, "Cadastrado no sistema.")]
+        vacinas: Dict[str, str] = {}
+        nivel_adestramento = 0
+        for instante in instantes[:extras]:
+            if especie == "Cachorro" and rng.random() < 0.3:
+                nivel_adestramento += 1
+                eventos.append((instante, f"Treinado. Nível atual: {nivel_adestramento}"))
+            else:
+                vacina = rng.choice(VACINAS)
+                vacinas[vacina] = instante.strftime("%Y-%m-%d")
+                eventos.append((instante, f"Vacinado contra {vacina}"))
+        # A reserva (última transição de um animal reservado) acontece exatamente na data da reserva.
+        instantes_transicoes = instantes[extras:]
+        if status == StatusAnimal.RESERVADO:
+            instantes_transicoes[-1] = fim
+        eventos.extend(zip(instantes_transicoes, transicoes))
+        eventos.extend(sorted(eventos_fila))
+
+        dados["historico"] = [f"[{instante.strftime('%Y-%m-%d %H:%M')}] {descricao}" for instante, descricao in eventos]
+        dados["vacinas"] = vacinas
+        if especie == "Cachorro":
+            dados["nivel_adestramento"] = nivel_adestramento
+        dados["data_reserva"] = data_reserva
+        dados["nome_reservante"] = nome_reservante
+        dados["fila_espera"] = fila
+        dados["uid"] = self._uid(rng)
+        dados["versao"] = 1
+        return dados
+
+    def adotantes(self) -> Iterator[Adotante]:
+        """Gera os M adotantes, um por vez.
+
+        Yields:
+            Adotante: Próximo adotante (já com uid e versão 1).
+        """
+        for posicao in range(self.quantidade_adotantes):
+            yield Adotante.from_dict(self.dados_adotante(posicao))
+
+    def animais(self) -> Iterator[Animal]:
+        """Gera os N animais, um por vez.
+
+        Yields:
+            Animal: Próximo Cachorro ou Gato (já com uid e versão 1).
+        """
+        for posicao in range(self.quantidade_animais):
+            animal = Animal.from_dict(self.dados_animal(posicao))
+            if animal is not None:
+                yield animal
+
+    def registros(self) -> Iterator[Dict[str, Any]]:
+        """Gera os registros do JSONL: primeiro os adotantes, depois os animais.
+
+        Yields:
+            Dict[str, Any]: Dados da entidade com o campo ``"tipo"`` ("adotante" ou "animal") na frente.
+        """
+        for posicao in range(self.quantidade_adotantes):
+            yield {"tipo": "adotante", **self.dados_adotante(posicao)}
+        for posicao in range(self.quantidade_animais):
+            yield {"tipo": "animal", **self.dados_animal(posicao)}
+
+    def escrever_jsonl(self, destino: Union[str, TextIO]) -> int:
+        """Escreve todos os registros em JSONL, um por linha.
+
+        Args:
+            destino (Union[str, TextIO]): Caminho do arquivo (sobrescrito) ou arquivo já aberto.
+
+        Returns:
+            int: Quantidade de registros escritos.
+        """
+        if isinstance(destino, str):
+            with open(destino, "w", encoding="utf-8") as f:
+                return self.escrever_jsonl(f)
+        quantidade = 0
+        for registro in self.registros():
+            destino.write(json.dumps(registro, ensure_ascii=False) + "\n")
+            quantidade += 1
+        return quantidade
+
+    def importar(self, repositorio: Repositorio) -> Tuple[int, int]:
+        """Acrescenta os adotantes e os animais ao repositório, sem apagar o que já existe.
+
+        Args:
+            repositorio (Repositorio): Destino (JSON ou SQLite).
+
+        Returns:
+            Tuple[int, int]: (adotantes gravados, animais gravados).
+
+        Raises:
+            RepositorioError: Se a mesma carga (mesma semente) já foi importada nesse repositório.
+        """
+        return repositorio.importar_adotantes(self.adotantes()), repositorio.importar_animais(self.animais())
+
+def _ler_pesos(texto: str, ler: Callable[[str], T]) -> Dict[T, float]:
+    """Converte "A=0.5,B=0.5" em {ler("A"): 0.5, ler("B"): 0.5}."""
+    pesos: Dict[T, float] = {}
+    for parte in texto.split(","):
+        chave, separador, peso = parte.partition("=")
+        if not separador:
+            raise ValueError(f"Peso sem '=': {parte!r} (use NOME=PESO,NOME=PESO).")
+        pesos[ler(chave.strip())] = float(peso)
+    return pesos
+
+def _ler_faixa(texto: str, converter: Callable[[str], T]) -> Tuple[T, T]:
+    """Converte "2:10" em (2, 10) e "5" em (5, 5)."""
+    minimo, _, maximo = texto.partition(":")
+    return converter(minimo), converter(maximo or minimo)
+
+def _ler_especie(texto: str) -> str:
+    """Aceita "cachorro"/"gato" em qualquer caixa."""
+    for especie in ESPECIES:
+        if especie.lower() == texto.lower():
+            return especie
+    raise ValueError(f"Espécie inválida: {texto!r}. Use {', '.join(ESPECIES)}.")
+
+def repositorio_da_pasta(pasta: str, banco: Optional[str] = None) -> Repositorio:
+    """Repositório com os mesmos arquivos que o NucleoAdocao usaria nessa pasta.
+
+    Args:
+        pasta (str): Diretório do abrigo (criado se não existir).
+        banco (Optional[str], optional): "JSON" ou "SQLITE". Defaults to o banco_tipo de settings.json (ou JSON).
+
+    Returns:
+        Repositorio: RepositorioSQLite ou RepositorioJSON.
+    """
+    os.makedirs(pasta, exist_ok=True)
+    if banco is None:
+        try:
+            with open(os.path.join(pasta, "settings.json"), encoding="utf-8") as f:
+                banco = json.load(f).get("banco_tipo", "JSON")
+        except (OSError, ValueError):
+            banco = "JSON"
+    if banco.upper() == "SQLITE":
+        return RepositorioSQLite(os.path.join(pasta, "adocao.db"))
+    return RepositorioJSON(os.path.join(pasta, "animais.json"), os.path.join(pasta, "adotantes.json"))
+
+def main(argv: Optional[list] = None) -> int:
+    """Gera a carga sintética pela linha de comando.
+
+    Args:
+        argv (Optional[list], optional): Argumentos (sem o nome do programa). Defaults to sys.argv.
+
+    Returns:
+        int: Código de saída.
+    """
+    from .commands import ler_enum
+    from .exceptions import RepositorioError
+
+    parser = argparse.ArgumentParser(description="Gera animais e adotantes sintéticos a partir de uma semente.")
+    parser.add_argument("--animais", type=int, required=True)
+    parser.add_argument("--adotantes", type=int, required=True)
+    parser.add_argument("--semente", type=int, default=42)
+    parser.add_argument("--referencia", type=datetime.fromisoformat, help="'agora' dos dados, ex: 2026-01-01T12:00 (padrão: agora)")
+    destino = parser.add_mutually_exclusive_group(required=True)
+    destino.add_argument("--jsonl", help="arquivo JSONL de saída ('-' para a saída padrão)")
+    destino.add_argument("--pasta", help="pasta de um abrigo; os dados são acrescentados ao repositório dela")
+    parser.add_argument("--banco", choices=["JSON", "SQLITE"], type=str.upper, help="backend da pasta (padrão: settings.json)")
+    parser.add_argument("--especies", help="ex: Cachorro=0.6,Gato=0.4")
+    parser.add_argument("--portes", help="ex: P=1,M=2,G=1")
+    parser.add_argument("--status", help="ex: DISPONIVEL=0.6,RESERVADO=0.2,ADOTADO=0.2")
+    parser.add_argument("--moradias", help="ex: CASA=0.5,APTO=0.5")
+    parser.add_argument("--temperamentos", help="traços separados por vírgula")
+    parser.add_argument("--temperamentos-por-animal", metavar="MIN:MAX")
+    parser.add_argument("--fila", metavar="MIN:MAX", help="tamanho da fila dos animais reservados")
+    parser.add_argument("--historico", metavar="MIN:MAX", help="eventos no histórico de cada animal")
+    parser.add_argument("--reserva-horas", metavar="MIN:MAX", help="idade das reservas, em horas")
+    args = parser.parse_args(argv)
+
+    perfil = PerfilSintetico()
+    try:
+        if args.especies:
+            perfil.especies = _ler_pesos(args.especies, _ler_especie)
+        if args.portes:
+            perfil.portes = _ler_pesos(args.portes, lambda nome: ler_enum(PorteAnimal, nome))
+        if args.status:
+            perfil.status = _ler_pesos(args.status, lambda nome: ler_enum(StatusAnimal, nome))
+        if args.moradias:
+            perfil.moradias = _ler_pesos(args.moradias, lambda nome: ler_enum(TipoMoradia, nome))
+        if args.temperamentos:
+            perfil.temperamentos = [t.strip() for t in args.temperamentos.split(",") if t.strip()]
+        if args.temperamentos_por_animal:
+            perfil.temperamentos_por_animal = _ler_faixa(args.temperamentos_por_animal, int)
+        if args.fila:
+            perfil.fila = _ler_faixa(args.fila, int)
+        if args.historico:
+            perfil.historico = _ler_faixa(args.historico, int)
+        if args.reserva_horas:
+            perfil.idade_reserva_horas = _ler_faixa(args.reserva_horas, float)
+        gerador = GeradorSintetico(args.animais, args.adotantes, perfil, args.semente, args.referencia)
+
+        if args.jsonl == "-":
+            gerador.escrever_jsonl(sys.stdout)
+        elif args.jsonl:
+            print(f"{gerador.escrever_jsonl(args.jsonl):,} registros escritos em {args.jsonl}.")
+        else:
+            adotantes, animais = gerador.importar(repositorio_da_pasta(args.pasta, args.banco))
+            print(f"{adotantes:,} adotantes e {animais:,} animais acrescentados em {args.pasta}.")
+    except (ValueError, RepositorioError) as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
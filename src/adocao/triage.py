@@ -0,0 +1,114 @@
+import re
+import unicodedata
+from typing import Dict, Iterable, List, Optional
+from .enums import StatusAnimal
+
+PALAVRAS_TRIAGEM_PADRAO: Dict[str, List[str]] = {
+    "saude": ["doente", "saude", "doenca", "vomito", "ferido"],
+    "agressao": ["mordeu", "agressivo", "atacou", "bravo", "arisco"]
+}
+
+PREFIXO_MOTIVO_DEVOLUCAO = "Motivo da devolução: "
+
+# Ordem de prioridade: se o motivo citar saúde e agressão, prevalece a quarentena.
+DESTINOS_TRIAGEM: Dict[str, StatusAnimal] = {
+    "saude": StatusAnimal.QUARENTENA,
+    "agressao": StatusAnimal.INADOTAVEL
+}
+
+def normalizar_texto(texto: str) -> str:
+    """Remove acentos e padroniza maiúsculas/minúsculas para comparação.
+
+    Args:
+        texto (str): Texto livre (ex: motivo da devolução).
+
+    Returns:
+        str: Texto sem diacríticos e em caixa baixa ("Saúde" -> "saude").
+    """
+    decomposto = unicodedata.normalize("NFKD", texto)
+    return "".join(c for c in decomposto if not unicodedata.combining(c)).casefold()
+
+class ClassificadorDevolucao:
+    """Triagem de devoluções por palavras-chave, compilada em uma única expressão regular.
+
+    Cada categoria vira um grupo nomeado de uma alternância, de modo que o
+    motivo é percorrido uma única vez. As palavras e o texto são normalizados
+    (sem acento, caixa baixa) e a comparação é por substring, como antes.
+
+    Attributes:
+        palavras (Dict[str, List[str]]): Palavras-chave normalizadas por categoria.
+    """
+
+    def __init__(self, palavras: Optional[Dict[str, List[str]]] = None) -> None:
+        """Compila o classificador.
+
+        Args:
+            palavras (Optional[Dict[str, List[str]]], optional): Palavras por categoria
+                ("saude", "agressao"). Defaults to PALAVRAS_TRIAGEM_PADRAO.
+        """
+        palavras = palavras if palavras is not None else PALAVRAS_TRIAGEM_PADRAO
+        self.palavras = {
+            categoria: sorted({normalizar_texto(p) for p in palavras.get(categoria, []) if p.strip()}, key=len, reverse=True)
+            for categoria in DESTINOS_TRIAGEM
+        }
+        grupos = [
+            f"(?P<{categoria}>{'|'.join(re.escape(p) for p in lista)})"
+            for categoria, lista in self.palavras.items() if lista
+        ]
+        self._padrao = re.compile("|".join(grupos)) if grupos else None
+
+    @classmethod
+    def de_settings(cls, settings: Dict) -> 'ClassificadorDevolucao':
+        """Cria o classificador a partir da chave "triagem_devolucao" das configurações.
+
+        Args:
+            settings (Dict): Configurações do sistema.
+
+        Returns:
+            ClassificadorDevolucao: Classificador compilado.
+        """
+        return cls(settings.get("triagem_devolucao"))
+
+    def categoria(self, motivo: str) -> Optional[str]:
+        """Identifica a categoria de maior prioridade citada no motivo.
+
+        Args:
+            motivo (str): Motivo da devolução.
+
+        Returns:
+            Optional[str]: "saude", "agressao" ou None se nenhuma palavra-chave aparecer.
+        """
+        if self._padrao is None:
+            return None
+        encontradas = set()
+        for match in self._padrao.finditer(normalizar_texto(motivo)):
+            encontradas.add(match.lastgroup)
+            if match.lastgroup == "saude":
+                break
+        for categoria in DESTINOS_TRIAGEM:
+            if categoria in encontradas:
+                return categoria
+        return None
+
+    def classificar(self, motivo: str) -> StatusAnimal:
+        """Define o status de destino de um animal devolvido.
+
+        Args:
+            motivo (str): Motivo da devolução.
+
+        Returns:
+            StatusAnimal: QUARENTENA (saúde), INADOTAVEL (agressão) ou DISPONIVEL.
+        """
+        categoria = self.categoria(motivo)
+        return DESTINOS_TRIAGEM[categoria] if categoria else StatusAnimal.DISPONIVEL
+
+    def classificar_lote(self, motivos: Iterable[str]) -> List[StatusAnimal]:
+        """Classifica vários motivos de uma vez (ex: re-triagem do histórico).
+
+        Args:
+            motivos (Iterable[str]): Motivos de devolução.
+
+        Returns:
+            List[StatusAnimal]: Status de destino, na mesma ordem.
+        """
+        return [self.classificar(m) for m in motivos]
@@ -0,0 +1,80 @@
+import os
+import tempfile
+import unittest
+from src.adocao.enums import StatusAnimal, PorteAnimal, TipoMoradia
+from src.adocao.exceptions import EntidadeNaoEncontradaError, OperacaoInvalidaError
+from src.adocao.pagination import FiltroAnimais
+from src.adocao.shelters import RedeAbrigos
+
+class TestRedeAbrigos(unittest.TestCase):
+    PARALELO = False
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.rede = RedeAbrigos(self.tmp.name, processos=2, paralelo=self.PARALELO)
+        centro = self.rede.criar_abrigo("centro")
+        for nome in ("Rex", "Bolt", "Rafa"):
+            centro.cadastrar_cachorro(nome, "SRD", PorteAnimal.M, ["calmo"], True)
+        centro.cadastrar_adotante("Ana", "a@x.com", 30, TipoMoradia.CASA, 200.0, False)
+        centro.cadastrar_adotante("Bia", "b@x.com", 25, TipoMoradia.CASA, 200.0, False)
+        norte = self.rede.criar_abrigo("norte", {"banco_tipo": "SQLITE", "idade_minima": 35})
+        norte.cadastrar_gato("Mia", "SRD", PorteAnimal.P, ["calmo"], 7)
+        norte.cadastrar_cachorro("Rocky", "SRD", PorteAnimal.M, ["calmo"], True)
+        norte.cadastrar_adotante("Caio", "c@x.com", 40, TipoMoradia.CASA, 200.0, False)
+        centro.reservar_animal(0, 0)
+        centro.entrar_fila_espera(0, 1)
+        norte.realizar_adocao(1, 0)
+
+    def tearDown(self):
+        self.rede.fechar()
+        self.tmp.cleanup()
+
+    def test_busca_mescla_abrigos_em_ordem(self):
+        resultado = self.rede.buscar_animais(FiltroAnimais(prefixo_nome="r"))
+        self.assertEqual([(i.abrigo, i.id, i.animal.nome) for i in resultado.itens],
+                         [("centro", 0, "Rex"), ("centro", 2, "Rafa"), ("norte", 1, "Rocky")])
+        self.assertEqual((resultado.total, resultado.por_abrigo), (3, {"centro": 2, "norte": 1}))
+
+        limitado = self.rede.buscar_animais(FiltroAnimais(status=StatusAnimal.DISPONIVEL), limite=1)
+        self.assertEqual(len(limitado.itens), 1)
+        self.assertEqual(limitado.total, 3)
+
+    def test_elegiveis_usa_a_politica_de_cada_abrigo(self):
+        resultado = self.rede.animais_elegiveis("centro", 1)
+        # Bia tem 25 anos: o abrigo norte exige 35.
+        self.assertEqual(resultado.por_abrigo, {"centro": 3, "norte": 0})
+        resultado = self.rede.animais_elegiveis("norte", 0)
+        self.assertIn(("norte", 0), [(i.abrigo, i.id) for i in resultado.itens])
+        with self.assertRaises(EntidadeNaoEncontradaError):
+            self.rede.animais_elegiveis("sul", 0)
+        with self.assertRaises(EntidadeNaoEncontradaError):
+            self.rede.animais_elegiveis("centro", 9)
+
+    def test_estatisticas_consolidadas(self):
+        stats = self.rede.estatisticas()
+        self.assertEqual(stats.caes, {"total": 4, "adotados": 1, "taxa": 25.0})
+        self.assertEqual(stats.gatos["total"], 1)
+        self.assertEqual([(a.nome, fila) for a, fila in stats.populares], [("Rex", 1)])
+
+    def test_consulta_ve_alteracoes_posteriores(self):
+        self.rede.buscar_animais()
+        self.rede.abrigo("norte").cadastrar_cachorro("Rufus", "SRD", PorteAnimal.G, ["calmo"], True)
+        self.assertEqual(self.rede.buscar_animais(FiltroAnimais(prefixo_nome="ru")).por_abrigo["norte"], 1)
+
+    def test_abrigo_com_problema_nao_derruba_a_consulta(self):
+        os.makedirs(os.path.join(self.tmp.name, "quebrado"))
+        with open(os.path.join(self.tmp.name, "quebrado", "settings.json"), "w") as f:
+            f.write('{"banco_tipo": "SQLITE"}')
+        with open(os.path.join(self.tmp.name, "quebrado", "adocao.db"), "w") as f:
+            f.write("isto não é um banco")
+        resultado = self.rede.buscar_animais()
+        self.assertIn("quebrado", resultado.erros)
+        self.assertEqual(resultado.total, 5)
+        with self.assertRaises(OperacaoInvalidaError):
+            self.rede.criar_abrigo("centro")
+
+class TestRedeAbrigosParalela(TestRedeAbrigos):
+    PARALELO = True
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,156 @@
+import http.client
+import json
+import os
+import tempfile
+import threading
+import unittest
+from src.adocao.api import ServidorAPI
+from src.adocao.core import NucleoAdocao
+from src.adocao.enums import StatusAnimal, PorteAnimal, TipoMoradia
+
+class TestServidorAPI(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.nucleo = NucleoAdocao(diretorio=self.tmp.name, registrar_log=False)
+        for i in range(3):
+            self.nucleo.cadastrar_cachorro(f"Cao{i}", "SRD", PorteAnimal.M, ["calmo"], True)
+        self.nucleo.cadastrar_gato("Mia", "SRD", PorteAnimal.P, ["calmo"], 7)
+        for i in range(8):
+            self.nucleo.cadastrar_adotante(f"Adotante{i}", f"a{i}@x.com", 30, TipoMoradia.CASA, 120.0, False)
+        self.servidor = ServidorAPI(self.nucleo, porta=0)
+        self.endereco = self.servidor.iniciar()
+
+    def tearDown(self):
+        self.servidor.parar()
+        self.nucleo.fechar()
+        self.tmp.cleanup()
+
+    def requisitar(self, conexao, metodo, alvo, dados=None):
+        corpo = json.dumps(dados) if dados is not None else None
+        conexao.request(metodo, alvo, body=corpo)
+        resposta = conexao.getresponse()
+        return resposta.status, json.loads(resposta.read()), resposta
+
+    def test_rotas_na_mesma_conexao(self):
+        conexao = http.client.HTTPConnection(*self.endereco, timeout=5)
+        try:
+            status, dados, resposta = self.requisitar(conexao, "GET", "/animais?especie=cachorro&tamanho=2")
+            self.assertEqual(status, 200)
+            self.assertIn("app;dur=", resposta.getheader("Server-Timing"))
+            self.assertEqual([a["nome"] for a in dados["itens"]], ["Cao0", "Cao1"])
+            self.assertEqual(dados["cursor_proximo"], 1)
+
+            status, dados, _ = self.requisitar(conexao, "POST", "/animais/0/reserva", {"adotante": 2})
+            self.assertEqual((status, dados["status"]), (200, StatusAnimal.RESERVADO.value))
+            status, dados, _ = self.requisitar(conexao, "POST", "/animais/0/adocao", {"adotante": 3})
+            self.assertEqual(status, 409)
+            status, dados, _ = self.requisitar(conexao, "GET", "/animais/99")
+            self.assertEqual(status, 404)
+            status, dados, _ = self.requisitar(conexao, "POST", "/adotantes", {"nome": "Bia"})
+            self.assertEqual(status, 400)
+            self.assertIn("contato", dados["erro"])
+            status, _, _ = self.requisitar(conexao, "GET", "/animais/0/reserva")
+            self.assertEqual(status, 405)
+            status, dados, _ = self.requisitar(conexao, "GET", "/animais/busca?q=cao1&limite=1")
+            self.assertEqual((status, [(a["id"], a["nome"]) for a in dados["itens"]]), (200, [(1, "Cao1")]))
+            status, _, _ = self.requisitar(conexao, "GET", "/animais/busca")
+            self.assertEqual(status, 400)
+            status, dados, _ = self.requisitar(conexao, "GET", "/adotantes/busca?nome=adotamte3&limite=2")
+            self.assertEqual([a["id"] for a in dados["itens"]], [3, 0])
+            status, dados, _ = self.requisitar(conexao, "GET", "/adotantes/duplicatas")
+            self.assertEqual((status, dados["pares"][0]["adotantes"]), (200, [0, 1]))
+            status, dados, _ = self.requisitar(conexao, "GET", "/estatisticas")
+            self.assertEqual((status, dados["relatorio"]), (200, "estatisticas"))
+            status, dados, _ = self.requisitar(conexao, "GET", "/metricas")
+            self.assertEqual(dados["POST /animais/<id>/reserva"]["total"], 1)
+            self.assertEqual(dados["POST /animais/<id>/adocao"]["erros"], 1)
+        finally:
+            conexao.close()
+
+    def test_reservas_concorrentes_do_mesmo_animal(self):
+        barreira = threading.Barrier(8)
+        status = []
+
+        def reservar(i):
+            conexao = http.client.HTTPConnection(*self.endereco, timeout=5)
+            barreira.wait()
+            status.append(self.requisitar(conexao, "POST", "/animais/1/reserva", {"adotante": i})[0])
+            conexao.close()
+
+        threads = [threading.Thread(target=reservar, args=(i,)) for i in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(sorted(status), [200] + [409] * 7)
+        self.assertEqual(self.nucleo.animais[1].status, StatusAnimal.RESERVADO)
+
+    def test_tratar_sem_http(self):
+        rota, status, dados = self.servidor.tratar("POST", "/comandos", json.dumps({"comando": "transacao", "comandos": [
+            {"comando": "reservar", "animal": 2, "adotante": 0},
+            {"comando": "adotar", "animal": 2, "adotante": 0}
+        ]}).encode("utf-8"))
+        self.assertEqual((rota, status), ("POST /comandos", 200))
+        self.assertEqual(self.nucleo.animais[2].status, StatusAnimal.ADOTADO)
+        self.assertEqual(self.servidor.tratar("GET", "/nada")[1], 404)
+        self.assertEqual(self.servidor.tratar("POST", "/comandos", b"[1]")[1], 400)
+
+    def test_erro_depois_de_gravar_vira_500(self):
+        def falhar(evento):
+            raise ValueError("falha no observador")
+        self.nucleo.notificar_observadores = falhar
+        with self.assertLogs("src.adocao.api", level="ERROR") as log:
+            rota, status, dados = self.servidor.tratar("POST", "/animais/0/adocao", b'{"adotante": 0}')
+        self.assertEqual((rota, status, dados), ("POST /animais/<id>/adocao", 500, {"erro": "Erro interno do servidor."}))
+        self.assertIn("falha no observador", log.output[0])
+        self.assertEqual(self.nucleo.animais[0].status, StatusAnimal.ADOTADO)
+
+        # Argumentos inválidos continuam 400, sem chegar ao núcleo.
+        self.assertEqual(self.servidor.tratar("POST", "/animais/1/adocao", b'{"adotante": "x"}')[1], 400)
+        self.assertEqual(self.servidor.tratar("GET", "/animais?porte=GIGANTE")[1], 400)
+        rota, status, dados = self.servidor.tratar("POST", "/comandos", json.dumps({"comando": "transacao", "comandos": [
+            {"comando": "reservar", "animal": 1, "adotante": 0},
+            {"comando": "adotar", "animal": 1}
+        ]}).encode("utf-8"))
+        self.assertEqual(status, 400)
+        self.assertIn("comando 2", dados["erro"])
+        self.assertEqual(self.nucleo.animais[1].status, StatusAnimal.DISPONIVEL)
+
+    def test_tamanho_e_limite_precisam_ser_positivos(self):
+        for caminho in ("/animais?tamanho=0", "/adotantes?tamanho=-1", "/animais/busca?q=rex&limite=0", "/adotantes/busca?nome=ana&limite=0"):
+            rota, status, dados = self.servidor.tratar("GET", caminho)
+            self.assertEqual(status, 400, caminho)
+            self.assertIn("no mínimo 1", dados["erro"])
+        self.assertEqual(self.servidor.tratar("GET", "/animais?tamanho=1")[1], 200)
+
+    def test_excecao_inesperada_responde_500_na_mesma_conexao(self):
+        def falhar(*args):
+            raise RuntimeError("boom")
+        self.nucleo.estatisticas = falhar
+        conexao = http.client.HTTPConnection(*self.endereco, timeout=5)
+        try:
+            with self.assertLogs("src.adocao.api", level="ERROR"):
+                status, dados, _ = self.requisitar(conexao, "GET", "/estatisticas")
+            self.assertEqual((status, dados), (500, {"erro": "Erro interno do servidor."}))
+            status, _, _ = self.requisitar(conexao, "GET", "/animais/0")
+            self.assertEqual(status, 200)
+        finally:
+            conexao.close()
+
+    def test_relatorio_so_grava_na_pasta_de_relatorios(self):
+        settings = os.path.join(self.tmp.name, "settings.json")
+        antes = open(settings, encoding="utf-8").read() if os.path.exists(settings) else None
+        for arquivo in ("../settings.json", os.path.join(self.tmp.name, "x.json"), "..", 3):
+            corpo = json.dumps({"comando": "relatorio", "formato": "json", "arquivo": arquivo}).encode("utf-8")
+            self.assertEqual(self.servidor.tratar("POST", "/comandos", corpo)[1], 400, arquivo)
+        self.assertEqual(open(settings, encoding="utf-8").read() if os.path.exists(settings) else None, antes)
+        self.assertFalse(os.path.exists(os.path.join(self.tmp.name, "x.json")))
+
+        corpo = json.dumps({"comando": "relatorio", "formato": "json", "arquivo": "resumo.json"}).encode("utf-8")
+        _, status, dados = self.servidor.tratar("POST", "/comandos", corpo)
+        self.assertEqual((status, dados["arquivo"]), (200, os.path.join(self.tmp.name, "relatorios", "resumo.json")))
+        self.assertTrue(os.path.exists(dados["arquivo"]))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,31 @@
+import unittest
+from benchmarks.bench_suite import comparar_resultados
+
+def documento(*medicoes):
+    return {"resultados": [{"banco": banco, "tamanho": 1000, "operacao": operacao, "mediana_ms": ms}
+                           for banco, operacao, ms in medicoes]}
+
+class TestCompararResultados(unittest.TestCase):
+
+    def test_regressao_tolerancia_e_piso(self):
+        base = documento(("JSON", "reserva", 10.0), ("JSON", "adocao", 10.0), ("SQLITE", "reserva", 0.2),
+                         ("SQLITE", "adocao", 0.0), ("SQLITE", "carga", 5.0))
+        novo = documento(("JSON", "reserva", 13.0), ("JSON", "adocao", 11.5), ("SQLITE", "reserva", 0.6),
+                         ("SQLITE", "adocao", 2.0), ("JSON", "fila", 1.0))
+        linhas = {(l["banco"], l["operacao"]): l for l in comparar_resultados(base, novo, tolerancia=0.2, piso_ms=0.5)}
+
+        # Só entram as medições presentes nos dois documentos.
+        self.assertEqual(set(linhas), {("JSON", "reserva"), ("JSON", "adocao"), ("SQLITE", "reserva"), ("SQLITE", "adocao")})
+        self.assertAlmostEqual(linhas[("JSON", "reserva")]["razao"], 1.3)
+        self.assertTrue(linhas[("JSON", "reserva")]["regressao"])
+        # 15% mais lento: dentro da tolerância de 20%.
+        self.assertFalse(linhas[("JSON", "adocao")]["regressao"])
+        # Três vezes mais lento, mas só 0,4 ms a mais: abaixo do piso de ruído.
+        self.assertAlmostEqual(linhas[("SQLITE", "reserva")]["razao"], 3.0)
+        self.assertFalse(linhas[("SQLITE", "reserva")]["regressao"])
+        # Base zerada: razão infinita, e regressão se a diferença passar do piso.
+        self.assertEqual(linhas[("SQLITE", "adocao")]["razao"], float("inf"))
+        self.assertTrue(linhas[("SQLITE", "adocao")]["regressao"])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,79 @@
+import tempfile
+import unittest
+from src.adocao.core import NucleoAdocao
+from src.adocao.domain import Cachorro, Gato
+from src.adocao.enums import StatusAnimal, PorteAnimal, TipoMoradia
+from src.adocao.indexes import IndiceBusca, tokenizar
+
+class TestIndiceBusca(unittest.TestCase):
+
+    def setUp(self):
+        self.mia = Gato("Mia", "Siamês", StatusAnimal.DISPONIVEL, PorteAnimal.P, ["calmo"], 3)
+        self.tom = Gato("Tom", "Persa", StatusAnimal.DISPONIVEL, PorteAnimal.P, ["brincalhão"], 2)
+        self.siamesa = Cachorro("Siamesa", "SRD", StatusAnimal.DISPONIVEL, PorteAnimal.M, ["agitado"], True)
+        self.indice = IndiceBusca()
+        self.indice.reconstruir([self.mia, self.tom, self.siamesa])
+
+    def nomes(self, consulta):
+        return [animal.nome for animal, _ in self.indice.buscar(consulta)]
+
+    def test_tokenizar_remove_acentos_e_caixa(self):
+        self.assertEqual(tokenizar("Siamês CALMO, 3 anos"), ["siames", "calmo", "3", "anos"])
+
+    def test_prefixo_e_todos_os_termos(self):
+        self.assertEqual(self.nomes("SIAMES calmo"), ["Mia"])
+        self.assertEqual(self.nomes("siam calm"), ["Mia"])
+        self.assertEqual(self.nomes("brinc"), ["Tom"])
+        self.assertEqual(self.nomes("siames agitado"), ["Siamesa"])
+        self.assertEqual(self.nomes("persa calmo"), [])
+        self.assertEqual(self.nomes("  ,, "), [])
+
+    def test_nome_exato_vale_mais_que_raca_e_prefixo(self):
+        self.assertEqual(self.nomes("siamesa"), ["Siamesa"])
+        self.assertEqual(self.nomes("siames"), ["Mia", "Siamesa"])
+
+    def test_historico_e_atualizacao_incremental(self):
+        self.mia.vacinar("Raiva")
+        self.assertEqual(self.nomes("raiva"), ["Mia"])
+        self.mia._nome = "Luna"
+        self.indice.atualizar(self.mia)
+        self.assertEqual(self.nomes("mia"), [])
+        self.assertEqual(self.nomes("luna raiva"), ["Luna"])
+        self.indice.remover(self.mia)
+        self.assertEqual(self.nomes("luna"), [])
+        self.mia.adicionar_evento("Vacinado contra Gripe")
+        self.assertEqual(self.nomes("gripe"), [])
+        self.assertEqual(len(self.indice), 2)
+
+class TestBuscaNucleo(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.nucleo = NucleoAdocao(diretorio=self.tmp.name, registrar_log=False)
+        self.nucleo.cadastrar_cachorro("Rex", "Labrador", PorteAnimal.G, ["agitado"], True)
+        self.nucleo.cadastrar_gato("Mia", "Siamês", PorteAnimal.P, ["calmo"], 3)
+        self.nucleo.cadastrar_gato("Nina", "Siamês", PorteAnimal.P, ["agitado"], 3)
+        self.nucleo.cadastrar_adotante("Ana", "a@x.com", 30, TipoMoradia.CASA, 200.0, False)
+
+    def tearDown(self):
+        self.nucleo.fechar()
+        self.tmp.cleanup()
+
+    def test_busca_acompanha_cadastro_edicao_exclusao_e_historico(self):
+        self.assertEqual([(i, a.nome) for i, a in self.nucleo.buscar_animais("o calmo siamês")], [])
+        self.assertEqual([(i, a.nome) for i, a in self.nucleo.buscar_animais("calmo siamês")], [(1, "Mia")])
+
+        self.nucleo.reservar_animal(2, 0)
+        self.assertEqual([a.nome for _, a in self.nucleo.buscar_animais("reservado")], ["Nina"])
+
+        self.nucleo.editar_animal(1, novo_nome="Luna")
+        self.assertEqual(self.nucleo.buscar_animais("mia"), [])
+        self.nucleo.excluir_animal(0)
+        self.assertEqual([(i, a.nome) for i, a in self.nucleo.buscar_animais("siam")], [(0, "Luna"), (1, "Nina")])
+        self.assertEqual(self.nucleo.buscar_animais("labrador"), [])
+
+        recarregado = NucleoAdocao(diretorio=self.tmp.name, registrar_log=False)
+        self.assertEqual([(i, a.nome) for i, a in recarregado.buscar_animais("luna")], [(0, "Luna")])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,157 @@
+import io
+import json
+import os
+import tempfile
+import unittest
+from src.adocao.commands import ExecutorComandos, ResumoExecucao
+from src.adocao.core import NucleoAdocao
+from src.adocao.enums import StatusAnimal, PorteAnimal, TipoMoradia
+from src.adocao.exceptions import OperacaoInvalidaError
+from src.adocao.observers import Observador
+
+class ObservadorMemoria(Observador):
+    def __init__(self):
+        self.eventos = []
+
+    def atualizar(self, evento):
+        self.eventos.append(evento)
+
+def linha(**dados):
+    return json.dumps(dados)
+
+class TestTransacao(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.nucleo = NucleoAdocao(diretorio=self.tmp.name, registrar_log=False)
+        self.nucleo.cadastrar_cachorro("Rex", "SRD", PorteAnimal.M, ["calmo"], True)
+        self.nucleo.cadastrar_adotante("Ana", "ana@x.com", 30, TipoMoradia.CASA, 100.0, False)
+        self.observador = ObservadorMemoria()
+        self.nucleo.adicionar_observador(self.observador)
+
+    def tearDown(self):
+        self.nucleo.fechar()
+        self.tmp.cleanup()
+
+    def test_falha_desfaz_tudo_e_descarta_eventos(self):
+        with self.assertRaises(Exception):
+            with self.nucleo.transacao():
+                self.nucleo.realizar_adocao(0, 0)
+                self.nucleo.cadastrar_adotante("Bia", "bia@x.com", 40, TipoMoradia.APTO, 50.0, False)
+                self.nucleo.realizar_adocao(5, 0)
+        self.assertEqual(self.nucleo.animais[0].status, StatusAnimal.DISPONIVEL)
+        self.assertEqual(len(self.nucleo.adotantes), 1)
+        self.assertEqual(self.observador.eventos, [])
+        recarregado = NucleoAdocao(diretorio=self.tmp.name, registrar_log=False)
+        self.assertEqual(recarregado.animais[0].status, StatusAnimal.DISPONIVEL)
+        self.assertEqual(len(recarregado.adotantes), 1)
+
+    def test_sucesso_grava_e_entrega_eventos_no_fim(self):
+        with self.nucleo.transacao():
+            self.nucleo.realizar_adocao(0, 0)
+            self.assertEqual(self.observador.eventos, [])
+        self.assertEqual(len(self.observador.eventos), 1)
+        recarregado = NucleoAdocao(diretorio=self.tmp.name, registrar_log=False)
+        self.assertEqual(recarregado.animais[0].status, StatusAnimal.ADOTADO)
+
+    def test_transacao_aninhada(self):
+        with self.nucleo.transacao():
+            with self.assertRaises(OperacaoInvalidaError):
+                with self.nucleo.transacao():
+                    pass
+
+class TestExecutorComandos(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.nucleo = NucleoAdocao(diretorio=self.tmp.name, registrar_log=False)
+        self.executor = ExecutorComandos(self.nucleo, pasta_relatorios=os.path.join(self.tmp.name, "relatorios"))
+
+    def tearDown(self):
+        self.nucleo.fechar()
+        self.tmp.cleanup()
+
+    def executar(self, *linhas):
+        saida = io.StringIO()
+        resumo = self.executor.executar(linhas, saida)
+        return resumo, [json.loads(l) for l in saida.getvalue().splitlines()]
+
+    def test_fluxo_completo(self):
+        resumo, resultados = self.executar(
+            linha(id=1, comando="cadastrar_cachorro", nome="Rex", raca="SRD", porte="M", temperamento=["calmo"]),
+            linha(comando="cadastrar_gato", nome="Mia", raca="SRD", porte="Pequeno", independencia=7),
+            linha(comando="cadastrar_adotante", nome="Ana", contato="ana@x.com", idade=30, moradia="Casa", area_util=100),
+            "",
+            "# comentário",
+            linha(comando="reservar", animal=0, adotante=0),
+            linha(comando="adotar", animal=0, adotante=0),
+            linha(comando="devolver", animal=0, motivo="mudança de cidade"),
+            linha(comando="expirar"),
+            linha(comando="relatorio", tipo="animais", formato="csv")
+        )
+        self.assertEqual((resumo.comandos, resumo.falhas), (8, 0))
+        self.assertEqual(resultados[0]["id"], 1)
+        self.assertEqual(resultados[0]["resultado"], {"animal": 0})
+        self.assertEqual(resultados[3]["resultado"]["status"], StatusAnimal.RESERVADO.value)
+        self.assertEqual(resultados[4]["linha"], 7)
+        self.assertTrue(os.path.exists(resultados[7]["resultado"]["arquivo"]))
+        self.assertEqual(resultados[-1]["resumo"]["comandos"], 8)
+        self.assertIn("p95", resultados[-1]["resumo"]["latencia_ms"])
+
+    def test_erros_nao_interrompem_o_lote(self):
+        resumo, resultados = self.executar(
+            "não é json",
+            linha(comando="voar"),
+            linha(comando="reservar", animal=0),
+            linha(comando="cadastrar_cachorro", nome="Rex", raca="SRD", porte="XG"),
+            linha(comando="cadastrar_cachorro", nome="Rex", raca="SRD", porte="G")
+        )
+        self.assertEqual((resumo.sucessos, resumo.falhas), (1, 4))
+        self.assertIn("voar", resultados[1]["erro"])
+        self.assertIn("adotante", resultados[2]["erro"])
+        self.assertIn("PorteAnimal", resultados[3]["erro"])
+
+    def test_campos_booleanos_exigem_true_ou_false(self):
+        resumo, resultados = self.executar(
+            linha(comando="cadastrar_cachorro", nome="Rex", raca="SRD", porte="M", precisa_passeio="false"),
+            linha(comando="cadastrar_adotante", nome="Ana", contato="ana@x.com", idade=30, moradia="CASA", tem_criancas=0),
+            linha(comando="cadastrar_adotante", nome="Ana", contato="ana@x.com", idade=30, moradia="CASA", tem_criancas=False)
+        )
+        self.assertEqual((resumo.sucessos, resumo.falhas), (1, 2))
+        self.assertIn("precisa_passeio", resultados[0]["erro"])
+        self.assertIn("tem_criancas", resultados[1]["erro"])
+        self.assertEqual(self.nucleo.animais, [])
+        self.assertFalse(self.nucleo.adotantes[0].tem_criancas)
+
+    def test_comando_transacao_e_atomico(self):
+        self.executar(
+            linha(comando="cadastrar_cachorro", nome="Rex", raca="SRD", porte="M"),
+            linha(comando="cadastrar_adotante", nome="Ana", contato="ana@x.com", idade=30, moradia="CASA", area_util=100)
+        )
+        resumo, resultados = self.executar(linha(comando="transacao", comandos=[
+            {"comando": "adotar", "animal": 0, "adotante": 0},
+            {"comando": "adotar", "animal": 3, "adotante": 0}
+        ]))
+        self.assertFalse(resultados[0]["ok"])
+        self.assertIn("comando 2", resultados[0]["erro"])
+        self.assertEqual(self.nucleo.animais[0].status, StatusAnimal.DISPONIVEL)
+
+        resumo, resultados = self.executar(linha(comando="transacao", comandos=[
+            {"comando": "reservar", "animal": 0, "adotante": 0},
+            {"comando": "adotar", "animal": 0, "adotante": 0}
+        ]))
+        self.assertTrue(resultados[0]["ok"])
+        self.assertEqual(len(resultados[0]["resultado"]["resultados"]), 2)
+        self.assertEqual(self.nucleo.animais[0].status, StatusAnimal.ADOTADO)
+
+class TestResumoExecucao(unittest.TestCase):
+
+    def test_percentis(self):
+        resumo = ResumoExecucao(sucessos=100, segundos=2.0, latencias_ms=[float(i) for i in range(1, 101)])
+        self.assertEqual(resumo.percentil(50), 50.0)
+        self.assertEqual(resumo.percentil(99), 99.0)
+        self.assertEqual(resumo.comandos_por_segundo, 50.0)
+        self.assertEqual(ResumoExecucao().percentil(95), 0.0)
+
+if __name__ == "__main__":
+    unittest.main()
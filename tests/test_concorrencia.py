@@ -0,0 +1,143 @@
+import random
+import tempfile
+import threading
+import time
+import unittest
+from collections import Counter
+from src.adocao.concurrency import TravaEstrutura, TravasEntidades
+from src.adocao.core import NucleoAdocao
+from src.adocao.enums import StatusAnimal, PorteAnimal, TipoMoradia
+from src.adocao.exceptions import AdocaoError
+
+class TestTravas(unittest.TestCase):
+
+    def test_ordem_global_evita_impasse(self):
+        travas = TravasEntidades()
+        def trabalhar(animal, adotante):
+            for _ in range(2000):
+                with travas.travar([animal], [adotante]):
+                    with travas.travar([animal]):
+                        pass
+        threads = [threading.Thread(target=trabalhar, args=(1, 2)), threading.Thread(target=trabalhar, args=(2, 1))]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join(timeout=10)
+        self.assertFalse(any(t.is_alive() for t in threads))
+
+    def test_exclusiva_espera_compartilhadas(self):
+        trava = TravaEstrutura()
+        ordem = []
+        dentro = threading.Event()
+        def leitor():
+            with trava.compartilhada():
+                dentro.set()
+                time.sleep(0.05)
+                ordem.append("leitura")
+        t = threading.Thread(target=leitor)
+        t.start()
+        dentro.wait()
+        with trava.exclusiva():
+            ordem.append("escrita")
+            with trava.compartilhada():
+                pass
+        t.join()
+        self.assertEqual(ordem, ["leitura", "escrita"])
+
+    def test_promocao_de_leitura_para_escrita(self):
+        trava = TravaEstrutura()
+        with trava.compartilhada():
+            with self.assertRaises(RuntimeError):
+                with trava.exclusiva():
+                    pass
+
+class TestEstresseNucleo(unittest.TestCase):
+
+    ANIMAIS = 30
+    ADOTANTES = 20
+    THREADS = 16
+    OPERACOES = 250
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.nucleo = NucleoAdocao(diretorio=self.tmp.name, registrar_log=False)
+        for i in range(self.ANIMAIS):
+            self.nucleo.cadastrar_cachorro(f"Cao{i}", "SRD", PorteAnimal.M, ["calmo"], True)
+        for i in range(self.ADOTANTES):
+            self.nucleo.cadastrar_adotante(f"Adotante{i}", f"a{i}@x.com", 30, TipoMoradia.CASA, 200.0, False)
+
+    def tearDown(self):
+        self.nucleo.fechar()
+        self.tmp.cleanup()
+
+    def test_operacoes_concorrentes_preservam_invariantes(self):
+        adocoes, devolucoes, erros_inesperados = Counter(), Counter(), []
+        contadores = threading.Lock()
+
+        def trabalhar(semente):
+            sorteio = random.Random(semente)
+            for _ in range(self.OPERACOES):
+                animal, adotante = sorteio.randrange(self.ANIMAIS), sorteio.randrange(self.ADOTANTES)
+                operacao = sorteio.choice(("reservar", "adotar", "adotar", "devolver", "fila"))
+                try:
+                    if operacao == "reservar":
+                        self.nucleo.reservar_animal(animal, adotante)
+                    elif operacao == "adotar":
+                        self.nucleo.realizar_adocao(animal, adotante)
+                        with contadores:
+                            adocoes[animal] += 1
+                    elif operacao == "devolver":
+                        self.nucleo.processar_devolucao(animal, "mudança de cidade")
+                        with contadores:
+                            devolucoes[animal] += 1
+                    else:
+                        self.nucleo.entrar_fila_espera(animal, adotante)
+                except AdocaoError:
+                    pass
+                except Exception as e:
+                    erros_inesperados.append(e)
+
+        threads = [threading.Thread(target=trabalhar, args=(i,)) for i in range(self.THREADS)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join(timeout=60)
+        self.assertFalse(any(t.is_alive() for t in threads), "possível impasse")
+        self.assertEqual(erros_inesperados, [])
+        self.assertGreater(sum(adocoes.values()), 0)
+
+        for idx, animal in enumerate(self.nucleo.animais):
+            saldo = adocoes[idx] - devolucoes[idx]
+            self.assertIn(saldo, (0, 1), f"{animal.nome} adotado {adocoes[idx]}x e devolvido {devolucoes[idx]}x")
+            self.assertEqual(saldo == 1, animal.status == StatusAnimal.ADOTADO)
+            if animal.status == StatusAnimal.RESERVADO:
+                self.assertTrue(animal.nome_reservante)
+            self.assertEqual(self.nucleo.indice_popularidade.tamanho_fila(animal), len(animal.fila_espera))
+
+        recarregado = NucleoAdocao(diretorio=self.tmp.name, registrar_log=False)
+        self.assertEqual([a.status for a in recarregado.animais], [a.status for a in self.nucleo.animais])
+        self.assertEqual([a.nome_reservante for a in recarregado.animais], [a.nome_reservante for a in self.nucleo.animais])
+
+    def test_cadastros_concorrentes_com_operacoes(self):
+        def cadastrar(i):
+            for j in range(20):
+                self.nucleo.cadastrar_adotante(f"Novo{i}-{j}", "x", 30, TipoMoradia.CASA, 200.0, False)
+
+        def reservar():
+            for idx in range(self.ANIMAIS):
+                try:
+                    self.nucleo.reservar_animal(idx, idx % self.ADOTANTES)
+                except AdocaoError:
+                    pass
+
+        threads = [threading.Thread(target=cadastrar, args=(i,)) for i in range(4)] + [threading.Thread(target=reservar)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join(timeout=60)
+        self.assertEqual(len(self.nucleo.adotantes), self.ADOTANTES + 80)
+        recarregado = NucleoAdocao(diretorio=self.tmp.name, registrar_log=False)
+        self.assertEqual(len(recarregado.adotantes), self.ADOTANTES + 80)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,159 @@
+import os
+import tempfile
+import threading
+import time
+import unittest
+from src.adocao.core import NucleoAdocao
+from src.adocao.dispatch import DespachanteAssincrono
+from src.adocao.enums import PoliticaFilaCheia, PorteAnimal, TipoMoradia
+from src.adocao.eventlog import Evento, ObservadorEventos
+from src.adocao.observers import LoggerObserver, Observador
+
+class ObservadorColetor(ObservadorEventos):
+    def __init__(self, atraso=0.0, liberar=None):
+        self.recebidos = []
+        self.atraso = atraso
+        self.liberar = liberar
+
+    def receber(self, evento):
+        if self.liberar is not None:
+            self.liberar.wait(5)
+        if self.atraso:
+            time.sleep(self.atraso)
+        self.recebidos.append(evento.mensagem)
+
+class ObservadorTexto(Observador):
+    def __init__(self):
+        self.mensagens = []
+
+    def atualizar(self, mensagem):
+        self.mensagens.append(mensagem)
+
+class TestDespachanteAssincrono(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.pasta = os.path.join(self._tmp.name, "transbordo")
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _eventos(self, quantidade):
+        return [Evento("TESTE", f"TESTE: {i}") for i in range(quantidade)]
+
+    def test_observador_lento_nao_bloqueia_os_demais(self):
+        despachante = DespachanteAssincrono(pasta_transbordo=self.pasta)
+        lento, rapido = ObservadorColetor(atraso=0.05), ObservadorColetor()
+        inicio = time.perf_counter()
+        for evento in self._eventos(20):
+            despachante.despachar(evento, [lento, rapido])
+        self.assertLess(time.perf_counter() - inicio, 0.5)
+        despachante.fechar()
+        esperado = [f"TESTE: {i}" for i in range(20)]
+        self.assertEqual(lento.recebidos, esperado)
+        self.assertEqual(rapido.recebidos, esperado)
+
+    def test_observador_de_texto_recebe_mensagem(self):
+        despachante = DespachanteAssincrono(pasta_transbordo=self.pasta)
+        texto = ObservadorTexto()
+        despachante.despachar(Evento("TESTE", "TESTE: ok"), [texto])
+        self.assertTrue(despachante.drenar(timeout=5))
+        self.assertEqual(texto.mensagens, ["TESTE: ok"])
+        despachante.fechar()
+
+    def test_fila_cheia_descarta(self):
+        liberar = threading.Event()
+        despachante = DespachanteAssincrono(capacidade=2, politica=PoliticaFilaCheia.DESCARTAR, pasta_transbordo=self.pasta)
+        observador = ObservadorColetor(liberar=liberar)
+        for evento in self._eventos(10):
+            despachante.despachar(evento, [observador])
+        liberar.set()
+        despachante.fechar()
+        estatisticas = despachante.estatisticas()["ObservadorColetor"]
+        self.assertGreater(estatisticas.descartados, 0)
+        self.assertEqual(estatisticas.entregues + estatisticas.descartados, 10)
+        self.assertEqual(observador.recebidos, sorted(observador.recebidos, key=lambda m: int(m.split()[-1])))
+
+    def test_fila_cheia_transborda_para_disco_em_ordem(self):
+        liberar = threading.Event()
+        despachante = DespachanteAssincrono(capacidade=2, politica=PoliticaFilaCheia.DISCO, pasta_transbordo=self.pasta)
+        observador = ObservadorColetor(liberar=liberar)
+        for evento in self._eventos(30):
+            despachante.despachar(evento, [observador])
+        self.assertGreater(despachante.estatisticas()["ObservadorColetor"].transbordados, 0)
+        liberar.set()
+        despachante.fechar()
+        self.assertEqual(observador.recebidos, [f"TESTE: {i}" for i in range(30)])
+        self.assertEqual(os.listdir(self.pasta), [])
+
+    def test_falha_do_observador_e_contada(self):
+        class Quebrado(ObservadorEventos):
+            def receber(self, evento):
+                raise RuntimeError("falhou")
+        despachante = DespachanteAssincrono(pasta_transbordo=self.pasta)
+        despachante.despachar(Evento("TESTE", "TESTE: x"), [Quebrado()])
+        despachante.fechar()
+        self.assertEqual(despachante.estatisticas()["Quebrado"].falhas, 1)
+
+    def test_falha_do_observador_vai_para_o_log(self):
+        class Quebrado(ObservadorEventos):
+            def receber(self, evento):
+                raise RuntimeError("falhou")
+        despachante = DespachanteAssincrono(pasta_transbordo=self.pasta)
+        with self.assertLogs("src.adocao.dispatch", "ERROR") as logs:
+            despachante.despachar(Evento("TESTE", "TESTE: x"), [Quebrado()])
+            despachante.fechar()
+        self.assertIn("Quebrado", logs.output[0])
+
+    def test_arquivo_de_transbordo_nao_depende_da_ordem(self):
+        primeiro = DespachanteAssincrono(pasta_transbordo=self.pasta)
+        log = LoggerObserver("a.log", pasta=self._tmp.name)
+        primeiro._canal(ObservadorTexto())
+        arquivo = primeiro._canal(log).arquivo_transbordo
+        primeiro.fechar()
+
+        segundo = DespachanteAssincrono(pasta_transbordo=self.pasta)
+        self.assertEqual(segundo._canal(LoggerObserver("a.log", pasta=self._tmp.name)).arquivo_transbordo, arquivo)
+        self.assertNotEqual(segundo._canal(LoggerObserver("b.log", pasta=self._tmp.name)).arquivo_transbordo, arquivo)
+        segundo.fechar()
+
+    def test_despacho_concorrente_com_fechar(self):
+        despachante = DespachanteAssincrono(pasta_transbordo=self.pasta)
+        observador = ObservadorColetor()
+        aceitos = []
+
+        def despachar(n):
+            for i in range(200):
+                try:
+                    despachante.despachar(Evento("TESTE", f"TESTE: {n}-{i}"), [observador])
+                except RuntimeError:
+                    return
+                aceitos.append(f"TESTE: {n}-{i}")
+
+        threads = [threading.Thread(target=despachar, args=(n,)) for n in range(4)]
+        for t in threads:
+            t.start()
+        despachante.fechar()
+        for t in threads:
+            t.join(timeout=5)
+        self.assertTrue(despachante.drenar(timeout=5))
+        self.assertEqual(sorted(observador.recebidos), sorted(aceitos))
+
+class TestNucleoDespachoAssincrono(unittest.TestCase):
+
+    def test_nucleo_entrega_ao_fechar(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            nucleo = NucleoAdocao(diretorio=tmp, registrar_log=False)
+            nucleo.settings["despacho_assincrono"] = True
+            nucleo.despachante = nucleo._criar_despachante()
+            observador = ObservadorColetor(atraso=0.01)
+            nucleo.adicionar_observador(observador)
+            nucleo.cadastrar_adotante("Ana", "1", 30, TipoMoradia.CASA, 100.0, False)
+            for i in range(5):
+                nucleo.cadastrar_cachorro(f"Rex{i}", "SRD", PorteAnimal.M, [], True)
+                nucleo.realizar_adocao(i, 0)
+            nucleo.fechar()
+            self.assertEqual(len(observador.recebidos), 5)
+
+if __name__ == '__main__':
+    unittest.main()
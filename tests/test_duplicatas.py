@@ -0,0 +1,106 @@
+import csv
+import os
+import random
+import tempfile
+import unittest
+from src.adocao.commands import ExecutorComandos
+from src.adocao.core import NucleoAdocao
+from src.adocao.domain import Adotante
+from src.adocao.enums import TipoMoradia
+from src.adocao.indexes import IndiceAdotantes, chave_contato, normalizar_nome, trigramas
+
+class TestIndiceAdotantes(unittest.TestCase):
+
+    def setUp(self):
+        self.adotantes = [
+            Adotante("Ana Souza", "ana@x.com", 30, TipoMoradia.CASA, 100.0, False),
+            Adotante("Bruno Lima", "(11) 98765-4321", 40, TipoMoradia.APTO, 60.0, True),
+            Adotante("Carla Dias", "carla@x.com", 25, TipoMoradia.CASA, 80.0, False),
+        ]
+        self.indice = IndiceAdotantes()
+        self.indice.reconstruir(self.adotantes)
+
+    def test_normalizacao(self):
+        self.assertEqual(normalizar_nome("  Ána   SOUZA. "), "ana souza")
+        self.assertEqual(chave_contato(" Ana@X.com "), "ana@x.com")
+        self.assertEqual(chave_contato("+55 11 98765-4321"), chave_contato("(11) 98765-4321"))
+        self.assertIsNone(chave_contato("  "))
+        self.assertEqual(trigramas("Ana"), {"  a", " an", "ana", "na "})
+
+    def test_busca_aproximada(self):
+        self.assertEqual([a.nome for a, _ in self.indice.buscar("ana sousa")], ["Ana Souza"])
+        self.assertEqual([a.nome for a, _ in self.indice.buscar("souza")], ["Ana Souza"])
+        self.assertEqual(self.indice.buscar("Zeca"), [])
+
+    def test_duplicatas_por_nome_e_contato(self):
+        self.assertEqual([(a.nome, m) for a, _, m in self.indice.duplicatas_de("ana souza ", "nova@x.com")],
+                         [("Ana Souza", "mesmo nome")])
+        self.assertEqual([(a.nome, m) for a, _, m in self.indice.duplicatas_de("B. Lima", "+55 11 98765-4321")],
+                         [("Bruno Lima", "mesmo contato")])
+        self.assertEqual(self.indice.duplicatas_de("Daniel Rocha", "d@x.com"), [])
+
+    def test_edicao_e_remocao(self):
+        self.adotantes[2]._nome = "Carla Souza Dias"
+        self.indice.atualizar(self.adotantes[2])
+        self.assertEqual([a.nome for a, _ in self.indice.buscar("carla dias")], ["Carla Souza Dias"])
+        self.indice.remover(self.adotantes[0])
+        self.assertEqual(self.indice.duplicatas_de("Ana Souza", "ana@x.com"), [])
+        self.assertEqual(len(self.indice), 2)
+
+    def test_filtro_de_prefixo_nao_perde_pares(self):
+        random.seed(7)
+        nomes = ["Ana", "Anna", "Maria", "Mariana", "Souza", "Sousa", "Silva", "Silveira", "Lima", "Limas"]
+        adotantes = [Adotante(" ".join(random.sample(nomes, 2)), f"{i}@x.com", 30, TipoMoradia.CASA, 50.0, False)
+                     for i in range(80)]
+        indice = IndiceAdotantes()
+        indice.reconstruir(adotantes)
+        esperados = set()
+        for i, a in enumerate(adotantes):
+            for j in range(i + 1, len(adotantes)):
+                x, y = trigramas(a.nome), trigramas(adotantes[j].nome)
+                if len(x & y) / len(x | y) >= 0.5:
+                    esperados.add((i, j))
+        posicao = {id(a): i for i, a in enumerate(adotantes)}
+        encontrados = {(posicao[id(a)], posicao[id(b)]) for a, b, _, _ in indice.pares_duplicados(0.5)}
+        self.assertEqual(encontrados, esperados)
+
+class TestDuplicatasNucleo(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.nucleo = NucleoAdocao(diretorio=self.tmp.name, registrar_log=False)
+        self.nucleo.cadastrar_adotante("Ana Souza", "ana@x.com", 30, TipoMoradia.CASA, 100.0, False)
+        self.nucleo.cadastrar_adotante("Bruno Lima", "11 98765-4321", 40, TipoMoradia.APTO, 60.0, True)
+        self.nucleo.cadastrar_adotante("ana souza ", "outra@x.com", 30, TipoMoradia.CASA, 100.0, False)
+
+    def tearDown(self):
+        self.nucleo.fechar()
+        self.tmp.cleanup()
+
+    def test_possiveis_duplicatas_e_relatorio(self):
+        suspeitas = self.nucleo.possiveis_duplicatas("Ana Sousa", "ana@x.com")
+        self.assertEqual([(s.idx, s.motivo) for s in suspeitas], [(0, "mesmo contato"), (2, "nome parecido")])
+        pares = self.nucleo.relatorio_duplicatas()
+        self.assertEqual([(p.idx_a, p.idx_b, p.motivo) for p in pares], [(0, 2, "mesmo nome")])
+
+        self.nucleo.excluir_adotante(0)
+        self.nucleo.editar_adotante(0, novo_nome="Bruna Lima")
+        self.assertEqual(self.nucleo.relatorio_duplicatas(), [])
+        self.assertEqual([(i, a.nome) for i, a, _ in self.nucleo.buscar_adotantes("bruna")], [(0, "Bruna Lima")])
+        recarregado = NucleoAdocao(diretorio=self.tmp.name, registrar_log=False)
+        self.assertEqual([i for i, _, _ in recarregado.buscar_adotantes("ana souza")], [1])
+
+    def test_importacao_em_lote_sinaliza_duplicatas(self):
+        executor = ExecutorComandos(self.nucleo, pasta_relatorios=os.path.join(self.tmp.name, "relatorios"))
+        resultado = executor.executar_comando({"comando": "cadastrar_adotante", "nome": "Bruno  Lima", "contato": "b@x.com",
+                                               "idade": 41, "moradia": "APTO"})
+        self.assertEqual(resultado["possiveis_duplicatas"], [{"adotante": 1, "motivo": "mesmo nome"}])
+
+        resultado = executor.executar_comando({"comando": "relatorio", "tipo": "duplicatas", "formato": "csv"})
+        self.assertEqual(resultado["registros"], 2)
+        with open(resultado["arquivo"], encoding="utf-8") as f:
+            linhas = list(csv.DictReader(f))
+        self.assertEqual([(l["id_a"], l["id_b"]) for l in linhas], [("0", "2"), ("1", "3")])
+
+if __name__ == "__main__":
+    unittest.main()
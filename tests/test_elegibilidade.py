@@ -0,0 +1,84 @@
+import os
+import tempfile
+import unittest
+from itertools import product
+from src.adocao.domain import Cachorro, Gato, Adotante
+from src.adocao.enums import StatusAnimal, PorteAnimal, TipoMoradia
+from src.adocao.indexes import IndiceElegibilidade
+from src.adocao.policy import PoliticaAdocao
+from src.adocao.services import SistemaAdocao
+
+SETTINGS = {"idade_minima": 18, "area_minima_g": 40.0}
+
+class TestPoliticaCompilada(unittest.TestCase):
+
+    def test_bitmap_equivale_a_politica(self):
+        """Para todas as combinações, o bitmap concorda com a avaliação completa."""
+        politica = PoliticaAdocao(SETTINGS)
+        indice = IndiceElegibilidade(politica)
+        animais = [
+            Cachorro("A", "R", StatusAnimal.DISPONIVEL, porte, temp, True)
+            for porte, temp in product(PorteAnimal, ([], ["Calmo"], ["arisco"], ["AGRESSIVO"]))
+        ]
+        adotantes = [
+            Adotante("X", "1", idade, moradia, area, criancas)
+            for idade, moradia, area, criancas in product((17, 18, 70), TipoMoradia, (10.0, 40.0), (False, True))
+        ]
+        for animal, adotante in product(animais, adotantes):
+            aprovado, _ = politica.avaliar(animal, adotante)
+            self.assertEqual(indice.elegivel(animal, adotante), aprovado)
+
+class TestConsultasElegibilidade(unittest.TestCase):
+
+    def setUp(self):
+        self._cwd = os.getcwd()
+        self._tmp = tempfile.TemporaryDirectory()
+        os.chdir(self._tmp.name)
+        self.sistema = SistemaAdocao()
+        self.sistema.animais = [
+            Cachorro("Hulk", "Dogue", StatusAnimal.DISPONIVEL, PorteAnimal.G, [], True),
+            Gato("Nala", "Angorá", StatusAnimal.DISPONIVEL, PorteAnimal.P, ["arisco"], 3),
+            Gato("Luna", "Siamês", StatusAnimal.ADOTADO, PorteAnimal.P, [], 1),
+        ]
+        self.sistema.adotantes = [
+            Adotante("Ana", "1", 30, TipoMoradia.CASA, 100.0, False),
+            Adotante("Beto", "2", 30, TipoMoradia.APTO, 60.0, True),
+            Adotante("Enzo", "3", 16, TipoMoradia.CASA, 100.0, False),
+        ]
+
+    def tearDown(self):
+        os.chdir(self._cwd)
+        self._tmp.cleanup()
+
+    def test_adotantes_elegiveis(self):
+        nomes = [a.nome for _, a in self.sistema.adotantes_elegiveis(0)]
+        self.assertEqual(nomes, ["Ana"])
+        nomes = [a.nome for _, a in self.sistema.adotantes_elegiveis(1)]
+        self.assertEqual(nomes, ["Ana"])
+
+    def test_animais_elegiveis(self):
+        self.assertEqual([i for i, _ in self.sistema.animais_elegiveis(0)], [0, 1])
+        self.assertEqual([i for i, _ in self.sistema.animais_elegiveis(0, apenas_adotaveis=False)], [0, 1, 2])
+        self.assertEqual(self.sistema.animais_elegiveis(2), [])
+
+    def test_cache_invalidado_ao_editar_adotante(self):
+        self.assertEqual(self.sistema.animais_elegiveis(1), [])
+        self.sistema.editar_adotante(1, nova_moradia=TipoMoradia.CASA, novas_criancas=False)
+        self.assertEqual([i for i, _ in self.sistema.animais_elegiveis(1)], [0, 1])
+
+    def test_cache_invalidado_ao_mudar_configuracao(self):
+        self.sistema.atualizar_configuracao("idade_minima", 40)
+        self.assertEqual(self.sistema.adotantes_elegiveis(1), [])
+
+    def test_adotantes_de_fora_nao_herdam_mascara(self):
+        """Adotantes temporários (ex: de outro abrigo) não reaproveitam o cache um do outro."""
+        self.sistema.animais = [Cachorro("Rex", "SRD", StatusAnimal.DISPONIVEL, PorteAnimal.M, [], True)]
+        adulto = Adotante("Ana", "1", 40, TipoMoradia.CASA, 100.0, False).to_dict()
+        menor = Adotante("Enzo", "2", 15, TipoMoradia.CASA, 100.0, False).to_dict()
+        for _ in range(20):
+            self.assertEqual(len(self.sistema.nucleo.animais_elegiveis_para(Adotante.from_dict(adulto))), 1)
+            self.assertEqual(self.sistema.nucleo.animais_elegiveis_para(Adotante.from_dict(menor)), [])
+        self.assertEqual(self.sistema.nucleo.indice_elegibilidade._mascaras, {})
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,122 @@
+import json
+import os
+import tempfile
+import threading
+import unittest
+from datetime import datetime, timedelta
+from decimal import Decimal
+from src.adocao.core import NucleoAdocao
+from src.adocao.enums import PorteAnimal, TipoMoradia
+from src.adocao.eventlog import Evento, LogEventosJSONL
+
+class TestLogEventosJSONL(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.pasta = self._tmp.name
+        self.base = datetime(2025, 1, 1, 12, 0)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _gravar(self, log, quantidade, inicio=0):
+        for i in range(inicio, inicio + quantidade):
+            tipo = "ADOÇÃO" if i % 2 == 0 else "EXPIRAÇÃO"
+            log.receber(Evento(tipo, f"{tipo}: evento {i}", animal=f"A{i}", momento=self.base + timedelta(hours=i)))
+
+    def test_rotacao_por_tamanho_e_por_dia(self):
+        log = LogEventosJSONL(self.pasta, tamanho_maximo=600, passo_indice=2)
+        self._gravar(log, 48)
+        log.fechar()
+        segmentos = log.segmentos()
+        self.assertGreater(len(segmentos), 2)
+        self.assertTrue(any("-20250102-" in s for s in segmentos))
+        with open(log.caminho_indice, encoding="utf-8") as f:
+            indice = json.load(f)
+        self.assertEqual(sorted(indice), segmentos)
+
+    def test_consulta_por_periodo_e_tipo(self):
+        log = LogEventosJSONL(self.pasta, tamanho_maximo=600, passo_indice=2)
+        self._gravar(log, 48)
+        inicio, fim = self.base + timedelta(hours=30), self.base + timedelta(hours=35)
+        eventos = list(log.consultar(inicio, fim, tipo="ADOÇÃO"))
+        self.assertEqual([e.animal for e in eventos], ["A30", "A32", "A34"])
+        log.fechar()
+
+    def test_indice_desatualizado_e_reconstruido(self):
+        log = LogEventosJSONL(self.pasta, passo_indice=4)
+        self._gravar(log, 10)
+        log.fechar()
+        with open(os.path.join(self.pasta, log.segmentos()[0]), "a", encoding="utf-8") as f:
+            f.write(json.dumps(Evento("ADOÇÃO", "extra", momento=self.base + timedelta(hours=11)).to_dict()) + "\n")
+
+        reaberto = LogEventosJSONL(self.pasta, passo_indice=4)
+        self.assertEqual(len(list(reaberto.consultar(self.base + timedelta(hours=9)))), 2)
+
+    def test_gravacao_concorrente_com_rotacao(self):
+        log = LogEventosJSONL(self.pasta, tamanho_maximo=2000, passo_indice=8)
+        erros = []
+
+        def gravar(t):
+            try:
+                for i in range(150):
+                    log.receber(Evento("ADOÇÃO", f"thread {t} evento {i}", momento=self.base + timedelta(seconds=i)))
+            except Exception as e:
+                erros.append(e)
+        threads = [threading.Thread(target=gravar, args=(t,)) for t in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        log.fechar()
+
+        self.assertEqual(erros, [])
+        self.assertGreater(len(log.segmentos()), 10)
+        self.assertEqual(len(list(LogEventosJSONL(self.pasta).consultar())), 8 * 150)
+        with open(log.caminho_indice, encoding="utf-8") as f:
+            indice = json.load(f)
+        self.assertEqual(sorted(indice), log.segmentos())
+        for nome, info in indice.items():
+            self.assertEqual(info["bytes"], os.path.getsize(os.path.join(self.pasta, nome)))
+
+class TestEventosDoNucleo(unittest.TestCase):
+
+    def test_adocao_gera_registro_estruturado(self):
+        with tempfile.TemporaryDirectory() as pasta:
+            nucleo = NucleoAdocao(diretorio=pasta)
+            nucleo.cadastrar_cachorro("Rex", "SRD", PorteAnimal.G, [], True)
+            nucleo.cadastrar_adotante("Ana", "1", 30, TipoMoradia.CASA, 100.0, False)
+            nucleo.realizar_adocao(0, 0)
+            nucleo.fechar()
+
+            log = LogEventosJSONL(os.path.join(pasta, "dados", "eventos"))
+            evento, = log.consultar(tipo="ADOÇÃO")
+            self.assertEqual((evento.animal, evento.adotante, evento.taxa), ("Rex", "Ana", Decimal("80.00")))
+
+    def test_adocoes_concorrentes_com_log_ligado(self):
+        with tempfile.TemporaryDirectory() as pasta:
+            nucleo = NucleoAdocao(diretorio=pasta, registrar_log=True)
+            for i in range(40):
+                nucleo.cadastrar_cachorro(f"Cao{i}", "SRD", PorteAnimal.P, [], True)
+            nucleo.cadastrar_adotante("Ana", "1", 30, TipoMoradia.CASA, 100.0, False)
+            erros = []
+
+            def adotar(indices):
+                try:
+                    for idx in indices:
+                        nucleo.realizar_adocao(idx, 0)
+                except Exception as e:
+                    erros.append(e)
+            threads = [threading.Thread(target=adotar, args=(range(t, 40, 4),)) for t in range(4)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+            nucleo.fechar()
+
+            self.assertEqual(erros, [])
+            log = LogEventosJSONL(os.path.join(pasta, "dados", "eventos"))
+            self.assertEqual(sorted(e.animal for e in log.consultar(tipo="ADOÇÃO")), sorted(f"Cao{i}" for i in range(40)))
+
+if __name__ == '__main__':
+    unittest.main()
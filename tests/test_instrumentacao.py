@@ -0,0 +1,128 @@
+import http.client
+import json
+import os
+import tempfile
+import unittest
+from src.adocao.api import ServidorAPI
+from src.adocao.core import NucleoAdocao
+from src.adocao.enums import PorteAnimal, TipoMoradia
+from src.adocao.exceptions import EntidadeNaoEncontradaError
+from src.adocao.instrumentation import BALDES_LATENCIA, Instrumentacao
+from src.adocao.observers import Observador
+from src.adocao.services import SistemaAdocao
+
+def amostras(texto):
+    """Linhas de amostra do formato Prometheus -> {nome{rótulos}: valor}."""
+    return {linha.rsplit(" ", 1)[0]: float(linha.rsplit(" ", 1)[1])
+            for linha in texto.splitlines() if linha and not linha.startswith("#")}
+
+class ObservadorContador(Observador):
+    def __init__(self):
+        self.mensagens = []
+
+    def atualizar(self, mensagem):
+        self.mensagens.append(mensagem)
+
+class TestInstrumentacao(unittest.TestCase):
+
+    def test_contadores_histograma_e_formato(self):
+        instrumentacao = Instrumentacao()
+        dobrar = instrumentacao.medir("teste", "dobrar", lambda x: 2 * x)
+        self.assertEqual(dobrar(4), 8)
+        falhar = instrumentacao.medir("teste", 'com "aspas"', lambda: 1 / 0)
+        with self.assertRaises(ZeroDivisionError):
+            falhar()
+        instrumentacao.registrar_chamada("teste", "dobrar", 0.003)
+        instrumentacao.registrar_transferencia("repositorio", "salvar_animais", 2, 512)
+
+        texto = instrumentacao.exportar()
+        valores = amostras(texto)
+        rotulo = '{componente="teste",metodo="dobrar"'
+        self.assertEqual(valores[f"adocao_chamadas_total{rotulo}}}"], 2)
+        self.assertEqual(valores[f"adocao_erros_total{rotulo}}}"], 0)
+        self.assertEqual(valores['adocao_erros_total{componente="teste",metodo="com \\"aspas\\""}'], 1)
+        self.assertEqual(valores[f'adocao_latencia_segundos_bucket{rotulo},le="0.0025"}}'], 1)
+        self.assertEqual(valores[f'adocao_latencia_segundos_bucket{rotulo},le="0.005"}}'], 2)
+        self.assertEqual(valores[f'adocao_latencia_segundos_bucket{rotulo},le="+Inf"}}'], 2)
+        baldes = [valores[f'adocao_latencia_segundos_bucket{rotulo},le="{limite!r}"}}'] for limite in BALDES_LATENCIA]
+        self.assertEqual(baldes, sorted(baldes))
+        self.assertEqual(valores['adocao_bytes_total{componente="repositorio",operacao="salvar_animais"}'], 512)
+        self.assertIn("# TYPE adocao_latencia_segundos histogram", texto)
+        for linha in texto.splitlines():
+            self.assertRegex(linha, r'^(# (HELP|TYPE) .+|[a-z_]+(\{.*\})? [0-9.e+-]+)$')
+
+class TestInstrumentacaoNucleo(unittest.TestCase):
+
+    def criar_nucleo(self, banco, ligada=True):
+        pasta = os.path.join(self.tmp.name, banco)
+        os.makedirs(pasta, exist_ok=True)
+        with open(os.path.join(pasta, "settings.json"), "w", encoding="utf-8") as f:
+            json.dump({"banco_tipo": banco, "instrumentacao": ligada}, f)
+        return NucleoAdocao(diretorio=pasta, registrar_log=False)
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_nucleo_repositorio_e_observadores(self):
+        for banco in ("JSON", "SQLITE"):
+            nucleo = self.criar_nucleo(banco)
+            observador = ObservadorContador()
+            nucleo.adicionar_observador(observador)
+            nucleo.cadastrar_cachorro("Rex", "SRD", PorteAnimal.M, ["calmo"], True)
+            nucleo.cadastrar_adotante("Ana", "a@x.com", 30, TipoMoradia.CASA, 100.0, False)
+            nucleo.reservar_animal(0, 0)
+            nucleo.realizar_adocao(0, 0)
+            with self.assertRaises(EntidadeNaoEncontradaError):
+                nucleo.buscar_animal(7)
+
+            valores = amostras(nucleo.instrumentacao.exportar())
+            self.assertEqual(valores['adocao_chamadas_total{componente="nucleo",metodo="reservar_animal"}'], 1)
+            self.assertEqual(valores['adocao_erros_total{componente="nucleo",metodo="buscar_animal"}'], 1)
+            self.assertEqual(valores['adocao_chamadas_total{componente="repositorio",metodo="carregar_animais"}'], 1)
+            self.assertGreaterEqual(valores['adocao_chamadas_total{componente="repositorio",metodo="salvar_animais"}'], 2)
+            self.assertGreater(valores['adocao_bytes_total{componente="repositorio",operacao="salvar_animais"}'], 0)
+            self.assertGreaterEqual(valores['adocao_registros_total{componente="repositorio",operacao="salvar_adotantes"}'], 1)
+            self.assertEqual(len(observador.mensagens), 1)
+            self.assertEqual(valores['adocao_chamadas_total{componente="observador",metodo="ObservadorContador.atualizar"}'], 1)
+
+            nucleo.fechar()
+            with open(os.path.join(self.tmp.name, banco, "dados", "metricas.prom"), encoding="utf-8") as f:
+                self.assertIn('adocao_chamadas_total{componente="nucleo",metodo="cadastrar_cachorro"} 1', f.read())
+
+    def test_desligada_nao_embrulha_nada(self):
+        nucleo = self.criar_nucleo("JSON", ligada=False)
+        self.assertIsNone(nucleo.instrumentacao)
+        self.assertIsNone(nucleo.repo.ao_transferir)
+        self.assertNotIn("reservar_animal", vars(nucleo))
+        self.assertNotIn("salvar_animais", vars(nucleo.repo))
+        servidor = ServidorAPI(nucleo)
+        self.assertEqual(servidor.tratar("GET", "/metricas/prometheus")[1], 404)
+        nucleo.fechar()
+        self.assertFalse(os.path.exists(os.path.join(self.tmp.name, "JSON", "dados", "metricas.prom")))
+
+    def test_sistema_e_exportacao_http(self):
+        nucleo = self.criar_nucleo("JSON")
+        sistema = SistemaAdocao(nucleo)
+        sistema.cadastrar_gato("Mia", "SRD", PorteAnimal.P, ["calmo"], 3)
+        servidor = ServidorAPI(nucleo, porta=0)
+        endereco = servidor.iniciar()
+        try:
+            conexao = http.client.HTTPConnection(*endereco, timeout=5)
+            conexao.request("GET", "/metricas/prometheus")
+            resposta = conexao.getresponse()
+            texto = resposta.read().decode("utf-8")
+            conexao.close()
+        finally:
+            servidor.parar()
+            nucleo.fechar()
+        self.assertEqual(resposta.status, 200)
+        self.assertTrue(resposta.getheader("Content-Type").startswith("text/plain; version=0.0.4"))
+        valores = amostras(texto)
+        self.assertEqual(valores['adocao_chamadas_total{componente="sistema",metodo="cadastrar_gato"}'], 1)
+        self.assertEqual(valores['adocao_chamadas_total{componente="nucleo",metodo="cadastrar_gato"}'], 1)
+
+if __name__ == "__main__":
+    unittest.main()
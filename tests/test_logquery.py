@@ -0,0 +1,65 @@
+import io
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from datetime import datetime, timedelta
+from src.adocao.logquery import ConsultaLog, interpretar_linha, main
+
+class TestConsultaLog(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.caminho = os.path.join(self._tmp.name, "historico_eventos.log")
+        self.base = datetime(2025, 12, 16, 3, 0, 0)
+        with open(self.caminho, "w", encoding="utf-8") as f:
+            f.write("\n")
+            for i in range(200):
+                momento = (self.base + timedelta(minutes=i)).strftime("%Y-%m-%d %H:%M:%S")
+                if i % 2 == 0:
+                    f.write(f"[{momento}] ADOÇÃO: Ana adotou Totó{i % 3}. Taxa: R$ 50.00 (padrão)\n")
+                else:
+                    f.write(f"[{momento}] EXPIRAÇÃO: Reserva de Thor (Tutor: Beto Lima) venceu e foi cancelada.\n")
+                if i == 100:
+                    f.write("linha corrompida sem carimbo\n")
+        self.consulta = ConsultaLog(self.caminho)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_interpreta_animal_e_adotante(self):
+        registro = interpretar_linha("[2025-12-16 03:36:38] ADOÇÃO: Carla Dias adotou Totó. Taxa: R$ 50.00 (padrão)")
+        self.assertEqual((registro.tipo, registro.adotante, registro.animal), ("ADOÇÃO", "Carla Dias", "Totó"))
+        registro = interpretar_linha("[2025-12-16 03:38:30] EXPIRAÇÃO: Reserva de Mel (Tutor: Helena) venceu e foi cancelada.")
+        self.assertEqual((registro.tipo, registro.adotante, registro.animal), ("EXPIRAÇÃO", "Helena", "Mel"))
+        self.assertIsNone(interpretar_linha("sem carimbo"))
+
+    def test_periodo_usa_busca_binaria_e_e_inclusivo(self):
+        inicio, fim = self.base + timedelta(minutes=50), self.base + timedelta(minutes=149)
+        registros = list(self.consulta.consultar(inicio, fim))
+        self.assertEqual(len(registros), 100)
+        self.assertEqual(registros[0].momento, inicio)
+        self.assertEqual(registros[-1].momento, fim)
+
+    def test_filtros_e_contagem(self):
+        self.assertEqual(self.consulta.contar(), {"ADOÇÃO": 100, "EXPIRAÇÃO": 100})
+        self.assertEqual(self.consulta.contar(tipo="EXPIRAÇÃO", adotante="Beto Lima"), {"EXPIRAÇÃO": 100})
+        totos = list(self.consulta.consultar(animal="Totó1"))
+        self.assertTrue(totos)
+        self.assertTrue(all(r.animal == "Totó1" for r in totos))
+        self.assertEqual(self.consulta.contar(animal="Totó"), {})
+
+    def test_periodo_fora_do_arquivo(self):
+        self.assertEqual(list(self.consulta.consultar(self.base + timedelta(days=1))), [])
+        self.assertEqual(len(list(self.consulta.consultar(fim=self.base))), 1)
+        self.assertEqual(list(ConsultaLog(os.path.join(self._tmp.name, "inexistente.log")).consultar()), [])
+
+    def test_linha_de_comando(self):
+        saida = io.StringIO()
+        with redirect_stdout(saida):
+            main(["--arquivo", self.caminho, "--tipo", "adoção", "--contar"])
+        self.assertIn("ADOÇÃO", saida.getvalue())
+        self.assertIn("100", saida.getvalue())
+
+if __name__ == '__main__':
+    unittest.main()
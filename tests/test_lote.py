@@ -0,0 +1,95 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import MagicMock
+from src.adocao.domain import Cachorro, Gato, Adotante
+from src.adocao.enums import StatusAnimal, PorteAnimal, TipoMoradia, TipoOperacao
+from src.adocao.exceptions import EntidadeNaoEncontradaError, ReservaInvalidaError
+from src.adocao.results import OperacaoLote
+from src.adocao.services import SistemaAdocao
+
+class TestOperacoesEmLote(unittest.TestCase):
+
+    def setUp(self):
+        self._cwd = os.getcwd()
+        self._tmp = tempfile.TemporaryDirectory()
+        os.chdir(self._tmp.name)
+        self.sistema = SistemaAdocao()
+        self.sistema.animais = [
+            Cachorro(f"Cao{i}", "SRD", StatusAnimal.DISPONIVEL, PorteAnimal.M, [], True) for i in range(3)
+        ] + [Gato("Mimi", "Persa", StatusAnimal.DISPONIVEL, PorteAnimal.P, [], 2)]
+        self.sistema.adotantes = [
+            Adotante("Ana", "1", 30, TipoMoradia.CASA, 100.0, False),
+            Adotante("Beto", "2", 40, TipoMoradia.CASA, 100.0, False),
+        ]
+        self.sistema.repo = MagicMock()
+
+    def tearDown(self):
+        os.chdir(self._cwd)
+        self._tmp.cleanup()
+
+    def test_vacinacao_em_lote_salva_uma_vez(self):
+        resultado = self.sistema.vacinar_lote([0, 1, 2, 3], "V10")
+        self.assertTrue(resultado.aplicado)
+        self.assertEqual(len(resultado.sucessos), 4)
+        self.assertTrue(all("V10" in a.agenda_vacinas for a in self.sistema.animais))
+        self.sistema.repo.salvar_animais.assert_called_once()
+
+    def test_lote_atomico_desfaz_tudo(self):
+        """A segunda reserva do mesmo animal falha e a primeira é desfeita."""
+        resultado = self.sistema.reservar_lote([(0, 0), (1, 0), (0, 1)])
+        self.assertFalse(resultado.aplicado)
+        self.assertIsInstance(resultado.itens[2].erro, ReservaInvalidaError)
+        self.assertTrue(all(a.status == StatusAnimal.DISPONIVEL for a in self.sistema.animais))
+        self.sistema.repo.salvar_animais.assert_not_called()
+
+        # O índice continua acompanhando os animais restaurados
+        self.sistema.entrar_fila_espera(0, 1)
+        self.assertEqual(self.sistema.animais_mais_populares(1)[0][0].nome, "Cao0")
+
+    def test_validacao_antecipada_cancela_lote(self):
+        resultado = self.sistema.adotar_lote([(0, 0), (99, 0)])
+        self.assertIsInstance(resultado.itens[1].erro, EntidadeNaoEncontradaError)
+        self.assertEqual(self.sistema.animais[0].status, StatusAnimal.DISPONIVEL)
+
+    def test_melhor_esforco_com_resultados_por_item(self):
+        observador = MagicMock()
+        self.sistema.observadores = [observador]
+        operacoes = [
+            OperacaoLote(TipoOperacao.ADOTAR, 0, 0),
+            OperacaoLote(TipoOperacao.DEVOLVER, 1, argumento="Mudança"),
+            OperacaoLote(TipoOperacao.ADOTAR, 2, 1),
+        ]
+        resultado = self.sistema.executar_lote(operacoes, atomico=False)
+
+        self.assertEqual([i.sucesso for i in resultado.itens], [True, False, True])
+        self.assertEqual(self.sistema.animais[0].status, StatusAnimal.ADOTADO)
+        self.assertEqual(observador.atualizar.call_count, 2)
+        self.sistema.repo.salvar_animais.assert_called_once()
+
+    def test_melhor_esforco_desfaz_operacao_que_falhou_no_meio(self):
+        """A triagem falha depois de a devolução já ter mudado o status: só esse animal volta ao estado anterior."""
+        self.sistema.animais[1].mudar_status(StatusAnimal.ADOTADO)
+        classificar = self.sistema.nucleo.classificador_devolucao.classificar
+        def classificar_falhando(motivo):
+            if motivo == "Falha":
+                raise ValueError("Triagem indisponível.")
+            return classificar(motivo)
+        self.sistema.nucleo.classificador_devolucao.classificar = classificar_falhando
+        operacoes = [
+            OperacaoLote(TipoOperacao.VACINAR, 1, argumento="V10"),
+            OperacaoLote(TipoOperacao.DEVOLVER, 1, argumento="Falha"),
+            OperacaoLote(TipoOperacao.ADOTAR, 0, 0),
+        ]
+        resultado = self.sistema.executar_lote(operacoes, atomico=False)
+
+        self.assertEqual([i.sucesso for i in resultado.itens], [True, False, True])
+        devolvido = self.sistema.animais[1]
+        self.assertEqual(devolvido.status, StatusAnimal.ADOTADO)
+        self.assertIn("V10", devolvido.agenda_vacinas)
+        self.assertFalse(any("Falha" in str(e) for e in devolvido.historico_eventos))
+        marcados = self.sistema.repo.marcar_animais.call_args[0][0]
+        self.assertEqual([a.nome for a in marcados], ["Cao1", "Cao0"])
+
+if __name__ == '__main__':
+    unittest.main()
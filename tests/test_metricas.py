@@ -0,0 +1,90 @@
+import io
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from datetime import datetime, timedelta
+from src.adocao.core import NucleoAdocao
+from src.adocao.enums import PorteAnimal, TipoMoradia
+from src.adocao.metrics import AmostraMetricas, SerieMetricas
+from src.adocao.reports import SaidaTexto, gerar_relatorio, relatorio_tendencia
+
+class TestSerieMetricas(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.serie = SerieMetricas(os.path.join(self._tmp.name, "dados", "metricas.db"))
+        self.base = datetime(2025, 1, 6)
+        for dia in range(28):
+            self.serie.registrar(AmostraMetricas(self.base + timedelta(days=dia), {
+                "caes_total": 30, "caes_adotados": dia, "gatos_total": 4, "gatos_adotados": 1, "fila_total": dia % 7
+            }))
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_arquivo_criado_so_na_primeira_gravacao(self):
+        vazia = SerieMetricas(os.path.join(self._tmp.name, "outra.db"))
+        self.assertEqual(vazia.consultar(), [])
+        self.assertIsNone(vazia.ultima())
+        self.assertFalse(os.path.exists(vazia.db_name))
+
+    def test_consulta_bruta_por_periodo(self):
+        pontos = self.serie.consultar(self.base + timedelta(days=3), self.base + timedelta(days=5))
+        self.assertEqual([p.valores["caes_adotados"] for p in pontos], [3, 4, 5])
+        self.assertEqual(self.serie.ultima().valores["caes_adotados"], 27)
+
+    def test_reducao_por_intervalo(self):
+        semana = timedelta(days=7)
+        ultimos = self.serie.consultar(self.base, intervalo=semana)
+        self.assertEqual([p.momento for p in ultimos], [self.base + semana * i for i in range(4)])
+        self.assertEqual([p.valores["caes_adotados"] for p in ultimos], [6, 13, 20, 27])
+
+        medias = self.serie.consultar(self.base, intervalo=semana, agregacao="media")
+        self.assertEqual(medias[0].valores["fila_total"], 3)
+        maximos = self.serie.consultar(self.base, intervalo=semana, agregacao="maximo")
+        self.assertEqual(maximos[1].valores["fila_total"], 6)
+
+        with self.assertRaises(ValueError):
+            self.serie.consultar(agregacao="mediana")
+
+    def test_variacao_e_relatorio_de_tendencia(self):
+        variacao = self.serie.variacao("caes_adotados", self.base, intervalo=timedelta(days=7))
+        self.assertEqual([v.valores["caes_adotados"] for v in variacao], [0, 7, 7, 7])
+
+        saida = io.StringIO()
+        pontos = self.serie.consultar(self.base, intervalo=timedelta(days=7))
+        gerar_relatorio(relatorio_tendencia(pontos, 7), [SaidaTexto(saida)])
+        self.assertIn("   2025-01-13 | Adoções: 7 | 🐶 43.3% 🐱 25.0%", saida.getvalue())
+
+class TestMetricasNucleo(unittest.TestCase):
+
+    def test_amostra_automatica_e_manual(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            nucleo = NucleoAdocao(diretorio=tmp, registrar_log=False)
+            nucleo.cadastrar_cachorro("Rex", "SRD", PorteAnimal.M, [], True)
+            nucleo.cadastrar_gato("Mimi", "Persa", PorteAnimal.P, [], 3)
+            nucleo.cadastrar_adotante("Ana", "1", 30, TipoMoradia.CASA, 100.0, False)
+            self.assertEqual(len(nucleo.metricas.consultar()), 1)
+
+            nucleo.realizar_adocao(0, 0)
+            amostra = nucleo.registrar_metricas(datetime.now() + timedelta(seconds=5))
+            self.assertEqual(amostra.valores["caes_adotados"], 1)
+            self.assertEqual(amostra.valores["gatos_total"], 1)
+            self.assertEqual(amostra.taxa_adocao("caes"), 100.0)
+            self.assertEqual(len(nucleo.tendencia_metricas(dias=1, intervalo_dias=1)), 1)
+            nucleo.fechar()
+
+    def test_falha_na_amostra_nao_desfaz_a_gravacao(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            nucleo = NucleoAdocao(diretorio=tmp, registrar_log=False)
+            bloqueio = os.path.join(tmp, "arquivo")
+            open(bloqueio, "w").close()
+            nucleo.metricas = SerieMetricas(os.path.join(bloqueio, "metricas.db"))
+            with self.assertLogs("src.adocao.core", "ERROR"):
+                nucleo.cadastrar_cachorro("Rex", "SRD", PorteAnimal.M, [], True)
+            self.assertEqual([a.nome for a in NucleoAdocao(diretorio=tmp, registrar_log=False).animais], ["Rex"])
+            nucleo.fechar()
+
+if __name__ == '__main__':
+    unittest.main()
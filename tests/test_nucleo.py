@@ -0,0 +1,133 @@
+import io
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from datetime import datetime, timedelta
+from decimal import Decimal
+from unittest.mock import MagicMock, patch
+from src.adocao.core import NucleoAdocao
+from src.adocao.enums import StatusAnimal, PorteAnimal, TipoMoradia
+from src.adocao.exceptions import AnimalReservadoError, OperacaoInvalidaError, RegraNegocioError
+from src.adocao.services import SistemaAdocao
+
+class TestNucleoHeadless(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.saida = io.StringIO()
+        with redirect_stdout(self.saida):
+            self.nucleo = NucleoAdocao(diretorio=self._tmp.name)
+            self.nucleo.cadastrar_cachorro("Rex", "SRD", PorteAnimal.M, [], True)
+            self.nucleo.cadastrar_gato("Mimi", "Persa", PorteAnimal.P, [], 3)
+            self.nucleo.cadastrar_adotante("Ana", "1", 30, TipoMoradia.CASA, 100.0, False)
+            self.nucleo.cadastrar_adotante("Beto", "2", 40, TipoMoradia.CASA, 100.0, False)
+
+    def tearDown(self):
+        self.nucleo.fechar()
+        self._tmp.cleanup()
+
+    def test_nao_imprime_e_grava_no_diretorio(self):
+        with redirect_stdout(self.saida):
+            resultado = self.nucleo.realizar_adocao(0, 0)
+            self.nucleo.fechar()
+        self.assertEqual(self.saida.getvalue(), "")
+        self.assertEqual(resultado.taxa.valor, Decimal("50.00"))
+        self.assertEqual(str(resultado.taxa), "R$ 50.00 (padrão)")
+        self.assertTrue(os.path.exists(os.path.join(self._tmp.name, "animais.json")))
+        self.assertTrue(os.path.exists(os.path.join(self._tmp.name, "dados", "historico_eventos.log")))
+
+    def test_reservado_para_outro_informa_titular(self):
+        self.nucleo.reservar_animal(0, 0)
+        with self.assertRaises(AnimalReservadoError) as ctx:
+            self.nucleo.reservar_animal(0, 1)
+        self.assertEqual(ctx.exception.titular, "Ana")
+
+        fila = self.nucleo.entrar_fila_espera(0, 1)
+        self.assertEqual(fila.posicao, 1)
+        self.assertEqual(self.nucleo.detalhes_fila(0).titular, "Ana")
+
+    def test_expiracao_notifica_apenas_reservas_vencidas(self):
+        self.nucleo.reservar_animal(0, 0)
+        self.nucleo.reservar_animal(1, 1)
+        self.nucleo.animais[0].data_reserva = (datetime.now() - timedelta(hours=100)).isoformat()
+        observador = MagicMock()
+        self.nucleo.observadores = [observador]
+
+        expiradas = self.nucleo.processar_reservas_vencidas()
+
+        self.assertEqual([e.animal.nome for e in expiradas], ["Rex"])
+        self.assertEqual(self.nucleo.animais[0].status, StatusAnimal.DISPONIVEL)
+        observador.atualizar.assert_called_once()
+
+    def test_erros_viram_excecoes(self):
+        with self.assertRaises(OperacaoInvalidaError):
+            self.nucleo.atualizar_configuracao("idade_minima", "abc")
+        with self.assertRaises(OperacaoInvalidaError):
+            self.nucleo.atualizar_configuracao("pesos_compatibilidade", "1")
+        with self.assertRaises(RegraNegocioError):
+            self.nucleo.treinar_animal(1)
+
+    def test_salvamento_adiado(self):
+        self.nucleo.salvar_automaticamente = False
+        self.nucleo.repo = MagicMock()
+        self.nucleo.vacinar_lote([0, 1], "V10")
+        self.nucleo.vacinar_animal(0, "Raiva")
+        self.nucleo.repo.salvar_animais.assert_not_called()
+        self.nucleo.salvar()
+        self.nucleo.repo.salvar_animais.assert_called_once()
+
+class TestCarregamentoTardio(unittest.TestCase):
+
+    def test_dados_carregados_no_primeiro_acesso(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            nucleo = NucleoAdocao(diretorio=tmp, registrar_log=False)
+            nucleo.cadastrar_cachorro("Rex", "SRD", PorteAnimal.M, [], True)
+            nucleo.cadastrar_adotante("Ana", "1", 30, TipoMoradia.CASA, 100.0, False)
+
+            tardio = NucleoAdocao(diretorio=tmp, registrar_log=False, carregamento_tardio=True)
+            self.assertEqual([a.nome for a in tardio.animais], ["Rex"])
+            self.assertEqual([a.nome for a in tardio.adotantes], ["Ana"])
+            self.assertTrue(tardio.dados_carregados)
+            self.assertEqual(tardio.animais_mais_populares(), [])
+
+    def test_erro_da_carga_aparece_no_acesso(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            with patch("src.adocao.repositories.RepositorioJSON.carregar_animais", side_effect=OSError("disco")):
+                nucleo = NucleoAdocao(diretorio=tmp, registrar_log=False, carregamento_tardio=True)
+                with self.assertRaises(OSError):
+                    nucleo.animais
+                with self.assertRaises(OSError):
+                    nucleo.adotantes
+
+    def test_backend_json_nao_importa_sqlite3(self):
+        raiz = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        codigo = "import sys, src.adocao.services; print('sqlite3' in sys.modules)"
+        saida = subprocess.run([sys.executable, "-c", codigo], cwd=raiz, capture_output=True, text=True, check=True)
+        self.assertEqual(saida.stdout.strip(), "False")
+
+class TestAdaptadorCLI(unittest.TestCase):
+
+    def setUp(self):
+        self._cwd = os.getcwd()
+        self._tmp = tempfile.TemporaryDirectory()
+        os.chdir(self._tmp.name)
+        self.sistema = SistemaAdocao()
+        self.sistema.nucleo.cadastrar_cachorro("Rex", "SRD", PorteAnimal.M, [], True)
+        self.sistema.nucleo.cadastrar_adotante("Ana", "1", 30, TipoMoradia.CASA, 100.0, False)
+        self.sistema.nucleo.cadastrar_adotante("Beto", "2", 40, TipoMoradia.CASA, 100.0, False)
+
+    def tearDown(self):
+        os.chdir(self._cwd)
+        self._tmp.cleanup()
+
+    def test_reserva_ocupada_oferece_fila(self):
+        self.sistema.reservar_animal(0, 0)
+        with patch("builtins.input", return_value="s"):
+            self.sistema.reservar_animal(0, 1)
+        self.assertEqual(len(self.sistema.animais[0].fila_espera), 1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,12 +1,13 @@
 import os
 import sys
+import threading
 import pytest
 from unittest.mock import MagicMock
 
 # Ajuste de caminho para encontrar o 'src'
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from src.adocao.services import SistemaAdocao, LoggerObserver
+from src.adocao.services import SistemaAdocao, LoggerObserver, LoggerBufferizado
 from src.adocao.domain import Cachorro, Adotante
 from src.adocao.enums import PorteAnimal, TipoMoradia, StatusAnimal
 from src.adocao.repositories import RepositorioSQLite
@@ -47,6 +48,50 @@ def test_observer_arquivo_log():
     # Limpeza
     os.remove(caminho)
 
+def test_logger_bufferizado_grava_em_ordem(tmp_path):
+    logger = LoggerBufferizado("buffer.log", pasta=str(tmp_path), intervalo=10, tamanho_lote=1000)
+    for i in range(50):
+        logger.atualizar(f"Evento {i}")
+
+    # Nada é gravado antes do intervalo/lote, a menos que se peça a descarga
+    logger.descarregar()
+    with open(tmp_path / "buffer.log", encoding="utf-8") as f:
+        linhas = f.read().splitlines()
+    assert [l.split("] ", 1)[1] for l in linhas] == [f"Evento {i}" for i in range(50)]
+
+    logger.atualizar("Último")
+    logger.fechar()
+    with open(tmp_path / "buffer.log", encoding="utf-8") as f:
+        assert f.read().splitlines()[-1].endswith("Último")
+    with pytest.raises(RuntimeError):
+        logger.atualizar("Depois de fechar")
+
+def test_logger_bufferizado_fechar_concorrente(tmp_path):
+    """Linha aceita durante o fechamento é gravada; descarregar não fica preso."""
+    logger = LoggerBufferizado("buffer.log", pasta=str(tmp_path), intervalo=10, tamanho_lote=1000)
+    logger.atualizar("Início")
+    aceitas = ["Início"]
+
+    def escrever(n):
+        for i in range(200):
+            try:
+                logger.atualizar(f"T{n}-{i}")
+            except RuntimeError:
+                return
+            aceitas.append(f"T{n}-{i}")
+            logger.descarregar()
+
+    threads = [threading.Thread(target=escrever, args=(n,)) for n in range(4)]
+    for t in threads:
+        t.start()
+    logger.fechar()
+    for t in threads:
+        t.join(timeout=5)
+        assert not t.is_alive()
+    with open(tmp_path / "buffer.log", encoding="utf-8") as f:
+        gravadas = {l.split("] ", 1)[1] for l in f.read().splitlines()}
+    assert set(aceitas) <= gravadas
+
 # --- TESTE 2: O SQLite aguenta Listas e Enums? ---
 def test_sqlite_persistencia_complexa():
     # Força uso do SQLite para este teste
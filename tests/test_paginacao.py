@@ -0,0 +1,86 @@
+import io
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from src.adocao.core import NucleoAdocao
+from src.adocao.domain import Cachorro, Gato
+from src.adocao.enums import StatusAnimal, PorteAnimal, TipoMoradia
+from src.adocao.exceptions import OperacaoInvalidaError
+from src.adocao.pagination import FiltroAnimais, FiltroAdotantes, paginar
+from src.adocao.services import SistemaAdocao
+
+class TestPaginar(unittest.TestCase):
+
+    def test_navegacao_para_frente_e_para_tras(self):
+        itens = list(range(25))
+        primeira = paginar(itens, lambda x: True, tamanho=10)
+        self.assertEqual([i for i, _ in primeira.itens], list(range(10)))
+        self.assertIsNone(primeira.cursor_anterior)
+        self.assertEqual(primeira.cursor_proximo, 9)
+
+        terceira = paginar(itens, lambda x: True, apos=19, tamanho=10)
+        self.assertEqual([i for i, _ in terceira.itens], list(range(20, 25)))
+        self.assertIsNone(terceira.cursor_proximo)
+
+        segunda = paginar(itens, lambda x: True, antes=terceira.cursor_anterior, tamanho=10)
+        self.assertEqual([i for i, _ in segunda.itens], list(range(10, 20)))
+        self.assertEqual((segunda.cursor_anterior, segunda.cursor_proximo), (10, 19))
+
+    def test_filtro_e_so_le_o_necessario(self):
+        lidos = []
+        def aceita(x):
+            lidos.append(x)
+            return x % 2 == 0
+        pagina = paginar(list(range(1000)), aceita, tamanho=5)
+        self.assertEqual([x for _, x in pagina.itens], [0, 2, 4, 6, 8])
+        self.assertEqual(len(lidos), 11)
+
+    def test_tamanho_invalido(self):
+        with self.assertRaises(ValueError):
+            paginar([1], lambda x: True, tamanho=0)
+
+class TestPaginacaoNucleo(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.nucleo = NucleoAdocao(diretorio=self._tmp.name, registrar_log=False)
+        for i, nome in enumerate(["Rex", "Rúfus", "Mimi", "Thor", "Mel"]):
+            if i % 2 == 0:
+                self.nucleo.cadastrar_cachorro(nome, "SRD", PorteAnimal.G if i == 0 else PorteAnimal.M, [], True)
+            else:
+                self.nucleo.cadastrar_gato(nome, "SRD", PorteAnimal.P, [], 3)
+        self.nucleo.cadastrar_adotante("Ana", "1", 30, TipoMoradia.CASA, 100.0, False)
+        self.nucleo.cadastrar_adotante("Álvaro", "2", 40, TipoMoradia.CASA, 100.0, False)
+        self.nucleo.cadastrar_adotante("Beto", "3", 40, TipoMoradia.CASA, 100.0, False)
+        self.nucleo.realizar_adocao(3, 0)
+
+    def tearDown(self):
+        self.nucleo.fechar()
+        self._tmp.cleanup()
+
+    def _nomes(self, pagina):
+        return [e.nome for _, e in pagina.itens]
+
+    def test_filtros_de_animais(self):
+        self.assertEqual(self._nomes(self.nucleo.pagina_animais(FiltroAnimais(prefixo_nome="ru"))), ["Rúfus"])
+        self.assertEqual(self._nomes(self.nucleo.pagina_animais(FiltroAnimais(especie=Gato))), ["Rúfus", "Thor"])
+        self.assertEqual(self._nomes(self.nucleo.pagina_animais(FiltroAnimais(porte=PorteAnimal.G))), ["Rex"])
+        self.assertEqual(self._nomes(self.nucleo.pagina_animais(FiltroAnimais(status=StatusAnimal.ADOTADO))), ["Thor"])
+        pagina = self.nucleo.pagina_animais(FiltroAnimais(especie=Cachorro), tamanho=2)
+        self.assertEqual(self._nomes(pagina), ["Rex", "Mimi"])
+        self.assertEqual(self._nomes(self.nucleo.pagina_animais(FiltroAnimais(especie=Cachorro), apos=pagina.cursor_proximo, tamanho=2)), ["Mel"])
+        with self.assertRaises(OperacaoInvalidaError):
+            self.nucleo.pagina_animais(tamanho=-1)
+
+    def test_filtro_de_adotantes_e_exibicao(self):
+        self.assertEqual(self._nomes(self.nucleo.pagina_adotantes(FiltroAdotantes("a"))), ["Ana", "Álvaro"])
+        saida = io.StringIO()
+        with redirect_stdout(saida):
+            sistema = SistemaAdocao(self.nucleo)
+            pagina = sistema.exibir_pagina_animais(tamanho=2)
+        linhas = [l for l in saida.getvalue().splitlines() if l.startswith("[")]
+        self.assertEqual(len(linhas), 2)
+        self.assertEqual(pagina.cursor_proximo, 1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,52 @@
+import unittest
+from src.adocao.domain import Cachorro, Gato, Adotante
+from src.adocao.enums import StatusAnimal, PorteAnimal, TipoMoradia
+from src.adocao.indexes import IndicePopularidade
+
+class TestIndicePopularidade(unittest.TestCase):
+
+    def setUp(self):
+        self.rex = Cachorro("Rex", "SRD", StatusAnimal.DISPONIVEL, PorteAnimal.M, [], True)
+        self.thor = Cachorro("Thor", "Husky", StatusAnimal.DISPONIVEL, PorteAnimal.G, [], True)
+        self.mimi = Gato("Mimi", "Persa", StatusAnimal.DISPONIVEL, PorteAnimal.P, [], 2)
+        self.pessoas = [Adotante(f"P{i}", str(i), 30, TipoMoradia.CASA, 100.0, False) for i in range(5)]
+
+        self.indice = IndicePopularidade()
+        self.indice.reconstruir([self.rex, self.thor, self.mimi])
+
+    def _encher(self, animal, quantidade):
+        for pessoa in self.pessoas[:quantidade]:
+            animal.fila_espera.adicionar(pessoa, 50)
+
+    def test_top_k_acompanha_filas(self):
+        """O índice é atualizado pela própria fila, sem reconstrução manual."""
+        self._encher(self.rex, 1)
+        self._encher(self.thor, 3)
+        self._encher(self.mimi, 2)
+
+        top = self.indice.top_k(2)
+        self.assertEqual([(a.nome, n) for a, n in top], [("Thor", 3), ("Mimi", 2)])
+
+        self.thor.fila_espera.proximo()
+        self.thor.fila_espera.proximo()
+        top = self.indice.top_k(5)
+        self.assertEqual([(a.nome, n) for a, n in top], [("Mimi", 2), ("Rex", 1), ("Thor", 1)])
+
+    def test_top_k_por_especie(self):
+        self._encher(self.rex, 1)
+        self._encher(self.mimi, 4)
+
+        self.assertEqual([a.nome for a, _ in self.indice.top_k(5, especie=Cachorro)], ["Rex"])
+        self.assertEqual([a.nome for a, _ in self.indice.top_k(5, especie=Gato)], ["Mimi"])
+
+    def test_remover_e_filas_vazias(self):
+        """Animais sem fila não aparecem e animais removidos deixam de ser acompanhados."""
+        self._encher(self.thor, 2)
+        self.assertEqual(len(self.indice), 1)
+
+        self.indice.remover(self.thor)
+        self.thor.fila_espera.adicionar(Adotante("Novo", "9", 30, TipoMoradia.CASA, 100.0, False), 10)
+        self.assertEqual(self.indice.top_k(5), [])
+
+if __name__ == '__main__':
+    unittest.main()
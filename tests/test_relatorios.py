@@ -0,0 +1,155 @@
+import csv
+import io
+import json
+import os
+import tempfile
+import tracemalloc
+import unittest
+from contextlib import redirect_stdout
+from datetime import datetime
+from src.adocao.core import NucleoAdocao
+from src.adocao.domain import Cachorro, Gato
+from src.adocao.enums import StatusAnimal, PorteAnimal, TipoMoradia
+from src.adocao.reports import SaidaCSV, SaidaJSON, SaidaTexto, gerar_relatorio, relatorio_animais, relatorio_estatistico
+from src.adocao.results import EstatisticasAbrigo
+from src.adocao.services import SistemaAdocao
+
+class TestRelatorios(unittest.TestCase):
+
+    def setUp(self):
+        self.rex = Cachorro("Rex", "SRD", StatusAnimal.DISPONIVEL, PorteAnimal.M, ["calmo"], True)
+        self.mimi = Gato("Mimi", "Persa", StatusAnimal.ADOTADO, PorteAnimal.P, [], 3)
+        self.stats = EstatisticasAbrigo(
+            gerado_em=datetime(2025, 12, 16, 3, 0, 0),
+            populares=[(self.rex, 3)],
+            caes={"total": 1, "adotados": 0, "taxa": 0.0},
+            gatos={"total": 1, "adotados": 1, "taxa": 100.0},
+            tempo_medio_dias=None,
+            quarentena=0, inadotaveis=1, devolvidos=0
+        )
+
+    def _gerar(self, relatorio, classe):
+        destino = io.StringIO()
+        gerar_relatorio(relatorio, [classe(destino)])
+        return destino.getvalue()
+
+    def test_texto_mantem_formato_do_console(self):
+        texto = self._gerar(relatorio_estatistico(self.stats), SaidaTexto)
+        self.assertIn("📊 RELATÓRIOS ESTATÍSTICOS DO ABRIGO", texto)
+        self.assertIn("Data de Geração: 16/12/2025 03:00:00", texto)
+        self.assertIn("   1º. Rex - Fila: 3 pessoas", texto)
+        self.assertIn("   🐱 Gatos: 1/1 (100.0%)", texto)
+        self.assertIn("   (Dados insuficientes para cálculo)", texto)
+        self.assertIn("   ⛔ Inadotáveis (Comportamento): 1", texto)
+
+    def test_json_e_csv_sao_legiveis_por_maquina(self):
+        dados = json.loads(self._gerar(relatorio_estatistico(self.stats), SaidaJSON))
+        secoes = {s["chave"]: s["registros"] for s in dados["secoes"]}
+        self.assertEqual(dados["relatorio"], "estatisticas")
+        self.assertEqual(secoes["populares"], [{"posicao": 1, "animal": "Rex", "fila": 3}])
+        self.assertEqual(secoes["tempo_medio"], [])
+
+        linhas = list(csv.DictReader(io.StringIO(self._gerar(relatorio_animais([self.rex, self.mimi]), SaidaCSV))))
+        self.assertEqual([l["nome"] for l in linhas], ["Rex", "Mimi"])
+        self.assertEqual(linhas[0]["temperamento"], "calmo")
+        self.assertEqual(linhas[1]["status"], StatusAnimal.ADOTADO.value)
+
+    def test_detalhado_em_memoria_constante(self):
+        def animais(quantidade):
+            for i in range(quantidade):
+                yield Cachorro(f"Cao{i}", "SRD", StatusAnimal.DISPONIVEL, PorteAnimal.M, [], False)
+
+        class Descarte(io.TextIOBase):
+            def write(self, texto):
+                return len(texto)
+
+        tracemalloc.start()
+        total = gerar_relatorio(relatorio_animais(animais(5000)), [SaidaCSV(Descarte()), SaidaJSON(Descarte())])
+        _, pico = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        self.assertEqual(total, 5000)
+        self.assertLess(pico, 1024 * 1024)
+
+    def test_sistema_salva_nos_formatos_pedidos(self):
+        cwd = os.getcwd()
+        with tempfile.TemporaryDirectory() as tmp:
+            os.chdir(tmp)
+            try:
+                with redirect_stdout(io.StringIO()):
+                    sistema = SistemaAdocao()
+                    sistema.nucleo.cadastrar_cachorro("Rex", "SRD", PorteAnimal.M, [], True)
+                    sistema.gerar_relatorios_estatisticos(["txt", "json"])
+                    sistema.exportar_relatorio_animais(["csv"])
+                    sistema.fechar()
+                arquivos = sorted(os.path.splitext(n)[1] for n in os.listdir("relatorios"))
+                self.assertEqual(arquivos, [".csv", ".json", ".txt"])
+            finally:
+                os.chdir(cwd)
+
+class TestCacheRelatorios(unittest.TestCase):
+
+    def setUp(self):
+        self._cwd = os.getcwd()
+        self._tmp = tempfile.TemporaryDirectory()
+        os.chdir(self._tmp.name)
+        with redirect_stdout(io.StringIO()):
+            self.sistema = SistemaAdocao()
+            self.sistema.nucleo.cadastrar_cachorro("Rex", "SRD", PorteAnimal.M, [], True)
+
+    def tearDown(self):
+        self.sistema.fechar()
+        os.chdir(self._cwd)
+        self._tmp.cleanup()
+
+    def _gerar(self):
+        with redirect_stdout(io.StringIO()):
+            self.sistema.gerar_relatorios_estatisticos(["txt"])
+        return os.listdir("relatorios")
+
+    def test_estatisticas_em_cache_ate_alteracao(self):
+        nucleo = self.sistema.nucleo
+        primeira = nucleo.estatisticas()
+        self.assertIs(nucleo.estatisticas(), primeira)
+
+        nucleo.cadastrar_gato("Mimi", "Persa", PorteAnimal.P, [], 3)
+        segunda = nucleo.estatisticas()
+        self.assertIsNot(segunda, primeira)
+        self.assertEqual(segunda.gatos["total"], 1)
+
+        nucleo.atualizar_configuracao("idade_minima", "21")
+        self.assertIsNot(nucleo.estatisticas(), segunda)
+
+    def test_arquivo_reaproveitado_sem_alteracoes(self):
+        primeiro = self._gerar()
+        self.assertEqual(self._gerar(), primeiro)
+
+        os.replace(os.path.join("relatorios", primeiro[0]), os.path.join("relatorios", "anterior.txt"))
+        self.sistema.nucleo.cadastrar_adotante("Ana", "1", 30, TipoMoradia.CASA, 100.0, False)
+        self.assertEqual(len(self._gerar()), 2)
+
+    def test_relatorios_na_pasta_do_nucleo(self):
+        with tempfile.TemporaryDirectory() as pasta:
+            with redirect_stdout(io.StringIO()):
+                sistema = SistemaAdocao(NucleoAdocao(diretorio=pasta, registrar_log=False))
+                sistema.gerar_relatorios_estatisticos(["txt", "json"])
+                sistema.gerar_relatorios_estatisticos(["txt", "json"])
+            gerados = sorted(os.listdir(os.path.join(pasta, "relatorios")))
+            self.assertEqual([os.path.splitext(n)[1] for n in gerados], [".json", ".txt"])
+            dados = sistema.nucleo.assinatura_dados()
+            self.assertTrue(all(dados[:16] in n for n in gerados))
+            self.assertFalse(os.path.exists("relatorios"))
+            sistema.fechar()
+
+    def test_arquivo_reaproveitado_por_outro_nucleo(self):
+        """Um núcleo novo sobre os mesmos dados reaproveita o arquivo gerado pelo anterior."""
+        primeiro = self._gerar()
+        self.sistema.fechar()
+        with redirect_stdout(io.StringIO()):
+            self.sistema = SistemaAdocao()
+        self.assertEqual(self._gerar(), primeiro)
+
+        self.sistema.nucleo.editar_animal(0, novo_nome="Bob")
+        self.assertEqual(len(self._gerar()), 2)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,105 @@
+import io
+import json
+import os
+import tempfile
+import unittest
+from collections import Counter
+from datetime import datetime, timedelta
+from src.adocao.core import NucleoAdocao
+from src.adocao.enums import StatusAnimal, TipoMoradia
+from src.adocao.exceptions import RepositorioError
+from src.adocao.repositories import RepositorioJSON, RepositorioSQLite
+from src.adocao.synthetic import GeradorSintetico, PerfilSintetico, main
+
+REFERENCIA = datetime(2026, 1, 1, 12, 0)
+
+class TestGeradorSintetico(unittest.TestCase):
+
+    def jsonl(self, gerador):
+        saida = io.StringIO()
+        gerador.escrever_jsonl(saida)
+        return saida.getvalue()
+
+    def test_mesma_semente_mesma_saida(self):
+        texto = self.jsonl(GeradorSintetico(50, 20, semente=3, referencia=REFERENCIA))
+        self.assertEqual(texto, self.jsonl(GeradorSintetico(50, 20, semente=3, referencia=REFERENCIA)))
+        self.assertNotEqual(texto, self.jsonl(GeradorSintetico(50, 20, semente=4, referencia=REFERENCIA)))
+        registros = [json.loads(linha) for linha in texto.splitlines()]
+        self.assertEqual(Counter(r["tipo"] for r in registros), {"adotante": 20, "animal": 50})
+        self.assertEqual(len({r["uid"] for r in registros}), 70)
+
+        # A entidade i não depende de quantas são geradas.
+        maior = GeradorSintetico(500, 20, semente=3, referencia=REFERENCIA)
+        self.assertEqual(maior.dados_animal(49), GeradorSintetico(50, 20, semente=3, referencia=REFERENCIA).dados_animal(49))
+
+    def test_distribuicoes_e_coerencia_das_reservas(self):
+        perfil = PerfilSintetico(status={StatusAnimal.DISPONIVEL: 1, StatusAnimal.RESERVADO: 3},
+                                 especies={"Gato": 1}, fila=(2, 4), historico=(3, 8), idade_reserva_horas=(10, 20))
+        gerador = GeradorSintetico(2000, 300, perfil, semente=1, referencia=REFERENCIA)
+        animais = [gerador.dados_animal(i) for i in range(2000)]
+        status = Counter(a["status"] for a in animais)
+        self.assertEqual(set(status), {"Disponível", "Reservado"})
+        self.assertAlmostEqual(status["Reservado"] / 2000, 0.75, delta=0.04)
+        self.assertTrue(all(a["tipo_classe"] == "Gato" for a in animais))
+
+        nomes_adotantes = {gerador.dados_adotante(j)["nome"] for j in range(300)}
+        for animal in animais:
+            datas = [linha[1:17] for linha in animal["historico"]]
+            self.assertEqual(datas, sorted(datas))
+            self.assertTrue(animal["historico"][0].endswith("Cadastrado no sistema."))
+            self.assertGreaterEqual(len(animal["historico"]), 3)
+            if animal["status"] != "Reservado":
+                self.assertEqual((animal["fila_espera"], animal["nome_reservante"]), ([], None))
+                continue
+            idade = REFERENCIA - datetime.fromisoformat(animal["data_reserva"])
+            self.assertTrue(timedelta(hours=10) <= idade <= timedelta(hours=20))
+            self.assertIn(animal["nome_reservante"], nomes_adotantes)
+            self.assertTrue(2 <= len(animal["fila_espera"]) <= 4)
+            ordem = [(-item["score"], item["data_entrada"]) for item in animal["fila_espera"]]
+            self.assertEqual(ordem, sorted(ordem))
+
+    def test_reservas_exigem_adotantes(self):
+        with self.assertRaises(ValueError):
+            GeradorSintetico(10, 0)
+        perfil = PerfilSintetico(status={StatusAnimal.DISPONIVEL: 1})
+        self.assertEqual(len(list(GeradorSintetico(10, 0, perfil).animais())), 10)
+
+class TestImportacaoSintetica(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.gerador = GeradorSintetico(200, 50, semente=9, referencia=REFERENCIA)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_importa_nos_dois_bancos_sem_apagar_dados(self):
+        for banco in ("JSON", "SQLITE"):
+            pasta = os.path.join(self.tmp.name, banco)
+            os.makedirs(pasta)
+            with open(os.path.join(pasta, "settings.json"), "w", encoding="utf-8") as f:
+                json.dump({"banco_tipo": banco}, f)
+            nucleo = NucleoAdocao(diretorio=pasta, registrar_log=False)
+            nucleo.cadastrar_adotante("Existente", "e@x.com", 30, TipoMoradia.CASA, 100.0, False)
+            nucleo.fechar()
+
+            self.assertEqual(main(["--animais", "200", "--adotantes", "50", "--semente", "9",
+                                   "--referencia", REFERENCIA.isoformat(), "--pasta", pasta]), 0)
+            nucleo = NucleoAdocao(diretorio=pasta, registrar_log=False)
+            self.assertEqual((len(nucleo.animais), len(nucleo.adotantes)), (200, 51))
+            self.assertEqual(nucleo.adotantes[0].nome, "Existente")
+            self.assertEqual(nucleo.animais[7].to_dict(), self.gerador.dados_animal(7))
+            self.assertEqual(nucleo.adotantes[1].versao, 1)
+            nucleo.editar_adotante(1, novo_nome="Editado")
+            nucleo.fechar()
+
+    def test_importar_de_novo_nao_duplica(self):
+        for repo in (RepositorioJSON(os.path.join(self.tmp.name, "a.json"), os.path.join(self.tmp.name, "b.json")),
+                     RepositorioSQLite(os.path.join(self.tmp.name, "adocao.db"))):
+            self.assertEqual(self.gerador.importar(repo), (50, 200))
+            with self.assertRaises(RepositorioError):
+                repo.importar_animais(GeradorSintetico(3, 50, semente=9, referencia=REFERENCIA).animais())
+            self.assertEqual(len(repo.carregar_animais()), 200)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,49 @@
+import unittest
+from decimal import Decimal
+from src.adocao.domain import Cachorro, Gato, Adotante
+from src.adocao.enums import StatusAnimal, PorteAnimal, TipoMoradia
+from src.adocao.fees import MotorTaxas
+from src.adocao.strategies import FabricaTaxas
+
+class TestMotorTaxas(unittest.TestCase):
+
+    def setUp(self):
+        self.motor = MotorTaxas()
+        self.dog_grande = Cachorro("G", "R", StatusAnimal.DISPONIVEL, PorteAnimal.G, [], False)
+        self.gato = Gato("M", "R", StatusAnimal.DISPONIVEL, PorteAnimal.P, [], 2)
+        self.jovem = Adotante("J", "C", 25, TipoMoradia.CASA, 100.0, False)
+        self.idoso = Adotante("S", "C", 60, TipoMoradia.CASA, 100.0, False)
+
+    def test_tabela_padrao_equivale_as_estrategias(self):
+        for animal in (self.dog_grande, self.gato):
+            for adotante in (self.jovem, self.idoso):
+                esperado = FabricaTaxas.obter_estrategia(animal, adotante).calcular(animal, adotante)
+                self.assertEqual(self.motor.cotar(animal, adotante).valor, esperado)
+
+    def test_valor_decimal_e_rotulo(self):
+        taxa = self.motor.cotar(self.dog_grande, self.jovem)
+        self.assertEqual(taxa.valor, Decimal("80.00"))
+        self.assertEqual(taxa.rotulo, "porte grande")
+        self.assertEqual(str(taxa), "R$ 80.00 (porte grande)")
+
+    def test_tabela_configurada_por_especie(self):
+        motor = MotorTaxas({
+            "padrao": {"rotulo": "padrão", "valor": "45.5"},
+            "regras": [{"rotulo": "felino", "especie": "Gato", "valor": "30"}]
+        })
+        self.assertEqual(motor.cotar(self.gato, self.idoso).valor, Decimal("30.00"))
+        self.assertEqual(motor.cotar(self.dog_grande, self.idoso).valor, Decimal("45.50"))
+
+    def test_cotacao_em_lote_memorizada(self):
+        pares = [(self.dog_grande, self.jovem), (self.gato, self.idoso)] * 1000
+        taxas = self.motor.cotar_lote(pares)
+        self.assertEqual(len(taxas), 2000)
+        self.assertEqual(taxas[1].rotulo, "sênior")
+        self.assertEqual(len(self.motor._cache), 2)
+
+    def test_tabela_invalida(self):
+        with self.assertRaises(ValueError):
+            MotorTaxas({"padrao": {"valor": "abc"}})
+
+if __name__ == '__main__':
+    unittest.main()
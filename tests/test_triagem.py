@@ -0,0 +1,60 @@
+import os
+import tempfile
+import unittest
+from src.adocao.core import NucleoAdocao
+from src.adocao.enums import StatusAnimal, PorteAnimal, TipoMoradia
+from src.adocao.triage import ClassificadorDevolucao, normalizar_texto
+
+class TestClassificadorDevolucao(unittest.TestCase):
+
+    def setUp(self):
+        self.classificador = ClassificadorDevolucao()
+
+    def test_normalizacao(self):
+        self.assertEqual(normalizar_texto("SAÚDE Frágil"), "saude fragil")
+
+    def test_classificacao_sem_acento_e_caixa(self):
+        self.assertEqual(self.classificador.classificar("Problema de SAUDE"), StatusAnimal.QUARENTENA)
+        self.assertEqual(self.classificador.classificar("Vômito constante"), StatusAnimal.QUARENTENA)
+        self.assertEqual(self.classificador.classificar("Ele ATACOU a visita"), StatusAnimal.INADOTAVEL)
+        self.assertEqual(self.classificador.classificar("Mudança de cidade"), StatusAnimal.DISPONIVEL)
+
+    def test_saude_tem_prioridade(self):
+        self.assertEqual(self.classificador.classificar("Mordeu porque estava doente"), StatusAnimal.QUARENTENA)
+
+    def test_palavras_configuraveis(self):
+        classificador = ClassificadorDevolucao({"saude": ["Alergia"], "agressao": []})
+        self.assertEqual(
+            classificador.classificar_lote(["alergia forte", "mordeu", "doente"]),
+            [StatusAnimal.QUARENTENA, StatusAnimal.DISPONIVEL, StatusAnimal.DISPONIVEL]
+        )
+
+class TestRetriagem(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.nucleo = NucleoAdocao(diretorio=self._tmp.name, registrar_log=False)
+        self.nucleo.cadastrar_cachorro("Rex", "SRD", PorteAnimal.M, [], True)
+        self.nucleo.cadastrar_adotante("Ana", "1", 30, TipoMoradia.CASA, 100.0, False)
+        self.nucleo.realizar_adocao(0, 0)
+        self.nucleo.processar_devolucao(0, "Começou a rosnar para todos")
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_motivo_registrado_no_historico(self):
+        self.assertEqual(self.nucleo.animais[0].status, StatusAnimal.DISPONIVEL)
+        self.assertTrue(any("Motivo da devolução: Começou a rosnar" in e for e in self.nucleo.animais[0].historico_eventos))
+
+    def test_retriagem_com_novas_palavras(self):
+        self.nucleo.classificador_devolucao = ClassificadorDevolucao({"agressao": ["rosnar"]})
+        sugestoes = self.nucleo.retriar_devolucoes()
+        self.assertEqual(sugestoes[0].status_sugerido, StatusAnimal.INADOTAVEL)
+        self.assertEqual(self.nucleo.animais[0].status, StatusAnimal.DISPONIVEL)
+
+        aplicadas = self.nucleo.retriar_devolucoes(aplicar=True)
+        self.assertTrue(aplicadas[0].aplicado)
+        self.assertEqual(self.nucleo.animais[0].status, StatusAnimal.INADOTAVEL)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,182 @@
+import json
+import multiprocessing
+import os
+import sqlite3
+import tempfile
+import unittest
+from src.adocao.core import NucleoAdocao
+from src.adocao.enums import StatusAnimal, PorteAnimal, TipoMoradia
+from src.adocao.exceptions import ConflitoVersaoError, RepositorioError
+
+ANIMAIS = 12
+PROCESSOS = 4
+
+def reservar_em_outro_processo(diretorio, indices):
+    """Executado em um processo filho: reserva os animais indicados, um por operação."""
+    nucleo = NucleoAdocao(diretorio=diretorio, registrar_log=False)
+    for idx in indices:
+        nucleo.reservar_animal(idx, idx % 3)
+    nucleo.fechar()
+
+class _BaseVersionamento:
+    BANCO = "JSON"
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        with open(os.path.join(self.tmp.name, "settings.json"), "w", encoding="utf-8") as f:
+            json.dump({"banco_tipo": self.BANCO}, f)
+        inicial = self.novo_nucleo()
+        for i in range(ANIMAIS):
+            inicial.cadastrar_cachorro(f"Cao{i}", "SRD", PorteAnimal.M, ["calmo"], True)
+        for i in range(3):
+            inicial.cadastrar_adotante(f"Adotante{i}", f"a{i}@x.com", 30, TipoMoradia.CASA, 200.0, False)
+        inicial.fechar()
+        self.a, self.b = self.novo_nucleo(), self.novo_nucleo()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def novo_nucleo(self):
+        return NucleoAdocao(diretorio=self.tmp.name, registrar_log=False)
+
+    def test_grava_so_marcadas_novas_e_excluidas(self):
+        repo = self.a.repo
+        animais = self.a.animais
+        serializados = []
+        for animal in animais:
+            original = animal.to_dict
+            animal.to_dict = lambda original=original, animal=animal: serializados.append(animal.nome) or original()
+        animais[1].nome_reservante = "Marcado"
+        animais[2].nome_reservante = "Sem marca"
+        repo.marcar_animais([animais[1]])
+        removido = animais.pop(3)
+        repo.salvar_animais(animais)
+        self.assertEqual(serializados, ["Cao1"])
+
+        relidos = self.novo_nucleo().animais
+        self.assertEqual([a.nome for a in relidos], [a.nome for a in animais])
+        self.assertNotIn(removido.uid, {a.uid for a in relidos})
+        self.assertEqual((relidos[1].nome_reservante, relidos[1].versao), ("Marcado", 2))
+        self.assertEqual((relidos[2].nome_reservante, relidos[2].versao), (None, 1))
+        serializados.clear()
+        repo.salvar_animais(animais)
+        self.assertEqual(serializados, [])
+
+    def test_conflito_na_mesma_entidade(self):
+        self.a.reservar_animal(0, 0)
+        with self.assertRaises(ConflitoVersaoError) as ctx:
+            self.b.reservar_animal(0, 1)
+        self.assertIn("Cao0", str(ctx.exception))
+        self.assertEqual(ctx.exception.conflitos[0].versao_esperada, 1)
+        # B passa a ver o que A gravou, em vez de manter a reserva perdida.
+        self.assertEqual(self.b.animais[0].nome_reservante, "Adotante0")
+        self.assertEqual(self.novo_nucleo().animais[0].nome_reservante, "Adotante0")
+
+        self.b.reservar_animal(1, 1)
+        self.assertEqual(self.novo_nucleo().animais[1].nome_reservante, "Adotante1")
+
+    def test_alteracoes_em_entidades_diferentes_sao_mescladas(self):
+        self.a.reservar_animal(0, 0)
+        self.b.reservar_animal(1, 1)
+        self.b.cadastrar_gato("Mia", "SRD", PorteAnimal.P, ["calmo"], 7)
+        self.a.cadastrar_adotante("Bia", "b@x.com", 40, TipoMoradia.CASA, 100.0, False)
+        self.a.editar_animal(2, novo_nome="Bolt")
+
+        recarregado = self.novo_nucleo()
+        self.assertEqual(recarregado.animais[0].status, StatusAnimal.RESERVADO)
+        self.assertEqual(recarregado.animais[1].nome_reservante, "Adotante1")
+        self.assertEqual(recarregado.animais[2].nome, "Bolt")
+        self.assertEqual(recarregado.animais[-1].nome, "Mia")
+        self.assertEqual([a.nome for a in recarregado.adotantes][-1], "Bia")
+        self.assertEqual(recarregado.animais[2].versao, 2)
+
+    def test_exclusao_por_outro_processo(self):
+        self.a.excluir_animal(0)
+        with self.assertRaises(ConflitoVersaoError) as ctx:
+            self.b.editar_animal(0, novo_nome="Rex")
+        self.assertIn("excluído", str(ctx.exception))
+        self.b.reservar_animal(1, 0)
+        recarregado = self.novo_nucleo()
+        self.assertEqual(len(recarregado.animais), ANIMAIS - 1)
+        self.assertNotIn("Rex", [a.nome for a in recarregado.animais])
+
+    def test_processos_paralelos_sem_trava_global(self):
+        contexto = multiprocessing.get_context("spawn")
+        processos = [
+            contexto.Process(target=reservar_em_outro_processo, args=(self.tmp.name, list(range(i, ANIMAIS, PROCESSOS))))
+            for i in range(PROCESSOS)
+        ]
+        for p in processos:
+            p.start()
+        for p in processos:
+            p.join(timeout=120)
+        self.assertEqual([p.exitcode for p in processos], [0] * PROCESSOS)
+        recarregado = self.novo_nucleo()
+        self.assertEqual([a.status for a in recarregado.animais], [StatusAnimal.RESERVADO] * ANIMAIS)
+
+class TestVersionamentoJSON(_BaseVersionamento, unittest.TestCase):
+    BANCO = "JSON"
+
+    def test_arquivo_antigo_sem_versao(self):
+        caminho = os.path.join(self.tmp.name, "animais.json")
+        with open(caminho, encoding="utf-8") as f:
+            registros = json.load(f)
+        for dados in registros:
+            del dados["uid"], dados["versao"]
+        with open(caminho, "w", encoding="utf-8") as f:
+            json.dump(registros, f)
+
+        a, b = self.novo_nucleo(), self.novo_nucleo()
+        self.assertEqual(a.animais[3].uid, "animal-3")
+        a.reservar_animal(3, 0)
+        with self.assertRaises(ConflitoVersaoError):
+            b.reservar_animal(3, 1)
+        self.assertEqual(self.novo_nucleo().animais[3].versao, 2)
+
+class TestVersionamentoSQLite(_BaseVersionamento, unittest.TestCase):
+    BANCO = "SQLITE"
+
+    def test_banco_antigo_sem_versao(self):
+        caminho = os.path.join(self.tmp.name, "antigo.db")
+        conn = sqlite3.connect(caminho)
+        conn.execute("CREATE TABLE animais (id INTEGER PRIMARY KEY AUTOINCREMENT, dados_json TEXT NOT NULL)")
+        conn.execute("CREATE TABLE adotantes (id INTEGER PRIMARY KEY AUTOINCREMENT, dados_json TEXT NOT NULL)")
+        for animal in self.a.animais[:2]:
+            dados = animal.to_dict()
+            del dados["uid"], dados["versao"]
+            conn.execute("INSERT INTO animais (dados_json) VALUES (?)", (json.dumps(dados),))
+        conn.commit()
+        conn.close()
+
+        from src.adocao.repositories import RepositorioSQLite
+        repo = RepositorioSQLite(caminho)
+        animais = repo.carregar_animais()
+        self.assertEqual([(a.uid, a.versao) for a in animais], [("animal-1", 1), ("animal-2", 1)])
+        animais[0].nome_reservante = "Bia"
+        repo.marcar_animais([animais[0]])
+        repo.salvar_animais(animais)
+        self.assertEqual([a.versao for a in RepositorioSQLite(caminho).carregar_animais()], [2, 1])
+
+    def test_banco_travado_levanta_erro_e_mantem_pendente(self):
+        from src.adocao.repositories import RepositorioSQLite
+        repo = RepositorioSQLite(os.path.join(self.tmp.name, "adocao.db"), tempo_espera=0.05)
+        animais = repo.carregar_animais()
+        animais[0].nome_reservante = "Bia"
+        repo.marcar_animais([animais[0]])
+        outro = sqlite3.connect(repo.db_name)
+        outro.execute("BEGIN EXCLUSIVE")
+        try:
+            with self.assertRaises(RepositorioError) as ctx:
+                repo.salvar_animais(animais)
+            self.assertNotIsInstance(ctx.exception, ConflitoVersaoError)
+            self.assertIn("locked", str(ctx.exception))
+            self.assertEqual(animais[0].versao, 1)
+        finally:
+            outro.rollback()
+            outro.close()
+        repo.salvar_animais(animais)
+        relido = RepositorioSQLite(repo.db_name).carregar_animais()[0]
+        self.assertEqual((relido.nome_reservante, relido.versao), ("Bia", 2))
+
+if __name__ == "__main__":
+    unittest.main()